@@ -0,0 +1,80 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Measure functions which are called by many nodes or on each tree update:
+data matching, deep copy of socket data, building of update lists,
+and Voronoi diagram of the pure Python implementation.
+
+Run with:
+
+    $ ./run_benchmarks.sh core_benchmark.py
+"""
+
+import numpy as np
+
+import bpy
+
+from sverchok.data_structure import match_long_repeat
+from sverchok.core.socket_data import sv_deep_copy
+from sverchok.core.update_system import build_update_list, clear_topology_cache
+from sverchok.utils.voronoi import voronoi_bounded, lloyd2d
+
+TREE_NAME = "sv_core_benchmark"
+
+def make_lists(count, seed=0):
+    """Lists of vertices of different lengths, as in typical node inputs"""
+    rng = np.random.RandomState(seed)
+    return [rng.uniform(-1, 1, size=(n, 3)).tolist() for n in [count, count // 10, 1]]
+
+def make_tree(n_chains, chain_length):
+    """Tree of separate chains of Scalar Math nodes"""
+    tree = bpy.data.node_groups.new(TREE_NAME, 'SverchCustomTreeType')
+    tree.sv_process = False
+    for i in range(n_chains):
+        previous = None
+        for j in range(chain_length):
+            node = tree.nodes.new('SvScalarMathNodeMK4')
+            node.location = (200 * j, 200 * i)
+            if previous is not None:
+                tree.links.new(previous.outputs[0], node.inputs[0])
+            previous = node
+    return tree
+
+def rebuild_update_lists(tree):
+    clear_topology_cache()
+    build_update_list(tree)
+
+def match_lists(lists):
+    return match_long_repeat(lists)
+
+def make_sites(count, seed=0):
+    rng = np.random.RandomState(seed)
+    return [(x, y, 0.0) for x, y in rng.uniform(-1, 1, size=(count, 2))]
+
+def voronoi(sites):
+    return voronoi_bounded(sites, make_faces=True)
+
+def lloyd(sites):
+    return lloyd2d('BOX', sites, 5)
+
+def cases():
+    for count in [1000, 100000]:
+        yield f"match_long_repeat {count}", match_lists, (make_lists(count),)
+        yield f"sv_deep_copy {count}", sv_deep_copy, ([make_lists(count)[0]],)
+    for n_chains, chain_length in [(10, 10), (20, 50)]:
+        tree = make_tree(n_chains, chain_length)
+        yield f"update lists {n_chains}x{chain_length} nodes", rebuild_update_lists, (tree,)
+    for count in [100, 1000]:
+        yield f"voronoi {count} sites", voronoi, (make_sites(count),)
+    for count in [1000, 100000]:
+        yield f"lloyd2d {count} sites x 5", lloyd, (make_sites(count),)
+
+def teardown():
+    for tree in list(bpy.data.node_groups):
+        if tree.name.startswith(TREE_NAME):
+            bpy.data.node_groups.remove(tree)
@@ -0,0 +1,71 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Memory and speed of 2D DCEL mesh of geom_2d package: half edges as Python
+objects (DCELMesh) versus half edges stored in NumPy arrays (DCELArrayMesh).
+
+Run with:
+
+    $ ./run_benchmarks.sh dcel_benchmark.py
+"""
+
+import random
+
+from sverchok.utils.geom_2d.merge_mesh import DCELMesh, DCELArrayMesh, find_intersections, monotone_faces_with_holes
+
+def make_grid(size):
+    """Edges of grid of size x size squares"""
+    verts = [(i, j, 0.0) for j in range(size + 1) for i in range(size + 1)]
+    edges = []
+    for j in range(size + 1):
+        for i in range(size):
+            edges.append((j * (size + 1) + i, j * (size + 1) + i + 1))
+            edges.append((i * (size + 1) + j, (i + 1) * (size + 1) + j))
+    return verts, edges
+
+def make_edges(count, seed=0):
+    """Short random segments in a square, with density of segments not depending on their count"""
+    rnd = random.Random(seed)
+    size = count ** 0.5
+    verts = []
+    edges = []
+    for i in range(count):
+        x, y = rnd.uniform(0, size), rnd.uniform(0, size)
+        dx, dy = rnd.uniform(-1, 1), rnd.uniform(-1, 1)
+        verts.append((x, y, 0.0))
+        verts.append((x + dx, y + dy, 0.0))
+        edges.append((2*i, 2*i + 1))
+    return verts, edges
+
+def build(mesh_class, verts, edges):
+    mesh = mesh_class(accuracy=1e-5)
+    mesh.from_sv_edges(verts, edges)
+    return mesh
+
+def build_and_export(mesh_class, verts, edges):
+    return build(mesh_class, verts, edges).to_sv_mesh(faces=False)
+
+def intersect(mesh_class, verts, edges):
+    mesh = build(mesh_class, verts, edges)
+    find_intersections(mesh, 1e-5)
+    return mesh.to_sv_mesh(faces=False)
+
+def edges_to_faces(mesh_class, verts, edges):
+    mesh = build(mesh_class, verts, edges)
+    mesh.generate_faces_from_hedges()
+    monotone_faces_with_holes(mesh)
+    return mesh.to_sv_mesh(edges=False, del_face_flag='del')
+
+def cases():
+    for mesh_class in [DCELMesh, DCELArrayMesh]:
+        name = mesh_class.__name__
+        verts, edges = make_grid(100)
+        yield f"{name} build {len(edges)} edges", build_and_export, (mesh_class, verts, edges)
+        yield f"{name} edges to faces {len(edges)} edges", edges_to_faces, (mesh_class, verts, edges)
+        verts, edges = make_edges(1000)
+        yield f"{name} intersect {len(edges)} edges", intersect, (mesh_class, verts, edges)
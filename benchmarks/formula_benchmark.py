@@ -0,0 +1,39 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compare evaluation of formulas, as formula nodes (scalar / vector field,
+curve, surface formula) do it: per element by safe_eval_compiled, and
+by the code compiled by compile_vectorized.
+
+Run with:
+
+    $ ./run_benchmarks.sh formula_benchmark.py
+"""
+
+import numpy as np
+
+from sverchok.utils.modules.eval_formula import sv_compile, safe_eval_compiled, compile_vectorized
+
+FORMULAS = ["x*x + y*y + z*z",
+            "sin(x)*cos(y) + sqrt(abs(z))",
+            "x if x*x + y*y < 1 else exp(-z)"]
+
+def per_element(formula, xs, ys, zs):
+    compiled = sv_compile(formula)
+    def function(x, y, z):
+        return safe_eval_compiled(compiled, dict(x=x, y=y, z=z))
+    return np.vectorize(function)(xs, ys, zs)
+
+def vectorized(formula, xs, ys, zs):
+    return compile_vectorized(formula)(dict(x=xs, y=ys, z=zs))
+
+def cases():
+    xs, ys, zs = np.random.RandomState(1).uniform(-1, 1, size=(3, 100000))
+    for formula in FORMULAS:
+        yield f"vectorized {formula!r}", vectorized, (formula, xs, ys, zs)
+    yield f"per element {FORMULAS[0]!r}", per_element, (FORMULAS[0], xs[:10000], ys[:10000], zs[:10000])
@@ -0,0 +1,46 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Scaling of 2D edges intersection: uniform grid broad phase
+versus checking of all pairs of edges.
+
+Run with:
+
+    $ ./run_benchmarks.sh intersect_edges_benchmark.py
+"""
+
+import random
+
+from sverchok.utils.intersect_edges import intersect_edges_2d, intersect_edges_2d_bruteforce
+
+def make_edges(count, seed=0):
+    """
+    Fixed set of short random segments in a square, with density
+    of segments not depending on their count - similar to plan drawings.
+    """
+    rnd = random.Random(seed)
+    size = count ** 0.5
+    verts = []
+    edges = []
+    for i in range(count):
+        x, y = rnd.uniform(0, size), rnd.uniform(0, size)
+        dx, dy = rnd.uniform(-1, 1), rnd.uniform(-1, 1)
+        verts.append((x, y, 0.0))
+        verts.append((x + dx, y + dy, 0.0))
+        edges.append((2*i, 2*i + 1))
+    return verts, edges
+
+def intersect(func, verts, edges):
+    return func(list(verts), edges, 1e-5)
+
+def cases():
+    for count in [1000, 10000]:
+        verts, edges = make_edges(count)
+        yield f"grid {count} edges", intersect, (intersect_edges_2d, verts, edges)
+        if count <= 1000:
+            yield f"all pairs {count} edges", intersect, (intersect_edges_2d_bruteforce, verts, edges)
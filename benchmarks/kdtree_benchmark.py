@@ -0,0 +1,39 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compare batched queries of KDTree implementations.
+
+Run with:
+
+    $ ./run_benchmarks.sh kdtree_benchmark.py
+"""
+
+import numpy as np
+
+from sverchok.utils.kdtree import SvBlenderKdTree, SvBruteforceKdTree, SvGridKdTree
+from sverchok.dependencies import scipy
+
+if scipy is not None:
+    from sverchok.utils.kdtree import SvSciPyKdTree
+
+def make_points(count, seed=0):
+    return np.random.RandomState(seed).uniform(-1.0, 1.0, size=(count, 3))
+
+def cases():
+    points = make_points(10000, seed=1)
+    needles = make_points(100000, seed=2)
+    implementations = [("Blender", SvBlenderKdTree), ("Grid", SvGridKdTree)]
+    if scipy is not None:
+        implementations.append(("SciPy", SvSciPyKdTree))
+    for name, cls in implementations:
+        kdt = cls(points)
+        yield f"{name} build 10000", cls, (points,)
+        yield f"{name} nearest 10000x100000", kdt.query_array, (needles,)
+        yield f"{name} ball 10000x10000", kdt.query_ball_array, (needles[:10000], 0.05)
+    kdt = SvBruteforceKdTree(points[:1000])
+    yield "Bruteforce nearest 1000x10000", kdt.query_array, (needles[:10000],)
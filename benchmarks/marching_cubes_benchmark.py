@@ -0,0 +1,38 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compare pure Python and vectorized NumPy implementations of marching cubes.
+
+Run with:
+
+    $ ./run_benchmarks.sh marching_cubes_benchmark.py
+"""
+
+import numpy as np
+
+from sverchok.utils.marching_cubes import isosurface_np, isosurface_vectorized
+
+def make_grid(size, seed=0):
+    """
+    Fixed scalar field: sum of several random "metaballs" on a size^3 grid.
+    """
+    rng = np.random.RandomState(seed)
+    centers = rng.uniform(0.2*size, 0.8*size, size=(5, 3))
+    xs = np.arange(size, dtype=np.float64)
+    x, y, z = np.meshgrid(xs, xs, xs, indexing='ij')
+    data = np.zeros((size, size, size))
+    for cx, cy, cz in centers:
+        data += size / (1.0 + (x - cx)**2 + (y - cy)**2 + (z - cz)**2)
+    return data
+
+def cases():
+    for size in [32, 128]:
+        data = make_grid(size)
+        yield f"numpy {size}^3", isosurface_vectorized, (data, 1.0)
+        if size <= 32:
+            yield f"python {size}^3", isosurface_np, (data, 1.0)
@@ -0,0 +1,67 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Compare ways of writing mesh data into Blender mesh, as the mesh viewer node
+does: via BMesh, and by foreach_set from flat arrays; plus the cost of
+topology fingerprint, which decides whether only coordinates are updated.
+
+Run with:
+
+    $ ./run_benchmarks.sh mesh_write_benchmark.py
+"""
+
+import numpy as np
+
+import bpy
+
+from sverchok.utils.sv_bmesh_utils import empty_bmesh, add_mesh_to_bmesh
+from sverchok.utils.mesh_arrays import flat_polygons, edges_array, topology_fingerprint, write_mesh
+
+MESH_NAME = "sv_mesh_write_benchmark"
+
+def make_grid(size):
+    """Grid of size x size quads"""
+    xs, ys = np.meshgrid(np.arange(size + 1), np.arange(size + 1))
+    verts = np.stack((xs.ravel(), ys.ravel(), np.zeros(xs.size)), axis=-1).astype(np.float64)
+    idx = np.arange((size + 1) ** 2).reshape((size + 1, size + 1))
+    faces = np.stack((idx[:-1, :-1], idx[:-1, 1:], idx[1:, 1:], idx[1:, :-1]), axis=-1).reshape((-1, 4))
+    return verts, faces
+
+def write_bmesh(mesh, verts, faces):
+    with empty_bmesh(False) as bm:
+        add_mesh_to_bmesh(bm, verts, [], faces, update_indexes=False, update_normals=False)
+        bm.to_mesh(mesh)
+    mesh.update()
+
+def write_arrays(mesh, verts, faces):
+    edges = edges_array([])
+    flat_faces, offsets, sizes = flat_polygons(faces)
+    topology_fingerprint(len(verts), edges, flat_faces, sizes)
+    write_mesh(mesh, verts, edges, flat_faces, offsets, sizes)
+    mesh.update()
+
+def update_coordinates(mesh, verts, faces):
+    edges = edges_array([])
+    flat_faces, offsets, sizes = flat_polygons(faces)
+    topology_fingerprint(len(verts), edges, flat_faces, sizes)
+    mesh.vertices.foreach_set('co', np.asarray(verts, dtype=np.float32).ravel())
+    mesh.update()
+
+def cases():
+    mesh = bpy.data.meshes.new(MESH_NAME)
+    for size in [100, 300, 1000]:
+        verts, faces = make_grid(size)
+        for kind, data in [("arrays", (verts, faces)), ("lists", (verts.tolist(), faces.tolist()))]:
+            for name, func in [("BMesh", write_bmesh), ("foreach_set", write_arrays),
+                               ("coordinates only", update_coordinates)]:
+                yield f"{name}, {size}x{size} quads from {kind}", func, (mesh,) + data
+
+def teardown():
+    mesh = bpy.data.meshes.get(MESH_NAME)
+    if mesh is not None:
+        bpy.data.meshes.remove(mesh)
@@ -0,0 +1,47 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Noise on arrays of points: mathutils.noise called per point (as noise fields
+and Noise Displace node did) versus sv_noise_numpy evaluated on whole arrays.
+
+Run with:
+
+    $ ./run_benchmarks.sh noise_benchmark.py
+"""
+
+import numpy as np
+from mathutils import noise
+
+from sverchok.utils import sv_noise_numpy
+
+def make_points(count, seed=0):
+    return np.random.RandomState(seed).uniform(-10.0, 10.0, size=(count, 3))
+
+def blender_noise_vector(points, noise_basis, seed):
+    noise.seed_set(seed)
+    def mk_noise(v):
+        r = noise.noise_vector(v, noise_basis=noise_basis)
+        return r[0], r[1], r[2]
+    return np.vectorize(mk_noise, signature="(3)->(),(),()")(points)
+
+def blender_turbulence(points, noise_basis):
+    return np.array([noise.turbulence(p, 4, False, noise_basis=noise_basis) for p in points])
+
+def numpy_noise_vector(points, noise_basis, seed):
+    return sv_noise_numpy.noise_vector(points, noise_basis=noise_basis, seed=seed)
+
+def numpy_turbulence(points, noise_basis):
+    return sv_noise_numpy.turbulence(points, 4, False, noise_basis=noise_basis)
+
+def cases():
+    points = make_points(100000)
+    for noise_basis in ['PERLIN_ORIGINAL', 'VORONOI_F1']:
+        yield f"mathutils noise_vector {noise_basis} 100000", blender_noise_vector, (points, noise_basis, 12345)
+        yield f"numpy noise_vector {noise_basis} 100000", numpy_noise_vector, (points, noise_basis, 12345)
+        yield f"mathutils turbulence {noise_basis} 100000", blender_turbulence, (points, noise_basis)
+        yield f"numpy turbulence {noise_basis} 100000", numpy_turbulence, (points, noise_basis)
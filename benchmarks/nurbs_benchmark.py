@@ -0,0 +1,48 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Measure evaluation of native NURBS curves.
+
+Run with:
+
+    $ ./run_benchmarks.sh nurbs_benchmark.py
+"""
+
+import numpy as np
+
+from sverchok.utils.curve import knotvector as sv_knotvector
+from sverchok.utils.curve.nurbs import SvNativeNurbsCurve
+from sverchok.utils.nurbs_common import basis_matrix_cache
+
+def make_curves(n_curves, n_points, degree, seed=0):
+    random = np.random.RandomState(seed)
+    knotvector = sv_knotvector.generate(degree, n_points)
+    curves = []
+    for i in range(n_curves):
+        control_points = random.uniform(-1.0, 1.0, size=(n_points, 3))
+        weights = random.uniform(0.5, 2.0, size=n_points)
+        curves.append(SvNativeNurbsCurve(degree, knotvector, control_points, weights))
+    return curves
+
+def evaluate_curves(curves, ts):
+    for curve in curves:
+        curve.evaluate_array(ts)
+        curve.tangent_array(ts)
+        curve.second_derivative_array(ts)
+
+def evaluate_cold(curves, ts):
+    """Evaluation of the first curve with empty cache of basis functions"""
+    basis_matrix_cache.clear()
+    evaluate_curves(curves[:1], ts)
+
+def cases():
+    for n_curves, n_points, n_ts in [(100, 20, 1000), (10, 1000, 100000)]:
+        curves = make_curves(n_curves, n_points, 3)
+        ts = np.linspace(0.0, 1.0, num=n_ts)
+        yield f"first curve, {n_points} points, {n_ts} parameters", evaluate_cold, (curves, ts)
+        yield f"{n_curves} curves, {n_points} points, {n_ts} parameters", evaluate_curves, (curves, ts)
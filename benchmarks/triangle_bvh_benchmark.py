@@ -0,0 +1,54 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Nearest point and ray cast queries for arrays of points: mathutils BVHTree
+called per point (as fields did with np.vectorize) versus batched SvTriangleBVH.
+
+Run with:
+
+    $ ./run_benchmarks.sh triangle_bvh_benchmark.py
+"""
+
+import numpy as np
+from mathutils.bvhtree import BVHTree
+
+from sverchok.utils.triangle_bvh import SvTriangleBVH
+
+def make_sphere(n_u, n_v):
+    """UV sphere of radius 1 with n_u x n_v quads"""
+    j, i = np.mgrid[0:n_v+1, 0:n_u]
+    theta = np.pi * j / n_v
+    phi = 2 * np.pi * i / n_u
+    verts = np.stack((np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)), axis=-1).reshape((-1, 3))
+    j, i = np.mgrid[0:n_v, 0:n_u]
+    a = j * n_u + i
+    b = j * n_u + (i + 1) % n_u
+    faces = np.stack((a, b, b + n_u, a + n_u), axis=-1).reshape((-1, 4))
+    return verts.tolist(), faces.tolist()
+
+def make_points(count, seed=0):
+    return np.random.RandomState(seed).uniform(-1.5, 1.5, size=(count, 3))
+
+def blender_nearest(bvh, points):
+    return np.vectorize(lambda v: bvh.find_nearest(v)[0], signature='(3)->(3)')(points)
+
+def blender_ray_cast(bvh, origins, directions):
+    return [bvh.ray_cast(o, d) for o, d in zip(origins, directions)]
+
+def cases():
+    verts, faces = make_sphere(100, 50)
+    points = make_points(100000, seed=1)
+    directions = make_points(100000, seed=2)
+    bvh = BVHTree.FromPolygons(verts, faces)
+    triangle_bvh = SvTriangleBVH(verts, faces)
+    yield "BVHTree build 5000 faces", BVHTree.FromPolygons, (verts, faces)
+    yield "SvTriangleBVH build 5000 faces", SvTriangleBVH, (verts, faces)
+    yield "BVHTree nearest 100000", blender_nearest, (bvh, points)
+    yield "SvTriangleBVH nearest 100000", triangle_bvh.find_nearest, (points,)
+    yield "BVHTree ray cast 100000", blender_ray_cast, (bvh, points, directions)
+    yield "SvTriangleBVH ray cast 100000", triangle_bvh.ray_cast, (points, directions)
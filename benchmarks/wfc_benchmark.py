@@ -0,0 +1,46 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Wave function collapse solver (WFC Texture node) on generated sample images,
+with fixed seeds.
+
+Run with:
+
+    $ ./run_benchmarks.sh wfc_benchmark.py
+"""
+
+import numpy as np
+
+from sverchok.utils.wfc_algorithm import WaveFunctionCollapse
+
+def make_maze_sample(size=12):
+    """White walls with a grid of rooms, red dot in the center of each room"""
+    ys, xs = np.mgrid[0:size, 0:size]
+    image = np.zeros((size, size, 4))
+    image[..., 3] = 1
+    image[(xs % 4 == 0) | (ys % 4 == 0), :3] = 1
+    image[(xs % 4 == 2) & (ys % 4 == 2), 0] = 1
+    return image
+
+def make_stripes_sample(size=24):
+    """Diagonal stripes of three colors with horizontal lines; gives about a hundred of 2x2 patterns"""
+    ys, xs = np.mgrid[0:size, 0:size]
+    image = np.zeros((size, size, 4))
+    image[..., 3] = 1
+    image[..., 0] = ((xs // 3 + ys // 5) % 3) / 2
+    image[..., 1] = (ys % 6 == 0)
+    return image
+
+def solve(image, pattern_size, output_size, seed=0):
+    wave = WaveFunctionCollapse(image, patter_size=pattern_size, periodic_input=True, rotate_patterns=True)
+    return wave.solve(output_size=(output_size, output_size), seed=seed, max_number_contradiction_tries=10)
+
+def cases():
+    for size in [32, 128]:
+        yield f"maze 3x3 patterns {size}x{size}", solve, (make_maze_sample(), 3, size)
+        yield f"stripes 2x2 patterns {size}x{size}", solve, (make_stripes_sample(), 2, size, 3)
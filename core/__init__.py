@@ -1,10 +1,14 @@
 import importlib
+import time
 import sverchok
 from sverchok.utils.logging import debug, exception
 from sverchok.core.update_system import clear_system_cache
 
 reload_event = False
 
+# time spent for importing modules at startup, see utils.profile.profiling_startup
+startup_timings = dict()
+
 root_modules = [
     "menu", "node_tree", "data_structure", "core",
     "utils", "ui", "nodes", "old_nodes"
@@ -49,19 +53,26 @@ def reload_all(imported_modules, node_list, old_nodes):
     # reload base modules
     _ = [importlib.reload(im) for im in imported_modules]
 
-    # reload nodes
-    _ = [importlib.reload(node) for node in node_list]
+    # reload nodes (node_list also contains core.lazy_nodes in lazy mode,
+    # its state must survive the reload)
+    _ = [importlib.reload(node) for node in node_list if node.__name__.startswith("sverchok.nodes.")]
 
     old_nodes.reload_old()
 
 
 
 def make_node_list(nodes):
-    node_list = []
-    base_name = "sverchok.nodes"
-    for category, names in nodes.nodes_dict.items():
-        importlib.import_module('.{}'.format(category), base_name)
-        import_modules(names, '{}.{}'.format(base_name, category), node_list)
+    from sverchok.core import lazy_nodes
+    start = time.perf_counter()
+    if lazy_nodes.is_lazy_mode():
+        node_list = lazy_nodes.make_node_list_lazy(nodes)
+    else:
+        node_list = []
+        base_name = "sverchok.nodes"
+        for category, names in nodes.nodes_dict.items():
+            importlib.import_module('.{}'.format(category), base_name)
+            import_modules(names, '{}.{}'.format(base_name, category), node_list)
+    startup_timings['nodes'] = time.perf_counter() - start
     return node_list
 
 
@@ -102,6 +113,7 @@ def import_all_modules(imported_modules, mods_bases):
 
 def init_architecture(sv_name, utils_modules, ui_modules):
 
+    start = time.perf_counter()
     imported_modules = []
     mods_bases = [
         (root_modules, "sverchok"),
@@ -113,6 +125,7 @@ def init_architecture(sv_name, utils_modules, ui_modules):
     import_settings(imported_modules, sv_name)
     print('sv: import all modules')
     import_all_modules(imported_modules, mods_bases)
+    startup_timings['architecture'] = time.perf_counter() - start
     return imported_modules
 
 
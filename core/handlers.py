@@ -5,7 +5,7 @@ from bpy.app.handlers import persistent
 
 from sverchok import old_nodes
 from sverchok import data_structure
-from sverchok.core import upgrade_nodes, undo_handler_node_count
+from sverchok.core import upgrade_nodes, undo_handler_node_count, lazy_nodes
 from sverchok.core.update_system import set_first_run, clear_system_cache
 from sverchok.core.events import CurrentEvents, BlenderEventsTypes
 from sverchok.ui import color_def, bgl_callback_nodeview, bgl_callback_3dview
@@ -193,6 +193,12 @@ def sv_post_load(scene):
     sv_types = {'SverchCustomTreeType', 'SverchGroupTreeType'}
     sv_trees = list(ng for ng in bpy.data.node_groups if ng.bl_idname in sv_types and ng.nodes)
 
+    # in lazy mode, used nodes can be still represented by stubs
+    try:
+        lazy_nodes.realize_tree_nodes(sv_trees)
+    except:
+        traceback.print_exc()
+
     for ng in sv_trees:
         with ng.throttle_update():
             try:
@@ -0,0 +1,232 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Lazy loading of node modules (experimental).
+
+Importing all node modules takes a considerable part of Blender startup time.
+In lazy mode, which is enabled by running Blender with
+`--sverchok-lazy-nodes` command line argument or with SVERCHOK_LAZY_NODES=1
+environment variable, only modules which can not be deferred are imported
+at startup (see utils/nodes_index.py). For other modules, lightweight stub
+node classes are registered instead, with bl_idname, label and icon taken
+from the nodes index, so that nodes are shown in menus and stay in saved
+files. Real module is imported and registered ("realized") when
+
+* a file using its nodes is loaded (see handlers.sv_post_load);
+* its node is added from the menu or from JSON import;
+* its stub node is created in any other way; in this case the node is
+  re-initialized right after the current operation.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+import bpy
+
+import sverchok
+from sverchok.utils.nodes_index import load_nodes_index
+from sverchok.utils.logging import debug, info, exception
+
+base_name = "sverchok.nodes"
+
+# Modules which have to be imported at startup in any case.
+EAGER_MODULES = {'scene.monad'}
+
+# module name ("category.name") -> list of node classes info, for modules which are not imported yet
+lazy_modules = dict()
+# bl_idname -> module name
+lazy_bl_idnames = dict()
+# bl_idname -> stub class, for registered stubs
+stub_classes = dict()
+# modules which were imported on demand, in order of realization
+realized_modules = []
+# (tree name, node name) of stub nodes created not via ensure_registered
+pending_nodes = []
+
+# eager: modules imported at startup; deferred: modules not imported at startup;
+# realized: deferred modules imported on demand since then
+lazy_statistics = dict(eager=0, eager_time=0.0, deferred=0, realized=0, realize_time=0.0)
+
+def is_lazy_mode():
+    return "--sverchok-lazy-nodes" in sys.argv or os.environ.get("SVERCHOK_LAZY_NODES") == "1"
+
+def make_node_list_lazy(nodes):
+    """
+    Import node modules which can not be deferred; remember the rest.
+    Returns the list of imported modules; this module itself is added to
+    the end of list, so that stubs are registered together with nodes.
+    """
+    lazy_modules.clear()
+    lazy_bl_idnames.clear()
+    index = load_nodes_index(nodes.directory, nodes.nodes_dict)
+    node_list = []
+    eager_time = 0.0
+    for category, names in nodes.nodes_dict.items():
+        importlib.import_module('.{}'.format(category), base_name)
+        for name in names:
+            module_name = f"{category}.{name}"
+            entry = index.get(module_name)
+            if entry is None or not entry['lazy'] or module_name in EAGER_MODULES:
+                start = time.perf_counter()
+                node_list.append(importlib.import_module('.{}'.format(name), f"{base_name}.{category}"))
+                eager_time += time.perf_counter() - start
+            else:
+                lazy_modules[module_name] = entry['classes']
+                for node_info in entry['classes']:
+                    lazy_bl_idnames[node_info['bl_idname']] = module_name
+    lazy_statistics['eager'] = len(node_list)
+    lazy_statistics['eager_time'] = eager_time
+    lazy_statistics['deferred'] = len(lazy_modules)
+    node_list.append(sys.modules[__name__])
+    return node_list
+
+def stub_poll(cls, ntree):
+    return ntree.bl_idname in ['SverchCustomTreeType', 'SverchGroupTreeType', 'SvGroupTree']
+
+def stub_init(self, context):
+    pending_nodes.append((self.id_data.name, self.name))
+    if not bpy.app.timers.is_registered(realize_pending):
+        bpy.app.timers.register(realize_pending, first_interval=0.0)
+
+def stub_draw_buttons(self, context, layout):
+    layout.label(text="Loading...")
+
+def make_stub_class(module_name, node_info):
+    attributes = dict(
+            bl_idname = node_info['bl_idname'],
+            bl_label = node_info['bl_label'],
+            __doc__ = node_info.get('doc'),
+            sv_lazy_module = module_name,
+            poll = classmethod(stub_poll),
+            init = stub_init,
+            draw_buttons = stub_draw_buttons)
+    for name in ['bl_icon', 'sv_icon']:
+        if name in node_info:
+            attributes[name] = node_info[name]
+    return type(node_info['class_name'], (bpy.types.Node,), attributes)
+
+def is_stub(node):
+    return hasattr(node, 'sv_lazy_module')
+
+def register():
+    node_classes = sverchok.utils.node_classes
+    for module_name, classes in lazy_modules.items():
+        for node_info in classes:
+            cls = make_stub_class(module_name, node_info)
+            bpy.utils.register_class(cls)
+            stub_classes[cls.bl_idname] = cls
+            node_classes[cls.bl_idname] = cls
+
+def unregister():
+    if bpy.app.timers.is_registered(realize_pending):
+        bpy.app.timers.unregister(realize_pending)
+    pending_nodes.clear()
+    for bl_idname, cls in stub_classes.items():
+        bpy.utils.unregister_class(cls)
+    stub_classes.clear()
+    for module in reversed(realized_modules):
+        if hasattr(module, "unregister"):
+            try:
+                module.unregister()
+            except RuntimeError as e:
+                exception("Error unregistering module %s: %s", module.__name__, e)
+    realized_modules.clear()
+
+def realize_module(module_name):
+    """
+    Replace stubs of node classes from the module with real ones.
+    Returns the module, or None if it is realized already.
+    """
+    classes = lazy_modules.pop(module_name, None)
+    if classes is None:
+        return None
+    start = time.perf_counter()
+    for node_info in classes:
+        bl_idname = node_info['bl_idname']
+        lazy_bl_idnames.pop(bl_idname, None)
+        cls = stub_classes.pop(bl_idname, None)
+        if cls is not None:
+            bpy.utils.unregister_class(cls)
+            sverchok.utils.node_classes.pop(bl_idname, None)
+
+    category, name = module_name.split('.')
+    module = importlib.import_module('.{}'.format(name), f"{base_name}.{category}")
+    if hasattr(module, "register"):
+        module.register()
+    realized_modules.append(module)
+
+    for node_info in classes:
+        cls = getattr(module, node_info['class_name'], None)
+        if cls is not None and getattr(bpy.types, node_info['bl_idname'], None) is not None:
+            sverchok.utils.node_classes[node_info['bl_idname']] = cls
+
+    spent = time.perf_counter() - start
+    lazy_statistics['realized'] += 1
+    lazy_statistics['realize_time'] += spent
+    debug("Node module %s is loaded on demand in %.4fs", module_name, spent)
+    return module
+
+def ensure_registered(bl_idnames):
+    """
+    Make sure that real classes are registered for all these node types.
+    """
+    for bl_idname in bl_idnames:
+        module_name = lazy_bl_idnames.get(bl_idname)
+        if module_name is not None:
+            realize_module(module_name)
+
+def realize_tree_nodes(trees):
+    """
+    Realize modules of all nodes used in the trees.
+    Returns True if any nodes were replaced.
+    """
+    bl_idnames = set()
+    for ng in trees:
+        bl_idnames.update(node.bl_idname for node in ng.nodes if node.bl_idname in lazy_bl_idnames)
+    ensure_registered(bl_idnames)
+    return len(bl_idnames) > 0
+
+def realize_all():
+    """
+    Import all deferred modules, as if lazy mode was not enabled.
+    """
+    for module_name in list(lazy_modules.keys()):
+        realize_module(module_name)
+
+def realize_pending():
+    """
+    Timer callback: realize modules of stub nodes created since the last call,
+    and initialize these nodes properly.
+    """
+    nodes = list(pending_nodes)
+    pending_nodes.clear()
+    for tree_name, node_name in nodes:
+        ng = bpy.data.node_groups.get(tree_name)
+        node = ng.nodes.get(node_name) if ng is not None else None
+        if node is None:
+            continue
+        try:
+            ensure_registered([node.bl_idname])
+            node = ng.nodes.get(node_name)
+            if not is_stub(node) and hasattr(node, 'sv_init'):
+                node.init(bpy.context)
+        except Exception as e:
+            exception("Can't load node %s: %s", node_name, e)
+    return None
+
+def format_lazy_statistics():
+    return "{} node modules imported at startup in {:.4f}s, {} deferred, {} of them loaded on demand in {:.4f}s".format(
+            lazy_statistics['eager'], lazy_statistics['eager_time'], lazy_statistics['deferred'],
+            lazy_statistics['realized'], lazy_statistics['realize_time'])
+
+def log_lazy_statistics():
+    if not lazy_statistics['deferred']:
+        return
+    info("Lazy nodes loading: %s", format_lazy_statistics())
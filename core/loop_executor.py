@@ -0,0 +1,164 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Execution of Loop In / Loop Out loops in Range mode.
+
+Nodes of loop body, sockets which pass data from Loop Out back to Loop In
+and the Break socket are resolved once per loop run, instead of looking
+nodes up by name and traversing links on each iteration. Nodes, which do not
+depend on data changing from iteration to iteration (loop-invariant nodes),
+are processed only once, before the first iteration.
+"""
+
+import time
+
+from sverchok.core.socket_data import get_socket_data, set_socket_data
+from sverchok.core.update_system import get_dep_dict
+from sverchok.utils.logging import debug, info
+
+# node_id of Loop Out node -> statistics of the last run of its loop
+loop_statistics = dict()
+
+
+def loop_variant_nodes(loop_in_node, body_nodes, dependencies=None):
+    """
+    Nodes of loop body (given in update order), which depend on the loop
+    number or on loop-carried data, directly or through other nodes.
+    dependencies: dependency dictionary of the tree (node name -> names of
+    nodes it depends on), as built by update system; it is used to follow
+    dependencies which are not links, like Wifi nodes, and links through
+    nodes which are not in the body (reroutes).
+    """
+    varying = {socket.socket_id for idx, socket in enumerate(loop_in_node.outputs)
+               if idx == 1 or idx >= 3}
+    dependencies = dependencies or dict()
+    body_names = {node.name for node in body_nodes}
+    variant_names = set()
+    checked_outside = dict()
+
+    def is_variant(name):
+        # loop_in_node itself is checked by sockets, since not all of its outputs change
+        if name in variant_names:
+            return True
+        if name == loop_in_node.name or name in body_names:
+            return False
+        # node outside of the body, e.g. reroute
+        if name not in checked_outside:
+            checked_outside[name] = False
+            checked_outside[name] = any(is_variant(dep) for dep in dependencies.get(name, ()))
+        return checked_outside[name]
+
+    variant = []
+    for node in body_nodes:
+        depends = any(is_variant(dep) for dep in dependencies.get(node.name, ()))
+        if not depends:
+            for socket in node.inputs:
+                if socket.is_linked:
+                    other = socket.other
+                    if other is not None and other.socket_id in varying:
+                        depends = True
+                        break
+        if depends:
+            variant.append(node)
+            variant_names.add(node.name)
+            varying.update(socket.socket_id for socket in node.outputs)
+    return variant
+
+
+class SvLoopExecutor(object):
+    """
+    Runs iterations of Range loop. The nodes of loop body must have been
+    processed once already (that is the first iteration).
+    """
+    def __init__(self, loop_in_node, loop_out_node, body, skip_invariant=False):
+        """
+        body: names of nodes between Loop In and Loop Out, in update order.
+        """
+        tree = loop_out_node.id_data
+        self.tree_id = tree.tree_id
+        self.loop_out_node = loop_out_node
+        tree_nodes = tree.nodes
+        body_nodes = [tree_nodes[name] for name in body]
+        if skip_invariant:
+            self.nodes = loop_variant_nodes(loop_in_node, body_nodes, get_dep_dict(tree))
+        else:
+            self.nodes = body_nodes
+        self.skipped = len(body_nodes) - len(self.nodes)
+
+        # loop-carried data: (Loop Out input socket, id of output socket linked to it, Loop In output socket id)
+        self.carried = []
+        for j, socket in enumerate(loop_out_node.inputs[2:]):
+            other = socket.other
+            # data can be taken from socket cache directly if no conversion is needed
+            source_id = other.socket_id if other is not None and other.bl_idname == socket.bl_idname else None
+            self.carried.append((socket, source_id, loop_in_node.outputs[j+3].socket_id))
+        self.loop_number_id = loop_in_node.outputs['Loop Number'].socket_id
+
+        break_socket = loop_out_node.inputs['Break']
+        break_other = break_socket.other
+        self.break_socket = break_socket if break_socket.is_linked else None
+        self.break_id = break_other.socket_id if break_other is not None else None
+
+        self.iteration_times = []
+
+    def break_loop(self):
+        if self.break_socket is None:
+            return False
+        if self.break_id is not None:
+            stop_ = get_socket_data(self.tree_id, self.break_id, None)
+            if stop_ is not None:
+                return stop_[0][0]
+        return self.break_socket.sv_get(deepcopy=False, default=[[False]])[0][0]
+
+    def pass_loop_data(self, iteration):
+        """Copy data from Loop Out inputs to Loop In outputs"""
+        tree_id = self.tree_id
+        # all the data is read before any of it is written,
+        # in case Loop In outputs are linked to Loop Out directly
+        data = []
+        for socket, source_id, _ in self.carried:
+            if source_id is not None:
+                data.append(get_socket_data(tree_id, source_id, []))
+            else:
+                data.append(socket.sv_get(deepcopy=False, default=[]))
+        for (_, _, target_id), item in zip(self.carried, data):
+            set_socket_data(tree_id, target_id, item)
+        set_socket_data(tree_id, self.loop_number_id, [[iteration]])
+
+    def run(self, iterations, do_print=False):
+        """Run iterations 1 .. iterations-1 (0th iteration is already done)"""
+        self.iteration_times = []
+        for i in range(1, iterations):
+            if self.break_loop():
+                break
+            start = time.perf_counter()
+            self.pass_loop_data(i)
+            if do_print:
+                print(f"Looping iteration Number {i}")
+            for node in self.nodes:
+                try:
+                    node.process()
+                except Exception as e:
+                    raise type(e)(str(e) + f' @ {node.name} node. Iteration number: {i}')
+            self.iteration_times.append(time.perf_counter() - start)
+        self.store_statistics(do_print)
+
+    def store_statistics(self, do_print=False):
+        times = self.iteration_times
+        statistics = dict(
+            iterations = len(times) + 1,
+            total_time = sum(times),
+            mean_time = sum(times) / len(times) if times else 0.0,
+            max_time = max(times) if times else 0.0,
+            nodes = len(self.nodes),
+            skipped_nodes = self.skipped)
+        loop_statistics[self.loop_out_node.node_id] = statistics
+        log = info if do_print else debug
+        log("Loop %s: %s iterations, %.4fs per iteration (max %.4fs), %s nodes processed, %s loop-invariant nodes skipped",
+            self.loop_out_node.name, statistics['iterations'], statistics['mean_time'],
+            statistics['max_time'], statistics['nodes'], statistics['skipped_nodes'])
@@ -16,6 +16,16 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import collections
+import hashlib
+import itertools
+import pickle
+import threading
+
+import numpy as np
+
+import bpy
+
 from sverchok import data_structure
 from sverchok.utils.logging import warning, info, debug
 
@@ -28,20 +38,64 @@ sentinel = object()
 # socket cache
 socket_data_cache = {}
 
+# Statistics of data copying by links: (tree name, from node, from socket, to node, to socket) -> [number of copies, bytes copied].
+# None means that statistics is not gathered.
+socket_copy_statistics = None
+socket_copy_statistics_lock = threading.Lock()
+
+# Version of data stored in each socket; it changes each time
+# when new data is written into the socket.
+socket_data_versions = {}
+socket_data_version_counter = itertools.count(1)
+
+# Hashes of content of data stored in sockets, computed on demand:
+# tree id -> socket id -> (version, hash).
+socket_data_hashes = {}
+
 # faster than builtin deep copy for us.
 # useful for our limited case
 # we should be able to specify vectors here to get them create
 # or stop destroying them when in vector socket.
 
 
+def _rows_of_scalars(lst):
+    """
+    True if lst is a non-empty list of non-empty lists or tuples of scalars,
+    which sv_deep_copy would copy with one slice per row.
+    """
+    if not lst or not set(map(type, lst)) <= {list, tuple}:
+        return False
+    return all(row and not isinstance(row[0], (list, tuple)) for row in lst)
+
 def sv_deep_copy(lst):
     """return deep copied data of list/tuple structure"""
     if isinstance(lst, (list, tuple)):
         if lst and not isinstance(lst[0], (list, tuple)):
             return lst[:]
+        if _rows_of_scalars(lst):
+            # Fast paths for the most common "rows of scalars" level,
+            # like list of vertices or list of faces.
+            if set(map(type, lst)) == {tuple}:
+                # tuples of scalars can not be mutated, so they can be shared
+                return list(lst)
+            return [row[:] for row in lst]
         return [sv_deep_copy(l) for l in lst]
     return lst
 
+def sv_deep_copy_size(lst):
+    """
+    Estimate number of bytes allocated by sv_deep_copy(lst):
+    sv_deep_copy creates new lists, but shares scalars, tuples of
+    scalars and NumPy arrays with the original data.
+    """
+    if isinstance(lst, (list, tuple)):
+        if lst and not isinstance(lst[0], (list, tuple)):
+            return 56 + 8 * len(lst)
+        if _rows_of_scalars(lst) and set(map(type, lst)) == {tuple}:
+            return 56 + 8 * len(lst)
+        return 56 + 8 * len(lst) + sum(sv_deep_copy_size(l) for l in lst)
+    return 0
+
 
 # Build string for showing in socket label
 def SvGetSocketInfo(socket):
@@ -78,27 +132,48 @@ def SvForgetSocket(socket):
     s_ng = socket.id_data.tree_id
     try:
         socket_data_cache[s_ng].pop(s_id, None)
+        socket_data_versions[s_ng].pop(s_id, None)
+        socket_data_hashes.get(s_ng, {}).pop(s_id, None)
     except KeyError:
         debug("it was never there")
 
 def SvSetSocket(socket, out):
     """sets socket data for socket"""
-    global socket_data_cache
+    set_socket_data(socket.id_data.tree_id, socket.socket_id, out)
 
-    s_id = socket.socket_id
-    s_ng = socket.id_data.tree_id
+
+def set_socket_data(s_ng, s_id, out):
+    """
+    sets socket data by tree id and socket id (see SvSocketCommon.socket_id),
+    for code which resolves sockets once and then writes data many times
+    """
+    global socket_data_cache
     try:
         socket_data_cache[s_ng][s_id] = out
     except KeyError:
         socket_data_cache[s_ng] = {}
         socket_data_cache[s_ng][s_id] = out
+    socket_data_versions.setdefault(s_ng, {})[s_id] = next(socket_data_version_counter)
+
+
+def get_socket_data(s_ng, s_id, default=sentinel):
+    """gets data written to output socket by tree id and socket id, without copying"""
+    try:
+        return socket_data_cache[s_ng][s_id]
+    except KeyError:
+        if default is sentinel:
+            raise SvNoDataError()
+        return default
 
 
 def SvGetSocket(socket, other=None, deepcopy=True):
     """gets socket data from socket,
-    if deep copy is True a deep copy is make_dep_dict,
+    if deep copy is True a copy of nested lists is made (see sv_deep_copy),
     to increase performance if the node doesn't mutate input
-    set to False and increase performance substanstilly
+    set to False and increase performance substanstilly.
+    The copy is made eagerly, there is no copy-on-write: tuples of scalars
+    and NumPy arrays are shared with the upstream node, so they must not
+    be changed in place even with deepcopy=True
     """
     global socket_data_cache
     try:
@@ -106,6 +181,8 @@ def SvGetSocket(socket, other=None, deepcopy=True):
         s_ng = other.id_data.tree_id
         out = socket_data_cache[s_ng][s_id]
         if deepcopy:
+            if socket_copy_statistics is not None:
+                record_socket_copy(socket, other, out)
             return sv_deep_copy(out)
         return out
 
@@ -115,6 +192,44 @@ def SvGetSocket(socket, other=None, deepcopy=True):
         raise SvNoDataError(socket)
 
 
+def record_socket_copy(socket, other, data):
+    key = (socket.id_data.name, other.node.name, other.name, socket.node.name, socket.name)
+    size = sv_deep_copy_size(data)
+    with socket_copy_statistics_lock:
+        if socket_copy_statistics is None:
+            return
+        item = socket_copy_statistics.setdefault(key, [0, 0])
+        item[0] += 1
+        item[1] += size
+
+def start_copy_statistics():
+    """
+    Start counting data copies made by sv_get(deepcopy=True) for each link.
+    """
+    global socket_copy_statistics
+    with socket_copy_statistics_lock:
+        socket_copy_statistics = {}
+
+def stop_copy_statistics():
+    """
+    Stop counting data copies.
+    Returns: dictionary (tree name, from node, from socket, to node, to socket) -> (number of copies, bytes copied).
+    """
+    global socket_copy_statistics
+    result = get_copy_statistics()
+    with socket_copy_statistics_lock:
+        socket_copy_statistics = None
+    return result
+
+def get_copy_statistics():
+    """
+    Returns: dictionary (tree name, from node, from socket, to node, to socket) -> (number of copies, bytes copied).
+    """
+    with socket_copy_statistics_lock:
+        if socket_copy_statistics is None:
+            return {}
+        return {key: tuple(value) for key, value in socket_copy_statistics.items()}
+
 class SvNoDataError(LookupError):
     def __init__(self, socket=None, node=None, msg=None):
 
@@ -172,6 +287,8 @@ def reset_socket_cache(ng):
     """
     global socket_data_cache
     socket_data_cache[ng.tree_id] = {}
+    socket_data_versions[ng.tree_id] = {}
+    socket_data_hashes[ng.tree_id] = {}
 
 def clear_all_socket_cache():
     """
@@ -179,3 +296,226 @@ def clear_all_socket_cache():
     """
     global socket_data_cache
     socket_data_cache.clear()
+    socket_data_versions.clear()
+    socket_data_hashes.clear()
+    node_output_cache.clear()
+
+#####################################
+# node outputs cache                #
+#####################################
+
+# Properties of sockets that are changed by the update system
+# itself and so should not be taken into account in fingerprints.
+FINGERPRINT_SKIP_PROPERTIES = {'rna_type', 'objects_number'}
+
+def estimate_data_size(data):
+    """
+    Rough estimation of memory used by socket data, in bytes.
+    """
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    if isinstance(data, (list, tuple)):
+        if not data:
+            return 64
+        if isinstance(data[0], (list, tuple, np.ndarray)):
+            return 64 + sum(estimate_data_size(item) for item in data)
+        return 64 + 8 * len(data)
+    return 64
+
+def _hashable_value(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, 'as_pointer'):
+        # pointers to Blender data-blocks or property groups
+        return ('pointer', value.as_pointer())
+    try:
+        return tuple(_hashable_value(item) for item in value)
+    except TypeError:
+        return repr(value)
+
+_base_properties_cache = {}
+
+def _base_properties(bpy_type):
+    """Names of properties that all nodes (or sockets) have, like location or color."""
+    names = _base_properties_cache.get(bpy_type)
+    if names is None:
+        names = {prop.identifier for prop in bpy_type.bl_rna.properties}
+        _base_properties_cache[bpy_type] = names
+    return names
+
+_fingerprint_properties_cache = {}
+
+def _fingerprint_properties(obj, base_properties):
+    """Names of properties of the node (or socket) class which are taken into fingerprint."""
+    names = _fingerprint_properties_cache.get(type(obj))
+    if names is None:
+        names = tuple(prop.identifier for prop in obj.bl_rna.properties
+                        if not prop.is_readonly
+                            and prop.identifier not in base_properties
+                            and prop.identifier not in FINGERPRINT_SKIP_PROPERTIES)
+        _fingerprint_properties_cache[type(obj)] = names
+    return names
+
+def _rna_properties_values(obj, base_properties):
+    return tuple((name, _hashable_value(getattr(obj, name))) for name in _fingerprint_properties(obj, base_properties))
+
+def data_hash(data):
+    """
+    Hash of content of socket data: digest of its pickled representation
+    (which is exact for numbers, unlike built-in hash()). Objects which
+    can not be pickled (like references to Blender data) are taken by identity.
+    """
+    try:
+        dump = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        if isinstance(data, (list, tuple)):
+            return tuple(data_hash(item) for item in data)
+        return ('id', id(data))
+    return hashlib.blake2b(dump, digest_size=16).digest()
+
+def get_socket_data_hash(s_ng, s_id):
+    """
+    Hash of content of data in the socket (see data_hash); it is computed
+    once for each version of socket data. Returns None if there is no data.
+    """
+    version = socket_data_versions.get(s_ng, {}).get(s_id)
+    if version is None:
+        return None
+    hashes = socket_data_hashes.setdefault(s_ng, {})
+    known = hashes.get(s_id)
+    if known is not None and known[0] == version:
+        return known[1]
+    value = data_hash(socket_data_cache[s_ng][s_id])
+    hashes[s_id] = (version, value)
+    return value
+
+def node_fingerprint(node):
+    """
+    Fingerprint of everything the node output depends on:
+    hashes of content of data in linked input sockets, values of node
+    properties and properties of unlinked input sockets, and which outputs
+    are linked. Upstream nodes write new data into their sockets on each
+    run, so data is compared by content, not by versions.
+    Returns None if some linked input has no data yet.
+    """
+    base_node_properties = _base_properties(bpy.types.Node)
+    base_socket_properties = _base_properties(bpy.types.NodeSocket)
+
+    tree = node.id_data
+    inputs = []
+    for socket in node.inputs:
+        if socket.is_linked:
+            other = socket.other
+            if other is None or not hasattr(other, 'socket_id'):
+                return None
+            content = get_socket_data_hash(tree.tree_id, other.socket_id)
+            if content is None:
+                return None
+            inputs.append((socket.identifier, content))
+        else:
+            inputs.append((socket.identifier, _rna_properties_values(socket, base_socket_properties)))
+    outputs = tuple(socket.is_linked for socket in node.outputs)
+    properties = _rna_properties_values(node, base_node_properties)
+    draft = getattr(tree, 'sv_draft', False)
+    return (tuple(inputs), outputs, properties, draft)
+
+class NodeOutputCache(object):
+    """
+    LRU cache of node outputs, keyed by node fingerprints.
+    When a node is about to be processed with the same inputs and properties
+    as in one of previous runs, the outputs of that run are put back into
+    socket cache (together with their versions, so that downstream nodes
+    can be skipped as well), and the node is not processed.
+    Total size of cached data is limited by memory_budget (in bytes).
+    """
+    def __init__(self, memory_budget=256 * 1024 * 1024):
+        self.memory_budget = memory_budget
+        self.entries = collections.OrderedDict()
+        self.total_size = 0
+        # per node: [hits, misses]
+        self.stats = collections.defaultdict(lambda: [0, 0])
+        # nodes can be processed in several threads, see update_system.do_update_parallel
+        self.lock = threading.Lock()
+
+    def _entry_key(self, node, fingerprint):
+        return (node.id_data.tree_id, node.node_id, fingerprint)
+
+    def restore(self, node, fingerprint):
+        """
+        Put cached outputs of the node back into socket cache.
+        Returns True if there was a cached entry for this fingerprint.
+        """
+        stats_key = (node.id_data.tree_id, node.node_id)
+        key = self._entry_key(node, fingerprint)
+        with self.lock:
+            stats = self.stats[stats_key]
+            entry = self.entries.get(key)
+            if entry is None:
+                stats[1] += 1
+                return False
+            stats[0] += 1
+            self.entries.move_to_end(key)
+        outputs, size = entry
+        s_ng = node.id_data.tree_id
+        data_cache = socket_data_cache.setdefault(s_ng, {})
+        versions = socket_data_versions.setdefault(s_ng, {})
+        for s_id, (data, version) in outputs.items():
+            data_cache[s_id] = data
+            versions[s_id] = version
+        return True
+
+    def store(self, node, fingerprint):
+        """
+        Remember current outputs of the node for this fingerprint.
+        """
+        s_ng = node.id_data.tree_id
+        data_cache = socket_data_cache.get(s_ng, {})
+        versions = socket_data_versions.get(s_ng, {})
+        outputs = dict()
+        size = 0
+        for socket in node.outputs:
+            s_id = socket.socket_id
+            if s_id in data_cache:
+                data = data_cache[s_id]
+                outputs[s_id] = (data, versions.get(s_id))
+                size += estimate_data_size(data)
+        if size > self.memory_budget:
+            return
+        key = self._entry_key(node, fingerprint)
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.total_size -= old[1]
+            self.entries[key] = (outputs, size)
+            self.total_size += size
+            while self.total_size > self.memory_budget and self.entries:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.total_size -= evicted_size
+
+    def get_stats(self, node):
+        """
+        Returns: tuple (hits, misses) for the node.
+        """
+        hits, misses = self.stats.get((node.id_data.tree_id, node.node_id), (0, 0))
+        return hits, misses
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_size = 0
+            self.stats.clear()
+
+node_output_cache = NodeOutputCache()
+
+def is_output_cacheable(node):
+    """
+    Outputs are cached only for nodes which declare that their outputs depend
+    only on their inputs and properties, and only if the tree has this enabled.
+    """
+    return getattr(node, 'sv_cacheable', False) and getattr(node.id_data, 'sv_output_cache', False)
+
+def get_node_cache_stats(node):
+    """
+    Returns: tuple (hits, misses) of outputs cache for the node.
+    """
+    return node_output_cache.get_stats(node)
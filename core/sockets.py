@@ -364,6 +364,7 @@ class SvSocketCommon(SvSocketProcessing):
         5. Raise no data error
         :param default: script default property
         :param deepcopy: in most cases should be False for efficiency but not in cases if input data will be modified
+            (nested lists are copied eagerly; NumPy arrays and tuples are shared even with deepcopy=True)
         :param implicit_conversions: if needed automatic conversion data from one socket type to another
         :return: data bound to the socket
         """
@@ -0,0 +1,174 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Telemetry of node tree updates.
+
+When "Record telemetry" is enabled for a tree, the update system writes
+a record for each processed node: when it was processed and for how long,
+how much data it has written to its outputs, and which exception it has
+raised, if any. Records are kept in a ring buffer of limited capacity,
+so the oldest records are dropped first.
+
+Records can be saved to JSON, CSV, or Chrome trace-event format (which can
+be opened in chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import collections
+import csv
+import json
+import threading
+
+from sverchok.core.socket_data import socket_data_cache, estimate_data_size
+from sverchok.utils.logging import info
+
+TelemetryRecord = collections.namedtuple('TelemetryRecord', [
+        'tree',      # tree name
+        'node',      # node name
+        'bl_idname', # node type
+        'run',       # number of tree update run
+        'start',     # time.perf_counter() at the start of processing, in seconds
+        'duration',  # processing time, in seconds
+        'thread',    # identifier of the thread which processed the node
+        'objects',   # number of objects written to outputs
+        'size',      # estimated size of data written to outputs, in bytes
+        'error'      # text of exception, or None
+    ])
+
+class TelemetryStore(object):
+    """
+    Ring buffer of TelemetryRecord.
+    """
+    def __init__(self, capacity=100000):
+        self.records = collections.deque(maxlen=capacity)
+        self.run_counter = 0
+        # nodes can be processed in several threads, see update_system.do_update_parallel
+        self.lock = threading.Lock()
+
+    @property
+    def capacity(self):
+        return self.records.maxlen
+
+    def new_run(self):
+        """
+        Get a number for the next tree update run.
+        """
+        with self.lock:
+            self.run_counter += 1
+            return self.run_counter
+
+    def record(self, node, run, start, duration, thread=None, error=None):
+        objects, size = output_data_sizes(node)
+        if thread is None:
+            thread = threading.get_ident()
+        record = TelemetryRecord(node.id_data.name, node.name, node.bl_idname,
+                    run, start, duration, thread, objects, size,
+                    None if error is None else repr(error))
+        with self.lock:
+            self.records.append(record)
+
+    def get_records(self, tree_name=None):
+        with self.lock:
+            records = list(self.records)
+        if tree_name is not None:
+            records = [record for record in records if record.tree == tree_name]
+        return records
+
+    def clear(self):
+        with self.lock:
+            self.records.clear()
+
+    def get_summary(self, tree_name=None):
+        """
+        Per-node summary: (tree, node) -> dictionary with number of runs,
+        total / mean / maximum processing time and number of errors.
+        """
+        summary = dict()
+        for record in self.get_records(tree_name):
+            key = (record.tree, record.node)
+            item = summary.get(key)
+            if item is None:
+                item = summary[key] = dict(bl_idname=record.bl_idname, count=0, total=0.0, max=0.0, errors=0)
+            item['count'] += 1
+            item['total'] += record.duration
+            item['max'] = max(item['max'], record.duration)
+            if record.error is not None:
+                item['errors'] += 1
+        for item in summary.values():
+            item['mean'] = item['total'] / item['count']
+        return summary
+
+    def dump_json(self, path, tree_name=None):
+        records = [record._asdict() for record in self.get_records(tree_name)]
+        with open(path, 'w') as output:
+            json.dump(records, output, indent=1)
+        info("%s telemetry records are written to %s", len(records), path)
+
+    def dump_csv(self, path, tree_name=None):
+        records = self.get_records(tree_name)
+        with open(path, 'w', newline='') as output:
+            writer = csv.writer(output)
+            writer.writerow(TelemetryRecord._fields)
+            writer.writerows(records)
+        info("%s telemetry records are written to %s", len(records), path)
+
+    def dump_chrome_trace(self, path, tree_name=None):
+        """
+        Write records in Chrome trace-event format; each tree is shown as a
+        separate process, each thread which processed nodes as a thread.
+        """
+        records = self.get_records(tree_name)
+        tree_ids = dict()
+        events = []
+        for record in records:
+            pid = tree_ids.get(record.tree)
+            if pid is None:
+                pid = tree_ids[record.tree] = len(tree_ids) + 1
+                events.append(dict(name="process_name", ph="M", pid=pid, args=dict(name=record.tree)))
+            args = dict(run=record.run, objects=record.objects, size=record.size)
+            if record.error is not None:
+                args['error'] = record.error
+            events.append(dict(name=record.node, cat=record.bl_idname, ph="X",
+                            ts=record.start * 1e6, dur=record.duration * 1e6,
+                            pid=pid, tid=record.thread, args=args))
+        with open(path, 'w') as output:
+            json.dump(dict(traceEvents=events, displayTimeUnit="ms"), output)
+        info("%s telemetry records are written to %s", len(records), path)
+
+    def dump(self, path, format='JSON', tree_name=None):
+        if format == 'JSON':
+            self.dump_json(path, tree_name)
+        elif format == 'CSV':
+            self.dump_csv(path, tree_name)
+        elif format == 'TRACE':
+            self.dump_chrome_trace(path, tree_name)
+        else:
+            raise Exception(f"Unsupported telemetry format: {format}")
+
+telemetry = TelemetryStore()
+
+def output_data_sizes(node):
+    """
+    Number of objects and estimated size in bytes of data,
+    which the node has written into its output sockets.
+    """
+    cache = socket_data_cache.get(node.id_data.tree_id)
+    if not cache:
+        return 0, 0
+    objects = 0
+    size = 0
+    for socket in node.outputs:
+        data = cache.get(socket.socket_id)
+        if data is None:
+            continue
+        if hasattr(data, '__len__'):
+            objects += len(data)
+        size += estimate_data_size(data)
+    return objects, size
+
+def is_telemetry_enabled(ng):
+    return getattr(ng, 'sv_telemetry', False) is True
@@ -17,7 +17,10 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import collections
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from itertools import chain
 
 import bpy
@@ -25,6 +28,8 @@ from mathutils import Vector
 
 from sverchok import data_structure
 from sverchok.core.socket_data import SvNoDataError, reset_socket_cache
+from sverchok.core.socket_data import node_output_cache, node_fingerprint, is_output_cacheable
+from sverchok.core.telemetry import telemetry, is_telemetry_enabled
 from sverchok.utils.logging import debug, info, warning, error, exception
 from sverchok.utils.profile import profile
 from sverchok.utils.exception_drawing_with_bgl import clear_exception_drawing_with_bgl, start_exception_drawing_with_bgl
@@ -54,6 +59,7 @@ def is_first_run():
 def clear_system_cache():
     print("cleaning Sverchok cache")
     clear_all_socket_cache()
+    clear_topology_cache()
     clear_nodes_id_dict()
     clear_link_memory()
 
@@ -67,6 +73,122 @@ def update_error_colors(self, context):
 update_cache = {}
 # cache for partial update lists
 partial_update_cache = {}
+# wall time of node sets evaluated by the parallel scheduler, per tree
+node_sets_timings = {}
+# dependency dicts and update lists per tree, valid while topology fingerprint is the same
+topology_cache = {}
+# statistics of topology cache usage, per tree
+topology_cache_statistics = collections.defaultdict(collections.Counter)
+
+WIFI_NODES = {'WifiInNode', 'WifiOutNode'}
+
+class TreeTopologyCache(object):
+    """
+    Dependency dictionaries and partial update lists of one tree.
+    They are valid while the topology fingerprint of the tree stays the same.
+    """
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        # down flag -> dependency dictionary
+        self.dep_dicts = {}
+        # (frozenset of node names, down flag) -> update list
+        self.update_lists = {}
+        # update lists of whole tree, as built by build_update_list(),
+        # and evaluation order key they were sorted with
+        self.tree_update_lists = None
+        self.tree_update_lists_order = None
+
+def tree_fingerprint(ng):
+    """
+    Topology fingerprint of the tree: names of nodes, links between nodes
+    and wifi variable names. It changes whenever update lists can change.
+    """
+    nodes = frozenset(ng.nodes.keys())
+    links = frozenset((link.from_node.name, link.to_node.name, link.is_hidden) for link in ng.links)
+    wifi = frozenset((node.name, node.bl_idname, node.var_name, bool(node.outputs))
+                     for node in ng.nodes.values() if node.bl_idname in WIFI_NODES)
+    return nodes, links, wifi
+
+def evaluation_order_key(ng):
+    """
+    What the order of node sets built by separate_nodes() depends on besides
+    the topology: evaluation order option and, for X / Y order, node locations.
+    """
+    sorting_type = getattr(ng, "sv_subtree_evaluation_order", None)
+    if sorting_type in {'X', 'Y'}:
+        return sorting_type, tuple((name, tuple(node.absolute_location)) for name, node in ng.nodes.items())
+    return sorting_type
+
+def get_topology_cache(ng):
+    """
+    Get TreeTopologyCache of the tree. The cache is dropped
+    if the tree topology fingerprint has changed.
+    """
+    statistics = topology_cache_statistics[ng.name]
+    start = time.perf_counter()
+    fingerprint = tree_fingerprint(ng)
+    statistics['fingerprint_time'] += time.perf_counter() - start
+    statistics['fingerprints'] += 1
+
+    cache = topology_cache.get(ng.name)
+    if cache is None or cache.fingerprint != fingerprint:
+        if cache is not None:
+            statistics['invalidations'] += 1
+            debug("Topology of tree %s has changed, dropping cached update lists", ng.name)
+        cache = TreeTopologyCache(fingerprint)
+        topology_cache[ng.name] = cache
+    return cache
+
+def get_dep_dict(ng, down=False, cache=None):
+    """
+    Cached version of make_dep_dict(). The returned dictionary is a plain dict,
+    so nodes without dependencies have to be looked up with .get(name, ()).
+    It must not be modified.
+    """
+    if cache is None:
+        cache = get_topology_cache(ng)
+    statistics = topology_cache_statistics[ng.name]
+    deps = cache.dep_dicts.get(down)
+    if deps is None:
+        statistics['dep_dict_misses'] += 1
+        start = time.perf_counter()
+        # plain dict, defaultdict would get new keys on lookups
+        deps = dict(make_dep_dict(ng, down))
+        statistics['build_time'] += time.perf_counter() - start
+        cache.dep_dicts[down] = deps
+    else:
+        statistics['dep_dict_hits'] += 1
+    return deps
+
+def get_topology_cache_stats(ng):
+    """
+    Statistics of topology cache usage for the tree, as dictionary.
+    """
+    statistics = dict(topology_cache_statistics[ng.name])
+    cache = topology_cache.get(ng.name)
+    if cache is not None:
+        nodes, links, wifi = cache.fingerprint
+        statistics.update(nodes = len(nodes), links = len(links),
+                          cached_update_lists = len(cache.update_lists))
+    return statistics
+
+def dump_topology_cache_statistics():
+    """
+    Log statistics of topology cache usage for all trees.
+    """
+    lines = []
+    for ng in sverchok_trees():
+        if ng.name in topology_cache_statistics:
+            statistics = get_topology_cache_stats(ng)
+            values = ", ".join(f"{key}: {value:.4f}" if isinstance(value, float) else f"{key}: {value}"
+                               for key, value in sorted(statistics.items()))
+            lines.append(f"{ng.name}: {values}")
+    if lines:
+        info("Topology cache statistics:\n" + "\n".join(lines))
+
+def clear_topology_cache():
+    topology_cache.clear()
+    topology_cache_statistics.clear()
 
 
 def make_dep_dict(node_tree, down=False):
@@ -136,7 +258,7 @@ def make_update_list(node_tree, node_set=None, dependencies=None):
     else:
         return []
     if not dependencies:
-        deps = make_dep_dict(ng)
+        deps = get_dep_dict(ng)
     else:
         deps = dependencies
 
@@ -148,7 +270,7 @@ def make_update_list(node_tree, node_set=None, dependencies=None):
     node_count = len(node_set)
     while node_count > len(out):
         node_dependencies = True
-        for dep_name in deps[name]:
+        for dep_name in deps.get(name, ()):
             if dep_name in node_set and dep_name not in out:
                 tree_stack_append(name)
                 name = dep_name
@@ -173,7 +295,7 @@ def make_update_list(node_tree, node_set=None, dependencies=None):
     return list(out.keys())
 
 
-def separate_nodes(ng, links=None):
+def separate_nodes(ng, links=None, cache=None):
     '''
     Separate a node group (layout) into unconnected parts
     Arguments: Node group
@@ -182,8 +304,10 @@ def separate_nodes(ng, links=None):
     nodes = set(ng.nodes.keys())
     if not nodes:
         return []
-    node_links = make_dep_dict(ng)
-    down = make_dep_dict(ng, down=True)
+    node_links = collections.defaultdict(set)
+    for name, links in get_dep_dict(ng, cache=cache).items():
+        node_links[name].update(links)
+    down = get_dep_dict(ng, down=True, cache=cache)
     for name, links in down.items():
         node_links[name].update(links)
     n = nodes.pop()
@@ -229,15 +353,23 @@ def make_tree_from_nodes(node_names, tree, down=True):
         warning("No nodes!")
         return make_update_list(ng)
 
+    cache = get_topology_cache(ng)
+    statistics = topology_cache_statistics[ng.name]
+    key = (frozenset(node_names), down)
+    update_list = cache.update_lists.get(key)
+    if update_list is not None:
+        statistics['update_list_hits'] += 1
+        return list(update_list)
+    statistics['update_list_misses'] += 1
+
     out_set = set(node_names)
 
     out_stack = collections.deque(node_names)
     current_node = out_stack.pop()
 
-    # build downwards links, this should be cached perhaps
-    node_links = make_dep_dict(ng, down)
+    node_links = get_dep_dict(ng, down, cache=cache)
     while current_node:
-        for node in node_links[current_node]:
+        for node in node_links.get(current_node, ()):
             if node not in out_set:
                 out_set.add(node)
                 out_stack.append(node)
@@ -247,9 +379,11 @@ def make_tree_from_nodes(node_names, tree, down=True):
             current_node = ''
 
     if len(out_set) == 1:
-        return list(out_set)
+        update_list = list(out_set)
     else:
-        return make_update_list(ng, out_set)
+        update_list = make_update_list(ng, out_set, get_dep_dict(ng, cache=cache))
+    cache.update_lists[key] = update_list
+    return list(update_list)
 
 
 # to make update tree based on node types and node names bases
@@ -358,6 +492,23 @@ def reset_error_nodes(ng):
         del ng["error nodes"]
 
 
+def process_node(node):
+    """
+    Process the node, or, if outputs caching is enabled, restore it's outputs
+    from previous run with the same inputs and properties.
+    """
+    if not hasattr(node, "process"):
+        return
+    if is_output_cacheable(node):
+        fingerprint = node_fingerprint(node)
+        if fingerprint is not None:
+            if node_output_cache.restore(node, fingerprint):
+                return
+            node.process()
+            node_output_cache.store(node, fingerprint)
+            return
+    node.process()
+
 @profile(section="UPDATE")
 def do_update_general(node_list, nodes, procesed_nodes=set()):
     """
@@ -370,6 +521,7 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
     
     total_time = 0
     done_nodes = set(procesed_nodes)
+    run = telemetry.new_run() if is_telemetry_enabled(nodes.id_data) else None
 
     # this is a no-op if no bgl being drawn.
     clear_exception_drawing_with_bgl(nodes)
@@ -377,17 +529,18 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
     for node_name in node_list:
         if node_name in done_nodes:
             continue
+        start = time.perf_counter()
         try:
             node = nodes[node_name]
-            start = time.perf_counter()
-            if hasattr(node, "process"):
-                node.process()
+            process_node(node)
 
             delta = time.perf_counter() - start
             total_time += delta
 
             if data_structure.DEBUG_MODE:
                 debug("Processed  %s in: %.4f", node_name, delta)
+            if run is not None:
+                telemetry.record(node, run, start, delta)
 
             timings.append(delta)
             gather({"name" : node_name, "bl_idname": node.bl_idname, "start": start, "duration": delta})
@@ -398,6 +551,8 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
 
         except Exception as err:
             ng = nodes.id_data
+            if run is not None and node_name in nodes:
+                telemetry.record(nodes[node_name], run, start, time.perf_counter() - start, error=err)
             update_error_nodes(ng, node_name, err)
             #traceback.print_tb(err.__traceback__)
             exception("Node %s had exception: %s", node_name, err)
@@ -417,9 +572,200 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
     return timings
 
 
+def is_thread_safe(node):
+    """
+    Nodes declare that their computation can be done outside of the main
+    thread by setting `sv_thread_safe = True` class attribute. Such node splits
+    it's processing into three methods:
+
+    * process_read(self) - called in the main thread; reads input sockets and
+      properties and returns everything the computation needs;
+    * process_compute(data) - a static method, called in a worker thread;
+      must not access Blender data, and must return the result;
+    * process_write(self, result) - called in the main thread; writes
+      the result into output sockets.
+
+    process() of such node is usually just
+    self.process_write(self.process_compute(self.process_read())).
+    """
+    return getattr(node, 'sv_thread_safe', False) and hasattr(node, 'process_compute')
+
+def process_node_timed(node):
+    start = time.perf_counter()
+    process_node(node)
+    return start, time.perf_counter() - start, threading.get_ident()
+
+def compute_timed(compute, data):
+    start = time.perf_counter()
+    result = compute(data)
+    return result, time.perf_counter() - start, threading.get_ident()
+
+@profile(section="UPDATE")
+def do_update_parallel(node_lists, nodes):
+    """
+    Update several node sets, which do not depend on each other.
+    Computation of nodes declared as thread-safe (see is_thread_safe) is done
+    in a thread pool, as soon as all nodes they depend on are processed; so
+    independent node sets, as well as independent branches inside one set, are
+    evaluated concurrently. Reading of inputs and writing of outputs of such
+    nodes, as well as processing of all other nodes (for example, the ones that
+    touch Blender data), is done in the main thread.
+
+    An exception in a node stops evaluation of that node set only.
+    Returns: list of wall times of node sets (None for failed sets).
+    """
+    global graphs
+    ng = nodes.id_data
+    deps = get_dep_dict(ng)
+    run = telemetry.new_run() if is_telemetry_enabled(ng) else None
+
+    set_index = dict()
+    for i, node_list in enumerate(node_lists):
+        for name in node_list:
+            set_index[name] = i
+
+    # Dependencies that are not in the update lists are considered already processed
+    waiting = dict()
+    dependents = collections.defaultdict(list)
+    for name, i in set_index.items():
+        waiting[name] = {dep for dep in deps.get(name, ()) if set_index.get(dep) == i}
+        for dep in waiting[name]:
+            dependents[dep].append(name)
+
+    set_graphs = [[] for node_list in node_lists]
+    set_start = [None for node_list in node_lists]
+    set_end = [None for node_list in node_lists]
+    errors = dict()
+
+    ready_main = collections.deque()
+    ready_pool = collections.deque()
+
+    def make_ready(name):
+        if set_index[name] in errors:
+            return
+        if is_thread_safe(nodes[name]):
+            ready_pool.append(name)
+        else:
+            ready_main.append(name)
+
+    def on_done(name, start, delta, thread):
+        i = set_index[name]
+        node = nodes[name]
+        if run is not None:
+            telemetry.record(node, run, start, delta, thread=thread)
+        if set_start[i] is None or start < set_start[i]:
+            set_start[i] = start
+        set_end[i] = max(set_end[i] or start, start + delta)
+        set_graphs[i].append({"name" : name, "bl_idname": node.bl_idname, "start": start, "duration": delta})
+        if data_structure.DEBUG_MODE:
+            debug("Processed  %s in: %.4f", name, delta)
+        [s.update_objects_number() for s in chain(node.inputs, node.outputs) if hasattr(s, 'update_objects_number')]
+        for other in dependents[name]:
+            waiting[other].discard(name)
+            if not waiting[other]:
+                make_ready(other)
+
+    def on_error(name, err):
+        i = set_index[name]
+        errors[i] = (name, err, traceback.format_exc())
+        if run is not None:
+            telemetry.record(nodes[name], run, time.perf_counter(), 0.0, error=err)
+        exception("Node %s had exception: %s", name, err)
+
+    # this is a no-op if no bgl being drawn.
+    clear_exception_drawing_with_bgl(nodes)
+
+    for node_list in node_lists:
+        for name in node_list:
+            if not waiting[name]:
+                make_ready(name)
+
+    max_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = dict()
+        while ready_main or ready_pool or running:
+            while ready_pool:
+                name = ready_pool.popleft()
+                if set_index[name] in errors:
+                    continue
+                node = nodes[name]
+                start = time.perf_counter()
+                try:
+                    fingerprint = node_fingerprint(node) if is_output_cacheable(node) else None
+                    if fingerprint is not None and node_output_cache.restore(node, fingerprint):
+                        on_done(name, start, time.perf_counter() - start, threading.get_ident())
+                        continue
+                    data = node.process_read()
+                except Exception as err:
+                    on_error(name, err)
+                    continue
+                read_time = time.perf_counter() - start
+                future = executor.submit(compute_timed, type(node).process_compute, data)
+                running[future] = (name, start, read_time, fingerprint)
+            if ready_main:
+                name = ready_main.popleft()
+                if set_index[name] in errors:
+                    continue
+                try:
+                    start, delta, thread = process_node_timed(nodes[name])
+                except Exception as err:
+                    on_error(name, err)
+                    continue
+                on_done(name, start, delta, thread)
+            elif running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, start, read_time, fingerprint = running.pop(future)
+                    try:
+                        result, compute_time, thread = future.result()
+                        write_start = time.perf_counter()
+                        node = nodes[name]
+                        node.process_write(result)
+                        if fingerprint is not None:
+                            node_output_cache.store(node, fingerprint)
+                        write_time = time.perf_counter() - write_start
+                    except Exception as err:
+                        on_error(name, err)
+                        continue
+                    # time spent waiting in the pool queue is not node's time
+                    on_done(name, start, read_time + compute_time + write_time, thread)
+
+    for name, err, error_text in errors.values():
+        update_error_nodes(ng, name, err)
+        if hasattr(ng, "sv_show_error_in_tree"):
+            if ng.sv_show_error_in_tree:
+                start_exception_drawing_with_bgl(ng, name, error_text, err)
+
+    wall_times = []
+    for i, node_list in enumerate(node_lists):
+        if i in errors or set_start[i] is None:
+            wall_times.append(None)
+            continue
+        graphs.append(set_graphs[i])
+        wall_time = set_end[i] - set_start[i]
+        wall_times.append(wall_time)
+        if data_structure.DEBUG_MODE:
+            busy_time = sum(item["duration"] for item in set_graphs[i])
+            debug("Node set #%s (%s nodes) updated in: %.4f seconds, sum of node times: %.4f seconds",
+                    i, len(node_list), wall_time, busy_time)
+
+    node_sets_timings[ng.name] = wall_times
+    return wall_times
+
+def get_node_sets_timings(ng):
+    """
+    Wall times of node sets, measured during last parallel update of the tree.
+    """
+    return node_sets_timings.get(ng.name, [])
+
+def is_parallel_update(nodes):
+    return getattr(nodes.id_data, 'sv_parallel_update', False)
+
 def do_update(node_list, nodes):
     if data_structure.HEAT_MAP:
         do_update_heat_map(node_list, nodes)
+    elif is_parallel_update(nodes):
+        do_update_parallel([node_list], nodes)
     else:
         do_update_general(node_list, nodes)
 
@@ -437,9 +783,19 @@ def build_update_list(ng=None):
         for ng in sverchok_trees():
             build_update_list(ng)
     else:
-        node_sets = separate_nodes(ng)
-        deps = make_dep_dict(ng)
+        cache = get_topology_cache(ng)
+        order = evaluation_order_key(ng)
+        if cache.tree_update_lists is not None and update_cache.get(ng.name) is cache.tree_update_lists \
+                and cache.tree_update_lists_order == order:
+            # neither topology nor order of node sets has changed since the lists were built
+            topology_cache_statistics[ng.name]['rebuilds_skipped'] += 1
+            return
+        topology_cache_statistics[ng.name]['rebuilds'] += 1
+        node_sets = separate_nodes(ng, cache=cache)
+        deps = get_dep_dict(ng, cache=cache)
         out = [make_update_list(ng, s, deps) for s in node_sets]
+        cache.tree_update_lists = out
+        cache.tree_update_lists_order = order
         update_cache[ng.name] = out
         partial_update_cache[ng.name] = {}
         # reset_socket_cache(ng)
@@ -533,8 +889,11 @@ def process_tree(ng=None):
         if not update_list:
             build_update_list(ng)
             update_list = update_cache.get(ng.name)
-        for l in update_list:
-            do_update(l, ng.nodes)
+        if is_parallel_update(ng.nodes) and not data_structure.HEAT_MAP:
+            do_update_parallel(update_list, ng.nodes)
+        else:
+            for l in update_list:
+                do_update(l, ng.nodes)
     else:
         pass
 
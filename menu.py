@@ -34,6 +34,7 @@ from sverchok.ui.sv_icons import node_icon, icon
 from sverchok.utils.context_managers import sv_preferences
 from sverchok.utils.extra_categories import get_extra_categories
 from sverchok.core.update_system import set_first_run
+from sverchok.core import lazy_nodes
 from sverchok.ui.presets import apply_default_preset
 from sverchok.utils.sv_json_import import JSONImporter
 
@@ -243,6 +244,7 @@ class SverchNodeItem(object):
                 # SverchNodeItem instance.
                 operator.use_transform = True
                 operator.type = self.nodetype
+                lazy_nodes.ensure_registered([self.nodetype])
                 node = operator.create_node(context)
                 apply_default_preset(node)
                 return {'FINISHED'}
@@ -206,6 +206,24 @@ class SverchCustomTree(NodeTree, SvNodeTreeCommon):
         default="None", update=lambda s, c: process_tree(s), options=set()
     )
 
+    # evaluate independent parts of the tree concurrently, see update_system.do_update_parallel
+    sv_parallel_update: BoolProperty(
+        name="Parallel update",
+        description="Process thread-safe nodes of independent node sets and branches in a thread pool",
+        default=False, update=lambda s, c: process_tree(s), options=set())
+
+    # skip nodes whose inputs and properties did not change, see socket_data.NodeOutputCache
+    sv_output_cache: BoolProperty(
+        name="Cache outputs",
+        description="Reuse outputs of nodes processed earlier with the same inputs and properties",
+        default=False, update=lambda s, c: process_tree(s), options=set())
+
+    # record timings, output sizes and exceptions of nodes, see core/telemetry.py
+    sv_telemetry: BoolProperty(
+        name="Record telemetry",
+        description="Record processing time, output data size and exceptions of each node into telemetry buffer",
+        default=False, options=set())
+
     # this mode will replace properties of some nodes so they could have lesser values for draft mode
     sv_draft: BoolProperty(
         name="Draft",
@@ -487,6 +505,15 @@ class SverchCustomTreeNode(UpdateNodes, NodeUtils):
     """Base class for all nodes"""
     _docstring = None  # A cache for docstring property
 
+    # Nodes which split process() into process_read / process_compute / process_write
+    # (see core.update_system.is_thread_safe) can set this to True; computation of
+    # such nodes is done in a thread pool when parallel update is enabled in the tree.
+    sv_thread_safe = False
+
+    # Nodes which outputs depend only on their inputs and properties can set this to True;
+    # such nodes are not processed again for the same inputs when outputs cache is enabled in the tree.
+    sv_cacheable = False
+
     @classproperty
     def docstring(cls):
         """
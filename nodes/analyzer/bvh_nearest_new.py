@@ -21,6 +21,7 @@ from bpy.props import EnumProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, match_long_cycle as C)
 from mathutils.bvhtree import BVHTree
+from sverchok.utils.triangle_bvh import SvTriangleBVH
 
 
 class SvBVHnearNewNode(bpy.types.Node, SverchCustomTreeNode):
@@ -56,14 +57,22 @@ class SvBVHnearNewNode(bpy.types.Node, SverchCustomTreeNode):
         for vertices, polygons in zip(*C([vsock.sv_get(), fsock.sv_get()])):
             yield BVHTree.FromPolygons(vertices, polygons, all_triangles=False, epsilon=0.0)
 
+    @staticmethod
+    def svmesh_to_triangle_bvh_lists(vsock, fsock):
+        for vertices, polygons in zip(*C([vsock.sv_get(), fsock.sv_get()])):
+            yield SvTriangleBVH(vertices, polygons)
+
     def process(self):
         vert_sock, face_sock, point_sock = self.inputs
         L, N, I, D = self.outputs
         RL = []
         PT = point_sock.sv_get()
         if self.mode == 'find_nearest':
-            for bvh, pt in zip(self.svmesh_to_bvh_lists(vert_sock, face_sock), PT):
-                RL.append([bvh.find_nearest(P) for P in pt])
+            # all points of an object are processed in one batch
+            for bvh, pt in zip(self.svmesh_to_triangle_bvh_lists(vert_sock, face_sock), PT):
+                locations, normals, indices, distances = bvh.find_nearest(pt)
+                RL.append(list(zip(map(tuple, locations.tolist()), map(tuple, normals.tolist()),
+                                   indices.tolist(), distances.tolist())))
         else:  # find_nearest_range
             for bvh, pt in zip(self.svmesh_to_bvh_lists(vert_sock, face_sock), PT):
                 RL.extend([bvh.find_nearest_range(P) for P in pt])
@@ -16,10 +16,11 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+
 import bpy
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, match_long_cycle as C)
-from mathutils.bvhtree import BVHTree
+from sverchok.utils.triangle_bvh import SvTriangleBVH
 
 # zeffii 2017 8 okt
 # airlifted from Kosvor's Raycast nodes..
@@ -52,7 +53,7 @@ class SvRaycasterLiteNode(bpy.types.Node, SverchCustomTreeNode):
     @staticmethod
     def svmesh_to_bvh_lists(v, f):
         for vertices, polygons in zip(*C([v, f])):
-            yield BVHTree.FromPolygons(vertices, polygons, all_triangles=False, epsilon=0.0)
+            yield SvTriangleBVH(vertices, polygons)
 
     def process(self):
         L, N, I, D, S = self.outputs
@@ -62,18 +63,23 @@ class SvRaycasterLiteNode(bpy.types.Node, SverchCustomTreeNode):
 
         for bvh, st, di in zip(*[self.svmesh_to_bvh_lists(vert_in, face_in), start_in, direction_in]):
             st, di = C([st, di])
-            RL.append([bvh.ray_cast(i, i2) for i, i2 in zip(st, di)])
+            locations, normals, indices, distances = bvh.ray_cast(st, di)
+            success = indices >= 0
+            locations[~success] = 0
+            normals[~success] = 0
+            distances[~success] = 0
+            RL.append((locations, normals, indices, distances, success))
 
         if L.is_linked:
-            L.sv_set([[r[0][:] if r[0] else (0, 0, 0) for r in L] for L in RL])
+            L.sv_set([[tuple(v) for v in r[0].tolist()] for r in RL])
         if N.is_linked:
-            N.sv_set([[r[1][:] if r[1] else (0, 0, 0) for r in L] for L in RL])
+            N.sv_set([[tuple(v) for v in r[1].tolist()] for r in RL])
         if I.is_linked:
-            I.sv_set([[r[2] if r[2] else -1 for r in L] for L in RL])
+            I.sv_set([r[2].tolist() for r in RL])
         if D.is_linked:
-            D.sv_set([[r[3] if r[3] else 0 for r in L] for L in RL])
+            D.sv_set([r[3].tolist() for r in RL])
         if S.is_linked:
-            S.sv_set([[r[2] != None for r in L] for L in RL])
+            S.sv_set([r[4].tolist() for r in RL])
 
 
 def register():
@@ -5,7 +5,7 @@ import bpy
 from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat, ensure_nesting_level
+from sverchok.data_structure import updateNode, zip_long_repeat, ensure_nesting_level, throttle_and_update_node
 
 class SvCurveLengthNode(bpy.types.Node, SverchCustomTreeNode):
     """
@@ -44,16 +44,33 @@ class SvCurveLengthNode(bpy.types.Node, SverchCustomTreeNode):
         items = modes,
         update = updateNode)
 
+    @throttle_and_update_node
+    def update_sockets(self, context):
+        self.inputs['Resolution'].hide_safe = self.method != 'POLYLINE'
+
+    methods = [
+        ('POLYLINE', "Polyline", "Calculate length of polyline with specified resolution", 0),
+        ('ADAPTIVE', "Adaptive", "Adaptive Gauss-Legendre integration; the length table is cached in the curve object", 1)
+    ]
+
+    method : EnumProperty(
+        name = "Method",
+        default = 'POLYLINE',
+        items = methods,
+        update = update_sockets)
+
     def sv_init(self, context):
         self.inputs.new('SvCurveSocket', "Curve")
         self.inputs.new('SvStringsSocket', "TMin").prop_name = 't_min'
         self.inputs.new('SvStringsSocket', "TMax").prop_name = 't_max'
         self.inputs.new('SvStringsSocket', "Resolution").prop_name = 'resolution'
         self.outputs.new('SvStringsSocket', "Length")
+        self.update_sockets(context)
 
     def draw_buttons(self, context, layout):
         layout.label(text='T mode:')
         layout.prop(self, 'mode', expand=True)
+        layout.prop(self, 'method', text='')
 
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
@@ -79,6 +96,8 @@ class SvCurveLengthNode(bpy.types.Node, SverchCustomTreeNode):
 
                 if t_min >= t_max:
                     length = 0.0
+                elif self.method == 'ADAPTIVE':
+                    length = curve.calc_length(t_min, t_max)
                 else:
                     # "resolution" is for whole range of curve;
                     # take only part of it which corresponds to t_min...t_max segment.
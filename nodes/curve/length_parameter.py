@@ -39,7 +39,8 @@ class SvCurveLengthParameterNode(DraftMode, bpy.types.Node, SverchCustomTreeNode
         update = updateNode)
 
     modes = [('SPL', 'Cubic', "Cubic Spline", 0),
-             ('LIN', 'Linear', "Linear Interpolation", 1)]
+             ('LIN', 'Linear', "Linear Interpolation", 1),
+             ('ADAPTIVE', 'Adaptive', "Adaptive Gauss-Legendre integration; the length table is cached in the curve object. Resolution is not used", 2)]
 
     mode: EnumProperty(name='Interpolation mode', default="SPL", items=modes, update=updateNode)
 
@@ -24,6 +24,7 @@ from sverchok.utils.field.vector import (SvVectorFieldPointDistance,
             SvSelectVectorField)
 from sverchok.utils.math import all_falloff_types, falloff_array
 from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.triangle_bvh import SvTriangleBVH
 
 class SvAttractorFieldNodeMk2(bpy.types.Node, SverchCustomTreeNode):
     """
@@ -228,8 +229,9 @@ class SvAttractorFieldNodeMk2(bpy.types.Node, SverchCustomTreeNode):
 
     def to_mesh(self, verts, faces, falloff):
         bvh = bvhtree.BVHTree.FromPolygons(verts, faces)
-        sfield = SvBvhAttractorScalarField(bvh=bvh, falloff=falloff, signed=self.signed)
-        vfield = SvBvhAttractorVectorField(bvh=bvh, falloff=falloff)
+        triangle_bvh = SvTriangleBVH(verts, faces)
+        sfield = SvBvhAttractorScalarField(bvh=bvh, falloff=falloff, signed=self.signed, triangle_bvh=triangle_bvh)
+        vfield = SvBvhAttractorVectorField(bvh=bvh, falloff=falloff, triangle_bvh=triangle_bvh)
         return vfield, sfield
 
     def to_edges(self, verts, edges, falloff):
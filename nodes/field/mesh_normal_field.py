@@ -18,6 +18,7 @@ from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.logging import info, exception
 from sverchok.utils.field.vector import SvBvhAttractorVectorField
 from sverchok.utils.field.rbf import SvBvhRbfNormalVectorField
+from sverchok.utils.triangle_bvh import SvTriangleBVH
 from sverchok.dependencies import scipy
 from sverchok.utils.math import rbf_functions
 
@@ -89,7 +90,7 @@ class SvExMeshNormalFieldNode(bpy.types.Node, SverchCustomTreeNode):
                         function = self.function,
                         mode = 'N-D')
 
-                field = SvBvhRbfNormalVectorField(bvh, rbf)
+                field = SvBvhRbfNormalVectorField(bvh, rbf, triangle_bvh=SvTriangleBVH(vertices, faces))
             else:
                 field = SvBvhAttractorVectorField(verts=vertices, faces=faces, use_normal=True, signed_normal=self.signed)
             fields_out.append(field)
@@ -6,8 +6,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, St
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, throttle_and_update_node, match_long_repeat
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
-from sverchok.utils.script_importhelper import safe_names_np
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled, compile_vectorized
 from sverchok.utils.logging import info, exception
 from sverchok.utils.math import (
         from_cylindrical, from_spherical,
@@ -97,11 +96,11 @@ class SvScalarFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         return function
 
     def make_function_vector(self, variables):
-        compiled = sv_compile(self.formula)
+        evaluate = compile_vectorized(self.formula)
 
         def carthesian(x, y, z, V):
             variables.update(dict(x=x, y=y, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+            r = evaluate(variables)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -109,7 +108,7 @@ class SvScalarFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         def cylindrical(x, y, z, V):
             rho, phi, z = to_cylindrical_np((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+            r = evaluate(variables)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -117,7 +116,7 @@ class SvScalarFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         def spherical(x, y, z, V):
             rho, phi, theta = to_spherical_np((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+            r = evaluate(variables)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -6,8 +6,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, St
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, throttle_and_update_node, match_long_repeat
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
-from sverchok.utils.script_importhelper import safe_names_np
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled, compile_vectorized
 from sverchok.utils.logging import info, exception
 from sverchok.utils.math import (
         from_cylindrical, from_spherical,
@@ -130,9 +129,9 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         return function
 
     def make_function_vector(self, variables):
-        compiled1 = sv_compile(self.formula1)
-        compiled2 = sv_compile(self.formula2)
-        compiled3 = sv_compile(self.formula3)
+        evaluate1 = compile_vectorized(self.formula1)
+        evaluate2 = compile_vectorized(self.formula2)
+        evaluate3 = compile_vectorized(self.formula3)
 
         if self.output_mode == 'XYZ':
             def out_coordinates(x, y, z):
@@ -146,9 +145,9 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
         def carthesian_in(x, y, z, V):
             variables.update(dict(x=x, y=y, z=z, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            v1 = evaluate1(variables)
+            v2 = evaluate2(variables)
+            v3 = evaluate3(variables)
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(x, v1)
             if not isinstance(v2, np.ndarray):
@@ -160,9 +159,9 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         def cylindrical_in(x, y, z, V):
             rho, phi, z = to_cylindrical_np((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            v1 = evaluate1(variables)
+            v2 = evaluate2(variables)
+            v3 = evaluate3(variables)
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(x, v1)
             if not isinstance(v2, np.ndarray):
@@ -174,9 +173,9 @@ class SvVectorFieldFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         def spherical_in(x, y, z, V):
             rho, phi, theta = to_spherical_np((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            v1 = evaluate1(variables)
+            v2 = evaluate2(variables)
+            v3 = evaluate3(variables)
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(x, v1)
             if not isinstance(v2, np.ndarray):
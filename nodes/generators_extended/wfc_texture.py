@@ -34,8 +34,8 @@ class SvWFCTextureNode(bpy.types.Node, SverchCustomTreeNode):
     bl_icon = 'FORCE_FORCE'
 
     image_name: bpy.props.StringProperty(name="Image", default="", update=updateNode, description="Sample image")
-    height: bpy.props.IntProperty(default=10, min=1, max=100, update=updateNode, description="For output image")
-    width: bpy.props.IntProperty(default=10, min=1, max=100, update=updateNode, description="For output image")
+    height: bpy.props.IntProperty(default=10, min=1, soft_max=256, update=updateNode, description="For output image")
+    width: bpy.props.IntProperty(default=10, min=1, soft_max=256, update=updateNode, description="For output image")
     seed: bpy.props.IntProperty(update=updateNode)
     pattern_size: bpy.props.IntProperty(default=3, min=1, max=5, update=updateNode, description="Usually 2 or 3")
     rotate_patterns: bpy.props.BoolProperty(update=updateNode, description="More complex result")
@@ -31,6 +31,8 @@ from mathutils.noise import seed_set, random
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.core.update_system import make_tree_from_nodes, do_update
+from sverchok.utils.evolver_workers import SvEvolverWorkerPool, genome_key
+from sverchok.utils.logging import info as log_info, warning
 from sverchok.utils.listutils import (
     listinput_getI,
     listinput_getF,
@@ -416,6 +418,25 @@ class Population:
         self.update_list = make_tree_from_nodes([g.name for g in self.genes], tree)
         self.population_g = []
         self.init_population(node.population_n)
+        # genome key -> fitness, genomes already evaluated are not evaluated again
+        self.fitness_cache = {}
+        self.evaluations = 0
+        self.cache_hits = 0
+        self.evaluation_time = 0.0
+        self.pool = None
+
+    def start_workers(self, workers):
+        '''evaluate fitness in background Blender processes instead of this session'''
+        try:
+            self.pool = SvEvolverWorkerPool(self.tree, self.node, self.genes, workers)
+        except OSError as e:
+            warning("Evolver: could not start worker processes (%s), evaluating in this session", e)
+            self.pool = None
+
+    def stop_workers(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
 
 
     def init_population(self, population_n):
@@ -439,11 +460,38 @@ class Population:
                 self.population_g.append(DNA(self.genes))
 
     def  evaluate_fitness_g(self):
-        try:
-            for agent in self.population_g:
-                agent.evaluate_fitness(self.tree, self.update_list, self.node)
-        finally:
-            self.tree.sv_process = True
+        start = time.perf_counter()
+        # agents with genomes which were not evaluated yet, by genome key
+        pending = {}
+        for agent in self.population_g:
+            key = genome_key(agent.genes)
+            if key in self.fitness_cache:
+                agent.fitness = self.fitness_cache[key]
+                self.cache_hits += 1
+            else:
+                pending.setdefault(key, []).append(agent)
+
+        if self.pool is not None:
+            fitness = self.pool.evaluate([agents[0].genes for agents in pending.values()])
+        else:
+            fitness = []
+            try:
+                for agents in pending.values():
+                    agents[0].evaluate_fitness(self.tree, self.update_list, self.node)
+                    fitness.append(agents[0].fitness)
+            finally:
+                self.tree.sv_process = True
+
+        for (key, agents), agent_fitness in zip(pending.items(), fitness):
+            self.fitness_cache[key] = agent_fitness
+            for agent in agents:
+                agent.fitness = agent_fitness
+        self.evaluations += len(pending)
+        self.evaluation_time += time.perf_counter() - start
+
+    def evaluations_per_second(self):
+        return self.evaluations / self.evaluation_time if self.evaluation_time else 0.0
+
     def population_genes(self):
         return [agent.genes for agent in self.population_g]
 
@@ -534,7 +582,10 @@ class Population:
             fitness_all.append(self.population_fitness())
 
         self.store_data(population_all, fitness_all)
-        self.node.info_label = info
+        rate = self.evaluations_per_second()
+        log_info("Evolver: %s evaluations, %.1f evaluations/s, %s cached fitness reused",
+                 self.evaluations, rate, self.cache_hits)
+        self.node.info_label = info.strip() + " (%.1f evals/s)" % rate
 
 
 class SvEvolverRun(bpy.types.Operator):
@@ -560,7 +611,12 @@ class SvEvolverRun(bpy.types.Operator):
         np.random.seed(node.r_seed)
 
         population = Population(genotype_frame, node, tree)
-        population.evolve()
+        if node.workers > 1:
+            population.start_workers(node.workers)
+        try:
+            population.evolve()
+        finally:
+            population.stop_workers()
         update_list = make_tree_from_nodes([node.name], tree)
         do_update(update_list, tree.nodes)
         return {'FINISHED'}
@@ -703,6 +759,13 @@ class SvEvolverNode(bpy.types.Node, SverchCustomTreeNode):
         name='Max Seconds', description='Maximum execution Time',
         update=props_changed)
 
+    workers: IntProperty(
+        default=0,
+        min=0,
+        name='Workers',
+        description='Number of background Blender processes evaluating fitness in parallel (0 or 1 to evaluate in this session)',
+        update=props_changed)
+
     info_label: StringProperty(default="Not Executed")
 
     memory: StringProperty(default="")
@@ -729,6 +792,7 @@ class SvEvolverNode(bpy.types.Node, SverchCustomTreeNode):
         layout.prop(self, "fitness_booster")
         layout.prop(self, "mutation")
         layout.prop(self, "max_time")
+        layout.prop(self, "workers")
         if self.use_fitness_goal:
             goal_row = layout.row(align=True)
             goal_row.prop(self, "use_fitness_goal", text="")
@@ -91,6 +91,11 @@ class SvLoopInNode(SverchCustomTreeNode, bpy.types.Node):
         name='Print progress in console', description='Maximum allowed iterations',
         default=False)
 
+    skip_invariant: BoolProperty(
+        name='Skip loop-invariant nodes',
+        description="Process nodes, which do not depend on Loop Number or looped data, only on the first iteration",
+        default=False, update=updateNode)
+
     def update_mode(self, context):
         self.inputs['Iterations'].hide_safe = self.mode == "For_Each"
         if self.mode == "For_Each":
@@ -131,6 +136,7 @@ class SvLoopInNode(SverchCustomTreeNode, bpy.types.Node):
         layout.prop(self, 'mode', expand=True)
         if self.mode == "Range":
             layout.prop(self, "max_iterations")
+            layout.prop(self, "skip_invariant")
         else:
             layout.prop(self, "list_match")
         layout.prop(self, 'print_to_console')
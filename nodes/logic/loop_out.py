@@ -23,6 +23,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 
 
 from sverchok.core.update_system import make_tree_from_nodes, do_update
+from sverchok.core.loop_executor import SvLoopExecutor, loop_statistics
 from sverchok.data_structure import list_match_func, enum_item_4, updateNode
 
 def process_looped_nodes(node_list, tree_nodes, process_name, iteration):
@@ -68,6 +69,13 @@ class SvLoopOutNode(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvStringsSocket', 'Data 0')
 
     def draw_buttons_ext(self, context, layout):
+        if self.mode == 'Range':
+            statistics = loop_statistics.get(self.node_id)
+            if statistics:
+                box = layout.box()
+                box.label(text=f"Last run: {statistics['iterations']} iterations")
+                box.label(text=f"Per iteration: {statistics['mean_time']*1000:.2f} ms (max {statistics['max_time']*1000:.2f} ms)")
+                box.label(text=f"Nodes: {statistics['nodes']}, loop-invariant: {statistics['skipped_nodes']}")
         if self.mode == 'For_Each':
             socket_labels_box = layout.box()
             socket_labels_box.label(text="Socket Labels")
@@ -292,16 +300,8 @@ class SvLoopOutNode(SverchCustomTreeNode, bpy.types.Node):
             tree_nodes = self.id_data.nodes
             do_update(intersection[:-1], tree_nodes)
 
-            for i in range(iterations-1):
-                if self.break_loop():
-                    break
-                for j, socket in enumerate(self.inputs[2:]):
-                    data = socket.sv_get(deepcopy=False, default=[])
-                    loop_in_node.outputs[j+3].sv_set(data)
-                loop_in_node.outputs['Loop Number'].sv_set([[i+1]])
-                if do_print:
-                    print(f"Looping iteration Number {i+1}")
-                process_looped_nodes(intersection[1:-1], tree_nodes, 'Iteration', i+1)
+            executor = SvLoopExecutor(loop_in_node, self, intersection[1:-1], loop_in_node.skip_invariant)
+            executor.run(iterations, do_print)
 
 
             for inp, outp in zip(self.inputs[2:], self.outputs):
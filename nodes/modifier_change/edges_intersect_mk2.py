@@ -39,6 +39,7 @@ class SvIntersectEdgesNodeMK2(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvIntersectEdgesNodeMK2'
     bl_label = 'Intersect Edges'
     sv_icon = 'SV_XALL'
+    sv_cacheable = True
 
     mode_items_2d = [("Alg_1", "Alg 1", "", 0), ("Sweep_line", "Sweep line", "", 1), ("Blender", "Blender", "", 2)]
 
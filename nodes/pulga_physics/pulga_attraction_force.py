@@ -51,7 +51,7 @@ class SvPulgaAttractionForceNode(bpy.types.Node, SverchCustomTreeNode):
     mode: EnumProperty(
         name='Mode',
         description='Algorithm used for calculation',
-        items=enum_item_4(['Brute Force', 'Kd-tree']),
+        items=enum_item_4(['Brute Force', 'Kd-tree', 'Neighbour List']),
         default='Kd-tree', update=updateNode)
 
     def sv_init(self, context):
@@ -63,8 +63,7 @@ class SvPulgaAttractionForceNode(bpy.types.Node, SverchCustomTreeNode):
         self.outputs.new('SvPulgaForceSocket', "Force")
 
     def draw_buttons(self, context, layout):
-        if scipy is not None and Cython is not None:
-            layout.prop(self, 'mode')
+        layout.prop(self, 'mode')
         layout.prop(self, 'stop_on_collide')
 
     def process(self):
@@ -75,9 +74,10 @@ class SvPulgaAttractionForceNode(bpy.types.Node, SverchCustomTreeNode):
         decay = self.inputs["Decay"].sv_get(deepcopy=False)
         max_distance = self.inputs["Max Distance"].sv_get(deepcopy=False)
         use_kdtree = self.mode in "Kd-tree" and scipy is not None and Cython is not None
+        use_neighbours = self.mode == 'Neighbour_List'
         forces_out = []
         for force_params in zip_long_repeat(strength, decay, max_distance):
-            forces_out.append(SvAttractionForce(*force_params, stop_on_collide=self.stop_on_collide, use_kdtree=use_kdtree))
+            forces_out.append(SvAttractionForce(*force_params, stop_on_collide=self.stop_on_collide, use_kdtree=use_kdtree, use_neighbours=use_neighbours))
         self.outputs[0].sv_set([forces_out])
 
 
@@ -40,7 +40,7 @@ class SvPulgaCollisionForceNode(bpy.types.Node, SverchCustomTreeNode):
     mode: EnumProperty(
         name='Mode',
         description='Algorithm used for calculation',
-        items=enum_item_4(['Brute Force', 'Kd-tree']),
+        items=enum_item_4(['Brute Force', 'Kd-tree', 'Neighbour List']),
         default='Kd-tree', update=updateNode)
 
 
@@ -50,8 +50,7 @@ class SvPulgaCollisionForceNode(bpy.types.Node, SverchCustomTreeNode):
         self.outputs.new('SvPulgaForceSocket', "Force")
 
     def draw_buttons(self, context, layout):
-        if scipy is not None and Cython is not None:
-            layout.prop(self, 'mode')
+        layout.prop(self, 'mode')
 
     def process(self):
 
@@ -61,8 +60,9 @@ class SvPulgaCollisionForceNode(bpy.types.Node, SverchCustomTreeNode):
 
         forces_out = []
         use_kdtree = self.mode in "Kd-tree" and scipy is not None and Cython is not None
+        use_neighbours = self.mode == 'Neighbour_List'
         for force in forces_in:
-            forces_out.append(SvCollisionForce(force, use_kdtree=use_kdtree))
+            forces_out.append(SvCollisionForce(force, use_kdtree=use_kdtree, use_neighbours=use_neighbours))
         self.outputs[0].sv_set([forces_out])
 
 
@@ -48,7 +48,7 @@ class SvPulgaFitForceNode(bpy.types.Node, SverchCustomTreeNode):
     algorithm: EnumProperty(
         name='Algorithm',
         description='Algorithm used for calculation',
-        items=enum_item_4(['Brute Force', 'Kd-tree']),
+        items=enum_item_4(['Brute Force', 'Kd-tree', 'Neighbour List']),
         default='Kd-tree', update=updateNode)
 
     def sv_init(self, context):
@@ -60,8 +60,7 @@ class SvPulgaFitForceNode(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         layout.prop(self, 'mode')
-        if scipy is not None and Cython is not None:
-            layout.prop(self, 'algorithm')
+        layout.prop(self, 'algorithm')
 
     def process(self):
 
@@ -72,8 +71,9 @@ class SvPulgaFitForceNode(bpy.types.Node, SverchCustomTreeNode):
         max_rad_in = self.inputs["Max Radius"].sv_get(deepcopy=False)
         forces_out = []
         use_kdtree = self.algorithm == "Kd-tree" and scipy is not None and Cython is not None
+        use_neighbours = self.algorithm == 'Neighbour_List'
         for force in zip(forces_in, min_rad_in, max_rad_in):
-            forces_out.append(SvFitForce(*force, self.mode, use_kdtree=use_kdtree))
+            forces_out.append(SvFitForce(*force, self.mode, use_kdtree=use_kdtree, use_neighbours=use_neighbours))
         self.outputs[0].sv_set([forces_out])
 
 
@@ -17,13 +17,15 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import ast
+import os
 from numpy import array
 import bpy
 from bpy.props import IntProperty, StringProperty, BoolProperty, FloatProperty, FloatVectorProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.utils.nodes_mixins.sv_animatable_nodes import SvAnimatableNode
 from sverchok.data_structure import updateNode, match_long_repeat
-from sverchok.utils.pulga_physics_modular_core import pulga_system_init
+from sverchok.utils.pulga_physics_modular_core import pulga_system_init, output_frames
+from sverchok.utils.pulga_frame_store import PulgaFrameStore, indexed_path
 
 
 class SvPulgaPhysicsSolverNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatableNode):
@@ -189,6 +191,26 @@ class SvPulgaPhysicsSolverNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatabl
         default=False,
         update=updateNode)
 
+    frame_cache : BoolProperty(name="Frame Cache",
+        description="Record requested iterations to a preallocated frame buffer and output them from it",
+        default=False,
+        update=updateNode)
+
+    frame_capacity : IntProperty(name="Max Frames",
+        description="Maximum number of requested iterations kept in the frame buffer",
+        default=1000, min=1,
+        update=updateNode)
+
+    frame_file : StringProperty(name="Frames File",
+        description="Keep recorded frames in this .npy file instead of memory (optional)",
+        default="", subtype='FILE_PATH',
+        update=updateNode)
+
+    frame_playback : BoolProperty(name="Play from File",
+        description="Output requested iterations from the frames file without running the simulation",
+        default=False,
+        update=updateNode)
+
     def sv_init(self, context):
 
         '''create sockets'''
@@ -229,6 +251,13 @@ class SvPulgaPhysicsSolverNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatabl
         '''draw buttons on the N-panel'''
         self.draw_buttons(context, layout)
         layout.prop(self, "output_numpy", toggle=False)
+        box = layout.box()
+        box.prop(self, "frame_cache")
+        if self.frame_cache:
+            box.prop(self, "frame_capacity")
+            box.prop(self, "frame_file", text="")
+            if self.frame_file:
+                box.prop(self, "frame_playback")
 
 
     def get_data(self):
@@ -283,6 +312,26 @@ class SvPulgaPhysicsSolverNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatabl
 
         return data, past, from_file
 
+    def frames_path(self, temp_id):
+        '''file used to keep frames of temp_id-th simulation, if any'''
+        if not self.frame_file:
+            return None
+        return indexed_path(bpy.path.abspath(self.frame_file), temp_id)
+
+    def get_frame_store(self, temp_id):
+        '''new frame store for temp_id-th simulation, or None if frames are not cached'''
+        if not self.frame_cache:
+            return None
+        return PulgaFrameStore(self.frame_capacity, self.frames_path(temp_id))
+
+    def playback_frames(self, params, out_lists):
+        '''output requested iterations from previously recorded frames files'''
+        for temp_id, par in enumerate(zip(*params)):
+            path = self.frames_path(temp_id)
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Frames file {path} does not exist, run the simulation first")
+            output_frames(PulgaFrameStore.load(path), par[1], self.output_numpy, out_lists)
+
     def process(self):
         '''main node function called every update'''
 
@@ -301,6 +350,9 @@ class SvPulgaPhysicsSolverNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatabl
 
         if self.accumulative and self.accumulative_parse:
             verts_out, rads_out, velocity_out, reactions_out = self.memory_to_lists()
+        elif self.frame_cache and self.frame_file and self.frame_playback:
+            out_lists = [verts_out, rads_out, velocity_out, reactions_out]
+            self.playback_frames(self.get_data(), out_lists)
         else:
             out_lists = [verts_out, rads_out, velocity_out, reactions_out]
             params = self.get_data()
@@ -309,7 +361,8 @@ class SvPulgaPhysicsSolverNode(bpy.types.Node, SverchCustomTreeNode, SvAnimatabl
             temp_id = 0
             for par in zip(*params):
                 cache = self.get_local_cache(past, data, from_file, temp_id)
-                cache_new = pulga_system_init(par, gates_dict, out_lists, cache)
+                frame_store = self.get_frame_store(temp_id)
+                cache_new = pulga_system_init(par, gates_dict, out_lists, cache, frame_store)
 
                 if self.accumulative:
                     self.accumulativity_set_data(cache_new, temp_id)
@@ -18,13 +18,12 @@
 
 import bpy
 from bpy.props import BoolProperty, StringProperty
-import bmesh
 
 import sverchok
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.utils.nodes_mixins.sv_animatable_nodes import SvAnimatableNode
 from sverchok.data_structure import updateNode
-from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh
+from sverchok.utils.mesh_arrays import pydata_from_mesh, material_indices_from_mesh
 from sverchok.core.handlers import get_sv_depsgraph, set_sv_depsgraph_need
 from sverchok.utils.nodes_mixins.show_3d_properties import Show3DProperties
 
@@ -140,6 +139,11 @@ class SvObjectsNodeMK3(Show3DProperties, bpy.types.Node, SverchCustomTreeNode, S
         description='sorting inserted objects by names',
         default=True, update=updateNode)
 
+    output_numpy: BoolProperty(
+        name='Output NumPy',
+        description='Output NumPy arrays (faster for big meshes)',
+        default=False, update=updateNode)
+
     object_names: bpy.props.CollectionProperty(type=SvOB3BDataCollection, options={'SKIP_SAVE'})
 
     active_obj_index: bpy.props.IntProperty()
@@ -226,6 +230,7 @@ class SvObjectsNodeMK3(Show3DProperties, bpy.types.Node, SverchCustomTreeNode, S
     def draw_buttons_ext(self, context, layout):
         layout.prop(self, 'draw_3dpanel', text="To Control panel")
         self.draw_animatable_buttons(layout)
+        layout.prop(self, 'output_numpy')
 
     def draw_buttons_3dpanel(self, layout):
         callback = 'node.ob3_callback'
@@ -237,20 +242,17 @@ class SvObjectsNodeMK3(Show3DProperties, bpy.types.Node, SverchCustomTreeNode, S
         self.wrapper_tracked_ui_draw_op(colo, callback, text='Get').fn_name = 'get_objects_from_scene'
 
 
-    def get_verts_and_vertgroups(self, obj_data):
-        vers = []
-        vers_grouped = []
-        for k, v in enumerate(obj_data.vertices):
-            if self.vergroups and v.groups.values():
-                vers_grouped.append(k)
-            vers.append(list(v.co))
-        return vers, vers_grouped
-
-    def get_materials_from_bmesh(self, bm):
-        return [face.material_index for face in bm.faces[:]]
+    def get_vertgroups(self, obj_data):
+        if not self.vergroups:
+            return []
+        return [k for k, v in enumerate(obj_data.vertices) if v.groups.values()]
 
-    def get_materials_from_mesh(self, mesh):
-        return [face.material_index for face in mesh.polygons[:]]
+    def get_mesh_data(self, obj_data):
+        vers, edgs, pols = pydata_from_mesh(obj_data, self.output_numpy)
+        materials = material_indices_from_mesh(obj_data)
+        if not self.output_numpy:
+            materials = materials.tolist()
+        return vers, edgs, pols, materials
 
     def sv_free(self):
         set_sv_depsgraph_need(False)
@@ -297,12 +299,11 @@ class SvObjectsNodeMK3(Show3DProperties, bpy.types.Node, SverchCustomTreeNode, S
                 try:
                     if obj.mode == 'EDIT' and obj.type == 'MESH':
                         # Mesh objects do not currently return what you see
-                        # from 3dview while in edit mode when using obj.to_mesh.
-                        me = obj.data
-                        bm = bmesh.from_edit_mesh(me)
-                        vers, edgs, pols = pydata_from_bmesh(bm)
-                        materials = self.get_materials_from_bmesh(bm)
-                        del bm
+                        # from 3dview while in edit mode when using obj.to_mesh,
+                        # so edit mesh is written to obj.data first.
+                        obj.update_from_editmode()
+                        vers, edgs, pols, materials = self.get_mesh_data(obj.data)
+                        vers_grouped = self.get_vertgroups(obj.data)
                     else:
 
                         """
@@ -320,11 +321,8 @@ class SvObjectsNodeMK3(Show3DProperties, bpy.types.Node, SverchCustomTreeNode, S
                         else:
                             obj_data = obj.to_mesh()
 
-                        if obj_data.polygons:
-                            pols = [list(p.vertices) for p in obj_data.polygons]
-                        vers, vers_grouped = self.get_verts_and_vertgroups(obj_data)
-                        materials = self.get_materials_from_mesh(obj_data)
-                        edgs = obj_data.edge_keys
+                        vers, edgs, pols, materials = self.get_mesh_data(obj_data)
+                        vers_grouped = self.get_vertgroups(obj_data)
 
                         obj.to_mesh_clear()
 
@@ -339,7 +337,7 @@ class SvObjectsNodeMK3(Show3DProperties, bpy.types.Node, SverchCustomTreeNode, S
             materials_out.append(materials)
             vers_out_grouped.append(vers_grouped)
 
-        if vers_out and vers_out[0]:
+        if vers_out and len(vers_out[0]):
             outputs['Vertices'].sv_set(vers_out)
             outputs['Edges'].sv_set(edgs_out)
             outputs['Polygons'].sv_set(pols_out)
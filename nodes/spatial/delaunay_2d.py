@@ -21,7 +21,8 @@ from bpy.props import FloatProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
-from sverchok.utils.voronoi import Site, computeVoronoiDiagram, computeDelaunayTriangulation
+from sverchok.utils.voronoi import Site, computeVoronoiDiagram, computeDelaunayTriangulation, delaunay_triangles_np
+from sverchok.dependencies import scipy
 
 # computeDelaunayTriangulation
 class DelaunayTriangulation2DNode(bpy.types.Node, SverchCustomTreeNode):
@@ -30,30 +31,44 @@ class DelaunayTriangulation2DNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Delaunay 2D'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_DELAUNAY'
+    sv_cacheable = True
+    sv_thread_safe = True
 
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', "Vertices")
         self.outputs.new('SvStringsSocket', "Polygons")
 
-    def process(self):
-
+    def process_read(self):
         if not self.inputs['Vertices'].is_linked:
-            return
+            return None
         if not self.outputs['Polygons'].is_linked:
-            return
+            return None
+        return self.inputs['Vertices'].sv_get()
 
-        tris_out = []
-        points_in = []
-        points_in = self.inputs['Vertices'].sv_get()
+    @staticmethod
+    def process_compute(points_in):
+        if points_in is None:
+            return None
 
+        tris_out = []
         for obj in points_in:
+            if scipy is not None:
+                tris_out.append(delaunay_triangles_np(obj).tolist())
+                continue
             pt_list = [Site(pt[0], pt[1]) for pt in obj]
             res = computeDelaunayTriangulation(pt_list)
             tris_out.append([tri for tri in res if -1 not in tri])
+        return tris_out
 
-
+    def process_write(self, tris_out):
+        if tris_out is None:
+            return
         self.outputs['Polygons'].sv_set(tris_out)
 
+    def process(self):
+        self.process_write(self.process_compute(self.process_read()))
+
+
 def register():
     bpy.utils.register_class(DelaunayTriangulation2DNode)
 
@@ -23,6 +23,7 @@ class SvLloyd2dNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Lloyd 2D'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_VORONOI'
+    sv_cacheable = True
 
     clip: FloatProperty(
         name='clip', description='Clipping Distance',
@@ -7,19 +7,20 @@
 
 
 from typing import NamedTuple, Any, List, Tuple
-import random
 from itertools import chain, repeat
 import numpy as np
 
 import bpy
 from mathutils import Vector
 from mathutils.bvhtree import BVHTree
-from mathutils.geometry import tessellate_polygon, area_tri
+from mathutils.geometry import tessellate_polygon
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, throttle_and_update_node
 from sverchok.utils.geom import calc_bounds
 from sverchok.utils.sv_mesh_utils import point_inside_mesh
+from sverchok.utils.spatial_hash import SvSpatialHashGrid, BATCH_SIZE
+from sverchok.utils.logging import error
 
 class SocketProperties(NamedTuple):
     name: str
@@ -50,11 +51,13 @@ INPUT_CONFIG = [
 class NodeProperties(NamedTuple):
     proportional: bool
     mode : str
+    min_distance : float = 0.0
 
 MAX_ITERATIONS = 1000
 
-def populate_mesh(verts, faces, count, seed):
+def populate_mesh(verts, faces, count, seed, min_distance=0.0):
     bvh = BVHTree.FromPolygons(verts, faces)
+    grid = SvSpatialHashGrid(cell_size=2*min_distance) if min_distance > 0 else None
     np.random.seed(seed)
     x_min, x_max, y_min, y_max, z_min, z_max = calc_bounds(verts)
     low = np.array([x_min, y_min, z_min])
@@ -64,10 +67,14 @@ def populate_mesh(verts, faces, count, seed):
     iterations = 0
     while True:
         if iterations > MAX_ITERATIONS:
-            raise Exception("Iterations limit is reached")
+            error("Maximum number of iterations (%s) reached, stop.", MAX_ITERATIONS)
+            break
         max_pts = max(count, count-done)
         points = np.random.uniform(low, high, size=(max_pts,3)).tolist()
         points = [p for p in points if point_inside_mesh(bvh, p)]
+        if grid is not None and points:
+            good = grid.insert_checked(points, min_r=min_distance)
+            points = np.array(points)[good].tolist()
         n = len(points)
         result.extend(points)
         done += n
@@ -78,89 +85,115 @@ def populate_mesh(verts, faces, count, seed):
 
 def node_process(inputs: InputData, properties: NodeProperties):
     if properties.mode == 'SURFACE':
-        me = TriangulatedMesh([Vector(co) for co in inputs.verts], inputs.faces)
+        me = TriangulatedMesh(inputs.verts, inputs.faces)
         if properties.proportional:
             me.use_even_points_distribution()
         if inputs.face_weight:
             me.set_custom_face_weights(inputs.face_weight)
-        return me.generate_random_points(inputs.number[0], inputs.seed[0])  # todo [0] <-- ?!
+        return me.generate_random_points(inputs.number[0], inputs.seed[0], properties.min_distance)  # todo [0] <-- ?!
     else:
-        return populate_mesh(inputs.verts, inputs.faces, inputs.number[0], inputs.seed[0])
+        return populate_mesh(inputs.verts, inputs.faces, inputs.number[0], inputs.seed[0], properties.min_distance)
 
 class TriangulatedMesh:
     def __init__(self, verts: List[Vector], faces: List[List[int]]):
-        self._verts = verts
+        self._verts = np.asarray(verts, dtype=np.float64).reshape((-1, 3))
         self._faces = faces
         self._face_weights = None
+        self._cum_face_weights = None
+        self._random = np.random.RandomState()
 
-        self._tri_faces = []
-        self._tri_face_areas = []
-        self._old_face_indexes_per_tri = []
+        self._tri_faces = None
+        self._tri_face_areas = None
+        self._old_face_indexes_per_tri = None
 
         self._triangulate()
 
     def use_even_points_distribution(self, even=True):
         self._face_weights = self.tri_face_areas if even else None
+        self._cum_face_weights = None
 
     def set_custom_face_weights(self, custom_weights):
         weights_per_tri = self._face_attrs_to_tri_face_attrs(custom_weights)
-        if self._face_weights:
-            self._face_weights *= weights_per_tri  # can be troubles if set custom weights several times
+        if self._face_weights is not None:
+            self._face_weights = self._face_weights * weights_per_tri  # can be troubles if set custom weights several times
         else:
             self._face_weights = weights_per_tri
+        self._cum_face_weights = None
+
+    def generate_random_points(self, random_points_total: int, seed: int, min_distance: float = 0.0) -> Tuple[list, list]:
+        self._random.seed(seed)
+        if min_distance <= 0:
+            random_points, old_face_indexes_per_point = self._generate_points(random_points_total)
+            return random_points.tolist(), old_face_indexes_per_point.tolist()
 
-    def generate_random_points(self, random_points_total: int, seed: int) -> Tuple[list, list]:
-        random.seed(seed)
-        points_total_per_face = self._distribute_points(random_points_total)
+        # points which are too close to previously generated ones are
+        # rejected, and new ones are generated instead
+        grid = SvSpatialHashGrid(cell_size=2*min_distance)
         random_points = []
         old_face_indexes_per_point = []
-        for tri_face, face_index, points_total in zip(self._tri_faces,
-                                                      self._old_face_indexes_per_tri,
-                                                      points_total_per_face):
-            tri_random_points = self._get_random_vectors_on_tri(*[self._verts[i] for i in tri_face], points_total)
-            random_points.extend(tri_random_points)
-            old_face_indexes_per_point.extend([face_index for _ in range(len(tri_random_points))])
-        return [v[:] for v in random_points], old_face_indexes_per_point
+        done = 0
+        iterations = 0
+        while done < random_points_total:
+            iterations += 1
+            if iterations > MAX_ITERATIONS:
+                error("Maximum number of iterations (%s) reached, stop.", MAX_ITERATIONS)
+                break
+            left = random_points_total - done
+            points, face_indexes = self._generate_points(min(BATCH_SIZE, left))
+            good = grid.insert_checked(points, min_r=min_distance)
+            random_points.append(points[good])
+            old_face_indexes_per_point.append(face_indexes[good])
+            done += np.count_nonzero(good)
+        if not random_points:
+            return [], []
+        return np.concatenate(random_points).tolist(), np.concatenate(old_face_indexes_per_point).tolist()
+
+    def _generate_points(self, random_points_total: int) -> Tuple[np.ndarray, np.ndarray]:
+        # random points on triangles chosen by _choose_faces, by barycentric coordinates
+        if not len(self._tri_faces) or not random_points_total:
+            return np.empty((0, 3)), np.empty((0,), dtype=np.int64)
+        tris = self._choose_faces(random_points_total)
+        u1, u2 = self._random.random_sample((2, random_points_total))
+        outside = u1 + u2 > 1
+        u1[outside] = 1 - u1[outside]
+        u2[outside] = 1 - u2[outside]
+        v1, v2, v3 = (self._verts[self._tri_faces[tris, i]] for i in range(3))
+        random_points = v1 + (v2 - v1) * u1[:, np.newaxis] + (v3 - v1) * u2[:, np.newaxis]
+        return random_points, self._old_face_indexes_per_tri[tris]
 
     @property
     def tri_face_areas(self):
-        if not self._tri_face_areas:
-            self._tri_face_areas = [area_tri(*[self._verts[i] for i in f]) for f in self._tri_faces]
+        if self._tri_face_areas is None:
+            v1, v2, v3 = (self._verts[self._tri_faces[:, i]] for i in range(3))
+            self._tri_face_areas = 0.5 * np.linalg.norm(np.cross(v2 - v1, v3 - v1), axis=1)
         return self._tri_face_areas
 
-    def _distribute_points(self, random_points_total: int) -> List[int]:
-        # generate list of numbers which mean how many points should be created on face
-        points_total_per_face = [0 for _ in range(len(self._tri_faces))]
-        chosen_faces = random.choices(range(len(self._tri_faces)), self._face_weights, k=random_points_total)
-        for i in chosen_faces:
-            points_total_per_face[i] += 1
-        return points_total_per_face
+    def _choose_faces(self, random_points_total: int) -> np.ndarray:
+        # indexes of triangles for each of new points, with probability proportional to face weights
+        n_tris = len(self._tri_faces)
+        if self._face_weights is None:
+            return self._random.randint(0, n_tris, size=random_points_total)
+        if self._cum_face_weights is None:
+            self._cum_face_weights = np.cumsum(self._face_weights)
+        values = self._random.uniform(0, self._cum_face_weights[-1], size=random_points_total)
+        return np.minimum(np.searchsorted(self._cum_face_weights, values, side='right'), n_tris - 1)
 
     def _triangulate(self):
         # generate list of triangle faces and list of indexes which points to initial faces for each new triangle
+        tri_faces = []
+        old_face_indexes_per_tri = []
         for i, f in enumerate(self._faces):
             face_verts = [[self._verts[i] for i in f]]
             # [[v1,v2,v3,v4]] - face_verts
             for tri_face in tessellate_polygon(face_verts):
-                self._tri_faces.append([f[itf] for itf in tri_face])
-                self._old_face_indexes_per_tri.append(i)
-
-    @staticmethod
-    def _get_random_vectors_on_tri(v1, v2, v3, number):
-        # returns random vertices for given triangle
-        out = []
-        for _ in range(number):
-            u1 = random.random()
-            u2 = random.random()
-            u1 = u1 if u1 + u2 <= 1 else 1 - u1
-            u2 = u2 if u1 + u2 <= 1 else 1 - u2
-            side1 = v2 - v1
-            side2 = v3 - v1
-            out.append(v1 + side1 * u1 + side2 * u2)
-        return out
+                tri_faces.append([f[itf] for itf in tri_face])
+                old_face_indexes_per_tri.append(i)
+        self._tri_faces = np.array(tri_faces, dtype=np.int64).reshape((-1, 3))
+        self._old_face_indexes_per_tri = np.array(old_face_indexes_per_tri, dtype=np.int64)
 
     def _face_attrs_to_tri_face_attrs(self, values):
-        return [values[i] if i <= len(values) - 1 else values[len(values) - 1] for i in self._old_face_indexes_per_tri]
+        values = np.asarray(values, dtype=np.float64)
+        return values[np.minimum(self._old_face_indexes_per_tri, len(values) - 1)]
 
 
 class SvRandomPointsOnMesh(bpy.types.Node, SverchCustomTreeNode):
@@ -199,11 +232,18 @@ class SvRandomPointsOnMesh(bpy.types.Node, SverchCustomTreeNode):
             items = modes,
             default = 'SURFACE',
             update=update_sockets)
+
+    min_distance: bpy.props.FloatProperty(
+            name = "Min Distance",
+            description = "Minimum distance between generated points; zero means no restriction",
+            default = 0.0, min = 0.0,
+            update=updateNode)
     
     def draw_buttons(self, context, layout):
         layout.prop(self, "mode", text='')
         if self.mode == 'SURFACE':
             layout.prop(self, "proportional")
+        layout.prop(self, "min_distance")
 
     def sv_init(self, context):
         [self.inputs.new(p.socket_type, p.name) for p in INPUT_CONFIG]
@@ -216,7 +256,7 @@ class SvRandomPointsOnMesh(bpy.types.Node, SverchCustomTreeNode):
         if not all([self.inputs['Verts'].is_linked, self.inputs['Faces'].is_linked]):
             return
 
-        props = NodeProperties(self.proportional, self.mode)
+        props = NodeProperties(self.proportional, self.mode, self.min_distance)
         out = [node_process(inputs, props) for inputs in self.get_input_data_iterator(INPUT_CONFIG)]
         [s.sv_set(data) for s, data in zip(self.outputs, zip(*out))]
 
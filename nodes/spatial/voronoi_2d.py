@@ -36,6 +36,7 @@ class Voronoi2DNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Voronoi 2D'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_VORONOI'
+    sv_cacheable = True
 
     clip: FloatProperty(
         name='clip', description='Clipping Distance',
@@ -8,7 +8,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.core.sockets import setup_new_node_location
 from sverchok.data_structure import updateNode, throttle_and_update_node, match_long_repeat
 from sverchok.utils.logging import info, exception
-from sverchok.utils.marching_cubes import isosurface_np
+from sverchok.utils.marching_cubes import isosurface_np, isosurface_vectorized
 from sverchok.dependencies import mcubes, skimage
 from sverchok.utils.nodes_mixins.draft_mode import DraftMode
 
@@ -26,6 +26,7 @@ class SvExMarchingCubesNode(DraftMode, bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Marching Cubes'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_EX_MCUBES'
+    sv_cacheable = True
 
     iso_value : FloatProperty(
             name = "Value",
@@ -112,6 +113,7 @@ class SvExMarchingCubesNode(DraftMode, bpy.types.Node, SverchCustomTreeNode):
             modes.append(("skimage", "SciKit-Image", "SciKit-Image", 0))
         if mcubes is not None:
             modes.append(("mcubes", "PyMCubes", "PyMCubes", 1))
+        modes.append(('numpy', "NumPy", "Vectorized NumPy implementation", 3))
         modes.append(('python', "Pure Python", "Pure Python implementation", 2))
         return modes
 
@@ -246,6 +248,11 @@ class SvExMarchingCubesNode(DraftMode, bpy.types.Node, SverchCustomTreeNode):
                 new_verts = self.scale_back(b1n, b2n, samples_x, samples_y, samples_z, new_verts)
                 new_verts, new_faces = new_verts.tolist(), new_faces.tolist()
                 new_normals = normals.tolist()
+            elif self.implementation == 'numpy':
+                new_verts, new_faces = isosurface_vectorized(func_values, value)
+                new_verts = self.scale_back(b1n, b2n, samples_x, samples_y, samples_z, new_verts)
+                new_verts, new_faces = new_verts.tolist(), new_faces.tolist()
+                new_normals = []
             else: # python
                 new_verts, new_faces = isosurface_np(func_values, value)
                 new_verts = self.scale_back(b1n, b2n, samples_x, samples_y, samples_z, new_verts)
@@ -8,8 +8,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, St
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, zip_long_repeat, match_long_repeat,
                                      ensure_nesting_level, throttle_and_update_node)
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
-from sverchok.utils.script_importhelper import safe_names_np
+from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled, compile_vectorized
 from sverchok.utils.logging import info, exception
 from sverchok.utils.math import (
             from_cylindrical, from_spherical,
@@ -122,9 +121,9 @@ class SvSurfaceFormulaNode(bpy.types.Node, SverchCustomTreeNode):
         return function
 
     def make_function_vector(self, variables):
-        compiled1 = sv_compile(self.formula1)
-        compiled2 = sv_compile(self.formula2)
-        compiled3 = sv_compile(self.formula3)
+        evaluate1 = compile_vectorized(self.formula1)
+        evaluate2 = compile_vectorized(self.formula2)
+        evaluate3 = compile_vectorized(self.formula3)
 
         if self.output_mode == 'XYZ':
             def out_coordinates(x, y, z):
@@ -138,9 +137,9 @@ class SvSurfaceFormulaNode(bpy.types.Node, SverchCustomTreeNode):
 
         def function(u, v):
             variables.update(dict(u=u, v=v))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
+            v1 = evaluate1(variables)
+            v2 = evaluate2(variables)
+            v3 = evaluate3(variables)
 
             if not isinstance(v1, np.ndarray):
                 v1 = np.full_like(u, v1)
@@ -17,68 +17,43 @@
 # ##### END GPL LICENSE BLOCK #####
 
 
-from math import sqrt
+from itertools import islice
 
 import bpy
 from bpy.props import EnumProperty, IntProperty, FloatVectorProperty, BoolProperty
-from mathutils import noise, Vector, Matrix
+from mathutils import Matrix
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, list_match_func, numpy_list_match_modes, iter_list_match_func, numpy_full_list_func)
 from sverchok.utils.sv_noise_utils import noise_options, noise_numpy_types
+from sverchok.utils.sv_noise_numpy import noise_vector
 from sverchok.utils.sv_itertools import recurse_f_level_control
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.modules.matrix_utils import matrix_apply_np
 
 import numpy as np
 
-def deepnoise(vert, noise_basis='PERLIN_ORIGINAL'):
-    noise_v = noise.noise_vector(vert, noise_basis=noise_basis)[:]
-    a = noise_v[0], noise_v[1], noise_v[2]-1   # a = noise_v minus (0,0,1)
-    return sqrt((a[0] * a[0]) + (a[1] * a[1]) + (a[2] * a[2])) * 0.5
-
-
-def vector_noise(params, noise_basis='PERLIN_ORIGINAL'):
-    vert, scale_out, matrix = params
-    v_vert = Vector(vert)
-    noise_v = noise.noise_vector(matrix @ v_vert, noise_basis=noise_basis)[:]
-    return v_vert + Vector((noise_v[0]*scale_out[0], noise_v[1]*scale_out[1], noise_v[2]*scale_out[2]))
-
-def vector_noise_multi_seed(params, noise_basis='PERLIN_ORIGINAL'):
-    vert, seed_val, scale_out, matrix = params
-    noise.seed_set(seed_val if seed_val else 1385)
-    v_vert = Vector(vert)
-    noise_v = noise.noise_vector(matrix @ v_vert, noise_basis=noise_basis)[:]
-    return v_vert + Vector((noise_v[0]*scale_out[0], noise_v[1]*scale_out[1], noise_v[2]*scale_out[2]))
-
-
-def vector_noise_normal(params, noise_basis='PERLIN_ORIGINAL'):
-    vert, scale_out, matrix, normal = params
-    v_vert = Vector(vert)
-    scalar_noise = deepnoise(matrix @ v_vert, noise_basis=noise_basis)
-    noise_v = Vector(normal) * scalar_noise
-    return v_vert + Vector((noise_v[0]*scale_out[0], noise_v[1]*scale_out[1], noise_v[2]*scale_out[2]))
-
-def vector_noise_normal_multi_seed(params, noise_basis='PERLIN_ORIGINAL'):
-    vert, seed_val, scale_out, matrix, normal = params
-    v_vert = Vector(vert)
-    noise.seed_set(seed_val if seed_val else 1385)
-    noise_scalar = deepnoise(matrix @ v_vert, noise_basis=noise_basis)
-    noise_v = Vector(normal) * noise_scalar
-    return v_vert + Vector((noise_v[0]*scale_out[0], noise_v[1]*scale_out[1], noise_v[2]*scale_out[2]))
-
-
-def v_noise(verts, _, m_prop, noise_type, result, output_numpy):
-    py_verts = verts.tolist() if isinstance(verts, np.ndarray) else verts
-    func = vector_noise if len(m_prop) == 2 else vector_noise_multi_seed
-    if output_numpy:
-        result.append(
-            np.array(
-                [func(v_prop, noise_basis=noise_type)[:] for v_prop in zip(py_verts, *m_prop)]
-                )
-            )
-    else:
-        result.append([func(v_prop, noise_basis=noise_type)[:] for v_prop in zip(py_verts, *m_prop)])
+def displace_props(verts, m_prop, seed):
+    """
+    Vertices, noise seeds, scales and noise positions (vertices transformed by noise matrices)
+    as arrays, matched in the same way as zip(verts, *m_prop) does.
+    If seed is None, m_prop holds seeds for each vertex as well.
+    """
+    props = list(islice(zip(*m_prop), len(verts)))
+    count = len(props)
+    np_verts = np.array(verts, dtype=np.float64).reshape((-1, 3))[:count]
+    if seed is None:
+        seed = np.array([int(prop[0]) or 1385 for prop in props], dtype=np.int64)
+        props = [prop[1:] for prop in props]
+    scales = np.array([prop[0] for prop in props], dtype=np.float64).reshape((-1, 3))
+    matrices = np.array([prop[1] for prop in props], dtype=np.float64).reshape((-1, 4, 4))
+    positions = np.einsum('nij,nj->ni', matrices[:, :3, :3], np_verts) + matrices[:, :3, 3]
+    return np_verts, seed, scales, positions
+
+def v_noise(verts, _, m_prop, seed, noise_type, result, output_numpy):
+    np_verts, seed, scales, positions = displace_props(verts, m_prop, seed)
+    displaced = np_verts + noise_vector(positions, noise_basis=noise_type, seed=seed) * scales
+    result.append(displaced if output_numpy else displaced.tolist())
 
 def v_noise_numpy(verts, _, noise_type, n_props, result, output_numpy):
     scale, seed, matrix, smooth, interpolate = n_props
@@ -98,21 +73,17 @@ def v_noise_numpy(verts, _, noise_type, n_props, result, output_numpy):
     else:
         result.append((np_verts +  (2 * n_v - 1) * scale).tolist())
 
-def v_normal(verts, pols, m_prop, noise_type, result, output_numpy):
+def v_normal(verts, pols, m_prop, seed, noise_type, result, output_numpy):
     py_verts = verts.tolist() if isinstance(verts, np.ndarray) else verts
     bm = bmesh_from_pydata(py_verts, [], pols, normal_update=True)
-    normals = [Vector(v.normal) for v in bm.verts]
-    func = vector_noise_normal if len(m_prop) == 2 else vector_noise_normal_multi_seed
-    if output_numpy:
-        result.append(
-            np.array(
-                [func(v_prop, noise_basis=noise_type)[:] for v_prop in zip(py_verts, *m_prop, normals)]
-                )
-            )
-    else:
-        result.append([func(v_prop, noise_basis=noise_type)[:] for v_prop in zip(verts, *m_prop, normals)])
-
+    normals = np.array([v.normal for v in bm.verts]).reshape((-1, 3))
     bm.free()
+    np_verts, seed, scales, positions = displace_props(verts, m_prop, seed)
+    # length of noise vector minus (0, 0, 1)
+    noise_vectors = noise_vector(positions, noise_basis=noise_type, seed=seed) - (0, 0, 1)
+    scalar_noise = np.linalg.norm(noise_vectors, axis=1) * 0.5
+    displaced = np_verts + normals[:len(np_verts)] * scalar_noise[:, np.newaxis] * scales
+    result.append(displaced if output_numpy else displaced.tolist())
 
 def v_normal_numpy(verts, pols, noise_type, n_props, result, output_numpy):
     bm = bmesh_from_pydata(verts, [], pols, normal_update=True)
@@ -141,12 +112,11 @@ def noise_displace(params, constant, matching_f):
             matrix = [matrix.inverted()]
         if len(seed_val) > 1:
             m_prop = local_match([seed_val, scale_out, matrix])
+            seed = None
         else:
             m_prop = local_match([scale_out, matrix])
-            seed_val = seed_val[0]
-
-            noise.seed_set(int(seed_val) if seed_val else 1385)
-        noise_function(verts, pols, m_prop, noise_type, result, output_numpy)
+            seed = int(seed_val[0]) or 1385
+        noise_function(verts, pols, m_prop, seed, noise_type, result, output_numpy)
 
     return result
 
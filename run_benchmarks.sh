@@ -0,0 +1,18 @@
+#!/bin/bash
+
+# If your blender is not available as just "blender" command, then you need
+# to specify path to blender when running this script, e.g.
+#
+# $ BLENDER=~/soft/blender-2.81/blender ./run_benchmarks.sh
+#
+# Arguments are passed to utils/benchmarking.py, e.g.
+#
+# $ ./run_benchmarks.sh --save
+# $ ./run_benchmarks.sh --threshold 0.5 "kdtree_*"
+#
+
+set -e
+
+BLENDER=${BLENDER:-blender}
+
+$BLENDER -b --addons sverchok --python utils/benchmarking.py --python-exit-code 1 -- "$@"
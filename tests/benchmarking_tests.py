@@ -0,0 +1,42 @@
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.benchmarking import compare_results, missing_cases, measure_case, run_module
+
+class BenchmarkingTests(SverchokTestCase):
+    def test_compare_results(self):
+        baseline = {"a/slow": dict(time=1.0, peak_memory=10 * 2**20),
+                    "a/fast": dict(time=0.0001, peak_memory=0),
+                    "a/same": dict(time=0.5, peak_memory=2**20)}
+        results = {"a/slow": dict(time=1.5, peak_memory=20 * 2**20),
+                   "a/fast": dict(time=0.0005, peak_memory=1024),
+                   "a/same": dict(time=0.55, peak_memory=2**20),
+                   "a/new": dict(time=10.0, peak_memory=0)}
+        regressions = compare_results(results, baseline, threshold=0.25)
+        self.assertEqual(sorted((name, key) for name, key, old, new in regressions),
+                         [("a/slow", "peak_memory"), ("a/slow", "time")])
+
+    def test_measure_case(self):
+        result = measure_case(lambda n: [0.0] * n, (100000,), repeat=2)
+        self.assertGreater(result['time'], 0)
+        self.assertGreaterEqual(result['peak_memory'], 800000)
+
+    def test_teardown(self):
+        calls = []
+        def failing():
+            raise Exception("case failed")
+        class Module(object):
+            def cases():
+                yield "ok", calls.append, ("case",)
+                yield "failing", failing, ()
+            def teardown():
+                calls.append("teardown")
+        results, failed = run_module("module", Module, repeat=1)
+        self.assertEqual(list(results.keys()), ["module/ok"])
+        self.assertEqual(failed, ["module/failing"])
+        self.assertEqual(calls[-1], "teardown")
+
+    def test_missing_cases(self):
+        baseline = {"a/ok": dict(time=1.0), "a/removed": dict(time=1.0),
+                    "a/failed": dict(time=1.0), "b/other": dict(time=1.0)}
+        results = {"a/ok": dict(time=1.0)}
+        self.assertEqual(missing_cases(results, baseline, ["a"], failed=["a/failed"]), ["a/removed"])
+        self.assertEqual(sorted(missing_cases(results, baseline, ["a", "b"])), ["a/failed", "a/removed", "b/other"])
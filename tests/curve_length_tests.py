@@ -0,0 +1,52 @@
+import numpy as np
+from copy import copy
+from math import pi
+
+from mathutils import Matrix
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.curve.primitives import SvCircle
+from sverchok.utils.curve.nurbs import SvNativeNurbsCurve
+from sverchok.utils.curve.algorithms import SvCurveLengthSolver
+
+class CurveLengthTests(SverchokTestCase):
+    def test_circle_length(self):
+        circle = SvCircle(Matrix(), 2.0)
+        circle.u_bounds = (0.0, pi)
+        self.assertAlmostEqual(circle.calc_length(0.0, pi), 2*pi, places=6)
+        self.assertAlmostEqual(circle.calc_length(0.5, 1.5), 2.0, places=6)
+
+    def test_circle_solve(self):
+        circle = SvCircle(Matrix(), 1.0)
+        circle.u_bounds = (0.0, 2*pi)
+        solver = SvCurveLengthSolver(circle)
+        solver.prepare('ADAPTIVE')
+        lengths = np.linspace(0.0, 2*pi, num=20)
+        ts = solver.solve(lengths)
+        self.assert_numpy_arrays_equal(ts, lengths, precision=4)
+
+    def test_cache_invalidation(self):
+        control_points = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+        curve = SvNativeNurbsCurve(2, [0, 0, 0, 1, 1, 1], control_points)
+        self.assertAlmostEqual(curve.calc_length(0.0, 1.0), 2.0, places=6)
+        curve.control_points[2] = [4.0, 0.0, 0.0]
+        self.assertAlmostEqual(curve.calc_length(0.0, 1.0), 4.0, places=6)
+
+    def test_solve_precision(self):
+        # speed of this curve varies a lot along it
+        control_points = np.array([[0.0, 0.0, 0.0], [0.1, 0.0, 0.0], [0.2, 0.1, 0.0], [3.0, 2.0, 0.0], [4.0, 0.0, 1.0]])
+        curve = SvNativeNurbsCurve(3, [0, 0, 0, 0, 0.3, 1, 1, 1, 1], control_points)
+        table = curve.get_length_table(tolerance=1e-9)
+        lengths = np.linspace(0.0, table.get_total_length(), num=50)
+        ts = table.solve(lengths)
+        self.assert_numpy_arrays_equal(table.calc_length_array(ts), lengths, precision=8)
+
+    def test_cache_key_by_geometry(self):
+        circle = SvCircle(Matrix(), 1.0)
+        self.assertAlmostEqual(circle.calc_length(0.0, pi), pi, places=6)
+        # the cached table is copied together with other attributes
+        bigger = copy(circle)
+        bigger.radius, bigger.vectorx = 2.0, 2.0 * circle.vectorx
+        self.assertAlmostEqual(bigger.calc_length(0.0, pi), 2*pi, places=6)
+        circle.radius, circle.vectorx = 3.0, 3.0 * circle.vectorx
+        self.assertAlmostEqual(circle.calc_length(0.0, pi), 3*pi, places=6)
@@ -0,0 +1,32 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.modules.eval_formula import (
+        sv_compile, safe_eval_compiled, compile_vectorized, numpy_code)
+
+class VectorizedFormulaTests(SverchokTestCase):
+    def assert_same_as_scalar(self, formula, xs, ys):
+        evaluate = compile_vectorized(formula)
+        self.assertTrue(evaluate.vectorized)
+        result = np.broadcast_to(evaluate(dict(x=xs, y=ys)), xs.shape)
+        compiled = sv_compile(formula)
+        expected = [safe_eval_compiled(compiled, dict(x=x, y=y)) for x, y in zip(xs, ys)]
+        self.assert_numpy_arrays_equal(result.astype(np.float64), np.array(expected, dtype=np.float64), precision=8)
+
+    def test_vectorized(self):
+        xs = np.linspace(-2, 2, 11)
+        ys = np.linspace(0, 1, 11)
+        for formula in ["x*x + y*y", "sin(x)*cos(y) + 2**y", "atan2(y, x) + pow(y, 2)",
+                        "abs(x) if x < 0.5 else sqrt(y)", "0 < x < 1 or not y > 0.5", "pi*e",
+                        "x or 3", "y and x + 1", "x > 0 and y or -1"]:
+            with self.subTest(formula=formula):
+                self.assert_same_as_scalar(formula, xs, ys)
+
+    def test_not_vectorizable(self):
+        for formula in ["[g*g for g in x]", "log(x, 2)", "x.real", "Vector((x, y, 0))"]:
+            with self.subTest(formula=formula):
+                self.assertIsNone(numpy_code(formula))
+                self.assertFalse(compile_vectorized(formula).vectorized)
+
+    def test_cache(self):
+        self.assertIs(compile_vectorized("x + 1"), compile_vectorized("x + 1"))
@@ -0,0 +1,18 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.evolver_workers import genome_key, json_value
+
+class EvolverWorkersTests(SverchokTestCase):
+    def test_genome_key(self):
+        genes = [1.5, 3, [2, 0, 1], [[0.0, 1.0, 2.0]]]
+        same = [1.5, 3, [2, 0, 1], [np.array([0.0, 1.0, 2.0])]]
+        other = [1.5, 3, [0, 2, 1], [[0.0, 1.0, 2.0]]]
+        self.assertEqual(genome_key(genes), genome_key(same))
+        self.assertNotEqual(genome_key(genes), genome_key(other))
+        self.assertEqual(len({genome_key(genes), genome_key(same), genome_key(other)}), 2)
+
+    def test_json_value(self):
+        genes = [np.float64(1.5), np.int64(3), np.array([2, 0, 1])]
+        self.assertEqual(json_value(genes), [1.5, 3, [2, 0, 1]])
+        self.assertIsInstance(json_value(genes)[1], int)
@@ -1,8 +1,13 @@
+from unittest.mock import patch
+
 from sverchok.utils.testing import SverchokTestCase
 from sverchok.utils.geom_2d.make_monotone import monotone_sv_face_with_holes
 from sverchok.utils.geom_2d.intersections import intersect_sv_edges
 from sverchok.utils.geom_2d.merge_mesh import edges_to_faces, merge_mesh_light, crop_mesh, crop_edges, merge_mesh
 from sverchok.utils.geom_2d.dissolve_mesh import dissolve_faces
+from sverchok.utils.geom_2d import merge_mesh as merge_mesh_module
+from sverchok.utils.geom_2d.merge_mesh import DCELMesh, DCELArrayMesh, find_intersections, monotone_faces_with_holes, \
+    mark_not_in_faces, get_min_face_indexes
 
 
 class MakeMonotoneTest(SverchokTestCase):
@@ -293,3 +298,60 @@ class DissolveFaces2DTest(SverchokTestCase):
         self.assert_sverchok_data_equal(expected_faces, result_faces)
         self.assert_sverchok_data_equal(expected_face_mask, result_face_mask)
         self.assert_sverchok_data_equal(expected_index_mask, result_index_mask)
+
+
+class DCELArrayMeshTest(SverchokTestCase):
+    # DCELArrayMesh should give the same results as DCELMesh
+
+    @staticmethod
+    def edges_to_faces(mesh_class, sv_points, sv_edges):
+        mesh = mesh_class(accuracy=5)
+        mesh.from_sv_edges(sv_points, sv_edges)
+        find_intersections(mesh, 5)
+        mesh.generate_faces_from_hedges()
+        monotone_faces_with_holes(mesh)
+        return mesh.to_sv_mesh(edges=False, del_face_flag='del')
+
+    @staticmethod
+    def merge_faces(mesh_class, sv_points, sv_faces):
+        mesh = mesh_class(accuracy=5)
+        mesh.from_sv_faces(sv_points, sv_faces, face_data={'index': list(range(len(sv_faces)))})
+        find_intersections(mesh, 5, face_overlapping=True)
+        mesh.generate_faces_from_hedges()
+        mark_not_in_faces(mesh)
+        monotone_faces_with_holes(mesh)
+        return list(mesh.to_sv_mesh(edges=False, del_face_flag='del')) + [get_min_face_indexes(mesh, 'index')]
+
+    def test_grid_with_crossing_edges(self):
+        sv_points = [(i, j, 0.0) for j in range(5) for i in range(5)] + [(0.5, 0.3, 0.0), (3.5, 3.7, 0.0)]
+        sv_edges = [(j * 5 + i, j * 5 + i + 1) for j in range(5) for i in range(4)] + \
+                   [(i * 5 + j, (i + 1) * 5 + j) for j in range(5) for i in range(4)] + [(25, 26)]
+
+        expected_points, expected_faces = self.edges_to_faces(DCELMesh, sv_points, sv_edges)
+        result_points, result_faces = self.edges_to_faces(DCELArrayMesh, sv_points, sv_edges)
+        self.assert_sverchok_data_equal(expected_points, result_points, precision=5)
+        self.assert_sverchok_data_equal(expected_faces, result_faces)
+
+    def test_overlapping_squares(self):
+        sv_points = [(0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0), (1, 1, 0), (3, 1, 0), (3, 3, 0), (1, 3, 0),
+                     (0.5, 0.5, 0), (1.5, 0.5, 0), (1.5, 1.5, 0), (0.5, 1.5, 0)]
+        sv_faces = [[0, 1, 2, 3], [4, 5, 6, 7], [8, 11, 10, 9]]
+
+        expected = self.merge_faces(DCELMesh, sv_points, sv_faces)
+        result = self.merge_faces(DCELArrayMesh, sv_points, sv_faces)
+        self.assert_sverchok_data_equal(expected[0], result[0], precision=5)
+        self.assert_sverchok_data_equal(expected[1], result[1])
+        self.assert_sverchok_data_equal(expected[2], result[2])
+
+    def test_edges_to_faces_without_intersections(self):
+        sv_points = [(i, j, 0.0) for j in range(5) for i in range(5)]
+        sv_edges = [(j * 5 + i, j * 5 + i + 1) for j in range(5) for i in range(4)] + \
+                   [(i * 5 + j, (i + 1) * 5 + j) for j in range(5) for i in range(4)]
+
+        expected_points, expected_faces = edges_to_faces(sv_points, sv_edges, do_intersect=False)
+        with patch.object(merge_mesh_module, 'ARRAY_MESH_MIN_EDGES', 1), \
+                patch.object(merge_mesh_module, 'DCELArrayMesh', wraps=DCELArrayMesh) as array_mesh:
+            result_points, result_faces = edges_to_faces(sv_points, sv_edges, do_intersect=False)
+        array_mesh.assert_called_once()
+        self.assert_sverchok_data_equal(expected_points, result_points, precision=5)
+        self.assert_sverchok_data_equal(expected_faces, result_faces)
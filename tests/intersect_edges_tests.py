@@ -1,5 +1,10 @@
+import random
+
+from mathutils import Vector
+
 from sverchok.core.update_system import process_tree
 from sverchok.utils.testing import *
+from sverchok.utils.intersect_edges import intersect_edges_2d, intersect_edges_2d_bruteforce, edges_grid_candidates
 
 
 class IntersectEdgesTest2(ReferenceTreeTestCase):
@@ -18,3 +23,37 @@ class IntersectEdgesTest2(ReferenceTreeTestCase):
         self.assert_sverchok_data_equals_file(result_verts, "intersecting_planes_result_verts.txt", precision=8)
         #self.store_reference_sverchok_data("intersecting_planes_result_faces.txt", result_edges)
         self.assert_sverchok_data_equals_file(result_edges, "intersecting_planes_result_faces.txt", precision=8)
+
+class IntersectEdges2DGridTest(SverchokTestCase):
+    def test_same_as_bruteforce(self):
+        rnd = random.Random(7)
+        verts = [(rnd.random(), rnd.random(), 0.0) for i in range(200)]
+        edges = [(2*i, 2*i+1) for i in range(100)]
+        # edges sharing vertices and zero-length edge
+        edges.extend([(0, 5), (5, 9), (3, 3)])
+
+        expected = intersect_edges_2d_bruteforce(list(verts), edges, 1e-5)
+        result = intersect_edges_2d(list(verts), edges, 1e-5)
+        self.assertEqual(result, expected)
+
+    def test_long_edges(self):
+        rnd = random.Random(11)
+        # many short edges and a few very long ones crossing all of them
+        verts = []
+        for i in range(300):
+            x, y = rnd.uniform(0, 100), rnd.uniform(0, 100)
+            verts.extend([(x, y, 0.0), (x + rnd.uniform(-0.5, 0.5), y + rnd.uniform(-0.5, 0.5), 0.0)])
+        verts.extend([(0.0, 0.0, 0.0), (100.0, 100.0, 0.0), (0.0, 50.0, 0.0), (100.0, 50.0, 0.0)])
+        edges = [(2*i, 2*i+1) for i in range(300)] + [(600, 601), (602, 603)]
+
+        expected = intersect_edges_2d_bruteforce(list(verts), edges, 1e-5)
+        result = intersect_edges_2d(list(verts), edges, 1e-5)
+        self.assertEqual(result, expected)
+
+        verts_in = [Vector(v) for v in verts]
+        ed_lengths = [(verts_in[e[1]] - verts_in[e[0]]).length for e in edges]
+        candidates = edges_grid_candidates(verts_in, edges, ed_lengths)
+        # the horizontal long edge is checked against all edges crossing its line
+        crossing = {i for i, (a, b) in enumerate(edges[:-1]) if min(verts[a][1], verts[b][1]) <= 50 <= max(verts[a][1], verts[b][1])}
+        self.assertIn(300, crossing)
+        self.assertTrue(crossing <= set(candidates[301]))
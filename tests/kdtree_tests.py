@@ -0,0 +1,44 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.kdtree import SvBlenderKdTree, SvBruteforceKdTree, SvGridKdTree
+
+class KdTreeTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        rng = np.random.RandomState(42)
+        self.points = rng.uniform(0.0, 1.0, size=(300, 3))
+        # some needles lie outside of points bounding box
+        self.needles = rng.uniform(-0.2, 1.2, size=(500, 3))
+
+    def _check_nearest(self, kdt, power=2):
+        for count in [1, 3]:
+            _, _, expected = SvBruteforceKdTree(self.points, power=power).query_array(self.needles, count)
+            locs, idxs, distances = kdt.query_array(self.needles, count)
+            self.assert_numpy_arrays_equal(distances, expected, precision=8)
+            self.assert_numpy_arrays_equal(locs, self.points[idxs], precision=8)
+
+    def test_bruteforce_single(self):
+        kdt = SvBruteforceKdTree(self.points)
+        loc, idx, distance = kdt.query(self.needles[0])
+        expected = np.linalg.norm(self.points - self.needles[0], axis=1).min()
+        self.assertAlmostEqual(distance, expected)
+
+    def test_grid(self):
+        self._check_nearest(SvGridKdTree(self.points))
+
+    def test_grid_manhattan(self):
+        self._check_nearest(SvGridKdTree(self.points, power=1), power=1)
+
+    def test_blender(self):
+        self._check_nearest(SvBlenderKdTree(self.points))
+
+    def test_query_ball(self):
+        radius = 0.15
+        expected = SvBruteforceKdTree(self.points)
+        for kdt in [SvGridKdTree(self.points), SvBlenderKdTree(self.points)]:
+            locs, idxs, distances = kdt.query_ball_array(self.needles[:50], radius)
+            for needle, needle_idxs, needle_distances in zip(self.needles[:50], idxs, distances):
+                _, expected_idxs, expected_distances = expected.query_ball(needle, radius)
+                self.assertEqual(set(needle_idxs.tolist()), set(expected_idxs.tolist()))
+                self.assert_numpy_arrays_equal(needle_distances, expected_distances, precision=8)
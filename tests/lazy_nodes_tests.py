@@ -0,0 +1,108 @@
+import os
+import sys
+import tempfile
+import unittest.mock
+from types import SimpleNamespace
+
+import bpy
+
+import sverchok
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core import lazy_nodes
+
+PACKAGE = "sv_lazy_nodes_test"
+
+LAZY_MODULE = '''
+import bpy
+
+class SvLazyTestNode(bpy.types.Node):
+    bl_idname = 'SvLazyTestNode'
+    bl_label = 'Lazy Test'
+
+def register():
+    bpy.utils.register_class(SvLazyTestNode)
+
+def unregister():
+    bpy.utils.unregister_class(SvLazyTestNode)
+'''
+
+# defines an operator, so it can not be deferred
+EAGER_MODULE = '''
+import bpy
+
+class SvEagerTestNode(bpy.types.Node):
+    bl_idname = 'SvEagerTestNode'
+    bl_label = 'Eager Test'
+
+class SvEagerTestOperator(bpy.types.Operator):
+    bl_idname = "node.sv_eager_test"
+    bl_label = "Eager Test"
+
+classes = [SvEagerTestNode, SvEagerTestOperator]
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+'''
+
+def registered(bl_idname):
+    return bpy.types.Node.bl_rna_get_subclass_py(bl_idname)
+
+class LazyNodesTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        category_path = os.path.join(self.directory.name, PACKAGE, "testcat")
+        os.makedirs(category_path)
+        for path, source in [(os.path.join(self.directory.name, PACKAGE, "__init__.py"), ""),
+                             (os.path.join(category_path, "__init__.py"), ""),
+                             (os.path.join(category_path, "lazy_node.py"), LAZY_MODULE),
+                             (os.path.join(category_path, "eager_node.py"), EAGER_MODULE)]:
+            with open(path, 'w') as module:
+                module.write(source)
+        sys.path.insert(0, self.directory.name)
+        self.nodes = SimpleNamespace(directory = os.path.join(self.directory.name, PACKAGE),
+                                     nodes_dict = {'testcat': ['lazy_node', 'eager_node']})
+        self.base_name = unittest.mock.patch.object(lazy_nodes, "base_name", PACKAGE)
+        self.base_name.start()
+        self.statistics = dict(lazy_nodes.lazy_statistics)
+        self.node_list = []
+
+    def tearDown(self):
+        for module in reversed(self.node_list):
+            module.unregister()
+        lazy_nodes.lazy_modules.clear()
+        lazy_nodes.lazy_bl_idnames.clear()
+        lazy_nodes.lazy_statistics.update(self.statistics)
+        for bl_idname in ['SvLazyTestNode', 'SvEagerTestNode']:
+            sverchok.utils.node_classes.pop(bl_idname, None)
+        self.base_name.stop()
+        sys.path.remove(self.directory.name)
+        for name in list(sys.modules):
+            if name.startswith(PACKAGE):
+                del sys.modules[name]
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_eager_and_lazy_modules(self):
+        self.node_list = lazy_nodes.make_node_list_lazy(self.nodes)
+        for module in self.node_list:
+            module.register()
+
+        self.assertIn(f"{PACKAGE}.testcat.eager_node", sys.modules)
+        self.assertNotIn(f"{PACKAGE}.testcat.lazy_node", sys.modules)
+        self.assertEqual(lazy_nodes.lazy_statistics['eager'], 1)
+        self.assertEqual(lazy_nodes.lazy_statistics['deferred'], 1)
+        self.assertFalse(lazy_nodes.is_stub(registered('SvEagerTestNode')))
+        self.assertTrue(lazy_nodes.is_stub(registered('SvLazyTestNode')))
+
+        realized = lazy_nodes.lazy_statistics['realized']
+        lazy_nodes.ensure_registered(['SvLazyTestNode', 'SvEagerTestNode'])
+        self.assertIn(f"{PACKAGE}.testcat.lazy_node", sys.modules)
+        self.assertFalse(lazy_nodes.is_stub(registered('SvLazyTestNode')))
+        self.assertEqual(lazy_nodes.lazy_statistics['realized'], realized + 1)
+        self.assertNotIn('SvLazyTestNode', lazy_nodes.lazy_bl_idnames)
@@ -0,0 +1,39 @@
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.loop_executor import loop_variant_nodes
+
+class FakeSocket(object):
+    def __init__(self, socket_id, other=None):
+        self.socket_id = socket_id
+        self.other = other
+        self.is_linked = other is not None
+
+class FakeNode(object):
+    def __init__(self, name, inputs, n_outputs=1):
+        self.name = name
+        self.inputs = [FakeSocket(name + "_in" + str(i), other) for i, other in enumerate(inputs)]
+        self.outputs = [FakeSocket(name + "_out" + str(i)) for i in range(n_outputs)]
+
+class LoopExecutorTests(SverchokTestCase):
+    def test_variant_nodes(self):
+        # outputs: Loop Out, Loop Number, Total Loops, Data 0
+        loop_in = FakeNode("loop_in", [], 4)
+        total = FakeNode("total", [loop_in.outputs[2]])
+        number = FakeNode("number", [loop_in.outputs[1]])
+        data = FakeNode("data", [loop_in.outputs[3], total.outputs[0]])
+        after_total = FakeNode("after_total", [total.outputs[0], None])
+        after_data = FakeNode("after_data", [after_total.outputs[0], data.outputs[0]])
+        body = [total, number, data, after_total, after_data]
+        variant = loop_variant_nodes(loop_in, body)
+        self.assertEqual([node.name for node in variant], ["number", "data", "after_data"])
+
+    def test_wifi_dependencies(self):
+        loop_in = FakeNode("loop_in", [], 4)
+        wifi_in = FakeNode("wifi_in", [loop_in.outputs[1]], 0)
+        wifi_out = FakeNode("wifi_out", [])
+        user = FakeNode("user", [wifi_out.outputs[0]])
+        constant = FakeNode("constant", [])
+        body = [wifi_in, constant, wifi_out, user]
+        dependencies = {"wifi_in": {"loop_in"}, "wifi_out": {"wifi_in"}, "user": {"wifi_out"}}
+        self.assertEqual([node.name for node in loop_variant_nodes(loop_in, body)], ["wifi_in"])
+        variant = loop_variant_nodes(loop_in, body, dependencies)
+        self.assertEqual([node.name for node in variant], ["wifi_in", "wifi_out", "user"])
@@ -0,0 +1,34 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.marching_cubes import isosurface_np, isosurface_vectorized
+
+class MarchingCubesTests(SverchokTestCase):
+    def _check_same(self, data, isolevel):
+        expected_verts, expected_faces = isosurface_np(data, isolevel)
+        verts, faces = isosurface_vectorized(data, isolevel)
+        self.assertEqual(faces.tolist(), expected_faces)
+        self.assert_numpy_arrays_equal(verts, np.asarray(expected_verts), precision=8)
+
+    def test_sphere(self):
+        xs = np.arange(12)
+        x, y, z = np.meshgrid(xs, xs, xs, indexing='ij')
+        data = ((x - 5.5)**2 + (y - 5.0)**2 + (z - 4.5)**2).astype(np.float64)
+        self._check_same(data, 16.0)
+
+    def test_sphere_exact_values(self):
+        # some grid points lie exactly on the isosurface
+        xs = np.arange(10)
+        x, y, z = np.meshgrid(xs, xs, xs, indexing='ij')
+        data = ((x - 5)**2 + (y - 5)**2 + (z - 5)**2).astype(np.float64)
+        self._check_same(data, 9.0)
+
+    def test_random_field(self):
+        data = np.random.RandomState(42).rand(7, 8, 9)
+        self._check_same(data, 0.5)
+
+    def test_empty(self):
+        verts, faces = isosurface_vectorized(np.zeros((5, 5, 5)), 1.0)
+        self.assertEqual(verts.shape, (0, 3))
+        self.assertEqual(len(faces), 0)
+
@@ -0,0 +1,76 @@
+import bpy
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.mesh_arrays import (pydata_from_mesh, material_indices_from_mesh, split_polygons,
+        flat_polygons, edges_array, topology_fingerprint, write_mesh)
+
+class MeshArraysTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mesh = bpy.data.meshes.new("sv_mesh_arrays_test")
+        verts = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0)]
+        faces = [(0, 1, 2, 3), (1, 4, 2)]
+        self.mesh.from_pydata(verts, [], faces)
+        self.mesh.update()
+
+    def tearDown(self):
+        bpy.data.meshes.remove(self.mesh)
+        super().tearDown()
+
+    def test_pydata_from_mesh(self):
+        verts, edges, faces = pydata_from_mesh(self.mesh)
+        self.assert_sverchok_data_equal(verts, [list(v.co) for v in self.mesh.vertices], precision=6)
+        self.assertEqual(sorted(map(tuple, edges)), sorted(self.mesh.edge_keys))
+        self.assertEqual(faces, [list(p.vertices) for p in self.mesh.polygons])
+        self.assertEqual(material_indices_from_mesh(self.mesh).tolist(), [0, 0])
+
+    def test_pydata_from_mesh_numpy(self):
+        verts, edges, faces = pydata_from_mesh(self.mesh, output_numpy=True)
+        self.assertEqual(verts.shape, (5, 3))
+        self.assertEqual(edges.shape, (len(self.mesh.edges), 2))
+        self.assertEqual([f.tolist() for f in faces], [list(p.vertices) for p in self.mesh.polygons])
+
+    def test_split_polygons(self):
+        flat = np.array([0, 1, 2, 2, 3, 4], dtype=np.int32)
+        faces = split_polygons(flat, np.array([0, 3]), np.array([3, 3]), output_numpy=True)
+        self.assertEqual(faces.shape, (2, 3))
+        self.assertTrue(np.shares_memory(faces, flat))
+
+    def test_write_mesh(self):
+        verts = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0), (3, 0, 0)]
+        faces = [[0, 1, 2, 3], [1, 4, 2]]
+        edges = edges_array([[4, 5]])
+        write_mesh(self.mesh, verts, edges, *flat_polygons(faces))
+        self.mesh.update()
+        self.assertEqual(len(self.mesh.vertices), 6)
+        self.assertEqual([list(p.vertices) for p in self.mesh.polygons], faces)
+        self.assertEqual(len(self.mesh.edges), 7)
+        self.assertIn((4, 5), self.mesh.edge_keys)
+
+    def test_write_mesh_negative_indices(self):
+        verts = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (3, 0, 0)]
+        write_mesh(self.mesh, verts, edges_array([[-1, 1]]), *flat_polygons([[0, 1, -2]]))
+        self.mesh.update()
+        self.assertEqual([list(p.vertices) for p in self.mesh.polygons], [[0, 1, 2]])
+        self.assertIn((1, 3), self.mesh.edge_keys)
+
+    def test_write_mesh_bad_indices(self):
+        verts = [(0, 0, 0), (1, 0, 0), (1, 1, 0)]
+        with self.assertRaises(IndexError):
+            write_mesh(self.mesh, verts, edges_array([]), *flat_polygons([[0, 1, 5]]))
+        with self.assertRaises(IndexError):
+            write_mesh(self.mesh, verts, edges_array([]), *flat_polygons([[0, 1, -4]]))
+        with self.assertRaises(IndexError):
+            write_mesh(self.mesh, verts, edges_array([[0, 3]]), *flat_polygons([]))
+        # the mesh is not changed
+        self.assertEqual(len(self.mesh.vertices), 5)
+
+    def test_topology_fingerprint(self):
+        edges = edges_array([])
+        faces = [[0, 1, 2, 3], [1, 4, 2]]
+        fingerprint = topology_fingerprint(5, edges, *flat_polygons(faces)[::2])
+        same = topology_fingerprint(5, edges, *flat_polygons(np.array(faces, dtype=object))[::2])
+        changed = topology_fingerprint(5, edges, *flat_polygons([[0, 1, 2, 3], [1, 2, 4]])[::2])
+        self.assertEqual(fingerprint, same)
+        self.assertNotEqual(fingerprint, changed)
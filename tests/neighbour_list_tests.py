@@ -0,0 +1,33 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.neighbour_list import cell_list_pairs, SvNeighbourList
+
+class NeighbourListTests(SverchokTestCase):
+    def _bruteforce_pairs(self, points, radius):
+        n = len(points)
+        result = set()
+        for i in range(n):
+            for j in range(i+1, n):
+                if np.linalg.norm(points[i] - points[j]) < radius:
+                    result.add((i, j))
+        return result
+
+    def test_cell_list_pairs(self):
+        rng = np.random.default_rng(1)
+        points = rng.uniform(0, 5, size=(200, 3))
+        pairs = cell_list_pairs(points, 0.7)
+        self.assertEqual(len(pairs), len(set(map(tuple, pairs.tolist()))))
+        self.assertEqual(set(map(tuple, pairs.tolist())), self._bruteforce_pairs(points, 0.7))
+
+    def test_neighbour_list_rebuild(self):
+        rng = np.random.default_rng(2)
+        points = rng.uniform(0, 5, size=(200, 3))
+        neighbours = SvNeighbourList(skin=0.5)
+        cutoff = 0.5
+        for step in range(10):
+            pairs = neighbours.pairs(points, cutoff)
+            found = set(map(tuple, pairs.tolist()))
+            self.assertTrue(self._bruteforce_pairs(points, cutoff).issubset(found))
+            points = points + rng.uniform(-0.01, 0.01, size=points.shape)
+        self.assertEqual(neighbours.rebuilds, 1)
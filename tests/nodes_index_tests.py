@@ -0,0 +1,48 @@
+import importlib
+import os
+import tempfile
+
+from sverchok import nodes
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.nodes_index import parse_node_module, load_nodes_index
+
+class NodesIndexTests(SverchokTestCase):
+    def test_index_matches_modules(self):
+        index = load_nodes_index(nodes.directory, nodes.nodes_dict, save=False)
+        for module_name, entry in index.items():
+            if not entry['lazy']:
+                continue
+            with self.subTest(module = module_name):
+                category, name = module_name.split('.')
+                module = importlib.import_module(f"sverchok.nodes.{category}.{name}")
+                for node_info in entry['classes']:
+                    cls = getattr(module, node_info['class_name'])
+                    self.assertEqual(cls.bl_idname, node_info['bl_idname'])
+                    self.assertEqual(cls.bl_label, node_info['bl_label'])
+
+    def test_parse_module(self):
+        source = '''
+import bpy
+from sverchok.node_tree import SverchCustomTreeNode
+
+class SvTestIndexNode(bpy.types.Node, SverchCustomTreeNode):
+    """Triggers: Test"""
+    bl_idname = 'SvTestIndexNode'
+    bl_label = 'Test Index'
+    sv_icon = 'SV_TEST'
+
+class SvTestOperator(bpy.types.Operator):
+    bl_idname = "node.sv_test_index"
+'''
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test_node.py")
+            with open(path, 'w') as module:
+                module.write(source)
+            info = parse_node_module(path)
+        self.assertFalse(info['lazy'])
+        self.assertEqual(len(info['classes']), 1)
+        node_info = info['classes'][0]
+        self.assertEqual(node_info['bl_idname'], 'SvTestIndexNode')
+        self.assertEqual(node_info['bl_label'], 'Test Index')
+        self.assertEqual(node_info['sv_icon'], 'SV_TEST')
+        self.assertEqual(node_info['doc'], "Triggers: Test")
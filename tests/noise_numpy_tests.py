@@ -0,0 +1,61 @@
+import numpy as np
+from mathutils import noise
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils import sv_noise_numpy
+
+class NoiseNumpyTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        rng = np.random.RandomState(42)
+        self.points = rng.uniform(-20.0, 20.0, size=(300, 3))
+        self.seeds = rng.randint(1, 5, size=300)
+
+    def test_noise(self):
+        for noise_basis in sv_noise_numpy.noise_bases:
+            with self.subTest(noise_basis=noise_basis):
+                expected = [noise.noise(p, noise_basis=noise_basis) for p in self.points]
+                result = sv_noise_numpy.noise(self.points, noise_basis=noise_basis)
+                np.testing.assert_allclose(result, np.array(expected, dtype=np.float64), atol=1e-5)
+
+    def test_noise_vector_seed(self):
+        for noise_basis in sv_noise_numpy.noise_bases:
+            for seed in [1, 12345]:
+                with self.subTest(noise_basis=noise_basis, seed=seed):
+                    noise.seed_set(seed)
+                    expected = [noise.noise_vector(p, noise_basis=noise_basis) for p in self.points]
+                    result = sv_noise_numpy.noise_vector(self.points, noise_basis=noise_basis, seed=seed)
+                    np.testing.assert_allclose(result, np.array(expected, dtype=np.float64), atol=1e-5)
+
+    def test_noise_vector_seeds(self):
+        expected = []
+        for p, seed in zip(self.points, self.seeds):
+            noise.seed_set(int(seed))
+            expected.append(noise.noise_vector(p))
+        result = sv_noise_numpy.noise_vector(self.points, seed=self.seeds)
+        np.testing.assert_allclose(result, np.array(expected, dtype=np.float64), atol=1e-5)
+
+    def test_turbulence(self):
+        for noise_basis in ['BLENDER', 'PERLIN_NEW', 'VORONOI_F2F1']:
+            with self.subTest(noise_basis=noise_basis):
+                expected = [noise.turbulence(p, 4, True, noise_basis=noise_basis, amplitude_scale=0.6) for p in self.points]
+                result = sv_noise_numpy.turbulence(self.points, 4, True, noise_basis=noise_basis, amplitude_scale=0.6)
+                np.testing.assert_allclose(result, np.array(expected, dtype=np.float64), atol=1e-5)
+
+    def test_turbulence_vector(self):
+        noise.seed_set(7)
+        expected = [noise.turbulence_vector(p, 3, False, frequency_scale=2.5) for p in self.points]
+        result = sv_noise_numpy.turbulence_vector(self.points, 3, False, frequency_scale=2.5, seed=7)
+        np.testing.assert_allclose(result, np.array(expected, dtype=np.float64), atol=1e-5)
+
+    def test_fractal(self):
+        for noise_basis in ['PERLIN_ORIGINAL', 'VORONOI_F1']:
+            with self.subTest(noise_basis=noise_basis):
+                expected = [noise.fractal(p, 0.7, 2.1, 3.5, noise_basis=noise_basis) for p in self.points]
+                result = sv_noise_numpy.fractal(self.points, 0.7, 2.1, 3.5, noise_basis=noise_basis)
+                np.testing.assert_allclose(result, np.array(expected, dtype=np.float64), atol=1e-5)
+
+    def test_cell(self):
+        expected = [noise.cell(p) for p in self.points]
+        result = sv_noise_numpy.cell(self.points)
+        np.testing.assert_allclose(result, np.array(expected, dtype=np.float64), atol=1e-5)
@@ -61,6 +61,18 @@ class NurbsCurveTests(SverchokTestCase):
 
         self.assert_numpy_arrays_equal(expected, d2s, precision=8)
 
+    def test_basis_matrix(self):
+        "Test sparse basis matrix against recursive basis functions"
+        knotvector = [0, 0, 0, 0.3, 0.3, 0.7, 1, 1, 1]
+        degree = 2
+        count = len(knotvector) - degree - 1
+        ts = np.concatenate((np.linspace(-0.2, 1.2, num=30), knotvector))
+        functions = SvNurbsBasisFunctions(knotvector)
+        matrix = functions.matrix(degree, ts, count, max_order=2, use_cache=False)
+        for k in range(3):
+            expected = np.array([functions.derivative(i, degree, k)(ts) for i in range(count)]).T
+            self.assert_numpy_arrays_equal(matrix.to_dense(count, k), expected, precision=8)
+
     #@unittest.skip
     @requires(geomdl)
     def test_curve_eval(self):
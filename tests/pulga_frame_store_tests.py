@@ -0,0 +1,77 @@
+import os
+import tempfile
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.pulga_frame_store import PulgaFrameStore
+from sverchok.utils.pulga_physics_modular_core import iterate, output_frames
+
+class FakeSystem(object):
+    "bare minimum of PulgaSystem used by recording of frames"
+    def __init__(self, n_verts):
+        self.iteration = 0
+        self.verts = np.zeros((n_verts, 3))
+        self.rads = np.ones(n_verts)
+        self.vel = np.zeros((n_verts, 3))
+        self.params = {"Pins Reactions": np.zeros((n_verts, 3)), "unpinned": np.ones(n_verts, dtype=bool)}
+
+    def iterate(self):
+        self.iteration += 1
+        self.verts[:] = self.iteration
+
+class PulgaFrameStoreTests(SverchokTestCase):
+    def _record(self, store, n_iterations):
+        for iteration in range(1, n_iterations + 1):
+            verts = np.full((4, 3), iteration, dtype=np.float64)
+            store.append(iteration, verts, np.ones(4), np.zeros((4, 3)), np.empty((0, 3)))
+
+    def test_ring_buffer(self):
+        store = PulgaFrameStore(5)
+        self._record(store, 12)
+        self.assertEqual(store.iterations.tolist(), [8, 9, 10, 11, 12])
+        frames = list(store.frames_of([12, 9, 12]))
+        self.assertEqual(len(frames), 2)
+        self.assertTrue((frames[0][0] == 9).all())
+        self.assertTrue((frames[1][0] == 12).all())
+        self.assertTrue(np.shares_memory(frames[1][0], store.frames))
+        # iteration 3 was overwritten
+        with self.assertRaises(LookupError):
+            list(store.frames_of([12, 3, 9]))
+
+    def test_file_backing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frames.npy")
+            store = PulgaFrameStore(3, path)
+            self._record(store, 4)
+            store.flush()
+            del store
+            loaded = PulgaFrameStore.load(path)
+            self.assertEqual(loaded.iterations.tolist(), [2, 3, 4])
+            verts, rads, vel, reactions = next(loaded.frames_of([3]))
+            self.assertTrue((verts == 3).all())
+            self.assertEqual(reactions.shape, (0, 3))
+            self.assertFalse(np.shares_memory(verts, loaded.frames))
+            del loaded
+            # output of previous run is still valid when the file is rewritten
+            store = PulgaFrameStore(3, path)
+            self._record(store, 1)
+            store.flush()
+            self.assertTrue((verts == 3).all())
+            del store
+
+    def test_more_iterations_than_capacity(self):
+        store = PulgaFrameStore(3)
+        iterations = [2500, 1, 1200, 1]
+        ps = FakeSystem(4)
+        iterate(max(iterations), [[i - 1 for i in iterations], ps, True, None], store)
+        self.assertEqual(store.iterations.tolist(), [1, 1200, 2500])
+        out_lists = [[], [], [], []]
+        output_frames(store, iterations, True, out_lists)
+        self.assertEqual([verts[0, 0] for verts in out_lists[0]], [1, 1200, 2500])
+
+        # more requested iterations than the buffer can keep
+        store = PulgaFrameStore(2)
+        iterate(max(iterations), [[i - 1 for i in iterations], FakeSystem(4), True, None], store)
+        with self.assertRaises(LookupError):
+            output_frames(store, iterations, True, [[], [], [], []])
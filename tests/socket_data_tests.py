@@ -0,0 +1,116 @@
+import unittest.mock
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.core.socket_data import (NodeOutputCache, socket_data_cache, socket_data_versions, sv_deep_copy,
+        socket_data_hashes, set_socket_data, data_hash, node_fingerprint)
+
+class FakeRna(object):
+    properties = []
+
+class FakeSocket(object):
+    bl_rna = FakeRna()
+
+    def __init__(self, socket_id, other=None):
+        self.socket_id = socket_id
+        self.identifier = socket_id
+        self.other = other
+        self.is_linked = other is not None
+
+class FakeNode(object):
+    bl_rna = FakeRna()
+
+    def __init__(self, node_id, upstream=None):
+        self.node_id = node_id
+        self.id_data = unittest.mock.Mock()
+        self.id_data.tree_id = "FakeTreeId"
+        self.id_data.sv_draft = False
+        self.outputs = [FakeSocket(node_id + "_out")]
+        self.inputs = [FakeSocket(node_id + "_in", upstream.outputs[0] if upstream else None)]
+
+    def set_output(self, data, version):
+        socket_data_cache.setdefault("FakeTreeId", {})[self.node_id + "_out"] = data
+        socket_data_versions.setdefault("FakeTreeId", {})[self.node_id + "_out"] = version
+
+    def get_output(self):
+        return socket_data_cache["FakeTreeId"][self.node_id + "_out"], socket_data_versions["FakeTreeId"][self.node_id + "_out"]
+
+class NodeOutputCacheTests(SverchokTestCase):
+    def tearDown(self):
+        socket_data_cache.pop("FakeTreeId", None)
+        socket_data_versions.pop("FakeTreeId", None)
+        socket_data_hashes.pop("FakeTreeId", None)
+
+    def test_restore(self):
+        cache = NodeOutputCache()
+        node = FakeNode("A")
+        self.assertFalse(cache.restore(node, "key1"))
+        node.set_output([[1, 2, 3]], 1)
+        cache.store(node, "key1")
+        node.set_output([[4, 5, 6]], 2)
+        self.assertTrue(cache.restore(node, "key1"))
+        self.assertEqual(node.get_output(), ([[1, 2, 3]], 1))
+        self.assertEqual(cache.get_stats(node), (1, 1))
+
+    def test_memory_budget(self):
+        cache = NodeOutputCache(memory_budget=1000)
+        node = FakeNode("A")
+        for i in range(10):
+            node.set_output([list(range(20))], i)
+            cache.store(node, i)
+        self.assertTrue(cache.total_size <= 1000)
+        self.assertFalse(cache.restore(node, 0))
+        self.assertTrue(cache.restore(node, 9))
+
+    def test_upstream_same_data(self):
+        cache = NodeOutputCache()
+        upstream = FakeNode("A")
+        node = FakeNode("B", upstream)
+        set_socket_data("FakeTreeId", "A_out", [[(0.0, 1.0, 2.0)]])
+        node.set_output([[1]], 1)
+        cache.store(node, node_fingerprint(node))
+        # upstream node is processed again and writes equal data
+        set_socket_data("FakeTreeId", "A_out", [[(0.0, 1.0, 2.0)]])
+        node.set_output([[2]], 2)
+        self.assertTrue(cache.restore(node, node_fingerprint(node)))
+        self.assertEqual(node.get_output(), ([[1]], 1))
+        # and then different data
+        set_socket_data("FakeTreeId", "A_out", [[(0.0, 1.0, 3.0)]])
+        self.assertFalse(cache.restore(node, node_fingerprint(node)))
+        self.assertEqual(cache.get_stats(node), (1, 1))
+
+    def test_data_hash(self):
+        self.assertEqual(data_hash([[1.0, 2.0], [3.0]]), data_hash([[1.0, 2.0], [3.0]]))
+        # built-in hash() is the same for -1 and -2
+        self.assertNotEqual(data_hash([-1]), data_hash([-2]))
+        array = np.arange(6.0)
+        self.assertEqual(data_hash([array]), data_hash([array.copy()]))
+        self.assertNotEqual(data_hash([array]), data_hash([array.reshape((2, 3))]))
+
+class DeepCopyTests(SverchokTestCase):
+    def test_vertices(self):
+        verts = [[(0, 0, 0), (1, 0, 0)], [(0, 1, 0)]]
+        result = sv_deep_copy(verts)
+        self.assertEqual(result, verts)
+        self.assertIsNot(result[0], verts[0])
+
+    def test_faces(self):
+        faces = [[[0, 1, 2], [1, 2, 3]]]
+        result = sv_deep_copy(faces)
+        self.assertEqual(result, faces)
+        result[0][0].append(4)
+        self.assertEqual(faces[0][0], [0, 1, 2])
+
+    def test_mixed_rows(self):
+        verts = [[(0, 0, 0), [1, 0, 0]]]
+        result = sv_deep_copy(verts)
+        self.assertEqual(result, [[(0, 0, 0), [1, 0, 0]]])
+        result[0][1][0] = 5
+        self.assertEqual(verts[0][1], [1, 0, 0])
+
+    def test_irregular(self):
+        data = [[1, 2], [[3]]]
+        result = sv_deep_copy(data)
+        self.assertEqual(result, data)
+        self.assertIsNot(result[1][0], data[1][0])
@@ -0,0 +1,60 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.spatial_hash import SvSpatialHashGrid
+
+class SpatialHashTests(SverchokTestCase):
+    def _check_bruteforce(self, points, radiuses, candidates, candidate_radiuses, min_r):
+        """Sequential check of each candidate against all accepted points."""
+        points = list(points)
+        radiuses = list(radiuses)
+        result = []
+        for candidate, radius in zip(candidates, candidate_radiuses):
+            if points:
+                distances = np.linalg.norm(np.array(points) - candidate, axis=1)
+                if min_r is not None:
+                    ok = (distances >= min_r).all()
+                else:
+                    ok = (np.array(radiuses) + radius < distances).all()
+            else:
+                ok = True
+            result.append(ok)
+            if ok:
+                points.append(candidate)
+                radiuses.append(radius)
+        return result
+
+    def test_min_distance(self):
+        rng = np.random.default_rng(1)
+        min_r = 0.3
+        grid = SvSpatialHashGrid(cell_size = 2*min_r)
+        points = rng.uniform(0, 5, size=(50, 3))
+        grid.insert(points)
+        candidates = rng.uniform(0, 5, size=(100, 3))
+        expected = self._check_bruteforce(points, np.zeros(50), candidates, np.zeros(100), min_r)
+        good = grid.check(candidates, min_r = min_r)
+        self.assertEqual(good.tolist(), expected)
+
+    def test_radiuses(self):
+        rng = np.random.default_rng(2)
+        grid = SvSpatialHashGrid()
+        points = rng.uniform(0, 5, size=(50, 3))
+        radiuses = rng.uniform(0, 0.4, size=50)
+        grid.insert(points, radiuses)
+        candidates = rng.uniform(0, 5, size=(100, 3))
+        candidate_radiuses = rng.uniform(0, 0.4, size=100)
+        expected = self._check_bruteforce(points, radiuses, candidates, candidate_radiuses, None)
+        good = grid.check(candidates, radiuses = candidate_radiuses)
+        self.assertEqual(good.tolist(), expected)
+
+    def test_insert_checked(self):
+        rng = np.random.default_rng(3)
+        min_r = 0.05
+        grid = SvSpatialHashGrid(cell_size = 2*min_r)
+        candidates = rng.uniform(0, 1, size=(1000, 3))
+        good = grid.insert_checked(candidates, min_r = min_r)
+        self.assertEqual(grid.count, good.sum())
+        points = grid.points
+        distances = np.linalg.norm(points[:, np.newaxis, :] - points[np.newaxis, :, :], axis=2)
+        np.fill_diagonal(distances, np.inf)
+        self.assertTrue((distances >= min_r).all())
@@ -0,0 +1,58 @@
+import csv
+import json
+import os
+import tempfile
+from types import SimpleNamespace
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.socket_data import socket_data_cache
+from sverchok.core.telemetry import TelemetryStore
+
+class TelemetryTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        tree = SimpleNamespace(name="TelemetryTree", tree_id="telemetry_tree_id")
+        output = SimpleNamespace(socket_id="telemetry_socket_id")
+        self.node = SimpleNamespace(id_data=tree, name="Node", bl_idname="SvFakeNode", outputs=[output])
+        socket_data_cache[tree.tree_id] = {output.socket_id: [[1, 2, 3], [4, 5]]}
+
+    def tearDown(self):
+        socket_data_cache.pop("telemetry_tree_id", None)
+        super().tearDown()
+
+    def test_ring_buffer(self):
+        store = TelemetryStore(capacity=3)
+        for i in range(5):
+            store.record(self.node, store.new_run(), float(i), 0.5)
+        records = store.get_records()
+        self.assertEqual([record.run for record in records], [3, 4, 5])
+        self.assertEqual(records[0].objects, 2)
+        summary = store.get_summary()
+        self.assertEqual(summary[("TelemetryTree", "Node")]['count'], 3)
+
+    def test_dump(self):
+        store = TelemetryStore()
+        run = store.new_run()
+        store.record(self.node, run, 1.0, 0.25)
+        store.record(self.node, run, 2.0, 0.0, error=Exception("Fake failure"))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "telemetry.json")
+            store.dump(path, 'JSON')
+            with open(path) as f:
+                records = json.load(f)
+            self.assertEqual(len(records), 2)
+            self.assertIsNone(records[0]['error'])
+
+            path = os.path.join(directory, "telemetry.csv")
+            store.dump(path, 'CSV')
+            with open(path) as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(rows[0]['node'], "Node")
+
+            path = os.path.join(directory, "telemetry_trace.json")
+            store.dump(path, 'TRACE')
+            with open(path) as f:
+                events = json.load(f)['traceEvents']
+            complete = [event for event in events if event['ph'] == 'X']
+            self.assertEqual(len(complete), 2)
+            self.assertEqual(complete[0]['dur'], 250000.0)
@@ -0,0 +1,111 @@
+import numpy as np
+
+from mathutils.bvhtree import BVHTree
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.triangle_bvh import SvTriangleBVH, closest_points_on_triangles
+
+def uv_sphere(n_u, n_v, radius=1.0):
+    j, i = np.mgrid[0:n_v+1, 0:n_u]
+    theta = np.pi * j / n_v
+    phi = 2 * np.pi * i / n_u
+    verts = np.stack((radius * np.sin(theta) * np.cos(phi),
+                      radius * np.sin(theta) * np.sin(phi),
+                      radius * np.cos(theta)), axis=-1).reshape((-1, 3))
+    j, i = np.mgrid[0:n_v, 0:n_u]
+    a = j * n_u + i
+    b = j * n_u + (i + 1) % n_u
+    faces = np.stack((a, b, b + n_u, a + n_u), axis=-1).reshape((-1, 4))
+    return verts.tolist(), faces.tolist()
+
+class TriangleBvhTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.verts, self.faces = uv_sphere(24, 12)
+        # a hexagon above the sphere, to check tessellation of ngons
+        n = len(self.verts)
+        self.verts.extend([(0.5 * np.cos(a), 0.5 * np.sin(a), 1.5) for a in np.linspace(0, 2*np.pi, 6, endpoint=False)])
+        self.faces.append(list(range(n, n + 6)))
+        self.bvh = SvTriangleBVH(self.verts, self.faces)
+        self.blender_bvh = BVHTree.FromPolygons(self.verts, self.faces)
+        rng = np.random.RandomState(42)
+        self.points = rng.uniform(-2.0, 2.0, size=(500, 3))
+        self.directions = rng.normal(size=(500, 3))
+
+    def test_closest_points_on_triangles(self):
+        a = np.array([[0.0, 0.0, 0.0]] * 4)
+        b = np.array([[1.0, 0.0, 0.0]] * 4)
+        c = np.array([[0.0, 1.0, 0.0]] * 4)
+        p = np.array([[0.2, 0.2, 1.0], [-1.0, -1.0, 0.0], [1.0, 1.0, 0.0], [0.5, -1.0, 0.0]])
+        expected = np.array([[0.2, 0.2, 0.0], [0.0, 0.0, 0.0], [0.5, 0.5, 0.0], [0.5, 0.0, 0.0]])
+        self.assert_numpy_arrays_equal(closest_points_on_triangles(p, a, b, c), expected, precision=8)
+
+    def test_find_nearest(self):
+        locations, normals, indices, distances = self.bvh.find_nearest(self.points)
+        for point, location, index, distance in zip(self.points, locations, indices, distances):
+            expected_location, _, expected_index, expected_distance = self.blender_bvh.find_nearest(point)
+            self.assertAlmostEqual(distance, expected_distance, places=5)
+            # Blender works in single precision, points near edges can be off a bit more
+            np.testing.assert_allclose(location, np.array(expected_location, dtype=np.float64), atol=1e-4)
+        self.assert_numpy_arrays_equal(np.linalg.norm(locations - self.points, axis=1), distances, precision=8)
+
+    def test_find_nearest_distance(self):
+        _, _, _, all_distances = self.bvh.find_nearest(self.points)
+        locations, normals, indices, distances = self.bvh.find_nearest(self.points, distance=0.3)
+        found = indices >= 0
+        self.assertTrue((found == (all_distances <= 0.3)).all())
+        self.assert_numpy_arrays_equal(distances[found], all_distances[found], precision=8)
+        self.assertTrue(np.isinf(distances[~found]).all())
+        self.assertTrue(np.isnan(locations[~found]).all())
+
+    def test_ray_cast(self):
+        locations, normals, indices, distances = self.bvh.ray_cast(self.points, self.directions)
+        for origin, direction, index, distance in zip(self.points, self.directions, indices, distances):
+            _, expected_normal, expected_index, expected_distance = self.blender_bvh.ray_cast(origin, direction)
+            if expected_index is None:
+                self.assertEqual(index, -1)
+            else:
+                self.assertAlmostEqual(distance, expected_distance, places=5)
+
+    def test_ray_cast_normals(self):
+        locations, normals, indices, distances = self.bvh.ray_cast(self.points, self.directions)
+        hit = indices >= 0
+        self.assertTrue(hit.any())
+        for index, normal in zip(indices[hit], normals[hit]):
+            center = np.mean([self.verts[i] for i in self.faces[index]], axis=0)
+            expected = np.array(self.blender_bvh.find_nearest(center)[1], dtype=np.float64)
+            np.testing.assert_allclose(np.abs(normal), np.abs(expected), atol=1e-5)
+
+    def test_zero_direction(self):
+        _, _, indices, distances = self.bvh.ray_cast([(0, 0, 0)], [(0, 0, 0)])
+        self.assertEqual(indices[0], -1)
+        self.assertTrue(np.isinf(distances[0]))
+
+    def test_empty_mesh(self):
+        bvh = SvTriangleBVH([], [])
+        _, _, indices, _ = bvh.find_nearest(self.points[:3])
+        self.assertEqual(indices.tolist(), [-1, -1, -1])
+        _, _, indices, _ = bvh.ray_cast(self.points[:3], self.directions[:3])
+        self.assertEqual(indices.tolist(), [-1, -1, -1])
+
+    def test_non_planar_quads(self):
+        # results differ noticeably if quads are split along other diagonal
+        verts, faces = uv_sphere(16, 8)
+        rng = np.random.RandomState(13)
+        verts = (np.array(verts) + rng.uniform(-0.05, 0.05, size=(len(verts), 3)) * [0, 0, 1]).tolist()
+        bvh = SvTriangleBVH(verts, faces)
+        blender_bvh = BVHTree.FromPolygons(verts, faces)
+
+        locations, _, _, distances = bvh.find_nearest(self.points)
+        for point, location, distance in zip(self.points, locations, distances):
+            expected_location, _, _, expected_distance = blender_bvh.find_nearest(point)
+            self.assertAlmostEqual(distance, expected_distance, places=5)
+            np.testing.assert_allclose(location, np.array(expected_location, dtype=np.float64), atol=1e-4)
+
+        origins = self.points * [0.3, 0.3, 1.0]
+        directions = -origins
+        _, _, indices, distances = bvh.ray_cast(origins, directions)
+        for origin, direction, index, distance in zip(origins, directions, indices, distances):
+            _, _, expected_index, expected_distance = blender_bvh.ray_cast(origin, direction)
+            self.assertEqual(index, expected_index)
+            self.assertAlmostEqual(distance, expected_distance, places=5)
@@ -1,10 +1,15 @@
 
 import collections
+import threading
 import unittest
+import unittest.mock
 
 from sverchok.utils.testing import *
 from sverchok.utils.logging import debug, info
-from sverchok.core.update_system import make_dep_dict, make_update_list
+from sverchok.core.update_system import make_dep_dict, make_update_list, do_update_parallel
+from sverchok.core.update_system import make_tree_from_nodes, clear_topology_cache, get_topology_cache_stats
+from sverchok.core.update_system import build_update_list, get_dep_dict, update_cache
+from sverchok.core import update_system
 #from sverchok.tests.mocks import *
 
 class UpdateSystemTests(ReferenceTreeTestCase):
@@ -36,3 +41,183 @@ class UpdateSystemTests(ReferenceTreeTestCase):
                 dep_idx = result.index(dep)
                 self.assertTrue(dep_idx < node_idx)
 
+    def test_update_list_cached(self):
+        tree = get_node_tree()
+        clear_topology_cache()
+        first = make_tree_from_nodes(['Box'], tree)
+        second = make_tree_from_nodes(['Box'], tree)
+        self.assertEqual(first, second)
+        stats = get_topology_cache_stats(tree)
+        self.assertEqual(stats['update_list_misses'], 1)
+        self.assertEqual(stats['update_list_hits'], 1)
+
+
+
+class FakeNode(object):
+    def __init__(self, name, log, thread_safe=False, fail=False):
+        self.name = name
+        self.bl_idname = "FakeNode"
+        self.inputs = []
+        self.outputs = []
+        self.sv_thread_safe = thread_safe
+        self.log = log
+        self.fail = fail
+        self.writes = []
+
+    def process_read(self):
+        return self.name, self.log, self.fail
+
+    @staticmethod
+    def process_compute(data):
+        name, log, fail = data
+        if fail:
+            raise Exception("Fake failure")
+        in_main = threading.current_thread() is threading.main_thread()
+        log.append((name, in_main))
+        return in_main
+
+    def process_write(self, result):
+        self.writes.append(threading.current_thread() is threading.main_thread())
+
+    def process(self):
+        self.process_write(self.process_compute(self.process_read()))
+
+
+class FakeNodes(dict):
+    def __init__(self, nodes):
+        super().__init__((node.name, node) for node in nodes)
+        self.id_data = unittest.mock.Mock()
+        self.id_data.name = "FakeTree"
+        self.id_data.sv_show_error_in_tree = False
+
+
+class FakeLink(object):
+    def __init__(self, from_node, to_node):
+        self.from_node = from_node
+        self.to_node = to_node
+        self.from_socket = self.to_socket = True
+        self.is_hidden = False
+
+
+class FakeTree(object):
+    def __init__(self, nodes):
+        self.name = "FakeTopologyTree"
+        self.nodes = FakeNodes(nodes)
+        self.links = []
+
+
+class TopologyCacheTests(SverchokTestCase):
+    def test_invalidation(self):
+        log = []
+        a, b, c = FakeNode("A", log), FakeNode("B", log), FakeNode("C", log)
+        tree = FakeTree([a, b, c])
+        tree.links.append(FakeLink(a, b))
+        clear_topology_cache()
+
+        self.assertEqual(make_tree_from_nodes(["A"], tree), ["A", "B"])
+        self.assertEqual(make_tree_from_nodes(["A"], tree), ["A", "B"])
+        tree.links.append(FakeLink(b, c))
+        self.assertEqual(make_tree_from_nodes(["A"], tree), ["A", "B", "C"])
+
+        stats = get_topology_cache_stats(tree)
+        self.assertEqual(stats['invalidations'], 1)
+        self.assertEqual(stats['update_list_hits'], 1)
+        self.assertEqual(stats['links'], 2)
+
+    def test_dep_dict_not_extended(self):
+        log = []
+        a, b = FakeNode("A", log), FakeNode("B", log)
+        tree = FakeTree([a, b])
+        tree.links.append(FakeLink(a, b))
+        clear_topology_cache()
+        make_tree_from_nodes(["A"], tree)
+        self.assertEqual(get_dep_dict(tree, down=True), {"A": {"B"}})
+        self.assertEqual(get_dep_dict(tree), {"B": {"A"}})
+
+    def test_evaluation_order(self):
+        log = []
+        a, b, c, d = FakeNode("A", log), FakeNode("B", log), FakeNode("C", log), FakeNode("D", log)
+        a.absolute_location = b.absolute_location = (0, 0)
+        c.absolute_location = d.absolute_location = (100, 0)
+        tree = FakeTree([a, b, c, d])
+        tree.sv_subtree_evaluation_order = 'X'
+        tree.links.extend([FakeLink(a, b), FakeLink(c, d)])
+        clear_topology_cache()
+        build_update_list(tree)
+        self.assertEqual(update_cache[tree.name], [["A", "B"], ["C", "D"]])
+        a.absolute_location = b.absolute_location = (200, 0)
+        build_update_list(tree)
+        self.assertEqual(update_cache[tree.name], [["C", "D"], ["A", "B"]])
+        tree.sv_subtree_evaluation_order = 'Y'
+        build_update_list(tree)
+        stats = get_topology_cache_stats(tree)
+        self.assertEqual(stats['rebuilds'], 3)
+        self.assertEqual(stats.get('rebuilds_skipped', 0), 0)
+
+
+class ParallelUpdateTests(SverchokTestCase):
+    def _run(self, nodes, deps, node_lists):
+        dep_dict = collections.defaultdict(set, deps)
+        with unittest.mock.patch("sverchok.core.update_system.get_dep_dict", return_value=dep_dict), \
+                unittest.mock.patch("sverchok.core.update_system.clear_exception_drawing_with_bgl"), \
+                unittest.mock.patch("sverchok.core.update_system.update_error_nodes") as update_error_nodes:
+            times = do_update_parallel(node_lists, nodes)
+        return times, update_error_nodes
+
+    def test_dependencies_order(self):
+        log = []
+        nodes = FakeNodes([FakeNode("A", log, True), FakeNode("B", log, True),
+                           FakeNode("C", log, True), FakeNode("D", log, False),
+                           FakeNode("E", log, True)])
+        deps = {"B": {"A"}, "C": {"A"}, "D": {"B", "C"}}
+        times, _ = self._run(nodes, deps, [["A", "B", "C", "D"], ["E"]])
+
+        names = [name for name, _ in log]
+        self.assertEqual(set(names), {"A", "B", "C", "D", "E"})
+        for name, node_deps in deps.items():
+            for dep in node_deps:
+                self.assertTrue(names.index(dep) < names.index(name))
+        in_main = dict(log)
+        self.assertTrue(in_main["D"])
+        self.assertFalse(in_main["A"])
+        for node in nodes.values():
+            self.assertEqual(node.writes, [True])
+        self.assertEqual(len(times), 2)
+
+    def test_exception_stops_one_set(self):
+        log = []
+        nodes = FakeNodes([FakeNode("A", log, True, fail=True), FakeNode("B", log, True),
+                           FakeNode("C", log, False)])
+        deps = {"B": {"A"}}
+        times, update_error_nodes = self._run(nodes, deps, [["A", "B"], ["C"]])
+
+        self.assertEqual([name for name, _ in log], ["C"])
+        self.assertIsNone(times[0])
+        self.assertIsNotNone(times[1])
+        update_error_nodes.assert_called_once()
+
+
+class ParallelNodeProcessTests(NodeProcessTestCase):
+    node_bl_idname = "DelaunayTriangulation2DNode"
+    connect_output_sockets = ["Polygons"]
+
+    def test_delaunay_in_pool(self):
+        ngon = create_node("SvNGonNode")
+        ngon.sides_ = 7
+        ngon.rand_r_ = 0.2
+        self.tree.links.new(ngon.outputs['Vertices'], self.node.inputs['Vertices'])
+        ngon.process()
+
+        self.node.process()
+        expected = self.get_output_data("Polygons")
+        self.node.outputs['Polygons'].sv_forget()
+
+        with unittest.mock.patch("sverchok.core.update_system.compute_timed",
+                    wraps=update_system.compute_timed) as compute_timed, \
+                unittest.mock.patch("sverchok.core.update_system.clear_exception_drawing_with_bgl"):
+            times = do_update_parallel([[self.node.name]], self.tree.nodes)
+
+        compute_timed.assert_called_once()
+        self.assertIsNotNone(times[0])
+        self.assertTrue(expected[0])
+        self.assert_output_data_equals("Polygons", expected)
@@ -0,0 +1,73 @@
+import unittest.mock
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.dependencies import scipy
+from sverchok.utils.voronoi import Bounds, Site, computeDelaunayTriangulation, lloyd2d
+
+if scipy is not None:
+    from scipy.spatial import cKDTree
+    from sverchok.utils.voronoi import (
+            bounds_halfplanes, voronoi_cells_np, polygon_centers_np,
+            delaunay_triangles_np, lloyd2d_np)
+
+def polygon_areas(polygons, counts):
+    k = polygons.shape[1]
+    idx = np.arange(k)
+    next_idx = (idx[np.newaxis, :] + 1) % counts[:, np.newaxis]
+    rows = np.arange(len(polygons))[:, np.newaxis]
+    valid = idx[np.newaxis, :] < counts[:, np.newaxis]
+    xs, ys = polygons[:, :, 0], polygons[:, :, 1]
+    return 0.5 * ((xs * ys[rows, next_idx] - xs[rows, next_idx] * ys) * valid).sum(axis=1)
+
+@requires(scipy)
+class VoronoiNumpyTests(SverchokTestCase):
+    def make_sites(self, count):
+        rng = np.random.RandomState(1)
+        return np.concatenate((rng.uniform(0, 1, size=(count, 2)), np.zeros((count, 1))), axis=1)
+
+    def test_cells_cover_box(self):
+        sites = self.make_sites(300)
+        bounds = Bounds.new('BOX')
+        bounds.init_from_sites(sites)
+        polygons, counts = voronoi_cells_np(sites, bounds_halfplanes(bounds, clip=0.1))
+        areas = polygon_areas(polygons, counts)
+        self.assertTrue((areas > 0).all())
+        box_area = (bounds.x_max - bounds.x_min + 0.2) * (bounds.y_max - bounds.y_min + 0.2)
+        self.assertAlmostEqual(areas.sum(), box_area, places=8)
+        # center of each cell is nearest to the site of that cell
+        centers = polygon_centers_np(polygons, counts)
+        _, nearest = cKDTree(sites[:, :2]).query(centers)
+        self.assert_numpy_arrays_equal(nearest, np.arange(len(sites)))
+
+    def test_delaunay_same_as_python(self):
+        sites = self.make_sites(100)
+        triangles = delaunay_triangles_np(sites)
+        expected = [tri for tri in computeDelaunayTriangulation([Site(x, y) for x, y, z in sites]) if -1 not in tri]
+        self.assertEqual([tuple(tri) for tri in triangles.tolist()], expected)
+        a, b, c = (sites[triangles[:, i], :2] for i in range(3))
+        cross = (b - a)[:, 0] * (c - a)[:, 1] - (b - a)[:, 1] * (c - a)[:, 0]
+        self.assertTrue((cross < 0).all())
+
+    def test_delaunay_degenerate(self):
+        self.assertEqual(delaunay_triangles_np([(0, 0, 0), (1, 0, 0)]).shape, (0, 3))
+        self.assertEqual(delaunay_triangles_np([(i, 2*i, 0) for i in range(5)]).shape, (0, 3))
+
+    def test_lloyd_keeps_bounds_and_duplicates(self):
+        sites = self.make_sites(200).tolist()
+        sites.append(sites[0])
+        points = lloyd2d_np('CIRCLE', sites, 5, clip=0.0)
+        bounds = Bounds.new('CIRCLE')
+        bounds.init_from_sites(sites)
+        radiuses = np.linalg.norm(points[:, :2] - np.array(bounds.center), axis=1)
+        self.assertTrue((radiuses <= bounds.r_max + 1e-9).all())
+        self.assert_numpy_arrays_equal(points[0], np.array(sites[0]))
+        self.assert_numpy_arrays_equal(points[-1], np.array(sites[0]))
+
+    def test_lloyd_same_as_python(self):
+        sites = self.make_sites(100).tolist()
+        points = lloyd2d_np('BOX', sites, 3)
+        with unittest.mock.patch('sverchok.utils.voronoi.scipy', None):
+            expected = np.array(lloyd2d('BOX', sites, 3))
+        np.testing.assert_allclose(points, expected, atol=1e-6)
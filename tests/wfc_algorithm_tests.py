@@ -0,0 +1,48 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.wfc_algorithm import WaveFunctionCollapse
+
+def make_sample(size=12):
+    ys, xs = np.mgrid[0:size, 0:size]
+    image = np.zeros((size, size, 4))
+    image[..., 3] = 1
+    image[(xs % 4 == 0) | (ys % 4 == 0), :3] = 1
+    image[(xs % 4 == 2) & (ys % 4 == 2), 0] = 1
+    return image
+
+class WaveFunctionCollapseTests(SverchokTestCase):
+    def test_patterns(self):
+        wave = WaveFunctionCollapse(make_sample(), patter_size=2, periodic_input=True, rotate_patterns=False)
+        patterns = {tuple(p.ravel()) for p in wave.patterns}
+        self.assertEqual(len(patterns), wave.number_of_unique_patterns)
+        # each of 12x12 positions of periodic input gives one pattern
+        self.assertEqual(wave.pattern_frequencies.sum(), 144)
+
+    def test_adjacencies(self):
+        wave = WaveFunctionCollapse(make_sample(), patter_size=3, periodic_input=True, rotate_patterns=True)
+        wave.calculate_adjacencies()
+        patterns = wave.patterns
+        for i in range(len(patterns)):
+            for j in range(len(patterns)):
+                left = np.array_equal(patterns[i][:, :-1], patterns[j][:, 1:])
+                up = np.array_equal(patterns[i][:-1], patterns[j][1:])
+                self.assertEqual(wave.allowed_pattern_adjacencies[0][i][j], left)
+                self.assertEqual(wave.allowed_pattern_adjacencies[1][j][i], left)
+                self.assertEqual(wave.allowed_pattern_adjacencies[2][i][j], up)
+                self.assertEqual(wave.allowed_pattern_adjacencies[3][j][i], up)
+
+    def test_solve(self):
+        width, height = 20, 15
+        wave = WaveFunctionCollapse(make_sample(), patter_size=3, periodic_input=True, rotate_patterns=True)
+        image = wave.solve(output_size=(width, height), seed=1, max_number_contradiction_tries=10)
+        self.assertEqual(np.array(image).shape, (height, width, 4))
+        # neighbour cells should have compatible patterns
+        picked = [cell.bit_length() - 1 for cell in wave.wave]
+        for cell in range(width * height):
+            for direction, neighbor in enumerate(wave.cell_neighbors[cell]):
+                if neighbor >= 0:
+                    self.assertTrue(wave.allowed_pattern_adjacencies[direction][picked[cell]][picked[neighbor]])
+        # same seed gives same image
+        wave = WaveFunctionCollapse(make_sample(), patter_size=3, periodic_input=True, rotate_patterns=True)
+        self.assertEqual(wave.solve(output_size=(width, height), seed=1, max_number_contradiction_tries=10), image)
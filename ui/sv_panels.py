@@ -23,6 +23,7 @@ from sverchok.utils import profile
 from sverchok.utils.sv_update_utils import version_and_sha
 from sverchok.ui.development import displaying_sverchok_nodes
 from sverchok.core.update_system import process_tree, build_update_list
+from sverchok.core.telemetry import telemetry
 from sverchok.utils.context_managers import sv_preferences
 
 
@@ -81,6 +82,8 @@ class SV_PT_ActiveTreePanel(SverchokPanels, bpy.types.Panel):
         col.use_property_split = True
         row = col.row(align=True)
         row.prop(ng, "sv_subtree_evaluation_order", text="Eval order", expand=True)
+        col.prop(ng, "sv_parallel_update")
+        col.prop(ng, "sv_output_cache")
         col.prop(ng, "sv_show_error_in_tree", text="Show error")
         if ng.sv_show_error_in_tree:
             col.prop(ng, "sv_show_error_details")
@@ -121,6 +124,14 @@ class SV_PT_ProfilingPanel(SverchokPanels, bpy.types.Panel):
         col_save.operator("node.sverchok_profile_save", text="Save data", icon="FILE_TICK")
         col_save.operator("node.sverchok_profile_reset", text="Reset data", icon="X")
 
+        ng = context.space_data.node_tree
+        if ng and ng.bl_idname == 'SverchCustomTreeType':
+            col.prop(ng, "sv_telemetry")
+        col_telemetry = col.column()
+        col_telemetry.active = bool(telemetry.records)
+        col_telemetry.operator("node.sverchok_telemetry_save", text="Save telemetry", icon="FILE_TICK")
+        col_telemetry.operator("node.sverchok_telemetry_reset", text="Clear telemetry", icon="X")
+
 
 class SV_PT_SverchokUtilsPanel(SverchokPanels, bpy.types.Panel):
     bl_idname = "SV_PT_SverchokUtilsPanel"
@@ -0,0 +1,245 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Running of benchmarks (benchmarks/*_benchmark.py) and comparison of
+their results with a stored baseline.
+
+A benchmark module takes part in the suite by defining function cases(),
+which yields tuples (name, function, args); input data of cases must be
+generated with fixed seeds, so that results of different runs are
+comparable. Each case is run several times, the best time is recorded,
+and peak memory allocated during one more run is recorded as reported by
+tracemalloc (NumPy arrays are included). If the module defines function
+teardown(), it is called after all cases of the module, even if some of
+them failed; it should remove Blender data (node trees, meshes) created
+by cases().
+
+Run with (see run_benchmarks.sh):
+
+    $ blender -b --addons sverchok --python utils/benchmarking.py --python-exit-code 1 -- [options] [pattern]
+
+Options:
+
+    --baseline PATH   baseline file, default benchmarks/baseline.json
+    --save            store results as new baseline
+    --threshold X     relative growth of time or memory reported as regression, default 0.25
+    --repeat N        number of timed runs of each case, default 3
+
+If the baseline file does not exist, results are stored into it.
+Otherwise results are compared with it, and the script fails if there
+are regressions, or if cases of benchmark modules that were run are
+present in the baseline, but were not run. The script also fails if
+some cases raised an exception.
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import sys
+import tracemalloc
+from collections import OrderedDict
+from glob import glob
+from os.path import dirname, join, basename, exists
+from time import perf_counter
+
+import numpy as np
+
+import bpy
+
+import sverchok
+from sverchok.utils.logging import info, warning, exception
+
+# time of cases faster than this is too noisy to be compared
+MIN_COMPARED_TIME = 0.001
+# peak memory of cases smaller than this is not compared
+MIN_COMPARED_MEMORY = 1024 * 1024
+
+
+def get_benchmarks_path():
+    """
+    Return path to benchmarks/ directory.
+    """
+    return join(dirname(sverchok.__file__), "benchmarks")
+
+
+def load_benchmark_modules(pattern=None):
+    if pattern is None:
+        pattern = "*_benchmark.py"
+    modules = []
+    for path in sorted(glob(join(get_benchmarks_path(), pattern))):
+        name = basename(path)[:-len(".py")]
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if hasattr(module, "cases"):
+            modules.append((name, module))
+        else:
+            info("Benchmark %s does not define cases(), skipping it", name)
+    return modules
+
+
+def measure_case(function, args, repeat=3):
+    times = []
+    for i in range(max(repeat, 1)):
+        start = perf_counter()
+        function(*args)
+        times.append(perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function(*args)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return dict(time = min(times), mean_time = sum(times) / len(times), peak_memory = peak_memory)
+
+
+def run_module(module_name, module, repeat=3):
+    """
+    Run all cases of one benchmark module, then its teardown(), if defined.
+    Returns: tuple:
+        * OrderedDict: "module/case name" -> dictionary of measurements;
+        * list of names of cases which failed.
+    """
+    results = OrderedDict()
+    failed = []
+    try:
+        for case_name, function, args in module.cases():
+            name = module_name + "/" + case_name
+            try:
+                result = measure_case(function, args, repeat)
+            except Exception as e:
+                exception("Benchmark case %s failed: %s", name, e)
+                failed.append(name)
+                continue
+            results[name] = result
+            info("%s: %.4fs (mean %.4fs), peak memory %.1f MB",
+                    name, result['time'], result['mean_time'], result['peak_memory'] / 2**20)
+    finally:
+        teardown = getattr(module, "teardown", None)
+        if teardown is not None:
+            teardown()
+    return results, failed
+
+
+def run_benchmarks(pattern=None, repeat=3):
+    """
+    Run cases of all benchmark modules matching the pattern.
+    Returns: tuple:
+        * OrderedDict: "module/case name" -> dictionary of measurements;
+        * list of names of cases which failed;
+        * list of names of modules which were run.
+    """
+    results = OrderedDict()
+    failed = []
+    module_names = []
+    for module_name, module in load_benchmark_modules(pattern):
+        module_results, module_failed = run_module(module_name, module, repeat)
+        results.update(module_results)
+        failed.extend(module_failed)
+        module_names.append(module_name)
+    return results, failed, module_names
+
+
+def save_baseline(results, path):
+    data = dict(
+        environment = dict(
+            blender = bpy.app.version_string,
+            python = platform.python_version(),
+            numpy = np.__version__,
+            platform = platform.platform()),
+        results = results)
+    with open(path, 'w') as baseline_file:
+        json.dump(data, baseline_file, indent=2)
+
+
+def load_baseline(path):
+    with open(path) as baseline_file:
+        return json.load(baseline_file)['results']
+
+
+def compare_results(results, baseline, threshold=0.25):
+    """
+    Find cases, which became slower or need more memory than in the baseline
+    by more than threshold (relative).
+    Returns: list of tuples (case name, measurement name, baseline value, new value).
+    """
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        for key, minimum in [('time', MIN_COMPARED_TIME), ('peak_memory', MIN_COMPARED_MEMORY)]:
+            if key not in old or max(old[key], result[key]) < minimum:
+                continue
+            if result[key] > old[key] * (1.0 + threshold):
+                regressions.append((name, key, old[key], result[key]))
+    return regressions
+
+
+def missing_cases(results, baseline, module_names, failed=()):
+    """
+    Find cases of given modules, which are present in the baseline,
+    but are absent in results (and did not fail, those are reported separately).
+    Returns: list of case names.
+    """
+    module_names = set(module_names)
+    return [name for name in baseline
+                if name.split("/")[0] in module_names and name not in results and name not in failed]
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(prog="benchmarking.py")
+    parser.add_argument("pattern", nargs="?", default=None)
+    parser.add_argument("--baseline", default=join(get_benchmarks_path(), "baseline.json"))
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    try:
+        argv = sys.argv
+        argv = argv[argv.index("--")+1:] if "--" in argv else []
+        arguments = parse_arguments(argv)
+        results, failed, module_names = run_benchmarks(arguments.pattern, arguments.repeat)
+        errors = []
+        if failed:
+            errors.append("%s benchmark cases failed" % len(failed))
+        if arguments.save or not exists(arguments.baseline):
+            if exists(arguments.baseline):
+                # keep results of cases which were not run this time
+                baseline = load_baseline(arguments.baseline)
+                baseline.update(results)
+                results = baseline
+            save_baseline(results, arguments.baseline)
+            info("Benchmark results are stored into %s", arguments.baseline)
+        else:
+            baseline = load_baseline(arguments.baseline)
+            missing = missing_cases(results, baseline, module_names, failed)
+            for name in missing:
+                warning("Case %s from the baseline was not run", name)
+            if missing:
+                errors.append("%s baseline cases were not run" % len(missing))
+            regressions = compare_results(results, baseline, arguments.threshold)
+            for name, key, old, new in regressions:
+                warning("Regression in %s: %s %.4g -> %.4g (x%.2f)", name, key, old, new, new / old)
+            if regressions:
+                errors.append("%s benchmark regressions" % len(regressions))
+            elif not errors:
+                info("No regressions compared with %s", arguments.baseline)
+        if errors:
+            # We have to raise an exception for Blender to exit with specified exit code.
+            raise Exception(", ".join(errors))
+        sys.exit(0)
+    except Exception as e:
+        print(e)
+        sys.exit(1)
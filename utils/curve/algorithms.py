@@ -33,9 +33,18 @@ def make_euclidian_ts(pts):
     return tknots
 
 class SvCurveLengthSolver(object):
+    """
+    Solve for curve's T parameter by length of curve segment.
+    Supported modes are:
+    * LIN, SPL: linear or cubic spline interpolation over a polyline
+      with specified resolution;
+    * ADAPTIVE: use curve's cached length table, see SvCurve.get_length_table();
+      resolution is not used.
+    """
     def __init__(self, curve):
         self.curve = curve
         self._spline = None
+        self._table = None
 
     def calc_length_segments(self, tknots):
         vectors = self.curve.evaluate_array(tknots)
@@ -44,11 +53,16 @@ class SvCurveLengthSolver(object):
         return lengths
 
     def get_total_length(self):
+        if self._table is not None:
+            return self._table.get_total_length()
         if self._spline is None:
             raise Exception("You have to call solver.prepare() first")
         return self._length_params[-1]
 
     def prepare(self, mode, resolution=50):
+        if mode == 'ADAPTIVE':
+            self._table = self.curve.get_length_table()
+            return
         t_min, t_max = self.curve.get_u_bounds()
         tknots = np.linspace(t_min, t_max, num=resolution)
         lengths = self.calc_length_segments(tknots)
@@ -63,10 +77,12 @@ class SvCurveLengthSolver(object):
         elif mode == 'SPL':
             spline = CubicSpline(control_points, tknots = self._length_params, is_cyclic = False)
         else:
-            raise Exception("Unsupported mode; supported are LIN and SPL.")
+            raise Exception("Unsupported mode; supported are LIN, SPL and ADAPTIVE.")
         return spline
 
     def solve(self, input_lengths):
+        if self._table is not None:
+            return self._table.solve(input_lengths)
         if self._spline is None:
             raise Exception("You have to call solver.prepare() first")
         spline_verts = self._spline.eval(input_lengths)
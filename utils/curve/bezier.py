@@ -278,6 +278,9 @@ class SvBezierCurve(SvCurve):
     def get_control_points(self):
         return self.points
 
+    def get_length_table_key(self):
+        return hash(np.asarray(self.points).tobytes())
+
     def elevate_degree(self, delta=1):
         points = elevate_bezier_degree(self.degree, self.points, delta)
         return SvBezierCurve(points)
@@ -418,6 +421,9 @@ class SvCubicBezierCurve(SvCurve):
     def get_control_points(self):
         return np.array([self.p0, self.p1, self.p2, self.p3])
 
+    def get_length_table_key(self):
+        return hash(self.get_control_points().tobytes())
+
     def to_nurbs(self, implementation = SvNurbsMaths.NATIVE):
         knotvector = sv_knotvector.generate(3, 4)
         control_points = np.array([self.p0, self.p1, self.p2, self.p3])
@@ -11,7 +11,7 @@ from math import sin, cos, pi, radians, sqrt
 from mathutils import Vector, Matrix
 
 from sverchok.utils.geom import LineEquation, CubicSpline
-from sverchok.utils.integrate import TrapezoidIntegral
+from sverchok.utils.integrate import TrapezoidIntegral, AdaptiveGaussLegendreIntegral
 from sverchok.utils.logging import info, error
 from sverchok.utils.math import binomial
 from sverchok.utils.nurbs_common import SvNurbsMaths
@@ -29,6 +29,103 @@ class ZeroCurvatureException(Exception):
 class UnsupportedCurveTypeException(TypeError):
     pass
 
+class SvCurveLengthTable(object):
+    """
+    Table of curve lengths from the beginning of the curve to a set of T
+    knots. Knots are selected by adaptive Gauss-Legendre integration of
+    curve's speed (length of tangent vector), so the table allows to
+    calculate length of any segment of the curve, and to find T
+    by length (by cubic Hermite interpolation of the inverse function,
+    refined by Newton iterations).
+
+    Usually this should be obtained by SvCurve.get_length_table(), which
+    caches the table in the curve object.
+    """
+    NEWTON_MAX_ITERATIONS = 8
+
+    def __init__(self, curve, tolerance=1e-6, min_segments=16):
+        self.curve = curve
+        self.tolerance = tolerance
+        self.key = None
+        t_min, t_max = curve.get_u_bounds()
+        self.integral = AdaptiveGaussLegendreIntegral(self._speed, t_min, t_max,
+                            tolerance = tolerance,
+                            min_segments = min_segments)
+        self.integral.calc()
+        self.tknots = self.integral.knots
+        self.lengths = self.integral.summands
+        self.speeds = self._speed(self.tknots)
+
+    def _speed(self, ts):
+        return np.linalg.norm(self.curve.tangent_array(ts), axis=1)
+
+    def get_total_length(self):
+        return self.lengths[-1]
+
+    def calc_length_array(self, ts):
+        """
+        Calculate lengths of curve segments from the beginning to each of ts.
+        """
+        return self.integral.evaluate(ts)
+
+    def calc_length(self, t_min, t_max):
+        l_min, l_max = self.calc_length_array(np.array([t_min, t_max]))
+        return l_max - l_min
+
+    def solve(self, input_lengths):
+        """
+        Find values of T at which lengths of curve segments from the beginning
+        are equal to input_lengths.
+        """
+        input_lengths = np.asarray(input_lengths, dtype=np.float64)
+        lengths = self.lengths
+        idxs = np.searchsorted(lengths, input_lengths, side='left') - 1
+        idxs = np.clip(idxs, 0, len(lengths) - 2)
+
+        l0, l1 = lengths[idxs], lengths[idxs+1]
+        t0, t1 = self.tknots[idxs], self.tknots[idxs+1]
+        dl = l1 - l0
+        dt = t1 - t0
+        good = dl > 0
+        s = np.zeros_like(input_lengths)
+        s[good] = (input_lengths[good] - l0[good]) / dl[good]
+
+        # dT/dL = 1/speed; scale tangents to [0; 1] segment parameter and
+        # clamp them so that interpolation stays monotonic.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            m0 = np.clip(dl / self.speeds[idxs], 0, 3*dt)
+            m1 = np.clip(dl / self.speeds[idxs+1], 0, 3*dt)
+        m0 = np.where(np.isfinite(m0), m0, dt)
+        m1 = np.where(np.isfinite(m1), m1, dt)
+
+        s2 = s * s
+        s3 = s2 * s
+        h00 = 2*s3 - 3*s2 + 1
+        h10 = s3 - 2*s2 + s
+        h01 = -2*s3 + 3*s2
+        h11 = s3 - s2
+        ts = h00*t0 + h10*m0 + h01*t1 + h11*m1
+        return self._refine(ts, input_lengths, t0, t1)
+
+    def _refine(self, ts, input_lengths, t0, t1):
+        """
+        Newton iterations t -= (L(t) - l) / |C'(t)|, for lengths within the
+        curve, until L(t) matches l within tolerance; T is kept within the
+        segment of the table where the solution lies.
+        """
+        tolerance = self.tolerance * max(self.get_total_length(), 1.0)
+        todo = np.flatnonzero((input_lengths >= 0) & (input_lengths <= self.get_total_length()))
+        for i in range(SvCurveLengthTable.NEWTON_MAX_ITERATIONS):
+            if len(todo) == 0:
+                break
+            t = ts[todo]
+            error = self.calc_length_array(t) - input_lengths[todo]
+            speed = self._speed(t)
+            bad = (np.abs(error) > tolerance) & (speed > 0)
+            todo = todo[bad]
+            ts[todo] = np.clip(t[bad] - error[bad] / speed[bad], t0[todo], t1[todo])
+        return ts
+
 ##################
 #                #
 #  Curves        #
@@ -36,6 +133,9 @@ class UnsupportedCurveTypeException(TypeError):
 ##################
 
 class SvCurve(object):
+    # number of points of the curve used by default get_length_table_key()
+    LENGTH_TABLE_KEY_SAMPLES = 7
+
     def __repr__(self):
         if hasattr(self, '__description__'):
             description = self.__description__
@@ -49,13 +149,49 @@ class SvCurve(object):
     def evaluate_array(self, ts):
         raise Exception("not implemented!")
 
-    def calc_length(self, t_min, t_max, resolution = 50):
+    def calc_length(self, t_min, t_max, resolution = None):
+        """
+        Calculate length of curve segment between t_min and t_max.
+        If resolution is specified, the length of polyline with that number
+        of vertices is returned; otherwise, the length is calculated
+        from the cached length table (see get_length_table()).
+        """
+        if resolution is None:
+            return self.get_length_table().calc_length(t_min, t_max)
         ts = np.linspace(t_min, t_max, num=resolution)
         vectors = self.evaluate_array(ts)
         dvs = vectors[1:] - vectors[:-1]
         lengths = np.linalg.norm(dvs, axis=1)
         return np.sum(lengths)
 
+    def get_length_table_key(self):
+        """
+        Value which changes when the geometry of the curve changes;
+        it is used to invalidate the cached length table. By default,
+        these are parameter bounds and points of the curve at a few
+        parameter values. Curves which can tell faster (by control
+        points, for example) should override this.
+        """
+        t_min, t_max = self.get_u_bounds()
+        ts = np.linspace(t_min, t_max, num=SvCurve.LENGTH_TABLE_KEY_SAMPLES)
+        points = np.asarray(self.evaluate_array(ts), dtype=np.float64)
+        return (t_min, t_max, points.tobytes())
+
+    def get_length_table(self, tolerance = 1e-6):
+        """
+        Get the SvCurveLengthTable for this curve. The table is cached in
+        the curve object and calculated again only if get_length_table_key()
+        has changed or better tolerance is requested.
+        """
+        key = self.get_length_table_key()
+        table = getattr(self, '_length_table', None)
+        # a table can be copied together with attributes of the curve
+        if table is None or table.curve is not self or table.key != key or table.tolerance > tolerance:
+            table = SvCurveLengthTable(self, tolerance)
+            table.key = key
+            self._length_table = table
+        return table
+
     def tangent(self, t):
         v = self.evaluate(t)
         h = self.tangent_delta
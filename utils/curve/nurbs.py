@@ -305,6 +305,14 @@ class SvNurbsCurve(SvCurve):
     def get_degree(self):
         raise Exception("Not implemented!")
 
+    def get_length_table_key(self):
+        control_points = np.asarray(self.get_control_points())
+        weights = np.asarray(self.get_weights())
+        knotvector = np.asarray(self.get_knotvector())
+        return (self.get_degree(), tuple(self.get_u_bounds()),
+                    hash(control_points.tobytes()), hash(weights.tobytes()),
+                    hash(knotvector.tobytes()))
+
     def elevate_degree(self, delta=None, target=None):
         if delta is None and target is None:
             delta = 1
@@ -700,16 +708,19 @@ class SvNativeNurbsCurve(SvNurbsCurve):
         else:
             return numerator / denominator
 
-    def fraction(self, deriv_order, ts):
-        n = len(ts)
+    def fraction(self, deriv_order, ts, max_order=None):
+        if max_order is None:
+            max_order = deriv_order
         p = self.degree
         k = len(self.control_points)
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts) for i in range(k)]) # (k, n)
-        coeffs = ns * self.weights[np.newaxis].T # (k, n)
-        coeffs_t = coeffs[np.newaxis].T # (n, k, 1)
-        numerator = (coeffs_t * self.control_points) # (n, k, 3)
-        numerator = numerator.sum(axis=1) # (n, 3)
-        denominator = coeffs.sum(axis=0) # (n,)
+        ts = np.asarray(ts)
+        # Sparse basis matrix is cached by (knotvector, ts); max_order
+        # is requested in advance, so that subsequent calls for lower
+        # derivatives at the same ts do not need to re-calculate basis.
+        basis = self.basis.matrix(p, ts, k, max_order)
+        weighted = self.control_points * self.weights[np.newaxis].T # (k, 3)
+        numerator = basis.dot(weighted, deriv_order) # (n, 3)
+        denominator = basis.dot(self.weights, deriv_order) # (n,)
 
         return numerator, denominator[np.newaxis].T
 
@@ -717,12 +728,10 @@ class SvNativeNurbsCurve(SvNurbsCurve):
         p = self.degree
         k = len(self.control_points)
         ts = np.array([t])
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts)[0] for i in range(k)]) # (k,)
-        coeffs = ns * self.weights # (k, )
-        coeffs_t = coeffs[np.newaxis].T
-        numerator = (coeffs_t * self.control_points) # (k, 3)
-        numerator = numerator.sum(axis=0) # (3,)
-        denominator = coeffs.sum(axis=0) # ()
+        basis = self.basis.matrix(p, ts, k, deriv_order, use_cache=False)
+        weighted = self.control_points * self.weights[np.newaxis].T # (k, 3)
+        numerator = basis.dot(weighted, deriv_order)[0] # (3,)
+        denominator = basis.dot(self.weights, deriv_order)[0] # ()
 
         return numerator, denominator
 
@@ -744,7 +753,7 @@ class SvNativeNurbsCurve(SvNurbsCurve):
         # numerator' = curve' * denominator + curve * denominator'
         # ergo:
         # curve' = (numerator' - curve*denominator') / denominator
-        numerator, denominator = self.fraction(0, ts)
+        numerator, denominator = self.fraction(0, ts, max_order=1)
         curve = numerator / denominator
         numerator1, denominator1 = self.fraction(1, ts)
         curve1 = (numerator1 - curve*denominator1) / denominator
@@ -756,7 +765,7 @@ class SvNativeNurbsCurve(SvNurbsCurve):
     def second_derivative_array(self, ts):
         # numerator'' = (curve * denominator)'' =
         #  = curve'' * denominator + 2 * curve' * denominator' + curve * denominator''
-        numerator, denominator = self.fraction(0, ts)
+        numerator, denominator = self.fraction(0, ts, max_order=2)
         curve = numerator / denominator
         numerator1, denominator1 = self.fraction(1, ts)
         curve1 = (numerator1 - curve*denominator1) / denominator
@@ -767,7 +776,7 @@ class SvNativeNurbsCurve(SvNurbsCurve):
     def third_derivative_array(self, ts):
         # numerator''' = (curve * denominator)''' = 
         #  = curve''' * denominator + 3 * curve'' * denominator' + 3 * curve' * denominator'' + denominator'''
-        numerator, denominator = self.fraction(0, ts)
+        numerator, denominator = self.fraction(0, ts, max_order=3)
         curve = numerator / denominator
         numerator1, denominator1 = self.fraction(1, ts)
         curve1 = (numerator1 - curve*denominator1) / denominator
@@ -781,7 +790,7 @@ class SvNativeNurbsCurve(SvNurbsCurve):
     def derivatives_array(self, n, ts):
         result = []
         if n >= 1:
-            numerator, denominator = self.fraction(0, ts)
+            numerator, denominator = self.fraction(0, ts, max_order=n)
             curve = numerator / denominator
             numerator1, denominator1 = self.fraction(1, ts)
             curve1 = (numerator1 - curve*denominator1) / denominator
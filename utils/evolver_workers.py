@@ -0,0 +1,194 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Evaluation of Evolver fitness in background Blender processes.
+
+The nodes the fitness depends on are exported into a JSON snapshot (by
+JSONExporter), each worker process imports the snapshot into its own tree
+and then evaluates genomes sent to it through stdin, one JSON line per
+genome, answering with one line of fitness (or error) per genome.
+Workers are started with factory settings, so nodes reading scene data
+(objects, text blocks etc.) do not see the data of the current file.
+
+This file is also the script run by the workers:
+
+    $ blender -b --factory-startup --addons sverchok --python evolver_workers.py -- snapshot.json
+"""
+
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+import numpy as np
+
+import bpy
+
+from sverchok import data_structure
+from sverchok.core.update_system import make_tree_from_nodes
+from sverchok.utils.sv_json_export import JSONExporter
+from sverchok.utils.sv_json_import import JSONImporter
+from sverchok.utils.logging import info, debug
+
+# prefix of worker output lines which are answers, other output is ignored
+RESULT_MARKER = "SV_EVOLVER_RESULT:"
+
+
+def genome_key(genes):
+    '''hashable key of agent genes (lists become tuples)'''
+    if isinstance(genes, (list, tuple, np.ndarray)):
+        return tuple(genome_key(g) for g in genes)
+    if isinstance(genes, np.generic):
+        return genes.item()
+    return genes
+
+
+def json_value(genes):
+    '''agent genes in form which can be written by json (NumPy values become Python ones)'''
+    if isinstance(genes, (list, tuple, np.ndarray)):
+        return [json_value(g) for g in genes]
+    if isinstance(genes, np.generic):
+        return genes.item()
+    return genes
+
+
+def snapshot_structure(tree, evolver_node, genes):
+    '''JSON structure of nodes needed to evaluate fitness of the evolver node'''
+    names = set(make_tree_from_nodes([evolver_node.name], tree, down=False))
+    names.update(gene.name for gene in genes)
+    nodes = [tree.nodes[name] for name in names]
+    # frames are exported too, so that framed nodes can find their parents
+    frames = {node.parent.name: node.parent for node in nodes if node.parent}
+    nodes.extend(frame for name, frame in frames.items() if name not in names)
+    return JSONExporter.get_nodes_structure(nodes)
+
+
+class SvEvolverWorkerPool(object):
+    """
+    Background Blender processes evaluating fitness of genomes.
+    Genomes are handed out one by one to whichever worker is free.
+    """
+    def __init__(self, tree, evolver_node, genes, workers):
+        from sverchok.nodes.logic.evolver import genes_to_string
+
+        self.directory = tempfile.mkdtemp(prefix="sv_evolver_")
+        snapshot_path = os.path.join(self.directory, "snapshot.json")
+        snapshot = dict(
+            tree = snapshot_structure(tree, evolver_node, genes),
+            genes = genes_to_string(genes),
+            evolver = evolver_node.name)
+        with open(snapshot_path, 'w') as snapshot_file:
+            json.dump(snapshot, snapshot_file)
+
+        command = [bpy.app.binary_path, '--background', '--factory-startup',
+                   '--addons', data_structure.SVERCHOK_NAME,
+                   '--python', os.path.abspath(__file__), '--', snapshot_path]
+        self.processes = []
+        try:
+            for i in range(workers):
+                log_file = open(os.path.join(self.directory, f"worker_{i}.log"), 'w')
+                try:
+                    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                               stderr=log_file, universal_newlines=True, bufsize=1)
+                finally:
+                    log_file.close()
+                self.processes.append(process)
+        except Exception:
+            self.close()
+            raise
+        info("Evolver: started %s worker processes", workers)
+
+    def evaluate(self, genomes):
+        '''fitness of each of given genomes (lists of agent genes)'''
+        jobs = queue.Queue()
+        for index, genome in enumerate(genomes):
+            jobs.put((index, genome))
+        results = [None] * len(genomes)
+        errors = []
+        threads = [threading.Thread(target=self._serve, args=(process, jobs, results, errors))
+                   for process in self.processes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return results
+
+    @staticmethod
+    def _serve(process, jobs, results, errors):
+        while not errors:
+            try:
+                index, genome = jobs.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                process.stdin.write(json.dumps(json_value(genome)) + '\n')
+                process.stdin.flush()
+                while True:
+                    line = process.stdout.readline()
+                    if not line:
+                        raise RuntimeError(f"Evolver worker exited with code {process.poll()}")
+                    if line.startswith(RESULT_MARKER):
+                        break
+                fitness, error = json.loads(line[len(RESULT_MARKER):])
+                if error:
+                    raise RuntimeError(f"Evolver worker failed: {error}")
+                results[index] = fitness
+            except Exception as e:
+                errors.append(e)
+                return
+
+    def close(self):
+        for process in self.processes:
+            try:
+                process.stdin.close()
+                process.wait(timeout=10)
+            except Exception:
+                process.kill()
+        self.processes = []
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def main():
+    from sverchok.nodes.logic.evolver import DNA, build_genes_from_name
+
+    snapshot_path = sys.argv[sys.argv.index('--') + 1]
+    with open(snapshot_path) as snapshot_file:
+        snapshot = json.load(snapshot_file)
+
+    tree = bpy.data.node_groups.new("Evolver Worker", 'SverchCustomTreeType')
+    JSONImporter(snapshot['tree']).import_into_tree(tree, print_log=False)
+    genes = build_genes_from_name(snapshot['genes'], tree)
+    evolver_node = tree.nodes[snapshot['evolver']]
+    update_list = make_tree_from_nodes([g.name for g in genes], tree)
+    debug("Evolver worker: %s genes, %s nodes to update", len(genes), len(update_list))
+
+    for line in sys.stdin:
+        agent = DNA(genes, empty=True)
+        agent.genes = json.loads(line)
+        try:
+            agent.evaluate_fitness(tree, update_list, evolver_node)
+            result = [float(agent.fitness), None]
+        except Exception as e:
+            result = [None, f"{type(e).__name__}: {e}"]
+        print(RESULT_MARKER + json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,33 +10,11 @@ import numpy as np
 
 from sverchok.utils.field.scalar import SvScalarField
 from sverchok.utils.logging import error
-from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.spatial_hash import SvSpatialHashGrid
 
 BATCH_SIZE = 50
 MAX_ITERATIONS = 1000
 
-def _check_min_distance(v_new, vs_old, min_r):
-    if not vs_old:
-        return True
-    kdt = SvKdTree.new(SvKdTree.BLENDER, vs_old)
-    nearest, idx, dist = kdt.query(v_new)
-    if dist is None:
-        return True
-    ok = (dist >= min_r)
-    #if not ok:
-    #    print(f"V {v_new} => {nearest}, {dist} >= {min_r}")
-    return ok
-
-def _check_min_radius(point, old_points, old_radiuses, min_r):
-    if not old_points:
-        return True
-    old_points = np.array(old_points)
-    old_radiuses = np.array(old_radiuses)
-    point = np.array(point)
-    distances = np.linalg.norm(old_points - point, axis=1)
-    ok = (old_radiuses + min_r < distances).all()
-    return ok
-
 def field_random_probe(field, bbox, count,
         threshold=0, proportional=False, field_min=None, field_max=None,
         min_r=0, min_r_field=None,
@@ -79,6 +57,7 @@ def field_random_probe(field, bbox, count,
     done = 0
     generated_verts = []
     generated_radiuses = []
+    grid = SvSpatialHashGrid(cell_size = 2*min_r if min_r_field is None else None)
     iterations = 0
     while done < count:
         iterations += 1
@@ -127,18 +106,14 @@ def field_random_probe(field, bbox, count,
             ys = np.array([p[1] for p in candidates])
             zs = np.array([p[2] for p in candidates])
             min_rs = min_r_field.evaluate_grid(xs, ys, zs).tolist()
-            good_verts = []
-            for candidate, min_r in zip(candidates, min_rs):
-                if random_radius:
-                    min_r = random.uniform(0, min_r)
-                if _check_min_radius(candidate, generated_verts + good_verts, generated_radiuses + good_radiuses, min_r):
-                    good_verts.append(candidate)
-                    good_radiuses.append(min_r)
+            if random_radius:
+                min_rs = [random.uniform(0, min_r) for min_r in min_rs]
+            good = grid.check(candidates, radiuses = min_rs).tolist()
+            good_verts = [candidate for candidate, ok in zip(candidates, good) if ok]
+            good_radiuses = [min_r for min_r, ok in zip(min_rs, good) if ok]
         else: # min_r != 0
-            good_verts = []
-            for candidate in candidates:
-                if _check_min_distance(candidate, generated_verts + good_verts, min_r):
-                    good_verts.append(candidate)
+            good = grid.check(candidates, min_r = min_r).tolist()
+            good_verts = [candidate for candidate, ok in zip(candidates, good) if ok]
             good_radiuses = [1 for c in good_verts]
 
         if predicate is not None:
@@ -146,6 +121,8 @@ def field_random_probe(field, bbox, count,
             good_verts = [p[0] for p in pairs]
             good_radiuses = [p[1] for p in pairs]
 
+        if min_r != 0 or min_r_field is not None:
+            grid.insert(good_verts, good_radiuses)
         generated_verts.extend(good_verts)
         generated_radiuses.extend(good_radiuses)
         done += len(good_verts)
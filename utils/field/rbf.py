@@ -61,9 +61,10 @@ class SvRbfVectorField(SvVectorField):
         return vx, vy, vz
 
 class SvBvhRbfNormalVectorField(SvVectorField):
-    def __init__(self, bvh, rbf):
+    def __init__(self, bvh, rbf, triangle_bvh=None):
         self.bvh = bvh
         self.rbf = rbf
+        self.triangle_bvh = triangle_bvh
 
     def evaluate(self, x, y, z):
         vertex = Vector((x,y,z))
@@ -80,7 +81,13 @@ class SvBvhRbfNormalVectorField(SvVectorField):
             return self.rbf(x0, y0, z0)
 
         points = np.stack((xs, ys, zs)).T
-        vectors = np.vectorize(find, signature='(3)->(3)')(points)
+        if self.triangle_bvh is not None:
+            nearest, normals, idxs, distances = self.triangle_bvh.find_nearest(points)
+            if (idxs < 0).any():
+                raise Exception("No nearest point on mesh found for vertex %s" % points[idxs < 0][0])
+            vectors = self.rbf(nearest[:,0], nearest[:,1], nearest[:,2])
+        else:
+            vectors = np.vectorize(find, signature='(3)->(3)')(points)
         R = vectors.T
         return R[0], R[1], R[2]
 
@@ -15,6 +15,7 @@ from mathutils import bvhtree
 from sverchok.utils.math import from_cylindrical, from_spherical, to_cylindrical, to_spherical
 from sverchok.utils.geom import LineEquation, CircleEquation3D
 from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.triangle_bvh import SvTriangleBVH
 
 ##################
 #                #
@@ -472,7 +473,7 @@ class SvCircleAttractorScalarField(SvScalarField):
 class SvBvhAttractorScalarField(SvScalarField):
     __description__ = "BVH Attractor"
 
-    def __init__(self, bvh=None, verts=None, faces=None, falloff=None, signed=False):
+    def __init__(self, bvh=None, verts=None, faces=None, falloff=None, signed=False, triangle_bvh=None):
         self.falloff = falloff
         self.signed = signed
         if bvh is not None:
@@ -481,6 +482,9 @@ class SvBvhAttractorScalarField(SvScalarField):
             self.bvh = bvhtree.BVHTree.FromPolygons(verts, faces)
         else:
             raise Exception("Either bvh or verts and faces must be provided!")
+        if triangle_bvh is None and verts is not None and faces is not None:
+            triangle_bvh = SvTriangleBVH(verts, faces)
+        self.triangle_bvh = triangle_bvh
 
     def evaluate(self, x, y, z):
         nearest, normal, idx, distance = self.bvh.find_nearest((x,y,z))
@@ -504,7 +508,14 @@ class SvBvhAttractorScalarField(SvScalarField):
             return sign * distance
 
         points = np.stack((xs, ys, zs)).T
-        norms = np.vectorize(find, signature='(3)->()')(points)
+        if self.triangle_bvh is not None:
+            nearest, normals, idxs, norms = self.triangle_bvh.find_nearest(points)
+            if (idxs < 0).any():
+                raise Exception("No nearest point on mesh found for vertex %s" % points[idxs < 0][0])
+            if self.signed:
+                norms = np.copysign(1, ((points - nearest) * normals).sum(axis=1)) * norms
+        else:
+            norms = np.vectorize(find, signature='(3)->()')(points)
         if self.falloff is not None:
             result = self.falloff(norms)
             return result
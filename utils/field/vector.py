@@ -16,6 +16,8 @@ from sverchok.utils.curve import SvCurveLengthSolver, SvNormalTrack, MathutilsRo
 from sverchok.utils.geom import LineEquation, CircleEquation3D
 from sverchok.utils.math import from_cylindrical, from_spherical
 from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils import sv_noise_numpy
+from sverchok.utils.triangle_bvh import SvTriangleBVH
 from sverchok.utils.field.voronoi import SvVoronoiFieldData
 
 ##################
@@ -274,12 +276,9 @@ class SvNoiseVectorField(SvVectorField):
         return np.array(v)
 
     def evaluate_grid(self, xs, ys, zs):
-        noise.seed_set(self.seed)
-        def mk_noise(v):
-            r = noise.noise_vector(v, noise_basis=self.noise_type)
-            return r[0], r[1], r[2]
-        vectors = np.stack((xs,ys,zs)).T
-        return np.vectorize(mk_noise, signature="(3)->(),(),()")(vectors)
+        vectors = np.stack((xs, ys, zs)).T
+        rxs, rys, rzs = sv_noise_numpy.noise_vector(vectors, noise_basis=self.noise_type, seed=self.seed).T
+        return rxs, rys, rzs
 
 class SvKdtVectorField(SvVectorField):
 
@@ -573,7 +572,7 @@ class SvEdgeAttractorVectorField(SvVectorField):
         
 class SvBvhAttractorVectorField(SvVectorField):
 
-    def __init__(self, bvh=None, verts=None, faces=None, falloff=None, use_normal=False, signed_normal=False):
+    def __init__(self, bvh=None, verts=None, faces=None, falloff=None, use_normal=False, signed_normal=False, triangle_bvh=None):
         self.falloff = falloff
         self.use_normal = use_normal
         self.signed_normal = signed_normal
@@ -583,6 +582,9 @@ class SvBvhAttractorVectorField(SvVectorField):
             self.bvh = bvhtree.BVHTree.FromPolygons(verts, faces)
         else:
             raise Exception("Either bvh or verts and faces must be provided!")
+        if triangle_bvh is None and verts is not None and faces is not None:
+            triangle_bvh = SvTriangleBVH(verts, faces)
+        self.triangle_bvh = triangle_bvh
         self.__description__ = "BVH Attractor"
 
     def evaluate(self, x, y, z):
@@ -590,7 +592,7 @@ class SvBvhAttractorVectorField(SvVectorField):
         nearest, normal, idx, distance = self.bvh.find_nearest(vertex)
         if self.use_normal:
             if self.signed_normal:
-                sign = (v - nearest).dot(normal)
+                sign = (vertex - nearest).dot(normal)
                 sign = copysign(1, sign)
             else:
                 sign = 1
@@ -605,6 +607,19 @@ class SvBvhAttractorVectorField(SvVectorField):
             else:
                 return dv
 
+    def _find_nearest_vectors(self, points):
+        nearest, normals, idxs, distances = self.triangle_bvh.find_nearest(points)
+        if (idxs < 0).any():
+            raise Exception("No nearest point on mesh found for vertex %s" % points[idxs < 0][0])
+        if self.use_normal:
+            if self.signed_normal:
+                signs = np.copysign(1, ((points - nearest) * normals).sum(axis=1))
+                return signs[np.newaxis].T * normals
+            else:
+                return normals
+        else:
+            return nearest - points
+
     def evaluate_grid(self, xs, ys, zs):
         def find(v):
             nearest, normal, idx, distance = self.bvh.find_nearest(v)
@@ -621,7 +636,10 @@ class SvBvhAttractorVectorField(SvVectorField):
                 return np.array(nearest) - v
 
         points = np.stack((xs, ys, zs)).T
-        vectors = np.vectorize(find, signature='(3)->(3)')(points)
+        if self.triangle_bvh is not None:
+            vectors = self._find_nearest_vectors(points)
+        else:
+            vectors = np.vectorize(find, signature='(3)->(3)')(points)
         if self.falloff is not None:
             norms = np.linalg.norm(vectors, axis=1, keepdims=True)
             nonzero = (norms > 0)[:,0]
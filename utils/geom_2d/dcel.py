@@ -595,12 +595,8 @@ class DCELMesh:
         face.mesh = None
 
 
-def generate_dcel_mesh(mesh, verts, faces, face_selection=None, face_flag=None, face_data=None, new_mesh=False):
-    # todo: self intersection polygons? double repeated polygons???
-    # face_data = {name of data: [value 1, val2, .., value n]} - number of values should be equal to number of faces
-    # I'm not going use zip longest or  something else with face mask and face data inputs
-    # Because I think it can lead to unexpected behaviour of algorithms, which will be difficult to debug
-    # If mesh is None all will be bind to new instent
+def check_face_parameters(faces, face_selection=None, face_flag=None, face_data=None):
+    # per face parameters should have the same length as list of faces
     if face_selection and len(face_selection) != len(faces):
         raise IndexError("Length of face_mask({}) input should be equal to"
                          " length of input faces({})".format(len(face_selection), len(faces)))
@@ -613,6 +609,15 @@ def generate_dcel_mesh(mesh, verts, faces, face_selection=None, face_flag=None,
                          "Each value should be a list with length equal to length of input faces"
                          "At list with key({}) length of input list({}) is not equal to "
                          "length of input faces({})".format(bad_key, length, len(faces)))
+
+
+def generate_dcel_mesh(mesh, verts, faces, face_selection=None, face_flag=None, face_data=None, new_mesh=False):
+    # todo: self intersection polygons? double repeated polygons???
+    # face_data = {name of data: [value 1, val2, .., value n]} - number of values should be equal to number of faces
+    # I'm not going use zip longest or  something else with face mask and face data inputs
+    # Because I think it can lead to unexpected behaviour of algorithms, which will be difficult to debug
+    # If mesh is None all will be bind to new instent
+    check_face_parameters(faces, face_selection, face_flag, face_data)
     if new_mesh:
         mesh = type(mesh)(mesh.accuracy)  # can bring trouble with isinstance, not sure
     half_edges_list = dict()
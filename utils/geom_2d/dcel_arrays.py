@@ -0,0 +1,628 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+from itertools import chain, cycle
+
+import numpy as np
+
+from .dcel import Point, HalfEdge, Face, DCELMesh, check_face_parameters
+
+
+"""
+Doubly-Connected Edge List data structure which keeps its data in NumPy arrays.
+It is alternative of DCELMesh from dcel module for big meshes.
+
+Links of half edges (origin, twin, next, last, face) are stored in integer arrays
+and coordinates of points in (n, 2) float array (Z coordinates are stored separately
+only for giving them back to Sverchok mesh). Algorithms of the package work with points and
+half edges as with objects, so each element has a view object with __slots__, which reads
+and writes the arrays (only coordinates of a point are kept by its view after first reading).
+A view is created once per element and is kept by the mesh, so identity of elements is the same as in DCELMesh.
+Generation of the mesh from Sverchok data and conversion back are vectorized.
+
+DCELArrayMesh has the same interface with DCELMesh, algorithms of the package should use
+their own versions of ArrayPoint and ArrayHalfEdge classes like they do with Point and HalfEdge.
+"""
+
+
+x, y, z = 0, 1, 2
+
+
+class FlagsView:
+    """
+    Set-like access to flags of a half edge of DCELArrayMesh.
+    Flags are stored as bits of integer array of the mesh.
+    """
+    __slots__ = ('storage', 'index')
+
+    def __init__(self, storage, index):
+        self.storage = storage
+        self.index = index
+
+    def __contains__(self, flag):
+        bit = self.storage.flag_bits.get(flag)
+        return bit is not None and bool(self.storage.hedge_flags.item(self.index) & bit)
+
+    def __iter__(self):
+        value = self.storage.hedge_flags.item(self.index)
+        return iter([flag for flag, bit in self.storage.flag_bits.items() if value & bit])
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+    def __bool__(self):
+        return bool(self.storage.hedge_flags.item(self.index))
+
+    def add(self, flag):
+        value = self.storage.hedge_flags.item(self.index)
+        self.storage.hedge_flags[self.index] = value | self.storage.get_flag_bit(flag)
+
+    def discard(self, flag):
+        bit = self.storage.flag_bits.get(flag)
+        if bit is not None:
+            self.storage.hedge_flags[self.index] = self.storage.hedge_flags.item(self.index) & ~bit
+
+    def remove(self, flag):
+        if flag not in self:
+            raise KeyError(flag)
+        self.discard(flag)
+
+
+class ArrayPoint:
+    """
+    View of point of DCELArrayMesh.
+    If mesh is not given the point keeps its coordinates by itself (as vector for calculations).
+    """
+    # attributes of algorithms of the package are declared here,
+    # so their versions of the class can be combined by multiple inheritance
+    __slots__ = ('mesh', '_storage', 'index', '_co', 'accuracy', 'up_edges', '_type', '_monotone_face')
+
+    def __init__(self, mesh, co):
+        if mesh is None:
+            self._init_view(None, None)
+            self._co = tuple(co)  # the point is not stored in a mesh
+        else:
+            self._init_view(mesh, mesh.add_points(DCELArrayMesh.to_co_array([co])))
+            mesh.point_views.append(self)
+
+    @classmethod
+    def new_view(cls, storage, index):
+        # view of existing point of the mesh
+        view = cls.__new__(cls)
+        view._init_view(storage, index)
+        return view
+
+    def _init_view(self, storage, index):
+        # should be extended by subclasses instead of __init__ method
+        self.mesh = storage  # can be set to None by algorithms, for marking the point as deleted
+        self._storage = storage
+        self.index = index
+        self._co = None
+        self.accuracy = type(storage).accuracy if storage is not None else DCELArrayMesh.accuracy
+
+    def __str__(self):
+        return "Point"
+
+    @property
+    def co(self):
+        # coordinates are read by sweep line algorithms very often, so tuple is kept after first reading
+        if self._co is None:
+            storage = self._storage
+            self._co = storage.point_co.item(self.index, 0), storage.point_co.item(self.index, 1), \
+                storage.point_z.item(self.index)
+        return self._co
+
+    @co.setter
+    def co(self, value):
+        storage = self._storage
+        self._co = tuple(value)
+        if storage is not None:
+            storage.point_co[self.index] = value[x], value[y]
+            storage.point_z[self.index] = value[z] if len(value) > 2 else 0
+
+    @property
+    def hedge(self):
+        storage = self._storage
+        if storage is None:
+            return None
+        i = storage.point_hedge.item(self.index)
+        return storage.hedge_views[i] if i >= 0 else None
+
+    @hedge.setter
+    def hedge(self, value):
+        self._storage.point_hedge[self.index] = -1 if value is None else value.index
+
+    __add__ = Point.__add__
+    __sub__ = Point.__sub__
+    __mul__ = Point.__mul__
+    length = Point.length
+    normalize = Point.normalize
+    cross_product = Point.cross_product
+
+
+class ArrayHalfEdge:
+    """View of half edge of DCELArrayMesh"""
+    accuracy = 1e-5
+    # attributes of algorithms of the package are declared here,
+    # so their versions of the class can be combined by multiple inheritance
+    __slots__ = ('mesh', '_storage', 'index', 'left', 'edge', 'lap_faces', 'in_faces')
+
+    def __init__(self, mesh, point, face=None):
+        self._init_view(mesh, mesh.add_hedges(np.array([point.index]), -1 if face is None else face.index))
+        mesh.hedge_views.append(self)
+
+    @classmethod
+    def new_view(cls, storage, index):
+        # view of existing half edge of the mesh
+        view = cls.__new__(cls)
+        view._init_view(storage, index)
+        return view
+
+    def _init_view(self, storage, index):
+        # should be extended by subclasses instead of __init__ method
+        self.mesh = storage  # can be set to None by algorithms, for marking the half edge as deleted
+        self._storage = storage
+        self.index = index
+        self.left = None  # Information about nearest left neighbour for hole detection, intersection algorithm user
+
+    def __str__(self):
+        return "Hedge"
+
+    # links are read very often by algorithms, so properties are not generated by a function
+
+    @property
+    def twin(self):
+        storage = self._storage
+        i = storage.hedge_twin.item(self.index)
+        return storage.hedge_views[i] if i >= 0 else None
+
+    @twin.setter
+    def twin(self, value):
+        self._storage.hedge_twin[self.index] = -1 if value is None else value.index
+
+    @property
+    def next(self):
+        storage = self._storage
+        i = storage.hedge_next.item(self.index)
+        return storage.hedge_views[i] if i >= 0 else None
+
+    @next.setter
+    def next(self, value):
+        self._storage.hedge_next[self.index] = -1 if value is None else value.index
+
+    @property
+    def last(self):
+        storage = self._storage
+        i = storage.hedge_last.item(self.index)
+        return storage.hedge_views[i] if i >= 0 else None
+
+    @last.setter
+    def last(self, value):
+        self._storage.hedge_last[self.index] = -1 if value is None else value.index
+
+    @property
+    def origin(self):
+        storage = self._storage
+        return storage.point_views[storage.hedge_origin.item(self.index)]
+
+    @origin.setter
+    def origin(self, value):
+        self._storage.hedge_origin[self.index] = value.index
+
+    @property
+    def face(self):
+        storage = self._storage
+        i = storage.hedge_face.item(self.index)
+        return storage.face_objects[i] if i >= 0 else None
+
+    @face.setter
+    def face(self, value):
+        self._storage.hedge_face[self.index] = -1 if value is None else value.index
+
+    @property
+    def flags(self):
+        # For any value wich an algorithm would like to keep with object, only add or remove
+        return FlagsView(self._storage, self.index)
+
+    @property
+    def _slop(self):
+        # 0 means that slop was not calculated yet
+        return self._storage.hedge_slop.item(self.index)
+
+    @_slop.setter
+    def _slop(self, value):
+        self._storage.hedge_slop[self.index] = value or 0
+
+    @property
+    def loop_hedges(self):
+        # returns hedges bounding face, the same as HalfEdge.loop_hedges but walks over array of links
+        if not self.mesh:
+            raise AttributeError("This method doesn't work with hedges({}) without link to a mesh."
+                                 "Besides, mesh object should have proper number of half edges "
+                                 "in hedges list".format(self))
+        yield self
+        storage = self._storage
+        views = storage.hedge_views
+        i = storage.hedge_next.item(self.index)
+        counter = 0
+        while i != self.index:
+            if i < 0:
+                raise AttributeError(' Some of half edges has incomplete data (does not have link to next half edge)')
+            yield views[i]
+            i = storage.hedge_next.item(i)  # links can be changed by the caller during the iteration
+            counter += 1
+            if counter > len(self.mesh.hedges):
+                raise RecursionError('Hedge - {} does not have a loop'.format(self))
+
+    ccw_hedges = HalfEdge.ccw_hedges
+    cw_hedges = HalfEdge.cw_hedges
+    slop = HalfEdge.slop
+
+
+class ArrayFace(Face):
+    """Face of DCELArrayMesh, it keeps its index in list of faces of the mesh, referred by half edges"""
+
+    def __init__(self, mesh):
+        super().__init__(mesh)
+        self.index = len(mesh.face_objects)
+        mesh.face_objects.append(self)
+
+    def insert_holes(self, sv_verts, sv_faces, face_selection=None, face_data=None):
+        # the same as Face.insert_holes, holes are generated directly in the mesh of the face
+        self.check_mesh()
+        number_inners = len(self.mesh.unbounded.inners)
+        self.mesh.from_sv_faces(sv_verts, sv_faces, face_selection, face_data=face_data)
+        hole_hedges = self.mesh.unbounded.inners[number_inners:]
+        del self.mesh.unbounded.inners[number_inners:]
+        self.inners.extend(hole_hedges)
+        for start_hedge in hole_hedges:
+            for hedge in start_hedge.loop_hedges:
+                hedge.face = self
+
+
+class DCELArrayMesh(DCELMesh):
+    Point = ArrayPoint
+    HalfEdge = ArrayHalfEdge
+    Face = ArrayFace
+    accuracy = 1e-5
+
+    def __init__(self, accuracy=None):
+        # arrays have some reserved space in the end, number of used rows is equal to length of list of views
+        self.point_co = np.zeros((0, 2))
+        self.point_z = np.zeros(0)
+        self.point_hedge = np.zeros(0, dtype=np.int32)
+        self.point_views = []
+
+        self.hedge_origin = np.zeros(0, dtype=np.int32)
+        self.hedge_twin = np.zeros(0, dtype=np.int32)
+        self.hedge_next = np.zeros(0, dtype=np.int32)
+        self.hedge_last = np.zeros(0, dtype=np.int32)
+        self.hedge_face = np.zeros(0, dtype=np.int32)
+        self.hedge_slop = np.zeros(0)
+        self.hedge_flags = np.zeros(0, dtype=np.int64)
+        self.hedge_views = []
+        self.flag_bits = dict()  # flag -> bit of hedge_flags array
+
+        self.face_objects = []  # face index -> face, includes faces which were removed from faces list
+        super().__init__(accuracy)
+
+    @classmethod
+    def set_accuracy(cls, accuracy):
+        # This value is using for comparing float figures
+        # points take the value of the mesh class, because accuracy is attribute of point view
+        if isinstance(accuracy, int):
+            accuracy = 1 / 10 ** accuracy
+        if not (1e-1 > accuracy > 1e-15):
+            raise ValueError("Accuracy should between 1^-1 and 1^-15, {} value was given".format(accuracy))
+        cls.HalfEdge.accuracy = accuracy
+        cls.Face.accuracy = accuracy
+        cls.accuracy = accuracy
+
+    @staticmethod
+    def to_co_array(verts):
+        # Sverchok vertices to array with shape (n, 3), 2D vertices get zero Z coordinate
+        verts = np.asarray(verts, dtype=np.float64)
+        if verts.ndim != 2 or len(verts) == 0:
+            return np.zeros((0, 3))
+        if verts.shape[1] < 3:
+            verts = np.concatenate((verts, np.zeros((len(verts), 3 - verts.shape[1]))), axis=1)
+        return verts[:, :3]
+
+    @staticmethod
+    def _reserve(array, size):
+        if size <= len(array):
+            return array
+        new_array = np.zeros((max(size, 2 * len(array)),) + array.shape[1:], dtype=array.dtype)
+        new_array[:len(array)] = array
+        return new_array
+
+    @property
+    def number_points(self):
+        return len(self.point_views)
+
+    @property
+    def number_hedges(self):
+        return len(self.hedge_views)
+
+    def add_points(self, co):
+        # add rows for given coordinates, returns index of first new point
+        # views of new points should be created by caller
+        first = self.number_points
+        size = first + len(co)
+        self.point_co = self._reserve(self.point_co, size)
+        self.point_z = self._reserve(self.point_z, size)
+        self.point_hedge = self._reserve(self.point_hedge, size)
+        self.point_co[first: size] = co[:, :2]
+        self.point_z[first: size] = co[:, 2]
+        self.point_hedge[first: size] = -1
+        return first
+
+    def add_hedges(self, origins, faces=-1):
+        # add rows for half edges with given origins, returns index of first new half edge
+        # views of new half edges should be created by caller
+        first = self.number_hedges
+        size = first + len(origins)
+        for name in ['hedge_origin', 'hedge_twin', 'hedge_next', 'hedge_last', 'hedge_face', 'hedge_slop',
+                     'hedge_flags']:
+            setattr(self, name, self._reserve(getattr(self, name), size))
+        self.hedge_origin[first: size] = origins
+        self.hedge_twin[first: size] = -1
+        self.hedge_next[first: size] = -1
+        self.hedge_last[first: size] = -1
+        self.hedge_face[first: size] = faces
+        self.hedge_slop[first: size] = 0
+        self.hedge_flags[first: size] = 0
+        return first
+
+    def get_flag_bit(self, flag):
+        bit = self.flag_bits.get(flag)
+        if bit is None:
+            if len(self.flag_bits) >= 63:
+                raise ValueError("Too many different flags of half edges")
+            bit = 1 << len(self.flag_bits)
+            self.flag_bits[flag] = bit
+        return bit
+
+    def _new_point_views(self, first, number):
+        views = [self.Point.new_view(self, i) for i in range(first, first + number)]
+        self.point_views.extend(views)
+        return views
+
+    def _new_hedge_views(self, first, number):
+        views = [self.HalfEdge.new_view(self, i) for i in range(first, first + number)]
+        self.hedge_views.extend(views)
+        return views
+
+    def _set_point_hedges(self, origins, hedges):
+        # as in DCELMesh, point gets link to the last of its half edges
+        origins_reversed, last_indexes = np.unique(origins[::-1], return_index=True)
+        self.point_hedge[origins_reversed] = hedges[::-1][last_indexes]
+
+    def from_sv_edges(self, verts, edges):
+        co = self.to_co_array(verts)
+        edges = np.asarray(edges, dtype=np.int64).reshape((-1, 2))
+        # edges of zero length are ignored
+        edges = edges[~np.all(np.abs(co[edges[:, 0]] - co[edges[:, 1]]) < self.accuracy, axis=1)]
+
+        first_point = self.add_points(co)
+        self.points.extend(self._new_point_views(first_point, len(co)))
+
+        # half edges of an edge are neighbours in the arrays: 2 * i - from first point, 2 * i + 1 - from second one
+        local_origins = edges.ravel()
+        first_hedge = self.add_hedges(local_origins + first_point)
+        hedges = np.arange(first_hedge, first_hedge + len(local_origins))
+        local_twins = np.arange(len(local_origins)).reshape((-1, 2))[:, ::-1].ravel()
+        self.hedge_twin[hedges] = hedges[local_twins]
+        self._set_point_hedges(local_origins + first_point, hedges)
+
+        # Link hedges around all points
+        slops = self._edges_slops(co, local_origins, local_twins)
+        self.hedge_slop[hedges] = slops
+        order = np.lexsort((slops, local_origins))
+        sorted_hedges = hedges[order]
+        sorted_origins = local_origins[order]
+        is_first = np.empty(len(order), dtype=bool)
+        is_first[:1] = True
+        is_first[1:] = sorted_origins[1:] != sorted_origins[:-1]
+        group_starts = np.flatnonzero(is_first)
+        group_ends = np.append(group_starts[1:], len(order)) - 1
+        groups = np.cumsum(is_first) - 1
+        positions = np.arange(len(order))
+        next_positions = np.where(positions == group_ends[groups], group_starts[groups], positions + 1)
+        next_twins = self.hedge_twin[sorted_hedges[next_positions]]
+        self.hedge_last[sorted_hedges] = next_twins
+        self.hedge_next[next_twins] = sorted_hedges
+
+        self.hedges.extend(self._new_hedge_views(first_hedge, len(hedges)))
+
+    def _edges_slops(self, co, origins, twins):
+        # slops of half edges (see HalfEdge.slop) given by indexes of their origins and twins
+        # in the same way as they are calculated during sorting half edges around points in DCELMesh
+        # direction is normalized in 3D space as HalfEdge.slop does
+        accuracy = self.HalfEdge.accuracy
+        start = co[origins]
+        end = co[origins[twins]]
+        direction = end - start
+        direction /= np.linalg.norm(direction, axis=1)[:, np.newaxis]
+        product = direction[:, x]
+        slops = np.where(direction[:, y] < 0, product + 1, 3 - product)
+        is_horizontal = np.abs(start[:, y] - end[:, y]) < accuracy
+        slops[is_horizontal] = np.where(start[is_horizontal, x] - end[is_horizontal, x] > accuracy, 4.0, 2.0)
+        # slop of half edge is taken from its twin if the twin was calculated before
+        twin_slops = slops[twins]
+        from_twin = origins[twins] < origins
+        slops[from_twin] = np.where(twin_slops[from_twin] == 2, 4, (twin_slops[from_twin] + 2) % 4)
+        return slops
+
+    def from_sv_faces(self, verts, faces, face_selection=None, face_flag=None, face_data=None):
+        # face_data = {name of data: [value 1, val2, .., value n]} - number of values should be equal to number of faces
+        check_face_parameters(faces, face_selection, face_flag, face_data)
+        co = self.to_co_array(verts)
+        first_point = self.add_points(co)
+        self.points.extend(self._new_point_views(first_point, len(co)))
+        if not faces:
+            return
+
+        sizes = np.array([len(face) for face in faces])
+        face_corners = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=sizes.sum())
+        offsets = np.cumsum(sizes) - sizes
+        corner_faces = np.repeat(np.arange(len(faces)), sizes)
+        corner_sizes = sizes[corner_faces]
+        corner_offsets = offsets[corner_faces]
+        positions = np.arange(len(face_corners)) - corner_offsets
+
+        # faces should be ccw, this is detected by most left point and its neighbours as is_ccw_polygon does
+        most_lefts = np.lexsort((positions, co[face_corners, x], corner_faces))[offsets]
+        last_co = co[face_corners[offsets + (positions[most_lefts] - 1) % sizes]]
+        left_co = co[face_corners[most_lefts]]
+        next_co = co[face_corners[offsets + (positions[most_lefts] + 1) % sizes]]
+        is_vertical = (np.abs(last_co[:, x] - left_co[:, x]) < 1e-6) & (np.abs(last_co[:, x] - next_co[:, x]) < 1e-6)
+        is_ccw = np.where(is_vertical, last_co[:, y] > left_co[:, y],
+                          (left_co[:, x] - last_co[:, x]) * (next_co[:, y] - last_co[:, y]) >
+                          (left_co[:, y] - last_co[:, y]) * (next_co[:, x] - last_co[:, x]))
+        oriented_positions = np.where(is_ccw[corner_faces], positions, corner_sizes - 1 - positions)
+        corners = face_corners[corner_offsets + oriented_positions]
+        next_corners = corner_offsets + (positions + 1) % corner_sizes
+        last_corners = corner_offsets + (positions - 1) % corner_sizes
+
+        # Generate faces
+        new_faces = []
+        face_data_iter = zip(cycle([face_data.keys()]), zip(*face_data.values())) if face_data else cycle([None])
+        for _, fm, ff, fd in zip(faces, face_selection or cycle([False]), face_flag or cycle([None]), face_data_iter):
+            f = self.Face(self)
+            f.select = bool(fm)
+            if ff:
+                f.flags.add(ff)
+            if fd:
+                for property_name, value in zip(*fd):
+                    f.sv_data[property_name] = value
+            new_faces.append(f)
+        face_indexes = np.array([f.index for f in new_faces])
+
+        # Generate hedges of faces
+        first_hedge = self.add_hedges(corners + first_point, face_indexes[corner_faces])
+        hedges = np.arange(first_hedge, first_hedge + len(corners))
+        self.hedge_next[hedges] = hedges[next_corners]
+        self.hedge_last[hedges] = hedges[last_corners]
+        self._set_point_hedges(corners + first_point, hedges)
+        hedge_views = self._new_hedge_views(first_hedge, len(hedges))
+        for f, offset in zip(new_faces, offsets.tolist()):
+            f.outer = hedge_views[offset]
+            self.faces.append(f)
+
+        # to twin hedges and create hedges of unbounded face
+        keys = corners * len(co) + corners[next_corners]
+        twin_keys = corners[next_corners] * len(co) + corners
+        sorted_keys = np.argsort(keys)
+        if len(keys) > 1 and np.any(keys[sorted_keys][1:] == keys[sorted_keys][:-1]):
+            raise Exception("It looks like input mesh has overlapping faces with common edge of the same direction. "
+                            "Handle such meshes does not implemented yet.")
+        twin_positions = sorted_keys[np.clip(np.searchsorted(keys, twin_keys, sorter=sorted_keys), 0, len(keys) - 1)]
+        has_twin = keys[twin_positions] == twin_keys
+        self.hedge_twin[hedges[has_twin]] = hedges[twin_positions[has_twin]]
+
+        boundary = hedges[~has_twin]
+        first_outer = self.add_hedges(corners[next_corners][~has_twin] + first_point)
+        outer_hedges = np.arange(first_outer, first_outer + len(boundary))
+        self.hedge_twin[boundary] = outer_hedges
+        self.hedge_twin[outer_hedges] = boundary
+        # views are created before assigning unbounded face as DCELMesh creates half edges without face
+        outer_views = self._new_hedge_views(first_outer, len(outer_hedges))
+        self.hedge_face[outer_hedges] = self.unbounded.index
+        self.hedges.extend(hedge_views)
+        self.hedges.extend(outer_views)
+
+        # link hedges of unbounded face in loops
+        next_outer = self.hedge_twin[self.hedge_last[boundary]]
+        is_found = self.hedge_face[next_outer] == self.unbounded.index
+        count = 0
+        while not is_found.all():
+            not_found = ~is_found
+            next_outer[not_found] = self.hedge_twin[self.hedge_last[next_outer[not_found]]]
+            is_found[not_found] = self.hedge_face[next_outer[not_found]] == self.unbounded.index
+            count += 1
+            if count > len(hedges):
+                raise RecursionError("The hedge ({}) cant find next neighbour".format(
+                    self.hedge_views[outer_hedges[not_found][0]]))
+        self.hedge_next[outer_hedges] = next_outer
+        self.hedge_last[next_outer] = outer_hedges
+
+        # link unbounded face to loops of edges of unbounded face
+        used = set()
+        next_list = self.hedge_next.tolist()
+        for outer_hedge in outer_hedges.tolist():
+            if outer_hedge in used:
+                continue
+            self.unbounded.inners.append(self.hedge_views[outer_hedge])
+            hedge = outer_hedge
+            while hedge not in used:
+                used.add(hedge)
+                hedge = next_list[hedge]
+
+    def to_sv_mesh(self, edges=True, faces=True, only_select=False, del_edge_flag=None, del_face_flag=None):
+        # all elements of mesh should have correct links
+        # will create only selected faces if only_select is True
+        if del_edge_flag and del_face_flag:
+            raise ValueError('Not sure that both del flags can do the job')
+        hedges = np.fromiter((hedge.index for hedge in self.hedges), dtype=np.int64, count=len(self.hedges))
+        origins = self.hedge_origin[hedges]
+        twins = self.hedge_twin[hedges]
+
+        # Points are numerated in order of their first half edges in the list
+        if del_face_flag:
+            # if all hedges around points have faces with del flag the point won't be added to the output list
+            used_faces = np.array([not face.is_unbounded and del_face_flag not in face.flags
+                                   for face in self.face_objects] + [False])
+            used_hedges = used_faces[self.hedge_face[hedges]]
+        elif del_edge_flag:
+            used_hedges = self.hedge_flags[hedges] & self.flag_bits.get(del_edge_flag, 0) == 0
+        else:
+            used_hedges = np.ones(len(hedges), dtype=bool)
+        is_used_point = np.zeros(self.number_points, dtype=bool)
+        is_used_point[origins[used_hedges]] = True
+        points, first_hedges = np.unique(origins, return_index=True)
+        points = points[np.argsort(first_hedges)]
+        points = points[is_used_point[points]]
+        point_index = np.full(self.number_points, -1)
+        point_index[points] = np.arange(len(points))
+        sv_points = [tuple(co) for co in np.concatenate((self.point_co[points], self.point_z[points, np.newaxis]),
+                                                        axis=1).tolist()]
+        out = [sv_points]
+
+        if edges or not faces:
+            # edge is given by first its half edge from the list
+            positions = np.full(self.number_hedges, len(hedges))
+            positions[hedges] = np.arange(len(hedges))
+            if del_edge_flag:
+                is_deleted = self.hedge_flags & self.flag_bits.get(del_edge_flag, 0) != 0
+            else:
+                is_deleted = np.zeros(self.number_hedges, dtype=bool)
+            is_edge = ~is_deleted[hedges] & ~((positions[twins] < np.arange(len(hedges))) & ~is_deleted[twins])
+            sv_edges = np.stack((point_index[origins[is_edge]], point_index[self.hedge_origin[twins[is_edge]]]), 1)
+            out.append([tuple(edge) for edge in sv_edges.tolist()])
+
+        if faces or not edges:
+            # It ignores  boundless super face
+            next_list = self.hedge_next.tolist()
+            corners = point_index[self.hedge_origin[:self.number_hedges]].tolist()
+            sv_faces = []
+            for face in self.faces:
+                if not face.outer or del_face_flag in face.flags:
+                    continue
+                if only_select and not face.select:
+                    continue
+                start = face.outer.index
+                sv_face = [corners[start]]
+                hedge = next_list[start]
+                while hedge != start:
+                    sv_face.append(corners[hedge])
+                    hedge = next_list[hedge]
+                    if len(sv_face) > self.number_hedges:
+                        raise RecursionError('Hedge - {} does not have a loop'.format(face.outer))
+                sv_faces.append(sv_face)
+            out.append(sv_faces)
+        return tuple(out)
@@ -7,6 +7,8 @@
 
 
 from .dcel import DCELMesh as DCELMesh_template, Point as Point_template, HalfEdge as HalfEdge_template
+from .dcel_arrays import DCELArrayMesh as DCELArrayMesh_template, ArrayPoint as ArrayPoint_template, \
+    ArrayHalfEdge as ArrayHalfEdge_template
 from .lin_alg import almost_equal, is_edges_intersect, intersect_edges
 from .sort_mesh import SortPointsUpDown, SortEdgeSweepingAlgorithm
 from sverchok.utils.avl_tree import AVLTree
@@ -62,6 +64,40 @@ class DCELMesh(DCELMesh_template):
     HalfEdge = HalfEdge
 
 
+NO_FACES = frozenset()
+
+
+class ArrayPoint(ArrayPoint_template, SortPointsUpDown):
+    # the same as Point but for DCELArrayMesh
+    __slots__ = ()
+
+    def __init__(self, mesh, co, accuracy=1e-6):
+        super().__init__(mesh, co)
+        self.accuracy = accuracy
+
+    def _init_view(self, storage, index):
+        super()._init_view(storage, index)
+        self.accuracy = 1e-6
+        self.up_edges = []  # edges below event point
+
+
+class ArrayHalfEdge(ArrayHalfEdge_template):
+    # the same as HalfEdge but for DCELArrayMesh
+    __slots__ = ()
+
+    def _init_view(self, storage, index):
+        super()._init_view(storage, index)
+        self.edge = None
+        # frozen sets can be shared, the algorithm does not change sets of faces of half edges in place
+        face = self.face
+        self.lap_faces = self.in_faces = frozenset([face]) if face else NO_FACES
+
+
+class DCELArrayMesh(DCELArrayMesh_template):
+    Point = ArrayPoint
+    HalfEdge = ArrayHalfEdge
+
+
 class Edge(SortEdgeSweepingAlgorithm):
     # Special class for storing in status data structure
 
@@ -7,6 +7,8 @@
 
 from sverchok.utils.avl_tree import AVLTree
 from .dcel import Point as Point_template, HalfEdge as HalfEdge_template, DCELMesh as DCELMesh_template
+from .dcel_arrays import ArrayPoint as ArrayPoint_template, ArrayHalfEdge as ArrayHalfEdge_template, \
+    DCELArrayMesh as DCELArrayMesh_template
 from .sort_mesh import SortPointsUpDown, SortHalfEdgesCCW, SortEdgeSweepingAlgorithm
 
 from .dcel_debugger import Debugger
@@ -121,6 +123,34 @@ class DCELMesh(DCELMesh_template):
     HalfEdge = HalfEdge
 
 
+class ArrayPoint(ArrayPoint_template, SortPointsUpDown):
+    # the same as Point but for DCELArrayMesh
+    __slots__ = ()
+    monotone_current_face = None
+
+    def _init_view(self, storage, index):
+        super()._init_view(storage, index)
+        self._type = None
+        self._monotone_face = None
+
+    type = Point.type
+    monotone_face = Point.monotone_face
+
+
+class ArrayHalfEdge(ArrayHalfEdge_template, SortHalfEdgesCCW):
+    # the same as HalfEdge but for DCELArrayMesh
+    __slots__ = ()
+
+    def _init_view(self, storage, index):
+        super()._init_view(storage, index)
+        self.edge = None
+
+
+class DCELArrayMesh(DCELArrayMesh_template):
+    Point = ArrayPoint
+    HalfEdge = ArrayHalfEdge
+
+
 class Edge(SortEdgeSweepingAlgorithm):
 
     def __init__(self, up_p, low_p):
@@ -15,13 +15,22 @@ except ImportError:
 from mathutils import Vector
 
 from .intersections import Point as InterPoint, HalfEdge as InterHalfEdge, DCELMesh as InterDCELMesh, find_intersections
+from .intersections import ArrayPoint as InterArrayPoint, ArrayHalfEdge as InterArrayHalfEdge, \
+                           DCELArrayMesh as InterDCELArrayMesh
 from .make_monotone import Point as MonPoint, HalfEdge as MonHalfEdge, DCELMesh as MonDCELMesh, \
                            monotone_faces_with_holes
+from .make_monotone import ArrayPoint as MonArrayPoint, ArrayHalfEdge as MonArrayHalfEdge, \
+                           DCELArrayMesh as MonDCELArrayMesh
 
 from .dcel_debugger import Debugger
 
 from sverchok.utils.geom_2d.lin_alg import is_ccw_polygon
 
+# edges_to_faces switches to DCELArrayMesh from this number of edges if no intersections are searched,
+# for big meshes the array mesh is faster and takes much less memory, find_intersections is slower with it
+ARRAY_MESH_MIN_EDGES = 100000
+
+
 def edges_to_faces(sv_verts, sv_edges, do_intersect=True, fill_holes=True, accuracy=1e-5):
     """
     Fill faces of Sverchok mesh determined by edges
@@ -35,7 +44,10 @@ def edges_to_faces(sv_verts, sv_edges, do_intersect=True, fill_holes=True, accur
     :param accuracy: two floats figures are equal if their difference is lower then accuracy value, float
     :return: list of SV points, list of SV faces
     """
-    mesh = DCELMesh(accuracy=accuracy)
+    if not do_intersect and len(sv_edges) >= ARRAY_MESH_MIN_EDGES:
+        mesh = DCELArrayMesh(accuracy=accuracy)
+    else:
+        mesh = DCELMesh(accuracy=accuracy)
     mesh.from_sv_edges(sv_verts, sv_edges)
     if do_intersect:
         find_intersections(mesh, accuracy)
@@ -171,6 +183,19 @@ class DCELMesh(InterDCELMesh, MonDCELMesh):
     HalfEdge = HalfEdge
 
 
+class ArrayPoint(InterArrayPoint, MonArrayPoint):
+    __slots__ = ()
+
+
+class ArrayHalfEdge(InterArrayHalfEdge, MonArrayHalfEdge):
+    __slots__ = ()
+
+
+class DCELArrayMesh(InterDCELArrayMesh, MonDCELArrayMesh):
+    Point = ArrayPoint
+    HalfEdge = ArrayHalfEdge
+
+
 def del_holes(dcel_mesh):
 
     del_flag = 'del'
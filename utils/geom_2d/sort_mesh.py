@@ -22,6 +22,7 @@ class SortPointsUpDown:
 
     Should be used with another class with "co" - (x, y, z) and "accuracy" - (float) attributes
     """
+    __slots__ = ()
 
     def __lt__(self, other):
         # Sorting of points from upper left point to lowest right point
@@ -179,6 +180,7 @@ class SortHalfEdgesCCW:
     Half edges are sorting in counterclockwise direction from -X direction.
     Should be used with HalfEdge class from dcel_mesh module
     """
+    __slots__ = ()
 
     def __lt__(self, other):
         # if self < other other it means that direction if closer to (-1, 0) direction
@@ -40,3 +40,91 @@ class TrapezoidIntegral(object):
         spline = CubicSpline(verts, tknots=xs, is_cyclic=False)
         return spline.eval(ts)[:,1]
 
+
+# Nodes and weights of 5-point Gauss-Legendre quadrature on [-1; 1]
+GAUSS_LEGENDRE_NODES, GAUSS_LEGENDRE_WEIGHTS = np.polynomial.legendre.leggauss(5)
+
+def gauss_legendre_segments(func, starts, ends):
+    """
+    Calculate integrals of func over segments [starts[i]; ends[i]]
+    by 5-point Gauss-Legendre quadrature.
+    func is called once, with all quadrature nodes in one array.
+
+    input:
+        * func: vectorized function, np.array of shape (n,) -> np.array of shape (n,)
+        * starts, ends: np.array of shape (m,)
+    output: np.array of shape (m,).
+    """
+    half = (ends - starts) / 2.0
+    middle = (ends + starts) / 2.0
+    ts = middle[np.newaxis].T + half[np.newaxis].T * GAUSS_LEGENDRE_NODES # (m, 5)
+    values = func(ts.flatten()).reshape(ts.shape)
+    return half * np.dot(values, GAUSS_LEGENDRE_WEIGHTS)
+
+class AdaptiveGaussLegendreIntegral(object):
+    """
+    Calculate integral of function from t_min to t by adaptive
+    Gauss-Legendre quadrature.
+
+    The range is subdivided until, for each segment, the integral over the
+    segment and the sum of integrals over it's halves differ by less
+    than tolerance (relative). Integrals from t_min to segment ends are
+    stored as a table; integral up to any t is then calculated from the
+    table plus one quadrature over part of the segment.
+    """
+    def __init__(self, func, t_min, t_max, tolerance=1e-6, min_segments=16, max_segments=100000):
+        self.func = func
+        self.t_min = t_min
+        self.t_max = t_max
+        self.tolerance = tolerance
+        self.min_segments = min_segments
+        self.max_segments = max_segments
+        self.knots = None
+        self.summands = None
+
+    def calc(self):
+        knots = np.linspace(self.t_min, self.t_max, num=self.min_segments+1)
+        starts, ends = knots[:-1], knots[1:]
+        values = gauss_legendre_segments(self.func, starts, ends)
+        # do not try to refine segments which contribute nothing to the integral
+        threshold = 1e-9 * np.abs(values).sum()
+
+        done_starts = []
+        done_values = []
+        n_done = 0
+        while len(starts) > 0:
+            mids = (starts + ends) / 2.0
+            m = len(starts)
+            halves = gauss_legendre_segments(self.func,
+                        np.concatenate((starts, mids)),
+                        np.concatenate((mids, ends)))
+            lefts, rights = halves[:m], halves[m:]
+            refined = lefts + rights
+            good = np.abs(refined - values) <= self.tolerance * (np.abs(refined) + threshold)
+            if n_done + 4*m > self.max_segments:
+                good[:] = True
+
+            done_starts.extend([starts[good], mids[good]])
+            done_values.extend([lefts[good], rights[good]])
+            n_done += 2 * np.count_nonzero(good)
+
+            bad = ~good
+            starts = np.concatenate((starts[bad], mids[bad]))
+            ends = np.concatenate((mids[bad], ends[bad]))
+            values = np.concatenate((lefts[bad], rights[bad]))
+
+        starts = np.concatenate(done_starts)
+        values = np.concatenate(done_values)
+        idxs = np.argsort(starts)
+        self.knots = np.append(starts[idxs], self.t_max)
+        self.summands = np.insert(np.cumsum(values[idxs]), 0, 0)
+
+    def evaluate(self, ts):
+        """
+        Calculate integral from t_min to each of ts.
+        """
+        ts = np.asarray(ts, dtype=np.float64)
+        idxs = np.searchsorted(self.knots, ts, side='right') - 1
+        idxs = np.clip(idxs, 0, len(self.knots) - 2)
+        starts = self.knots[idxs]
+        return self.summands[idxs] + gauss_legendre_segments(self.func, starts, ts)
@@ -179,18 +179,152 @@ def intersect_edges_3d(verts_in, edges_in, s_epsilon):
 def edges_from_ed_inter(ed_inter):
     '''create edges from intersections library'''
     edges_out = []
+    edges_set = set()
     for e in ed_inter:
         # sort by first element of tuple (distances)
         e_s = sorted(e)
         e_s = [e for i,e in enumerate(e_s) if e[1]!= e_s[i-1][1]] 
         for i in range(1, len(e_s)):
-            # if e_s[i-1][1] != e_s[i][1]:
-            if(e_s[i-1][1], e_s[i][1])not in edges_out:
-                edges_out.append((e_s[i-1][1], e_s[i][1]))
+            edge = (e_s[i-1][1], e_s[i][1])
+            if edge not in edges_set:
+                edges_set.add(edge)
+                edges_out.append(edge)
     return edges_out
 
+# Edges which would occupy more grid cells than this are checked
+# against all other edges instead of being put into the grid.
+MAX_CELLS_PER_EDGE = 64
+
+def edges_grid_candidates(verts_in, edges, ed_lengths):
+    '''
+    Broad phase of 2D edges intersection: put edges into uniform grid
+    cells by their bounding boxes, so that only edges sharing at least
+    one cell have to be checked for intersection. Edges which are much
+    longer than typical ones are checked by bounding boxes against all
+    other edges, so that they do not fill a lot of cells.
+    Returns: list, for each edge i - sorted list of edges j < i, which
+    can intersect with edge i. Zero-length edges are skipped.
+    '''
+    n = len(edges)
+    boxes = []
+    extents = []
+    for e, d in zip(edges, ed_lengths):
+        if d == 0:
+            boxes.append(None)
+            continue
+        v1, v2 = verts_in[e[0]], verts_in[e[1]]
+        min_x, max_x = min(v1.x, v2.x), max(v1.x, v2.x)
+        min_y, max_y = min(v1.y, v2.y), max(v1.y, v2.y)
+        boxes.append((min_x, min_y, max_x, max_y))
+        extents.append(max(max_x - min_x, max_y - min_y))
+
+    candidates = [[] for i in range(n)]
+    if not extents:
+        return candidates
+
+    # Cell size of the order of typical edge size, so that most edges
+    # occupy only a few cells; median is not affected by a few long edges.
+    extents.sort()
+    cell_size = extents[len(extents) // 2]
+    if cell_size == 0:
+        cell_size = extents[-1] or 1.0
+    # Make boxes slightly bigger, to be sure that intersection points
+    # lying exactly at cell borders are not lost due to rounding.
+    pad = cell_size * 1e-6
+
+    grid = defaultdict(list)
+    long_edges = []
+    for i, box in enumerate(boxes):
+        if box is None:
+            continue
+        min_x, min_y, max_x, max_y = box
+        i_min, i_max = int((min_x - pad) // cell_size), int((max_x + pad) // cell_size)
+        j_min, j_max = int((min_y - pad) // cell_size), int((max_y + pad) // cell_size)
+        if (i_max - i_min + 1) * (j_max - j_min + 1) > MAX_CELLS_PER_EDGE:
+            found = range(i)
+            long_edges.append(i)
+        else:
+            found = set(long_edges)
+            for ci in range(i_min, i_max + 1):
+                for cj in range(j_min, j_max + 1):
+                    cell = grid[(ci, cj)]
+                    found.update(cell)
+                    cell.append(i)
+        for j in found:
+            other = boxes[j]
+            if other is None:
+                continue
+            if (max_x + pad < other[0] or other[2] + pad < min_x or
+                    max_y + pad < other[1] or other[3] + pad < min_y):
+                continue
+            candidates[i].append(j)
+        candidates[i].sort()
+
+    return candidates
+
 def intersect_edges_2d(verts, edges, epsilon):
-    '''Iterate through edges  and expose them to intersect_line_line_2d'''
+    '''
+    Find intersections of edges, looking at X and Y coordinates only.
+    Uses uniform grid to find pairs of edges that can intersect;
+    the output is the same as of intersect_edges_2d_bruteforce.
+    '''
+    verts_in = [Vector(v) for v in verts]
+    ed_lengths = [(verts_in[e[1]] - verts_in[e[0]]).length for e in edges]
+    verts_out = verts
+    # index of vertices by exact coordinates, to reuse already existing ones
+    verts_index = dict()
+    for idx, v in enumerate(verts_out):
+        if isinstance(v, tuple):
+            verts_index.setdefault(v, idx)
+    ed_inter = [[] for e in edges]
+    candidates = edges_grid_candidates(verts_in, edges, ed_lengths)
+    for i, (e, d) in enumerate(zip(edges, ed_lengths)):
+        # if there is no intersections this will create a normal edge
+        ed_inter[i].append([0.0, e[0]])
+        ed_inter[i].append([d, e[1]])
+        v1 = verts_in[e[0]]
+        v2 = verts_in[e[1]]
+
+        for j in candidates[i]:
+            e2 = edges[j]
+            if (e2[0] in e) or (e2[1] in e):
+                continue
+            d2 = ed_lengths[j]
+
+            v3 = verts_in[e2[0]]
+            v4 = verts_in[e2[1]]
+            vx = intersect_line_line_2d(v1, v2, v3, v4)
+            if vx:
+                d_to_1 = (vx - v1.to_2d()).length
+                d_to_2 = (vx - v3.to_2d()).length
+
+                new_vert = (vx.x, vx.y, v1.z)
+                new_id = verts_index.get(new_vert, None)
+                if new_id is None:
+                    new_id = len(verts_out)
+                    if d_to_1 < epsilon:
+                        new_id = e[0]
+                    elif d_to_1 > d - epsilon:
+                        new_id = e[1]
+                    elif d_to_2 < epsilon:
+                        new_id = e2[0]
+                    elif d_to_2 > d2 - epsilon:
+                        new_id = e2[1]
+                    if new_id == len(verts_out):
+                        verts_index[new_vert] = new_id
+                        verts_out.append(new_vert)
+
+                # first item stores distance to origin, second the vertex id
+                ed_inter[i].append([d_to_1, new_id])
+                ed_inter[j].append([d_to_2, new_id])
+
+    edges_out = edges_from_ed_inter(ed_inter)
+
+    return verts_out, edges_out
+
+def intersect_edges_2d_bruteforce(verts, edges, epsilon):
+    '''Iterate through edges  and expose them to intersect_line_line_2d.
+    This checks all pairs of edges; kept as a reference implementation.'''
     verts_in = [Vector(v) for v in verts]
     ed_lengths = [(verts_in[e[1]] - verts_in[e[0]]).length for e in edges]
     verts_out = verts
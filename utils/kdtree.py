@@ -44,8 +44,48 @@ class SvKdTree(object):
     def query_array(self, needle, count=1):
         raise Exception("Not implemented")
 
+    def query_ball(self, needle, radius):
+        """
+        Find all points within specified distance from the needle.
+        Returns: tuple of np.arrays: locations, indices and distances
+            of found points, sorted by distance.
+        """
+        raise Exception("Not implemented")
+
+    def query_ball_array(self, needles, radius):
+        """
+        Find all points within specified distance from each of needles.
+        Returns: tuple of three lists (with one np.array per needle):
+            locations, indices and distances of found points, sorted by distance.
+        """
+        res = [self.query_ball(needle, radius) for needle in needles]
+        locs = [loc for loc, idx, distance in res]
+        idxs = [idx for loc, idx, distance in res]
+        distances = [distance for loc, idx, distance in res]
+        return locs, idxs, distances
+
+def _sort_ball_result(points, idxs, distances):
+    order = np.argsort(distances, kind='stable')
+    idxs = np.asarray(idxs, dtype=np.int64)[order]
+    return points[idxs], idxs, distances[order]
+
+def _concatenate_ranges(starts, ends):
+    """
+    Concatenation of np.arange(start, end) for all pairs of starts and ends.
+    """
+    lengths = ends - starts
+    total = lengths.sum()
+    if total == 0:
+        return np.empty((0,), dtype=np.int64)
+    # offset of each range in the result
+    offsets = np.cumsum(lengths) - lengths
+    result = np.arange(total, dtype=np.int64) - np.repeat(offsets - starts, lengths)
+    return result
+
 class SvBlenderKdTree(SvKdTree):
     def __init__(self, points):
+        self.points = np.asarray(points)
+        self.grid = None
         self.kdtree = kdtree.KDTree(len(points))
         for i, v in enumerate(points):
             self.kdtree.insert(v, i)
@@ -67,12 +107,24 @@ class SvBlenderKdTree(SvKdTree):
             return locs, idxs, distances
 
     def query_array(self, needle, count=1, **kwargs):
-        res = [self.query(item, count) for item in needle]
-        locs = [loc for loc, idx, distance in res]
-        idxs = [idx for loc, idx, distance in res]
-        distances = [distance for loc, idx, distance in res]
+        # Batched queries are served by a grid index, which is built on first use;
+        # querying Blender's KDTree for each needle from Python is much slower.
+        if self.grid is None:
+            self.grid = SvGridKdTree(self.points)
+        return self.grid.query_array(needle, count)
 
-        return np.array(locs), np.array(idxs), np.array(distances)
+    def query_ball(self, needle, radius):
+        res = self.kdtree.find_range(needle, radius)
+        locs = np.array([np.array(loc) for loc, idx, distance in res]).reshape((-1, 3))
+        idxs = np.array([idx for loc, idx, distance in res], dtype=np.int64)
+        distances = np.array([distance for loc, idx, distance in res])
+        order = np.argsort(distances, kind='stable')
+        return locs[order], idxs[order], distances[order]
+
+    def query_ball_array(self, needles, radius):
+        if self.grid is None:
+            self.grid = SvGridKdTree(self.points)
+        return self.grid.query_ball_array(needles, radius)
 
 class SvSciPyKdTree(SvKdTree):
     def __init__(self, points, power=2):
@@ -90,6 +142,11 @@ class SvSciPyKdTree(SvKdTree):
         locs = self.points[idxs]
         return locs, idxs, distances
 
+    def query_ball(self, needle, radius):
+        idxs = self.kdtree.query_ball_point(needle, radius, p=self.power)
+        distances = np.linalg.norm(self.points[idxs] - needle, axis=1, ord=self.power)
+        return _sort_ball_result(self.points, idxs, distances)
+
 class SvBruteforceKdTree(SvKdTree):
     def __init__(self, points, power=2):
         self.points = np.asarray(points)
@@ -110,9 +167,197 @@ class SvBruteforceKdTree(SvKdTree):
             return locs, idxs, distances
 
     def query_array(self, needle, count=1):
+        needle = np.asarray(needle)
+        count = min(count, len(self.points))
+        idxs, distances = _chunked_k_smallest(needle, self.points, count, self.power)
         if count == 1:
-            return np.vectorize(self.query, signature='(3)->(3),(),()')(needle)
+            idxs, distances = idxs[:,0], distances[:,0]
+        return self.points[idxs], idxs, distances
+
+    def query_ball(self, needle, radius):
+        distances = np.linalg.norm(self.points - needle, axis=1, ord=self.power)
+        idxs = np.where(distances <= radius)[0]
+        return _sort_ball_result(self.points, idxs, distances[idxs])
+
+def _k_smallest(distances, count):
+    """
+    For each row of distances matrix, find indices and values of
+    count smallest elements, sorted by value.
+    """
+    if count == 1:
+        idxs = np.argmin(distances, axis=1)[:, np.newaxis]
+    elif count < distances.shape[1]:
+        idxs = np.argpartition(distances, count-1, axis=1)[:, :count]
+    else:
+        idxs = np.broadcast_to(np.arange(distances.shape[1]), distances.shape)
+    values = np.take_along_axis(distances, idxs, axis=1)
+    order = np.argsort(values, axis=1, kind='stable')
+    return np.take_along_axis(idxs, order, axis=1), np.take_along_axis(values, order, axis=1)
+
+# Maximum size of distances matrix calculated at once by batched queries
+MAX_CHUNK_ELEMENTS = 1000000
+
+def _chunked_k_smallest(needles, points, count, power):
+    """
+    For each of needles, find indices of count nearest points
+    and distances to them, sorted by distance.
+    Needles are processed in chunks, so that the matrix of
+    distances from chunk to all points is not too big.
+    """
+    idxs = np.empty((len(needles), count), dtype=np.int64)
+    distances = np.empty((len(needles), count))
+    chunk_size = max(1, MAX_CHUNK_ELEMENTS // len(points))
+    if power == 2:
+        # Squared euclidean distances can be calculated by matrix product,
+        # which is much faster than calculating all differences.
+        # Coordinates are centered to lose less precision.
+        center = points.mean(axis=0)
+        centered_points = points - center
+        points_sq = (centered_points * centered_points).sum(axis=1)
+    for start in range(0, len(needles), chunk_size):
+        chunk = needles[start : start + chunk_size]
+        if power == 2:
+            centered_chunk = chunk - center
+            chunk_sq = (centered_chunk * centered_chunk).sum(axis=1)
+            chunk_distances = chunk_sq[:, np.newaxis] + points_sq[np.newaxis, :] - 2 * (centered_chunk @ centered_points.T)
+            chunk_idxs, _ = _k_smallest(chunk_distances, count)
+            # exact distances for found points
+            chunk_distances = np.linalg.norm(chunk[:, np.newaxis, :] - points[chunk_idxs], axis=2)
+            order = np.argsort(chunk_distances, axis=1, kind='stable')
+            chunk_idxs = np.take_along_axis(chunk_idxs, order, axis=1)
+            chunk_distances = np.take_along_axis(chunk_distances, order, axis=1)
         else:
-            qry = lambda p: self.query(p, count=count)
-            return np.vectorize(qry, signature='(n,3)->(k,3),(k),(k)')(needle)
+            chunk_distances = np.linalg.norm(chunk[:, np.newaxis, :] - points[np.newaxis, :, :], axis=2, ord=power)
+            chunk_idxs, chunk_distances = _k_smallest(chunk_distances, count)
+        idxs[start : start + chunk_size], distances[start : start + chunk_size] = chunk_idxs, chunk_distances
+    return idxs, distances
+
+class SvGridKdTree(SvKdTree):
+    """
+    Uniform grid (bucket) index of points, which is used for batched queries
+    when SciPy is not available. Points are sorted by grid cells; needles are
+    processed in groups lying in the same cell, and candidate points for the
+    whole group are taken from the box of cells around it. The box is grown
+    until found distances are guaranteed to be smaller than the distance to
+    any point outside of the box.
+    """
+    def __init__(self, points, power=2, points_per_cell=16):
+        self.points = np.asarray(points, dtype=np.float64)
+        self.power = power
+        n_points = len(self.points)
+
+        self.min = self.points.min(axis=0)
+        sizes = self.points.max(axis=0) - self.min
+        nonzero = sizes > 1e-12
+        n_dims = nonzero.sum()
+        if n_dims == 0:
+            cell_size = 1.0
+        else:
+            cell_size = (np.prod(sizes[nonzero]) * points_per_cell / n_points) ** (1.0 / n_dims)
+            cell_size = max(cell_size, sizes.max() / 1024.0)
+        self.cell_size = cell_size
+        self.resolution = np.maximum(np.ceil(sizes / cell_size).astype(np.int64), 1)
+
+        cells = self._cell_ids(self.points)
+        self.order = np.argsort(cells, kind='stable')
+        sorted_cells = cells[self.order]
+        n_cells = np.prod(self.resolution)
+        self.cell_starts = np.searchsorted(sorted_cells, np.arange(n_cells + 1))
+
+    def _cell_coords(self, points):
+        coords = np.floor((points - self.min) / self.cell_size).astype(np.int64)
+        return np.clip(coords, 0, self.resolution - 1)
+
+    def _cell_ids(self, points):
+        coords = self._cell_coords(points)
+        return np.ravel_multi_index(coords.T, self.resolution)
+
+    def _box_points(self, lo, hi):
+        """Indices of points in the box of cells from lo to hi (inclusive)."""
+        xs, ys = np.meshgrid(np.arange(lo[0], hi[0]+1), np.arange(lo[1], hi[1]+1), indexing='ij')
+        xs, ys = xs.ravel(), ys.ravel()
+        # cells with the same X and Y are consecutive
+        first_cells = np.ravel_multi_index((xs, ys, np.full_like(xs, lo[2])), self.resolution)
+        last_cells = np.ravel_multi_index((xs, ys, np.full_like(xs, hi[2])), self.resolution)
+        sorted_idxs = _concatenate_ranges(self.cell_starts[first_cells], self.cell_starts[last_cells + 1])
+        return self.order[sorted_idxs]
+
+    def _box_bounds(self, needles, lo, hi):
+        """
+        Lower bound of distance from each of needles to any
+        point which is not in the box of cells from lo to hi.
+        """
+        box_min = self.min + lo * self.cell_size
+        box_max = self.min + (hi + 1) * self.cell_size
+        below = np.where(lo > 0, needles - box_min, np.inf)
+        above = np.where(hi < self.resolution - 1, box_max - needles, np.inf)
+        return np.minimum(below, above).min(axis=1)
+
+    def _groups(self, needles):
+        """Split needles into groups lying in the same cell."""
+        coords = self._cell_coords(needles)
+        cells = np.ravel_multi_index(coords.T, self.resolution)
+        order = np.argsort(cells, kind='stable')
+        _, starts = np.unique(cells[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+        for start, end in zip(starts, ends):
+            group = order[start:end]
+            yield coords[group[0]], group
+
+    def query(self, needle, count=1):
+        locs, idxs, distances = self.query_array(np.asarray(needle)[np.newaxis], count)
+        return locs[0], idxs[0], distances[0]
+
+    def query_array(self, needle, count=1):
+        needles = np.asarray(needle, dtype=np.float64)
+        count = min(count, len(self.points))
+        result_idxs = np.empty((len(needles), count), dtype=np.int64)
+        result_distances = np.empty((len(needles), count))
+
+        for cell, group in self._groups(needles):
+            ring = 1
+            while len(group):
+                lo = np.maximum(cell - ring, 0)
+                hi = np.minimum(cell + ring, self.resolution - 1)
+                candidates = self._box_points(lo, hi)
+                if len(candidates) >= count:
+                    group_needles = needles[group]
+                    idxs, distances = _chunked_k_smallest(group_needles, self.points[candidates], count, self.power)
+                    good = distances[:, -1] <= self._box_bounds(group_needles, lo, hi)
+                    result_idxs[group[good]] = candidates[idxs[good]]
+                    result_distances[group[good]] = distances[good]
+                    group = group[~good]
+                ring += 1
+
+        if count == 1:
+            result_idxs, result_distances = result_idxs[:,0], result_distances[:,0]
+        return self.points[result_idxs], result_idxs, result_distances
+
+    def query_ball(self, needle, radius):
+        locs, idxs, distances = self.query_ball_array(np.asarray(needle)[np.newaxis], radius)
+        return locs[0], idxs[0], distances[0]
+
+    def query_ball_array(self, needles, radius):
+        needles = np.asarray(needles, dtype=np.float64)
+        result_locs = [None] * len(needles)
+        result_idxs = [None] * len(needles)
+        result_distances = [None] * len(needles)
+        # needles are not farther than cell_size from their cell along each axis
+        ring = int(np.ceil(radius / self.cell_size))
+        for cell, group in self._groups(needles):
+            lo = np.maximum(cell - ring, 0)
+            hi = np.minimum(cell + ring, self.resolution - 1)
+            candidates = self._box_points(lo, hi)
+            candidate_points = self.points[candidates]
+            chunk_size = max(1, MAX_CHUNK_ELEMENTS // max(len(candidates), 1))
+            for start in range(0, len(group), chunk_size):
+                chunk = group[start : start + chunk_size]
+                distances = np.linalg.norm(needles[chunk][:, np.newaxis, :] - candidate_points[np.newaxis, :, :], axis=2, ord=self.power)
+                for i, needle_distances in zip(chunk, distances):
+                    good = needle_distances <= radius
+                    locs, idxs, dists = _sort_ball_result(self.points, candidates[good], needle_distances[good])
+                    result_locs[i] = locs
+                    result_idxs[i] = idxs
+                    result_distances[i] = dists
+        return result_locs, result_idxs, result_distances
 
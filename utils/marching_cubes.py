@@ -486,3 +486,132 @@ def isosurface_np(data, isolevel):
 
     return np.array(polygoniser.vertices), triangles
 
+# Corner offsets of the cube, in the order used by edgetable / tritable
+# (see the picture at the top of this file).
+CUBE_CORNERS = np.array([
+        (0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0),
+        (0, 0, 1), (0, 1, 1), (1, 1, 1), (1, 0, 1)
+    ], dtype=np.int64)
+
+# For each of 12 cube edges: the pair of corners it connects,
+# in the same order as Polygoniser.polygonise uses them.
+CUBE_EDGES = np.array([
+        (0, 1), (1, 2), (2, 3), (3, 0),
+        (4, 5), (5, 6), (6, 7), (7, 4),
+        (0, 4), (1, 5), (2, 6), (3, 7)
+    ], dtype=np.int64)
+
+EDGETABLE_NP = np.array(edgetable, dtype=np.int64)
+TRITABLE_NP = np.array(tritable, dtype=np.int64)
+
+# Axis along which each cube edge goes, and the offset of
+# it's start point (the corner with minimal coordinates).
+EDGE_AXIS = np.argmax(CUBE_CORNERS[CUBE_EDGES[:,0]] != CUBE_CORNERS[CUBE_EDGES[:,1]], axis=-1)
+EDGE_START = np.minimum(CUBE_CORNERS[CUBE_EDGES[:,0]], CUBE_CORNERS[CUBE_EDGES[:,1]])
+
+def _edge_ids_layout(shape):
+    """
+    Each edge of the sampling grid is identified by a single integer.
+    Edges along X, Y and Z axes are numbered in three consecutive blocks;
+    inside each block, edges are numbered by the grid point they start at.
+    Returns: np.array of shape (3, 3) with index strides of each block,
+        and np.array of shape (3,) with block offsets.
+    """
+    sx, sy, sz = shape
+    dims = [(sx-1, sy, sz), (sx, sy-1, sz), (sx, sy, sz-1)]
+    strides = np.array([(dy*dz, dz, 1) for dx, dy, dz in dims], dtype=np.int64)
+    sizes = [dx*dy*dz for dx, dy, dz in dims]
+    offsets = np.array([0, sizes[0], sizes[0] + sizes[1]], dtype=np.int64)
+    return strides, offsets
+
+def isosurface_vectorized(data, isolevel):
+    """
+    NumPy-batched implementation of marching cubes algorithm.
+    It classifies all cubes at once and interpolates all edge crossings in bulk.
+    Vertices shared between neighbouring cubes are merged by integer edge IDs.
+
+    The output is the same as of isosurface_np (which is kept as a reference
+    implementation): the same vertices in the same order, and the same triangles.
+
+    Args:
+        data: np.array of shape (sx, sy, sz) - scalar field values at grid points.
+        isolevel: field value to build isosurface for.
+
+    Returns:
+        tuple: np.array of shape (n, 3) with vertices in grid coordinates,
+            and np.array of shape (m, 3) with triangles.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    sx, sy, sz = data.shape
+    below = data < isolevel
+
+    # classify all cubes
+    cube_index = np.zeros((sx-1, sy-1, sz-1), dtype=np.int64)
+    for bit, (dx, dy, dz) in enumerate(CUBE_CORNERS):
+        corner_below = below[dx : sx-1+dx, dy : sy-1+dy, dz : sz-1+dz]
+        cube_index |= corner_below.astype(np.int64) << bit
+
+    # Enumerate cubes in the same order as isosurface_np does:
+    # Z is the outer loop, X is the inner one.
+    cube_index = cube_index.transpose((2, 1, 0))
+    cz, cy, cx = np.nonzero(EDGETABLE_NP[cube_index])
+    if len(cx) == 0:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+    cube_index = cube_index[cz, cy, cx]
+
+    cube_points = np.stack((cx, cy, cz), axis=-1)
+    n_cubes = len(cube_index)
+
+    # Edges crossed by the surface, in the same order as
+    # Polygoniser.polygonise meets them: by cube, then by edge number.
+    edge_bits = EDGETABLE_NP[cube_index][:, np.newaxis] & (1 << np.arange(12))
+    crossed_cubes, crossed_edges = np.nonzero(edge_bits)
+
+    # Global IDs of crossed edges
+    axis = EDGE_AXIS[crossed_edges]
+    start = cube_points[crossed_cubes] + EDGE_START[crossed_edges]
+    strides, offsets = _edge_ids_layout(data.shape)
+    crossed_ids = offsets[axis] + (start * strides[axis]).sum(axis=-1)
+
+    # Deduplicate vertices by edge IDs; number them in the order of first occurence.
+    _, first_idxs, inverse = np.unique(crossed_ids, return_index=True, return_inverse=True)
+    order = np.argsort(first_idxs, kind='stable')
+    vertex_by_unique = np.empty_like(order)
+    vertex_by_unique[order] = np.arange(len(order))
+    cube_vertices = np.full((n_cubes, 12), -1, dtype=np.int64)
+    cube_vertices[crossed_cubes, crossed_edges] = vertex_by_unique[inverse.ravel()]
+
+    # Interpolate edge crossings, in the direction the edge was first met
+    first_idxs = first_idxs[order]
+    first_cubes = cube_points[crossed_cubes[first_idxs]]
+    first_edges = CUBE_EDGES[crossed_edges[first_idxs]]
+    p1 = first_cubes + CUBE_CORNERS[first_edges[:,0]]
+    p2 = first_cubes + CUBE_CORNERS[first_edges[:,1]]
+    val1 = data[p1[:,0], p1[:,1], p1[:,2]]
+    val2 = data[p2[:,0], p2[:,1], p2[:,2]]
+    vertices = vertexinterp_np(isolevel, p1, p2, val1, val2)
+
+    # Triangles of each cube: (n_cubes, 5, 3) table of local edge numbers
+    cube_tris = TRITABLE_NP[cube_index][:, :15].reshape((n_cubes, 5, 3))
+    good = cube_tris[:, :, 0] >= 0
+    tri_cubes, _ = np.nonzero(good)
+    faces = cube_vertices[tri_cubes[:, np.newaxis], cube_tris[good]]
+
+    return vertices, faces
+
+def vertexinterp_np(isolevel, p1, p2, valp1, valp2):
+    """
+    Vectorized version of vertexinterp.
+    p1, p2: np.arrays of shape (n, 3); valp1, valp2: np.arrays of shape (n,).
+    """
+    p1 = p1.astype(np.float64)
+    p2 = p2.astype(np.float64)
+    take_p1 = (ABS(isolevel - valp1) < 0.00001) | (ABS(valp1 - valp2) < 0.00001)
+    take_p2 = (ABS(isolevel - valp2) < 0.00001) & ~(ABS(isolevel - valp1) < 0.00001)
+    denominator = np.where(take_p1 | take_p2, 1.0, valp2 - valp1)
+    mu = (isolevel - valp1) / denominator
+    result = p1 + mu[:, np.newaxis] * (p2 - p1)
+    result[take_p1] = p1[take_p1]
+    result[take_p2] = p2[take_p2]
+    return result
+
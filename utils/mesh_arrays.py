@@ -0,0 +1,173 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Bulk access to Blender mesh data by foreach_get / foreach_set with NumPy
+arrays, instead of iterating over mesh elements in Python.
+
+Polygons are kept in "flat" form: one array of vertex indices of all
+polygons (in the order of polygons), plus arrays of offsets of polygons in
+it and of their sizes. split_polygons converts them to usual Sverchok form.
+"""
+
+import hashlib
+from itertools import chain
+
+import numpy as np
+
+
+def vertices_from_mesh(mesh):
+    '''vertex coordinates as (n, 3) array'''
+    n = len(mesh.vertices)
+    co = np.empty(n * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    return co.reshape((n, 3)).astype(np.float64)
+
+
+def edges_from_mesh(mesh):
+    '''edges as (m, 2) array, with vertex indices of each edge sorted (like mesh.edge_keys)'''
+    m = len(mesh.edges)
+    edges = np.empty(m * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edges)
+    return np.sort(edges.reshape((m, 2)), axis=1)
+
+
+def flat_polygons_from_mesh(mesh):
+    '''
+    Returns: tuple (vertex indices of all polygons, offsets, sizes)
+    '''
+    k = len(mesh.polygons)
+    loop_start = np.empty(k, dtype=np.int32)
+    loop_total = np.empty(k, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_start)
+    mesh.polygons.foreach_get('loop_total', loop_total)
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_vertices)
+
+    offsets = np.zeros(k, dtype=np.int64)
+    np.cumsum(loop_total[:-1], out=offsets[1:])
+    if not np.array_equal(loop_start, offsets):
+        # loops of polygons are not stored in the order of polygons
+        total = int(loop_total.sum())
+        indexes = np.repeat(loop_start - offsets, loop_total) + np.arange(total)
+        loop_vertices = loop_vertices[indexes]
+    return loop_vertices, offsets, loop_total
+
+
+def material_indices_from_mesh(mesh):
+    k = len(mesh.polygons)
+    materials = np.empty(k, dtype=np.int32)
+    mesh.polygons.foreach_get('material_index', materials)
+    return materials
+
+
+def split_polygons(flat_vertices, offsets, sizes, output_numpy=False):
+    '''
+    Convert flat polygons to Sverchok form: a list of lists,
+    or a (k, size) array (view of flat_vertices) if all polygons have the
+    same size and output_numpy is True, or a list of arrays otherwise.
+    '''
+    if len(sizes) == 0:
+        return np.empty((0, 3), dtype=np.int32) if output_numpy else []
+    if (sizes == sizes[0]).all():
+        polygons = flat_vertices.reshape((len(sizes), int(sizes[0])))
+        return polygons if output_numpy else polygons.tolist()
+    if output_numpy:
+        return np.split(flat_vertices, offsets[1:])
+    flat = flat_vertices.tolist()
+    return [flat[start : start+size] for start, size in zip(offsets.tolist(), sizes.tolist())]
+
+
+def pydata_from_mesh(mesh, output_numpy=False):
+    '''
+    Vertices, edges and polygons of Blender mesh, read by foreach_get.
+    If output_numpy is True, data are returned as NumPy arrays,
+    otherwise as lists.
+    '''
+    verts = vertices_from_mesh(mesh)
+    edges = edges_from_mesh(mesh)
+    faces = split_polygons(*flat_polygons_from_mesh(mesh), output_numpy=output_numpy)
+    if output_numpy:
+        return verts, edges, faces
+    return verts.tolist(), edges.tolist(), faces
+
+
+def flat_polygons(faces):
+    '''
+    Sverchok polygons (list of lists, list of arrays or 2D array) to flat form.
+    Returns: tuple (vertex indices of all polygons, offsets, sizes)
+    '''
+    if isinstance(faces, np.ndarray) and faces.ndim == 2:
+        n_faces, size = faces.shape
+        flat = np.ascontiguousarray(faces, dtype=np.int32).ravel()
+        sizes = np.full(n_faces, size, dtype=np.int32)
+    else:
+        sizes = np.fromiter(map(len, faces), dtype=np.int32, count=len(faces))
+        flat = np.fromiter(chain.from_iterable(faces), dtype=np.int32, count=int(sizes.sum()))
+    offsets = np.zeros(len(sizes), dtype=np.int32)
+    np.cumsum(sizes[:-1], out=offsets[1:])
+    return flat, offsets, sizes
+
+
+def edges_array(edges):
+    return np.ascontiguousarray(np.asarray(edges, dtype=np.int32).reshape((-1, 2)))
+
+
+def topology_fingerprint(n_verts, edges, flat_faces, sizes):
+    '''
+    Hash of number of vertices, edges and polygons; it changes if any
+    index or size of any polygon changes, but not if vertices are moved.
+    '''
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.array([n_verts, len(edges), len(sizes)], dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(edges, dtype=np.int32).tobytes())
+    digest.update(np.ascontiguousarray(sizes, dtype=np.int32).tobytes())
+    digest.update(np.ascontiguousarray(flat_faces, dtype=np.int32).tobytes())
+    return digest.hexdigest()
+
+
+def resolve_indices(n_verts, edges, flat_faces):
+    '''
+    Negative indices of vertices are counted from the end, as in Python lists
+    (and as BMesh creation from Sverchok data used to treat them).
+    Returns: tuple (edges, flat_faces) with negative indices replaced.
+    Raise IndexError if edges or polygons refer to vertices which do not exist;
+    Blender would silently create an invalid mesh from such data.
+    '''
+    resolved = []
+    for name, indices in [('Edges', edges), ('Polygons', flat_faces)]:
+        indices = np.asarray(indices)
+        if indices.size and (indices.min() < -n_verts or indices.max() >= n_verts):
+            bad = indices[(indices < -n_verts) | (indices >= n_verts)][0]
+            raise IndexError(f"{name} refer to vertex index {bad}, while there are {n_verts} vertices")
+        if indices.size and indices.min() < 0:
+            indices = np.where(indices < 0, indices + n_verts, indices)
+        resolved.append(indices)
+    return tuple(resolved)
+
+
+def write_mesh(mesh, verts, edges, flat_faces, offsets, sizes):
+    '''
+    Replace geometry of Blender mesh by given vertices, edges (array (m, 2))
+    and flat polygons. Edges of polygons are added automatically if they are
+    not in edges.
+    '''
+    verts = np.asarray(verts, dtype=np.float32).reshape((-1, 3))
+    edges, flat_faces = resolve_indices(len(verts), edges, flat_faces)
+    mesh.clear_geometry()
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set('co', verts.ravel())
+    if len(edges):
+        mesh.edges.add(len(edges))
+        mesh.edges.foreach_set('vertices', np.ravel(edges))
+    if len(sizes):
+        mesh.loops.add(len(flat_faces))
+        mesh.loops.foreach_set('vertex_index', flat_faces)
+        mesh.polygons.add(len(sizes))
+        mesh.polygons.foreach_set('loop_start', offsets)
+        mesh.polygons.foreach_set('loop_total', sizes)
+        mesh.update(calc_edges=True)
@@ -17,8 +17,12 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import ast
+from functools import lru_cache
+from math import e, pi
 
-from sverchok.utils.script_importhelper import safe_names
+import numpy as np
+
+from sverchok.utils.script_importhelper import safe_names, safe_names_np
 from sverchok.utils import logging
 
 class VariableCollector(ast.NodeVisitor):
@@ -153,3 +157,143 @@ def safe_eval(string, variables):
         logging.exception(e)
         raise Exception("Invalid expression syntax: " + str(e))
 
+
+# Functions which can be called in vectorized formulas: NumPy ufuncs
+# with the same meaning as functions of math module with the same name
+numpy_functions = {
+        'acos': np.arccos, 'acosh': np.arccosh, 'asin': np.arcsin,
+        'asinh': np.arcsinh, 'atan': np.arctan, 'atan2': np.arctan2,
+        'atanh': np.arctanh, 'ceil': np.ceil, 'copysign': np.copysign,
+        'cos': np.cos, 'cosh': np.cosh, 'degrees': np.degrees,
+        'exp': np.exp, 'expm1': np.expm1, 'fabs': np.fabs,
+        'floor': np.floor, 'fmod': np.fmod, 'hypot': np.hypot,
+        'isfinite': np.isfinite, 'isinf': np.isinf, 'isnan': np.isnan,
+        'ldexp': np.ldexp, 'log': np.log, 'log10': np.log10,
+        'log1p': np.log1p, 'log2': np.log2, 'pow': np.power,
+        'radians': np.radians, 'sin': np.sin, 'sinh': np.sinh,
+        'sqrt': np.sqrt, 'tan': np.tan, 'tanh': np.tanh,
+        'trunc': np.trunc, 'abs': np.abs, 'sign': np.sign
+    }
+
+# Names of NumPy functions used in place of Python constructs
+_WHERE, _AND, _OR, _NOT = '_sv_where', '_sv_and', '_sv_or', '_sv_not'
+
+def _numpy_and(a, b):
+    # like Python's "a and b": returns an operand, not a boolean
+    return np.where(a, b, a)
+
+def _numpy_or(a, b):
+    # like Python's "a or b"
+    return np.where(a, a, b)
+
+numpy_namespace = dict(numpy_functions)
+numpy_namespace.update({
+        'e': e, 'pi': pi,
+        _WHERE: np.where, _AND: _numpy_and,
+        _OR: _numpy_or, _NOT: np.logical_not,
+        '__builtins__': {}
+    })
+
+class NotVectorizable(Exception):
+    pass
+
+class NumpyTransformer(ast.NodeTransformer):
+    """
+    Rewrite formula AST so that it can be evaluated for NumPy arrays of
+    variable values with one call: function calls become calls of NumPy
+    ufuncs, "a if c else b" becomes where(c, a, b), "a or b" becomes
+    where(a, a, b) (and "and" likewise), "not" becomes logical_not.
+
+    Constructs which have no element-wise meaning (comprehensions,
+    lambdas, subscripts, attributes, strings, unknown functions...) raise
+    NotVectorizable.
+    """
+    allowed_nodes = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Name, ast.Load,
+                     ast.operator, ast.unaryop, ast.cmpop, ast.boolop)
+
+    @staticmethod
+    def call(name, args):
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+
+    def generic_visit(self, node):
+        if not isinstance(node, self.allowed_nodes):
+            raise NotVectorizable(type(node).__name__)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return self.call(_NOT, [self.visit(node.operand)])
+        if isinstance(node, (ast.Is, ast.IsNot, ast.In, ast.NotIn)):
+            raise NotVectorizable(type(node).__name__)
+        return super().generic_visit(node)
+
+    def visit_Num(self, node):
+        return node
+
+    def visit_Constant(self, node):
+        if not isinstance(node.value, (int, float)):
+            raise NotVectorizable(repr(node.value))
+        return node
+
+    def visit_Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise NotVectorizable("call")
+        function = numpy_functions.get(node.func.id)
+        if function is None or len(node.args) != function.nin:
+            raise NotVectorizable(node.func.id)
+        if any(isinstance(arg, ast.Starred) for arg in node.args):
+            raise NotVectorizable("call")
+        return self.call(node.func.id, [self.visit(arg) for arg in node.args])
+
+    def visit_IfExp(self, node):
+        return self.call(_WHERE, [self.visit(node.test), self.visit(node.body), self.visit(node.orelse)])
+
+    def visit_BoolOp(self, node):
+        name = _AND if isinstance(node.op, ast.And) else _OR
+        values = [self.visit(value) for value in node.values]
+        result = values[0]
+        for value in values[1:]:
+            result = self.call(name, [result, value])
+        return result
+
+    def visit_Compare(self, node):
+        for op in node.ops:
+            self.generic_visit(op)
+        left = self.visit(node.left)
+        comparators = [self.visit(c) for c in node.comparators]
+        # a < b < c  ->  (a < b) and (b < c)
+        result = None
+        for op, right in zip(node.ops, comparators):
+            compare = ast.Compare(left=left, ops=[op], comparators=[right])
+            result = compare if result is None else self.call(_AND, [result, compare])
+            left = right
+        return result
+
+def numpy_code(string):
+    """
+    Compile formula into code, which evaluates it for NumPy arrays
+    of variable values (in numpy_namespace).
+    Returns None if the formula can not be vectorized.
+    """
+    try:
+        root = ast.parse(string.strip(), mode='eval')
+        root = ast.fix_missing_locations(NumpyTransformer().visit(root))
+        return compile(root, "<expression>", 'eval')
+    except (SyntaxError, NotVectorizable):
+        return None
+
+@lru_cache(maxsize=256)
+def compile_vectorized(string):
+    """
+    Returns function(variables), which evaluates formula for a dictionary
+    of variable values, which can be NumPy arrays, with one call.
+    Formulas which can not be rewritten to NumPy calls are evaluated by
+    safe_eval_compiled with NumPy versions of functions, as before.
+    """
+    code = numpy_code(string)
+    if code is None:
+        compiled = sv_compile(string)
+        def evaluate(variables):
+            return safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
+    else:
+        def evaluate(variables):
+            return eval(code, numpy_namespace, variables)
+    evaluate.vectorized = code is not None
+    return evaluate
@@ -0,0 +1,134 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Cell lists and Verlet neighbour lists: finding all pairs of points which are
+closer than given distance to each other, in near-linear time and memory
+(unlike enumerating all n*(n-1)/2 pairs), without SciPy.
+"""
+
+import itertools
+
+import numpy as np
+
+# Maximum number of cells along one axis; grids are made coarser for point
+# sets which are very sparse compared to the search distance.
+MAX_CELLS_PER_AXIS = 2**20
+
+# Offsets to neighbouring cells, such that each unordered pair of
+# neighbouring cells is visited once: (0, 0, 1), (0, 1, -1), ... .
+HALF_SHELL_OFFSETS = [offset for offset in itertools.product([-1, 0, 1], repeat=3) if offset > (0, 0, 0)]
+
+def _cell_pairs(order, starts, counts, cells_a, cells_b, same_cell):
+    """
+    Pairs of point indices (i, j), such that i is in one of cells_a and j is
+    in corresponding cell of cells_b. If same_cell is True, cells_a and cells_b
+    are the same, and only pairs with i < j (in cell order) are returned.
+    """
+    counts_a = counts[cells_a]
+    counts_b = counts[cells_b]
+    sizes = counts_a * counts_b
+    total = sizes.sum()
+    if total == 0:
+        return np.empty((0,), dtype=np.int64), np.empty((0,), dtype=np.int64)
+    pair_cell = np.repeat(np.arange(len(sizes)), sizes)
+    local = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    count_b = counts_b[pair_cell]
+    local_a = local // count_b
+    local_b = local % count_b
+    if same_cell:
+        good = local_a < local_b
+        pair_cell, local_a, local_b = pair_cell[good], local_a[good], local_b[good]
+    i = order[starts[cells_a][pair_cell] + local_a]
+    j = order[starts[cells_b][pair_cell] + local_b]
+    return i, j
+
+def cell_list_pairs(points, radius):
+    """
+    Find all pairs of points which are closer than radius to each other,
+    by sorting points into cubic cells of size radius.
+
+    Returns: numpy array of shape (n_pairs, 2), with i < j in each pair.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    if n < 2 or radius <= 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    p_min = points.min(axis=0)
+    extent = (points.max(axis=0) - p_min).max()
+    cell_size = max(radius, extent / (MAX_CELLS_PER_AXIS - 1))
+    coords = np.floor((points - p_min) / cell_size).astype(np.int64)
+    # one extra cell on each side, so that neighbour coordinates are never negative
+    coords += 1
+    shape = coords.max(axis=0) + 2
+    cell_ids = np.ravel_multi_index(coords.T, shape)
+
+    order = np.argsort(cell_ids, kind='stable')
+    cells, starts, counts = np.unique(cell_ids[order], return_index=True, return_counts=True)
+    cell_coords = np.array(np.unravel_index(cells, shape)).T
+
+    all_i = []
+    all_j = []
+    own = np.arange(len(cells))
+    i, j = _cell_pairs(order, starts, counts, own, own, True)
+    all_i.append(i)
+    all_j.append(j)
+    for offset in HALF_SHELL_OFFSETS:
+        neighbour_ids = np.ravel_multi_index((cell_coords + offset).T, shape)
+        found = np.searchsorted(cells, neighbour_ids)
+        found = np.minimum(found, len(cells) - 1)
+        exists = cells[found] == neighbour_ids
+        i, j = _cell_pairs(order, starts, counts, own[exists], found[exists], False)
+        all_i.append(i)
+        all_j.append(j)
+
+    i = np.concatenate(all_i)
+    j = np.concatenate(all_j)
+    distances = np.linalg.norm(points[i] - points[j], axis=1)
+    good = distances < radius
+    i, j = i[good], j[good]
+    return np.stack((np.minimum(i, j), np.maximum(i, j)), axis=-1)
+
+class SvNeighbourList(object):
+    """
+    Verlet neighbour list. Pairs of points are searched within
+    cutoff * (1 + skin) distance, and the same list of pairs is reused while
+    points have not moved further than half of that margin since the list was
+    built; so each call of pairs() returns all pairs closer than cutoff (and,
+    possibly, some more pairs), but the list is rebuilt only once in a while.
+    """
+    def __init__(self, skin=0.3):
+        self.skin = skin
+        self.indexes = None
+        self.reference = None
+        self.list_radius = 0.0
+        self.rebuilds = 0
+
+    def invalidate(self):
+        self.indexes = None
+
+    def needs_rebuild(self, points, cutoff):
+        if self.indexes is None or len(points) != len(self.reference):
+            return True
+        if cutoff > self.list_radius:
+            return True
+        max_displacement = np.sqrt(((points - self.reference)**2).sum(axis=1).max())
+        return cutoff + 2*max_displacement >= self.list_radius
+
+    def pairs(self, points, cutoff):
+        """
+        Returns: numpy array of shape (n_pairs, 2) of index pairs, which
+        includes all pairs of points closer than cutoff.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if self.needs_rebuild(points, cutoff):
+            self.list_radius = cutoff * (1.0 + self.skin)
+            self.indexes = cell_list_pairs(points, self.list_radius)
+            self.reference = points.copy()
+            self.rebuilds += 1
+        return self.indexes
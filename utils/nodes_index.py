@@ -0,0 +1,179 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Index of node classes defined in modules of sverchok/nodes directory.
+
+The index is built by parsing module sources (without importing them), and
+is stored in nodes/nodes_index.json. For each module it keeps file size and
+modification time, so that only changed modules are parsed again. It is used
+by lazy node loading (see core/lazy_nodes.py).
+
+This module does not depend on Blender, so the index can be prebuilt by
+
+    $ python3 utils/nodes_index.py
+"""
+
+import ast
+import json
+import os
+import sys
+
+INDEX_FILE_NAME = "nodes_index.json"
+INDEX_VERSION = 1
+
+NODE_BASES = {'bpy.types.Node', 'Node', 'SverchCustomTreeNode'}
+NODE_ATTRIBUTES = ['bl_idname', 'bl_label', 'bl_icon', 'sv_icon']
+BLENDER_TYPES = {'Operator', 'PropertyGroup', 'Menu', 'Panel', 'UIList',
+                 'SvGenericCallbackWithParams'}
+
+def dotted_name(expr):
+    # ast.unparse is not available in python 3.7
+    if isinstance(expr, ast.Name):
+        return expr.id
+    if isinstance(expr, ast.Attribute):
+        base = dotted_name(expr.value)
+        if base is not None:
+            return base + '.' + expr.attr
+    return None
+
+def string_value(expr):
+    if isinstance(expr, ast.Constant) and isinstance(expr.value, str):
+        return expr.value
+    if sys.version_info < (3, 8) and isinstance(expr, ast.Str):
+        return expr.s
+    return None
+
+def is_blender_type(base):
+    return base.startswith('bpy.types.') or base in BLENDER_TYPES
+
+def parse_node_module(path):
+    """
+    Find node classes defined in the module.
+    Returns: dictionary with
+    * classes: list of dictionaries with class_name, bl_idname, bl_label,
+      doc and, if they are defined, bl_icon and sv_icon;
+    * lazy: whether the module can be imported only when its nodes are
+      needed. This is not the case if the module depends on optional
+      dependencies (it can register a dummy node instead, which must be known
+      from the start), defines Blender classes other than nodes (operators,
+      menus and so on), or defines node classes with non-literal bl_idname.
+    """
+    with open(path, encoding='utf-8') as source:
+        tree = ast.parse(source.read(), path)
+
+    classes = []
+    lazy = True
+    for statement in ast.walk(tree):
+        if isinstance(statement, ast.ImportFrom) and statement.module == 'sverchok.dependencies':
+            lazy = False
+            continue
+        if not isinstance(statement, ast.ClassDef):
+            continue
+        cls = statement
+        bases = {dotted_name(base) or '' for base in cls.bases}
+        if not bases & NODE_BASES:
+            if any(is_blender_type(base) for base in bases):
+                lazy = False
+            continue
+        info = dict(class_name = cls.name, doc = ast.get_docstring(cls, clean=False))
+        for item in cls.body:
+            if isinstance(item, ast.Assign):
+                targets = item.targets
+            elif isinstance(item, ast.AnnAssign):
+                targets = [item.target]
+            else:
+                continue
+            for target in targets:
+                if isinstance(target, ast.Name) and target.id in NODE_ATTRIBUTES:
+                    value = string_value(item.value)
+                    if value is not None:
+                        info[target.id] = value
+        if 'bl_idname' in info:
+            info.setdefault('bl_label', info['bl_idname'])
+            classes.append(info)
+        else:
+            lazy = False
+    return dict(classes = classes, lazy = lazy)
+
+def file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def load_nodes_index(nodes_directory, nodes_dict, save=True):
+    """
+    Load the index from nodes_directory, parse modules which are not
+    in the index or changed since it was written, and save the index
+    back if anything was updated (errors of writing are ignored).
+
+    nodes_dict: category -> list of module names, see nodes/__init__.py.
+    Returns: dictionary "category.module" -> module info, see parse_node_module;
+    modules which could not be parsed are not included.
+    """
+    path = os.path.join(nodes_directory, INDEX_FILE_NAME)
+    try:
+        with open(path) as index_file:
+            index = json.load(index_file)
+        if index.get('version') != INDEX_VERSION:
+            index = None
+    except (OSError, ValueError):
+        index = None
+    if index is None:
+        index = dict(version = INDEX_VERSION, modules = dict())
+
+    old_modules = index['modules']
+    modules = dict()
+    changed = False
+    for category, names in nodes_dict.items():
+        for name in names:
+            module_name = f"{category}.{name}"
+            module_path = os.path.join(nodes_directory, category, name + ".py")
+            try:
+                signature = file_signature(module_path)
+            except OSError:
+                continue
+            entry = old_modules.get(module_name)
+            if entry is None or entry['signature'] != signature:
+                try:
+                    entry = parse_node_module(module_path)
+                except (SyntaxError, UnicodeDecodeError, OSError):
+                    continue
+                entry['signature'] = signature
+                changed = True
+            modules[module_name] = entry
+    if set(modules) != set(old_modules):
+        changed = True
+
+    if changed and save:
+        index['modules'] = modules
+        try:
+            with open(path, 'w') as index_file:
+                json.dump(index, index_file, indent=1, sort_keys=True)
+        except OSError:
+            pass
+
+    return modules
+
+def collect_node_modules(nodes_directory):
+    """
+    Same as nodes.automatic_collection(), without ignore list.
+    """
+    nodes_dict = dict()
+    for category in sorted(os.listdir(nodes_directory)):
+        category_path = os.path.join(nodes_directory, category)
+        if category == '__pycache__' or not os.path.isdir(category_path):
+            continue
+        nodes_dict[category] = [file[:-3] for file in sorted(os.listdir(category_path))
+                                if file.endswith('.py') and file != '__init__.py']
+    return nodes_dict
+
+if __name__ == "__main__":
+    nodes_directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nodes")
+    index = load_nodes_index(nodes_directory, collect_node_modules(nodes_directory))
+    n_classes = sum(len(entry['classes']) for entry in index.values())
+    n_lazy = sum(1 for entry in index.values() if entry['lazy'])
+    print(f"Nodes index: {len(index)} modules ({n_lazy} can be loaded lazily), {n_classes} node classes")
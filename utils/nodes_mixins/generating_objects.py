@@ -17,7 +17,7 @@ from mathutils import Matrix
 
 from sverchok.data_structure import updateNode, update_with_kwargs, numpy_full_list, repeat_last
 from sverchok.utils.handle_blender_data import correct_collection_length, delete_data_block
-from sverchok.utils.sv_bmesh_utils import empty_bmesh, add_mesh_to_bmesh
+from sverchok.utils.mesh_arrays import flat_polygons, edges_array, topology_fingerprint, write_mesh
 
 
 class SvObjectData(bpy.types.PropertyGroup):
@@ -170,6 +170,8 @@ class BlenderObjects:
 
 class SvMeshData(bpy.types.PropertyGroup):
     mesh: bpy.props.PointerProperty(type=bpy.types.Mesh, options={'SKIP_SAVE'})
+    # fingerprint of topology which was written to the mesh last time
+    topology: bpy.props.StringProperty(options={'SKIP_SAVE'})
 
     def regenerate_mesh(self, mesh_name: str, verts, edges=None, faces=None, matrix: Matrix = None,
                         make_changes_test=True):
@@ -187,16 +189,16 @@ class SvMeshData(bpy.types.PropertyGroup):
         if not self.mesh:
             # new mesh should be created
             self.mesh = bpy.data.meshes.new(name=mesh_name)
-        if not make_changes_test or self.is_topology_changed(verts, edges, faces):
-            with empty_bmesh(False) as bm:
-                add_mesh_to_bmesh(bm, verts, edges, faces, update_indexes=False, update_normals=False)
-                if matrix:
-                    bm.transform(matrix)
-                bm.to_mesh(self.mesh)
+        edges = edges_array(edges)
+        flat_faces, offsets, sizes = flat_polygons(faces)
+        topology = topology_fingerprint(len(verts), edges, flat_faces, sizes)
+        if not make_changes_test or self.is_topology_changed(topology, len(verts), len(sizes)):
+            write_mesh(self.mesh, verts, edges, flat_faces, offsets, sizes)
+            self.topology = topology
         else:
             self.update_vertices(verts)
-            if matrix:
-                self.mesh.transform(matrix)
+        if matrix:
+            self.mesh.transform(matrix)
         self.mesh.update()
 
     def set_smooth(self, is_smooth_mesh):
@@ -207,29 +209,22 @@ class SvMeshData(bpy.types.PropertyGroup):
             is_smooth = np.zeros(len(self.mesh.polygons), dtype=bool)
         self.mesh.polygons.foreach_set('use_smooth', is_smooth)
 
-    def is_topology_changed(self, verts: list, edges: list, faces: list) -> bool:
+    def is_topology_changed(self, topology: str, verts_number: int, faces_number: int) -> bool:
         """
-        Simple and fast test but not 100% robust.
-        If number of vertices and faces are unchanged it assumes that topology is not changed
-        This test is useful if mesh just changed its location.
-        It is much faster just set new coordinate for each vector then recreate whole object
+        Compares fingerprint of new topology (see topology_fingerprint) with the one written to the mesh last time.
+        If only location of vertices was changed, it is much faster just set new coordinate for each vector
+        then recreate whole object. Numbers of mesh elements are checked too, in case the mesh was edited by user.
         """
-        if not faces:
-            # edges can be take in account if mesh does not have polygons
-            # because Sverchok edges can exclude edges within polygons
-            return len(self.mesh.vertices) != len(verts) or len(self.mesh.edges) != len(edges)
-        else:
-            number_is_changed = len(self.mesh.vertices) != len(verts) or len(self.mesh.polygons) != len(faces)
-            # check several polygons indexes
-            are_polygons_changed = any([list(p.vertices) != f for _, p, f in zip(range(5), self.mesh.polygons, faces)])
-            return number_is_changed or are_polygons_changed
+        return (topology != self.topology
+                or len(self.mesh.vertices) != verts_number
+                or len(self.mesh.polygons) != faces_number)
 
     def update_vertices(self, verts: Union[list, np.ndarray]):
         """
         Just update position of mesh vertices, order and number of given vertices should be the same as mesh
         numpy array with float32 type will be 10 times faster than any other input data
         """
-        verts = np.array(verts, dtype=np.float32)  # todo will be this fast if it is already array float 32?
+        verts = np.asarray(verts, dtype=np.float32)
         self.mesh.vertices.foreach_set('co', np.ravel(verts))
 
     def remove_data(self):
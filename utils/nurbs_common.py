@@ -5,6 +5,9 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+import threading
+from collections import OrderedDict
+
 import numpy as np
 
 from sverchok.utils.math import binomial
@@ -112,6 +115,108 @@ def from_homogenous(control_points):
     else:
         raise Exception(f"control_points have ndim={control_points.ndim}, supported are only 2 and 3")
 
+class SvNurbsBasisMatrix(object):
+    """
+    Values of NURBS basis functions (and their derivatives) of degree p
+    at a set of parameter values, stored in compact sparse form.
+    For each parameter value, only p+1 of basis functions can be non-zero;
+    so instead of (n, k) matrix we store
+
+    * indices: array of shape (n, p+1) - indices of non-zero basis functions;
+    * values: array of shape (max_order+1, n, p+1) - values of these
+      functions (values[0]) and their derivatives (values[1], values[2]...).
+    """
+    def __init__(self, indices, values):
+        self.indices = indices
+        self.values = values
+
+    @property
+    def max_order(self):
+        return len(self.values) - 1
+
+    @property
+    def nbytes(self):
+        return self.indices.nbytes + self.values.nbytes
+
+    def dot(self, coefficients, deriv_order=0):
+        """
+        Calculate sum of coefficients[i] * N_i(t) for each t.
+        coefficients: array of shape (k,) or (k, m).
+        Output: array of shape (n,) or (n, m).
+        """
+        values = self.values[deriv_order]
+        coefficients = coefficients[self.indices]
+        if coefficients.ndim == 2:
+            return (values * coefficients).sum(axis=1)
+        else:
+            return np.einsum('nj,nj...->n...', values, coefficients)
+
+    def to_dense(self, count, deriv_order=0):
+        """
+        Convert to dense (n, count) matrix.
+        """
+        n = len(self.indices)
+        result = np.zeros((n, count))
+        rows = np.broadcast_to(np.arange(n)[np.newaxis].T, self.indices.shape)
+        np.add.at(result, (rows, self.indices), self.values[deriv_order])
+        return result
+
+class SvNurbsBasisMatrixCache(object):
+    """
+    LRU cache of SvNurbsBasisMatrix instances, keyed by (knotvector, degree,
+    parameter values). Many curves in one list usually share the knotvector,
+    and nodes tend to evaluate them at the same set of parameter values.
+    """
+    def __init__(self, memory_budget = 64 * 1024 * 1024):
+        self.memory_budget = memory_budget
+        self.data = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_key(knotvector, degree, ts):
+        return (knotvector.tobytes(), degree, ts.dtype.str, ts.tobytes())
+
+    def get(self, key, max_order):
+        with self.lock:
+            matrix = self.data.get(key)
+            if matrix is None or matrix.max_order < max_order:
+                self.misses += 1
+                return None
+            self.data.move_to_end(key)
+            self.hits += 1
+            return matrix
+
+    def put(self, key, matrix):
+        if matrix.nbytes > self.memory_budget:
+            return
+        with self.lock:
+            old = self.data.pop(key, None)
+            if old is not None:
+                self.size -= old.nbytes
+            self.data[key] = matrix
+            self.size += matrix.nbytes
+            while self.size > self.memory_budget:
+                _, old = self.data.popitem(last=False)
+                self.size -= old.nbytes
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        with self.lock:
+            return dict(entries = len(self.data), size = self.size,
+                        hits = self.hits, misses = self.misses)
+
+basis_matrix_cache = SvNurbsBasisMatrixCache()
+
+
 class SvNurbsBasisFunctions(object):
     def __init__(self, knotvector):
         self.knotvector = np.array(knotvector)
@@ -216,3 +321,116 @@ class SvNurbsBasisFunctions(object):
         
         return calc
 
+
+    def _padded_knotvector(self, p):
+        # Repeat the end knots p more times, so that for any span
+        # all knots referenced by Cox-de Boor triangle do exist.
+        # This does not change values of "real" basis functions,
+        # since N[i,p] depends only on knots u[i] ... u[i+p+1].
+        u = self.knotvector
+        return np.concatenate(([u[0]]*p, u, [u[-1]]*p))
+
+    def find_spans(self, p, ts):
+        """
+        For each t, find index j of knot span u[j] <= t < u[j+1] in
+        the knotvector padded by p knots at each side.
+        At the end of the knotvector, the last non-empty span is used.
+        Output: array of shape (n,) of integers.
+        """
+        u = self._padded_knotvector(p)
+        spans = np.searchsorted(u, ts, side='right') - 1
+        non_empty = np.flatnonzero(u[1:] > u[:-1])
+        if len(non_empty) == 0:
+            return np.full(len(ts), p)
+        first, last = non_empty[0], non_empty[-1]
+        return np.clip(spans, first, last)
+
+    def local_derivatives(self, p, ts, max_order=0):
+        """
+        Calculate values of all p+1 basis functions of degree p, which are
+        not zero at each of ts, together with their derivatives up to max_order.
+        See "The NURBS book", 2nd edition, p.2.5, algorithm A2.3; here it
+        is vectorized over all parameter values.
+        Output: tuple
+            * spans: array of shape (n,) - see find_spans();
+            * derivatives: array of shape (max_order+1, n, p+1).
+        """
+        ts = np.asarray(ts, dtype=np.float64)
+        n = len(ts)
+        u = self._padded_knotvector(p)
+        spans = self.find_spans(p, ts)
+
+        left = np.empty((p+1, n))
+        right = np.empty((p+1, n))
+        ndu = np.empty((p+1, p+1, n))
+        ndu[0, 0] = 1.0
+        for j in range(1, p+1):
+            left[j] = ts - u[spans+1-j]
+            right[j] = u[spans+j] - ts
+            saved = 0.0
+            for r in range(j):
+                ndu[j, r] = right[r+1] + left[j-r]
+                temp = ndu[r, j-1] / ndu[j, r]
+                ndu[r, j] = saved + right[r+1] * temp
+                saved = left[j-r] * temp
+            ndu[j, j] = saved
+
+        derivatives = np.zeros((max_order+1, n, p+1))
+        derivatives[0] = ndu[:, p].T
+        a = np.empty((2, p+1, n))
+        for r in range(p+1):
+            s1, s2 = 0, 1
+            a[0, 0] = 1.0
+            for k in range(1, min(max_order, p)+1):
+                d = np.zeros(n)
+                rk, pk = r-k, p-k
+                if r >= k:
+                    a[s2, 0] = a[s1, 0] / ndu[pk+1, rk]
+                    d += a[s2, 0] * ndu[rk, pk]
+                j1 = 1 if rk >= -1 else -rk
+                j2 = k-1 if r-1 <= pk else p-r
+                for j in range(j1, j2+1):
+                    a[s2, j] = (a[s1, j] - a[s1, j-1]) / ndu[pk+1, rk+j]
+                    d += a[s2, j] * ndu[rk+j, pk]
+                if r <= pk:
+                    a[s2, k] = -a[s1, k-1] / ndu[pk+1, r]
+                    d += a[s2, k] * ndu[r, pk]
+                derivatives[k, :, r] = d
+                s1, s2 = s2, s1
+
+        coeff = p
+        for k in range(1, min(max_order, p)+1):
+            derivatives[k] *= coeff
+            coeff *= (p - k)
+
+        return spans, derivatives
+
+    def matrix(self, p, ts, count, max_order=0, use_cache=True):
+        """
+        Calculate values of basis functions of degree p, and their derivatives
+        up to max_order, at parameter values ts, in sparse form.
+        count: number of basis functions (i.e. number of control points).
+        Results are cached in basis_matrix_cache, if use_cache is True.
+        Output: SvNurbsBasisMatrix.
+        """
+        ts = np.asarray(ts)
+        if use_cache:
+            key = SvNurbsBasisMatrixCache.make_key(self.knotvector, p, ts)
+            matrix = basis_matrix_cache.get(key, max_order)
+            if matrix is not None:
+                return matrix
+
+        spans, values = self.local_derivatives(p, ts, max_order)
+        # spans are calculated in padded knotvector, which has p more knots
+        # at the beginning; so index of first non-zero function is span - 2p.
+        indices = (spans - 2*p)[np.newaxis].T + np.arange(p+1)
+        u = self.knotvector
+        bad_indices = (indices < 0) | (indices >= count)
+        out_of_bounds = (ts < u[0]) | (ts > u[-1])
+        values[:, bad_indices | out_of_bounds[np.newaxis].T] = 0.0
+        indices = np.clip(indices, 0, count-1)
+
+        matrix = SvNurbsBasisMatrix(indices, values)
+        if use_cache:
+            basis_matrix_cache.put(key, matrix)
+        return matrix
@@ -17,6 +17,7 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import sys
+import time
 import cProfile
 import pstats
 from io import StringIO
@@ -27,6 +28,8 @@ from bpy.props import BoolProperty, EnumProperty
 
 from sverchok.utils.logging import info, debug
 from sverchok.utils.context_managers import sv_preferences
+from sverchok.core.socket_data import start_copy_statistics, stop_copy_statistics, get_copy_statistics
+from sverchok.core.telemetry import telemetry
 
 # Global cProfile.Profile singleton
 _global_profile = None
@@ -34,6 +37,8 @@ _global_profile = None
 _profile_nesting = 0
 # Whether the profiling is enabled by "Start profiling" toggle
 is_currently_enabled = False
+# Statistics of socket data copying, gathered during last profiling session
+_copy_statistics = {}
 
 def get_global_profile():
     """
@@ -142,6 +147,20 @@ def dump_stats(sort = "tottime", strip_dirs = False, file_path=None):
             stats.print_stats()
             info("Profiling results are written to %s", file_path)
 
+def dump_copy_statistics():
+    """
+    Dump statistics of socket data copies made by sv_get(deepcopy=True), by link.
+    """
+    statistics = get_copy_statistics() or _copy_statistics
+    if not statistics:
+        info("There are no socket data copying statistics yet")
+        return
+    lines = []
+    items = sorted(statistics.items(), key=lambda item: item[1][1], reverse=True)
+    for (tree, from_node, from_socket, to_node, to_socket), (count, size) in items:
+        lines.append(f"{tree}: {from_node}.{from_socket} -> {to_node}.{to_socket}: {count} copies, {size} bytes")
+    info("Socket data copies:\n" + "\n".join(lines))
+
 def save_stats(path):
     """
     Dump profiling statistics to file in cProfile's binary format.
@@ -186,8 +205,24 @@ def profiling_enabled():
     else:
         yield None
 
+def log_startup_timings(registration_time, log=info):
+    """
+    Report time spent for importing Sverchok modules and registering classes.
+    """
+    from sverchok.core import startup_timings
+    from sverchok.core import lazy_nodes
+    architecture = startup_timings.get('architecture', 0.0)
+    nodes = startup_timings.get('nodes', 0.0)
+    if lazy_nodes.is_lazy_mode():
+        mode = "lazy mode: " + lazy_nodes.format_lazy_statistics()
+    else:
+        mode = "all node modules"
+    log("Sverchok startup: importing modules %.4fs, importing nodes %.4fs (%s), registration %.4fs, total %.4fs",
+            architecture, nodes, mode, registration_time, architecture + nodes + registration_time)
+
 @contextmanager
 def profiling_startup():
+    start = time.perf_counter()
     if "--profile-sverchok-startup" in sys.argv:
         global _profile_nesting
         profile = None
@@ -203,8 +238,10 @@ def profiling_startup():
                 profile.disable()
             dump_stats(file_path="sverchok_profile.txt")
             save_stats("sverchok_profile.prof")
+            log_startup_timings(time.perf_counter() - start)
     else:
         yield None
+        log_startup_timings(time.perf_counter() - start, log=debug)
 
 ########################
 #
@@ -221,7 +258,13 @@ class SvProfilingToggle(bpy.types.Operator):
     def execute(self, context):
         global is_currently_enabled
 
+        global _copy_statistics
+
         is_currently_enabled = not is_currently_enabled
+        if is_currently_enabled:
+            start_copy_statistics()
+        else:
+            _copy_statistics = stop_copy_statistics()
         info("Profiling is set to %s", is_currently_enabled)
 
         return {'FINISHED'}
@@ -249,7 +292,12 @@ class SvProfileDump(bpy.types.Operator):
             default = True)
 
     def execute(self, context):
+        from sverchok.core.update_system import dump_topology_cache_statistics
+        from sverchok.core.lazy_nodes import log_lazy_statistics
         dump_stats(sort = self.sort, strip_dirs = self.strip_dirs)
+        dump_copy_statistics()
+        dump_topology_cache_statistics()
+        log_lazy_statistics()
         return {'FINISHED'}
     
     def invoke(self, context, event):
@@ -283,7 +331,45 @@ class SvProfileReset(bpy.types.Operator):
         info("Profiling statistics data cleared.")
         return {'FINISHED'}
     
-classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset]
+class SvTelemetrySave(bpy.types.Operator):
+    """Save recorded telemetry of node trees to file"""
+    bl_idname = "node.sverchok_telemetry_save"
+    bl_label = "Save telemetry"
+    bl_options = {'INTERNAL'}
+
+    formats = [
+            ("JSON", "JSON", "List of records in JSON format", 0),
+            ("CSV", "CSV", "Comma-separated values", 1),
+            ("TRACE", "Chrome trace", "Chrome trace-event format, for chrome://tracing or Perfetto", 2)
+        ]
+
+    format: EnumProperty(name = "Format",
+            description = "File format",
+            items = formats,
+            default = "JSON")
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+
+    def execute(self, context):
+        telemetry.dump(self.filepath, self.format)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+class SvTelemetryReset(bpy.types.Operator):
+    """Clear recorded telemetry"""
+    bl_idname = "node.sverchok_telemetry_reset"
+    bl_label = "Clear telemetry"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        telemetry.clear()
+        info("Telemetry data cleared.")
+        return {'FINISHED'}
+
+classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset, SvTelemetrySave, SvTelemetryReset]
 
 def register():
     for class_name in classes:
@@ -0,0 +1,142 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Storage of recorded frames (iterations) of Pulga Physics simulations.
+"""
+
+import os
+
+import numpy as np
+
+
+def frame_dtype(n_verts, n_reactions):
+    '''structured dtype of one recorded frame'''
+    return np.dtype([
+        ('iteration', np.int64),
+        ('verts', np.float64, (n_verts, 3)),
+        ('rads', np.float64, (n_verts,)),
+        ('vel', np.float64, (n_verts, 3)),
+        ('reactions', np.float64, (n_reactions, 3))])
+
+
+def indexed_path(path, index):
+    '''file path for the frames of index-th simulation: sim.npy, sim_1.npy, sim_2.npy...'''
+    if index == 0:
+        return path
+    base, ext = os.path.splitext(path)
+    return f"{base}_{index}{ext or '.npy'}"
+
+
+class PulgaFrameStore(object):
+    """
+    Preallocated ring buffer of simulation frames. Each frame keeps
+    vertices, radiuses, velocities and pins reactions of one iteration;
+    when the buffer is full, the oldest frames are overwritten, so memory
+    usage does not depend on the number of iterations.
+
+    If path is provided, frames are kept in a memory-mapped .npy file
+    instead of RAM; such a file can be opened later by PulgaFrameStore.load
+    to output recorded frames without running the simulation again.
+    Buffers are allocated when the first frame is added, since the number
+    of particles is not known before that.
+    """
+    def __init__(self, capacity, path=None):
+        self.capacity = max(1, capacity)
+        self.path = path
+        self.frames = None
+        self.next_slot = 0
+
+    @classmethod
+    def load(cls, path, writable=False):
+        '''open frames previously recorded to a file'''
+        frames = np.load(path, mmap_mode='r+' if writable else 'r')
+        store = cls(len(frames), path)
+        store.frames = frames
+        iterations = frames['iteration']
+        if (iterations >= 0).any():
+            store.next_slot = (int(np.argmax(iterations)) + 1) % len(frames)
+        return store
+
+    def allocate(self, n_verts, n_reactions):
+        dtype = frame_dtype(n_verts, n_reactions)
+        if self.path:
+            self.frames = np.lib.format.open_memmap(self.path, mode='w+', dtype=dtype, shape=(self.capacity,))
+        else:
+            self.frames = np.zeros((self.capacity,), dtype=dtype)
+        self.frames['iteration'] = -1
+        self.next_slot = 0
+
+    def append(self, iteration, verts, rads, vel, reactions):
+        '''copy the state of the system into the next slot'''
+        reactions = np.asarray(reactions).reshape((-1, 3))
+        if self.frames is None:
+            self.allocate(len(verts), len(reactions))
+        slot = self.next_slot
+        frames = self.frames
+        frames['iteration'][slot] = iteration
+        frames['verts'][slot] = verts
+        frames['rads'][slot] = rads
+        frames['vel'][slot] = vel
+        frames['reactions'][slot] = reactions
+        self.next_slot = (slot + 1) % self.capacity
+
+    def flush(self):
+        if isinstance(self.frames, np.memmap):
+            self.frames.flush()
+
+    @property
+    def iterations(self):
+        '''numbers of recorded iterations, from oldest to newest'''
+        if self.frames is None:
+            return np.empty((0,), dtype=np.int64)
+        iterations = self.frames['iteration']
+        return np.sort(iterations[iterations >= 0])
+
+    def __len__(self):
+        return len(self.iterations)
+
+    def slots(self, iterations):
+        '''
+        slots where given iterations are stored, or -1 for iterations
+        which were not recorded (or were already overwritten)
+        '''
+        iterations = np.asarray(iterations, dtype=np.int64)
+        if self.frames is None:
+            return np.full(iterations.shape, -1, dtype=np.int64)
+        recorded = self.frames['iteration']
+        order = np.argsort(recorded)
+        sorted_recorded = recorded[order]
+        found = np.searchsorted(sorted_recorded, iterations)
+        found = np.minimum(found, len(recorded) - 1)
+        return np.where(sorted_recorded[found] == iterations, order[found], -1)
+
+    def frame(self, slot):
+        '''vertices, radiuses, velocities and reactions of slot, as array views'''
+        frames = self.frames
+        return frames['verts'][slot], frames['rads'][slot], frames['vel'][slot], frames['reactions'][slot]
+
+    def frames_of(self, iterations):
+        '''
+        yield recorded frames for requested iterations, in ascending order
+        of iterations and without repetitions. Frames are views of stored
+        arrays, except for file-backed stores: their frames are copied, since
+        the file is overwritten by the next simulation while output data can
+        still be used.
+        Raises LookupError if some of the iterations were not recorded
+        or were already overwritten.
+        '''
+        iterations = np.unique(iterations)
+        slots = self.slots(iterations)
+        if (slots < 0).any():
+            missing = iterations[slots < 0].tolist()
+            raise LookupError(f"Iterations {missing} are not recorded, frame buffer keeps {self.capacity} frames")
+        for slot in slots.tolist():
+            frame = self.frame(slot)
+            if self.path:
+                frame = tuple(data.copy() for data in frame)
+            yield frame
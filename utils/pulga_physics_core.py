@@ -7,11 +7,13 @@
 
 import numpy as np
 
+from sverchok.utils.neighbour_list import SvNeighbourList
+
 def cross_indices3(n):
     '''create crossed indices'''
 
     nu = np.sum(np.arange(n, dtype=np.int64))
-    ind = np.zeros((nu, 2), dtype=np.int16)
+    ind = np.zeros((nu, 2), dtype=np.int32)
     c = 0
     for i in range(n-1):
         l = n-i-1
@@ -74,11 +76,17 @@ def self_react(params):
     '''behaviors between particles: collide, attract and fit'''
     ps, collision, sum_rad, gates, att_params, fit_params = params
     use_collide, use_attract, use_grow = gates
-    indexes = ps.params['indexes']
-    if use_grow:
+    neighbours = ps.params.get('neighbours')
+    if neighbours is not None:
+        # without attraction, only pairs closer than sum of radiuses interact
+        indexes = neighbours.pairs(ps.verts, 2 * np.amax(ps.rads))
         sum_rad = ps.rads[indexes[:, 0]] + ps.rads[indexes[:, 1]]
-        if use_attract:
-            att_params[2] = ps.mass[indexes[:, 0]] * ps.mass[indexes[:, 1]]
+    else:
+        indexes = ps.params['indexes']
+        if use_grow:
+            sum_rad = ps.rads[indexes[:, 0]] + ps.rads[indexes[:, 1]]
+            if use_attract:
+                att_params[2] = ps.mass[indexes[:, 0]] * ps.mass[indexes[:, 1]]
     dif_v = ps.verts[indexes[:, 0], :] - ps.verts[indexes[:, 1], :]
     dist = np.linalg.norm(dif_v, axis=1)
     mask = sum_rad > dist
@@ -88,17 +96,14 @@ def self_react(params):
     some_attractions = use_attract and(len(index_inter) < len(indexes))
 
     if some_collisions or some_attractions:
-        result = np.zeros((ps.v_len, ps.v_len, 3), dtype=np.float64)
         dist_cor = np.clip(dist, 1e-6, 1e4)
         normal_v = dif_v/dist_cor[:, np.newaxis]
 
         if some_collisions:
-            self_collision_force(result, dist, sum_rad, index_inter, mask, normal_v, collision)
+            self_collision_force(ps.r, dist, sum_rad, index_inter, mask, normal_v, collision)
         if some_attractions:
             antimask = np.invert(mask)
-            attract_force(result, dist_cor, antimask, indexes, normal_v, att_params)
-
-        ps.r += np.sum(result, axis=1)
+            attract_force(ps.r, dist_cor, antimask, indexes, normal_v, att_params)
 
     if use_grow:
         fit_force(ps, index_inter, fit_params)
@@ -106,7 +111,7 @@ def self_react(params):
 
 
 def self_collision_force(result, dist, sum_rad, index_inter, mask, normal_v, self_collision):
-    '''apply collision forces between particles'''
+    '''apply collision forces between particles (add them to result)'''
 
     id0 = index_inter[:, 0]
     id1 = index_inter[:, 1]
@@ -117,12 +122,12 @@ def self_collision_force(result, dist, sum_rad, index_inter, mask, normal_v, sel
     sf = self_collision[:, np.newaxis]
     len0, len1 = [sf[id1], sf[id0]] if variable_coll else [sf, sf]
 
-    result[id0, id1, :] = -no * le * len0
-    result[id1, id0, :] = no * le * len1
+    np.add.at(result, id0, -no * le * len0)
+    np.add.at(result, id1, no * le * len1)
 
 
 def attract_force(result, dist, mask, index, norm_v, att_params):
-    '''apply attractions between particles'''
+    '''apply attractions between particles (add them to result)'''
     attract, att_decay, mass_product = att_params
 
     dist2 = np.power(dist, att_decay)[mask, np.newaxis]
@@ -137,15 +142,15 @@ def attract_force(result, dist, mask, index, norm_v, att_params):
     att = attract
     len0, len1 = [att[id1], att[id0]] if variable_att else [att, att]
 
-    result[id0, id1, :] = - direction * len0
-    result[id1, id0, :] = direction * len1
+    np.add.at(result, id0, - direction * len0)
+    np.add.at(result, id1, direction * len1)
 
 
 def fit_force(ps, index_inter, fit_params):
     '''the untouched particles will grow, the ones that collide will shrink'''
     grow, min_rad, max_rad = fit_params
     touch = np.unique(index_inter)
-    free = np.setdiff1d(np.arange(ps.v_len, dtype=np.int16), touch)
+    free = np.setdiff1d(np.arange(ps.v_len, dtype=np.int64), touch)
     v_grow = len(grow) > 1
     grow_un, grow_tou = [grow[free], grow[touch]] if v_grow else [grow, grow]
     ps.rads[free] += grow_un*0.1
@@ -172,8 +177,13 @@ def self_react_setup(ps, dicti, forces_composite):
     if not use_self_react:
         return
 
-    ps.params['indexes'] = cross_indices3(ps.v_len)
-    sum_rad = ps.rads[ps.params['indexes'][:, 0]] + ps.rads[ps.params['indexes'][:, 1]]
+    if use_attract:
+        # attraction acts between all pairs of particles
+        ps.params['indexes'] = cross_indices3(ps.v_len)
+        sum_rad = ps.rads[ps.params['indexes'][:, 0]] + ps.rads[ps.params['indexes'][:, 1]]
+    else:
+        ps.params['neighbours'] = SvNeighbourList()
+        sum_rad = None
 
     att_params = att_setup(use_attract, ps, np_attract, att_decay)
     fit_params = fit_setup(use_grow, np_grow, min_rad, max_rad)
@@ -636,6 +646,7 @@ class PulgaSystem():
     v_len = []
     params = {}
     def __init__(self, init_params):
+        self.params = {}
         self.main_setup(init_params)
         self.mass = self.density * np.power(self.rads, 3)
         self.random_v = []
@@ -16,6 +16,7 @@ from sverchok.utils.surface.freecad import is_solid_face_surface
 from sverchok.dependencies import scipy
 from sverchok.utils.sv_mesh_utils import polygons_to_edges_np
 from sverchok.utils.modules.edge_utils import adjacent_faces_number
+from sverchok.utils.neighbour_list import SvNeighbourList
 
 def np_dot(u, v, axis=1):
     return np.sum(u * v, axis=axis)
@@ -624,13 +625,16 @@ class SvRandomForce():
 
 
 class SvCollisionForce():
-    def __init__(self, magnitude, use_kdtree=False):
+    def __init__(self, magnitude, use_kdtree=False, use_neighbours=False):
 
         self.magnitude = np.array(magnitude)
         self.uniform_magnitude = len(magnitude) < 2
         self.needs = ['dif_v', 'dist', 'dist_cor', 'collide', 'normal_v']
         self.use_kdtree = use_kdtree
-        if self.use_kdtree:
+        if use_neighbours:
+            self.needs = ['neighbours', 'nb_collisions']
+            self.add = self.add_kdt
+        elif self.use_kdtree:
             self.needs = ['kd_tree', 'max_radius', 'kd_collisions']
             self.add = self.add_kdt
         else:
@@ -688,7 +692,7 @@ class SvCollisionForce():
 
 
 class SvAttractionForce():
-    def __init__(self, magnitude, decay, max_distance, stop_on_collide=False, use_kdtree=False):
+    def __init__(self, magnitude, decay, max_distance, stop_on_collide=False, use_kdtree=False, use_neighbours=False):
 
         self.magnitude = np.array(magnitude)
         self.uniform_magnitude = len(magnitude) < 2
@@ -697,7 +701,10 @@ class SvAttractionForce():
         self.use_kdtree = use_kdtree
         self.max_distance = max_distance[0]
         self.stop_on_collide = stop_on_collide
-        if self.use_kdtree:
+        if use_neighbours:
+            self.needs = ['neighbours']
+            self.add = self.add_neighbours
+        elif self.use_kdtree:
             self.needs = ['kd_tree']
             self.add = self.add_kdt
         else:
@@ -714,6 +721,8 @@ class SvAttractionForce():
             self.f_magnitude = self.magnitude
         else:
             self.f_magnitude = numpy_fit_long_repeat([self.magnitude], ps.v_len)[0]
+        if 'neighbours' in self.needs:
+            ps.relations.nb_distance = max(ps.relations.nb_distance, self.max_distance)
 
     def add_brute_force(self, ps):
         relations = ps.relations
@@ -738,13 +747,22 @@ class SvAttractionForce():
     def add_kdt(self, ps):
         relations = ps.relations
         indexes = relations.kd_tree.query_pairs(r=self.max_distance, output_type='ndarray')
+        self.add_pairs(ps, indexes)
+
+    def add_neighbours(self, ps):
+        relations = ps.relations
+        close = relations.nb_dist < self.max_distance
+        self.add_pairs(ps, relations.nb_indexes[close], relations.nb_dif_v[close], relations.nb_dist[close])
+
+    def add_pairs(self, ps, indexes, dif_v=None, dist=None):
         if len(indexes) > 0:
 
             id0 = indexes[:, 0]
             id1 = indexes[:, 1]
-            dif_v = ps.verts[id0, :] - ps.verts[id1, :]
+            if dif_v is None:
+                dif_v = ps.verts[id0, :] - ps.verts[id1, :]
+                dist = np.linalg.norm(dif_v, axis=1)
 
-            dist = np.linalg.norm(dif_v, axis=1)
             if self.stop_on_collide:
                 collide_mask = dist > ps.mass[id0] * ps.mass[id1]
                 dist_cor = np.clip(dist[collide_mask], 1e-6, 1e4)
@@ -769,7 +787,7 @@ class SvAttractionForce():
 
 
 class SvAlignForce():
-    def __init__(self, strength, decay, max_distance, use_kdtree=False):
+    def __init__(self, strength, decay, max_distance, use_kdtree=False, use_neighbours=False):
 
         self.strength = np.array(strength)
         self.uniform_strength = len(strength) < 2
@@ -779,7 +797,10 @@ class SvAlignForce():
         self.f_strength = self.strength
         self.max_distance = np.array(max_distance[0])
         self.use_kdtree = use_kdtree
-        if self.use_kdtree:
+        if use_neighbours:
+            self.needs = ['neighbours']
+            self.add = self.add_neighbours
+        elif self.use_kdtree:
             self.needs = ['kd_tree']
             self.add = self.add_kdt
         else:
@@ -796,6 +817,8 @@ class SvAlignForce():
             self.f_strength = self.strength
         else:
             self.f_strength = numpy_fit_long_repeat([self.strength], ps.v_len)[0]
+        if 'neighbours' in self.needs:
+            ps.relations.nb_distance = max(ps.relations.nb_distance, float(self.max_distance))
 
 
 
@@ -822,9 +845,18 @@ class SvAlignForce():
 
         relations = ps.relations
         indexes = relations.kd_tree.query_pairs(r=self.max_distance, output_type='ndarray')
+        self.add_pairs(ps, indexes)
+
+    def add_neighbours(self, ps):
+        relations = ps.relations
+        close = relations.nb_dist < self.max_distance
+        self.add_pairs(ps, relations.nb_indexes[close], relations.nb_dist[close])
+
+    def add_pairs(self, ps, indexes, dist=None):
         if len(indexes) > 0:
-            dif_v = ps.verts[indexes[:, 0], :] - ps.verts[indexes[:, 1], :]
-            dist = np.linalg.norm(dif_v, axis=1)
+            if dist is None:
+                dif_v = ps.verts[indexes[:, 0], :] - ps.verts[indexes[:, 1], :]
+                dist = np.linalg.norm(dif_v, axis=1)
             dist_cor = np.clip(dist, 1e-6, 1e4)
             id0 = indexes[:, 0]
             id1 = indexes[:, 1]
@@ -844,7 +876,7 @@ class SvAlignForce():
 
 
 class SvFitForce():
-    def __init__(self, magnitude, min_radius, max_radius, mode, use_kdtree=False):
+    def __init__(self, magnitude, min_radius, max_radius, mode, use_kdtree=False, use_neighbours=False):
 
         self.magnitude = np.array(magnitude)
         self.uniform_magnitude = len(magnitude) < 2
@@ -859,7 +891,10 @@ class SvFitForce():
 
         self.size_changer = True
         self.use_kdtree = use_kdtree
-        if self.use_kdtree:
+        if use_neighbours:
+            self.needs = ['neighbours', 'nb_collisions']
+            self.add = self.add_kdt
+        elif self.use_kdtree:
             self.needs = ['kd_tree', 'max_radius', 'kd_collisions']
             self.add = self.add_kdt
         else:
@@ -868,7 +903,7 @@ class SvFitForce():
 
     def setup(self, ps):
         ps.aware = True
-        self.all_range = np.arange(ps.v_len, dtype=np.int16)
+        self.all_range = np.arange(ps.v_len, dtype=np.int64)
 
         for need in self.needs:
             ps.relations.needed[need] = True
@@ -1404,6 +1439,8 @@ class PulgaSystem():
         self.goal_pins = True
         self.relations = lambda: None
         self.relations.needed = {}
+        # maximum interaction distance of forces using the neighbour list
+        self.relations.nb_distance = 0.0
         for force in self.forces:
             if hasattr(force, 'pin_force'):
                 self.pinned = True
@@ -1423,6 +1460,8 @@ class PulgaSystem():
 
 
     def relations_setup(self):
+        if 'neighbours' in self.relations.needed:
+            self.relations.neighbour_list = SvNeighbourList()
         if 'indexes' in self.relations.needed:
             self.relations.indexes = cross_indices3(self.v_len)
         if 'cross_matrix' in self.relations.needed:
@@ -1438,6 +1477,8 @@ class PulgaSystem():
             self.relations.max_radius = np.amax(self.rads)
         if 'kd_tree' in self.relations.needed:
             self.relations.kd_tree = scipy.spatial.cKDTree(self.verts)
+        if 'neighbours' in self.relations.needed:
+            self.neighbours_update()
         if 'kd_collisions' in self.relations.needed:
             indexes = self.relations.kd_tree.query_pairs(r=self.relations.max_radius*2, output_type='ndarray')
             self.relations.kd_indexes = indexes
@@ -1473,6 +1514,28 @@ class PulgaSystem():
         if 'cross_matrix' in self.relations.needed:
             self.relations.result[:] = 0
 
+    def neighbours_update(self):
+        '''
+        Pairs of particles which can interact, from the neighbour list shared by forces.
+        Collision and fit forces read them in the same way as kd_collisions.
+        '''
+        relations = self.relations
+        cutoff = relations.nb_distance
+        if 'nb_collisions' in relations.needed:
+            cutoff = max(cutoff, 2 * np.amax(self.rads))
+        indexes = relations.neighbour_list.pairs(self.verts, cutoff)
+        relations.nb_indexes = indexes
+        relations.nb_dif_v = self.verts[indexes[:, 0], :] - self.verts[indexes[:, 1], :]
+        relations.nb_dist = np.linalg.norm(relations.nb_dif_v, axis=1)
+        if 'nb_collisions' in relations.needed:
+            sum_rad = self.rads[indexes[:, 0]] + self.rads[indexes[:, 1]]
+            colliding = relations.nb_dist < sum_rad
+            relations.kd_indexes = indexes[colliding]
+            relations.kd_dif_v = relations.nb_dif_v[colliding]
+            relations.kd_sum_rad = sum_rad[colliding]
+            relations.kd_dist = relations.nb_dist[colliding]
+            relations.kd_mask = np.ones(len(relations.kd_indexes), dtype=np.bool_)
+
     def main_setup(self, local_params):
         '''prepare main data'''
         params = self.params
@@ -1566,7 +1629,7 @@ def local_dict(dictionaries, name):
     return [dictionaries[0][name], dictionaries[1][name], dictionaries[2][name]]
 
 
-def pulga_system_init(parameters, gates, out_lists, cache):
+def pulga_system_init(parameters, gates, out_lists, cache, frame_store=None):
     '''the main function of the engine'''
 
     ps = PulgaSystem(parameters)
@@ -1580,18 +1643,25 @@ def pulga_system_init(parameters, gates, out_lists, cache):
     if gates["accumulate"] and len(cache) > 0:
         ps.hard_update_list(cache)
 
-    iterate(iterations_max, out_params)
+    iterate(iterations_max, out_params, frame_store)
+    if frame_store is not None:
+        frame_store.flush()
+        output_frames(frame_store, iterations, gates["output"], out_lists)
 
     return ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"][np.invert(ps.params['unpinned'])]
 
 
-def iterate(iterations_max, out_params):
+def iterate(iterations_max, out_params, frame_store=None):
     ''' execute repeatedly the defined force map'''
     ps = out_params[1]
+    iterations_rec = set(out_params[0])
 
     for it in range(iterations_max):
         ps.iterate()
-        output_data(it, out_params)
+        if frame_store is None:
+            output_data(it, out_params)
+        elif it in iterations_rec:
+            record_frame(ps, frame_store)
 
 
 def output_data(it, params):
@@ -1607,11 +1677,27 @@ def prepare_output_data(ps, use_numpy_out):
     '''prepare data to output'''
 
     if use_numpy_out:
-        return [ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"][np.invert(ps.params['unpinned'])]]
+        # the system is updated in place, so recorded arrays have to be copied
+        return [ps.verts.copy(), ps.rads.copy(), ps.vel.copy(), ps.params["Pins Reactions"][np.invert(ps.params['unpinned'])]]
 
     return [ps.verts.tolist(), ps.rads.tolist(), ps.vel.tolist(), ps.params["Pins Reactions"][np.invert(ps.params['unpinned'])].tolist()]
 
 
+def record_frame(ps, frame_store):
+    '''save current state to the frame store'''
+    reactions = ps.params["Pins Reactions"][np.invert(ps.params['unpinned'])]
+    frame_store.append(ps.iteration, ps.verts, ps.rads, ps.vel, reactions)
+
+
+def output_frames(frame_store, iterations, use_numpy_out, out_lists):
+    '''output requested iterations from the frame store, in ascending order, as the simulation does'''
+    for frame in frame_store.frames_of(iterations):
+        if use_numpy_out:
+            record_data(frame, out_lists)
+        else:
+            record_data([data.tolist() for data in frame], out_lists)
+
+
 def record_data(data_out, out_lists):
     '''save data to main list'''
     verts_out, rads_out, velocity_out, reactions_out = out_lists
@@ -0,0 +1,203 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+import itertools
+from math import ceil
+
+import numpy as np
+
+BATCH_SIZE = 100
+
+# multipliers for hashing of cell coordinates
+HASH_PRIMES = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+
+class SvSpatialHashGrid(object):
+    """
+    Incremental uniform hash grid of points, which is used for
+    Poisson-disk-like sampling ("generate random points, but not closer than
+    minimum distance to each other"). Points can be added one batch after
+    another; candidate points are checked against all points added before
+    in a vectorized way, by looking only into neighbouring cells.
+
+    Each point can have a radius. There are two kinds of checks:
+
+    * check(candidates, min_r = R): candidate is good if the distance from it
+      to any point is not less than R;
+    * check(candidates, radiuses = rs): candidate is good if the sphere with
+      radius rs[i] around it does not touch any of spheres around points.
+    """
+    def __init__(self, cell_size=None, dimensions=3):
+        """
+        cell_size: size of grid cell. For better performance, it should be
+        about twice the minimum distance. If not provided, it is calculated
+        from radiuses of the first batch of points.
+        """
+        if cell_size is not None and cell_size <= 0:
+            cell_size = None
+        self.cell_size = cell_size
+        self.dimensions = dimensions
+        self.cells = dict()
+        self._points = np.empty((0, dimensions))
+        self._radiuses = np.empty((0,))
+        self.count = 0
+        self.max_radius = 0.0
+
+    @property
+    def points(self):
+        return self._points[:self.count]
+
+    @property
+    def radiuses(self):
+        return self._radiuses[:self.count]
+
+    def _init_cell_size(self, radiuses):
+        if self.cell_size is None:
+            max_radius = radiuses.max() if len(radiuses) else 0.0
+            self.cell_size = 2*max_radius if max_radius > 0 else 1.0
+
+    def _cell_coords(self, points):
+        return np.floor(points / self.cell_size).astype(np.int64)
+
+    def _hash(self, coords):
+        # Hash collisions only add more points to check exact distances to,
+        # so they do not affect results.
+        primes = HASH_PRIMES[:self.dimensions]
+        return np.bitwise_xor.reduce(coords * primes, axis=-1)
+
+    def insert(self, points, radiuses=None):
+        """
+        Add points (and their radiuses) to the grid.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, self.dimensions))
+        n = len(points)
+        if n == 0:
+            return
+        if radiuses is None:
+            radiuses = np.zeros((n,))
+        else:
+            radiuses = np.asarray(radiuses, dtype=np.float64)
+        self._init_cell_size(radiuses)
+
+        new_count = self.count + n
+        if new_count > len(self._points):
+            capacity = max(new_count, 2*len(self._points))
+            new_points = np.empty((capacity, self.dimensions))
+            new_points[:self.count] = self.points
+            new_radiuses = np.empty((capacity,))
+            new_radiuses[:self.count] = self.radiuses
+            self._points, self._radiuses = new_points, new_radiuses
+        self._points[self.count : new_count] = points
+        self._radiuses[self.count : new_count] = radiuses
+
+        cells = self.cells
+        for idx, key in enumerate(self._hash(self._cell_coords(points)).tolist(), start=self.count):
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [idx]
+            else:
+                cell.append(idx)
+        self.count = new_count
+        self.max_radius = max(self.max_radius, radiuses.max())
+
+    def _neighbour_pairs(self, candidates, search_radius):
+        """
+        Pairs of indices (candidate, point) for all points, which can lie
+        within search_radius from candidates.
+        """
+        scaled = candidates / self.cell_size
+        coords = np.floor(scaled).astype(np.int64)
+        if 2*search_radius <= self.cell_size:
+            # the ball around a candidate can only touch the cell of the candidate,
+            # and neighbouring cells on the side of the nearest cell boundary
+            # along each axis, so it is enough to look into 2^dimensions cells.
+            n_offsets = 2 ** self.dimensions
+            sides = np.where(scaled - coords < 0.5, -1, 1)
+            offsets = np.array(list(itertools.product([0, 1], repeat=self.dimensions)))
+            offsets = offsets[np.newaxis, :, :] * sides[:, np.newaxis, :]
+        else:
+            n = int(ceil(search_radius / self.cell_size))
+            n_offsets = (2*n + 1) ** self.dimensions
+            offsets = np.array(list(itertools.product(range(-n, n+1), repeat=self.dimensions)))[np.newaxis, :, :]
+        if n_offsets >= len(self.cells):
+            # neighbourhood is comparable with whole grid
+            candidate_idxs = np.repeat(np.arange(len(candidates)), self.count)
+            point_idxs = np.tile(np.arange(self.count), len(candidates))
+            return candidate_idxs, point_idxs
+
+        keys = self._hash(coords[:, np.newaxis, :] + offsets).ravel().tolist()
+        cells = self.cells
+        empty = []
+        found = [cells.get(key, empty) for key in keys]
+        counts = np.array([len(cell) for cell in found], dtype=np.int64)
+        point_idxs = np.fromiter(itertools.chain.from_iterable(found), dtype=np.int64, count=counts.sum())
+        candidate_idxs = np.repeat(np.arange(len(keys)) // n_offsets, counts)
+        return candidate_idxs, point_idxs
+
+    def check(self, candidates, min_r=0.0, radiuses=None):
+        """
+        Check candidates against points in the grid and against each other.
+        Candidates are processed in order, so a candidate is good if it is
+        far enough from all points in the grid and from all good candidates
+        before it. Candidates are not added to the grid.
+        This calculates all pairwise distances between candidates, so it is
+        supposed to be called with batches of up to BATCH_SIZE candidates.
+
+        Returns: boolean mask of good candidates.
+        """
+        candidates = np.asarray(candidates, dtype=np.float64).reshape((-1, self.dimensions))
+        n = len(candidates)
+        good = np.ones((n,), dtype=bool)
+        if n == 0:
+            return good
+        if radiuses is not None:
+            radiuses = np.asarray(radiuses, dtype=np.float64)
+            self._init_cell_size(radiuses)
+            search_radius = radiuses.max() + self.max_radius
+        else:
+            self._init_cell_size(np.array([min_r]))
+            search_radius = min_r
+
+        if self.count:
+            candidate_idxs, point_idxs = self._neighbour_pairs(candidates, search_radius)
+            distances = np.linalg.norm(candidates[candidate_idxs] - self._points[point_idxs], axis=1)
+            if radiuses is not None:
+                bad = self._radiuses[point_idxs] + radiuses[candidate_idxs] >= distances
+            else:
+                bad = distances < min_r
+            good[candidate_idxs[bad]] = False
+
+        idxs = np.where(good)[0]
+        if len(idxs) > 1:
+            sub = candidates[idxs]
+            distances = np.linalg.norm(sub[:, np.newaxis, :] - sub[np.newaxis, :, :], axis=2)
+            if radiuses is not None:
+                sub_radiuses = radiuses[idxs]
+                conflicts = sub_radiuses[:, np.newaxis] + sub_radiuses[np.newaxis, :] >= distances
+            else:
+                conflicts = distances < min_r
+            accepted = np.zeros((len(idxs),), dtype=bool)
+            for i in range(len(idxs)):
+                accepted[i] = not (conflicts[i, :i] & accepted[:i]).any()
+            good[idxs[~accepted]] = False
+        return good
+
+    def insert_checked(self, candidates, min_r=0.0, radiuses=None, batch_size=BATCH_SIZE):
+        """
+        Check candidates by batches of batch_size, and add good ones to the grid.
+        Returns: boolean mask of good candidates.
+        """
+        candidates = np.asarray(candidates, dtype=np.float64).reshape((-1, self.dimensions))
+        if radiuses is not None:
+            radiuses = np.asarray(radiuses, dtype=np.float64)
+        good = np.zeros((len(candidates),), dtype=bool)
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start : start + batch_size]
+            batch_radiuses = None if radiuses is None else radiuses[start : start + batch_size]
+            batch_good = self.check(batch, min_r=min_r, radiuses=batch_radiuses)
+            good[start : start + batch_size] = batch_good
+            self.insert(batch[batch_good], None if radiuses is None else batch_radiuses[batch_good])
+        return good
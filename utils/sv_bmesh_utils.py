@@ -19,7 +19,7 @@
 from contextlib import contextmanager
 import math
 from operator import setitem, getitem
-from itertools import count
+from itertools import count, chain
 
 import numpy as np
 
@@ -29,6 +29,7 @@ import mathutils
 
 from sverchok.data_structure import zip_long_repeat
 from sverchok.utils.logging import debug
+from sverchok.utils.mesh_arrays import split_polygons
 
 @contextmanager
 def empty_bmesh(use_operators=True):
@@ -141,25 +142,36 @@ def add_mesh_to_bmesh(bm, verts, edges=None, faces=None, sv_index_name=None, upd
 
 
 def numpy_data_from_bmesh(bm, out_np, face_data=None):
+    """
+    Mesh data from bmesh; out_np flags tell which of vertices, edges, faces
+    and face data should be output as NumPy arrays. BMesh has no bulk access
+    to its data, so elements are read into flat arrays by np.fromiter,
+    without building intermediate lists.
+    """
     if out_np[0]:
-        verts = np.array([v.co[:] for v in bm.verts])
+        verts = np.fromiter(chain.from_iterable(v.co for v in bm.verts), dtype=np.float64, count=3*len(bm.verts))
+        verts = verts.reshape((-1, 3))
     else:
         verts = [v.co[:] for v in bm.verts]
     if out_np[1]:
-        edges = np.array([[e.verts[0].index, e.verts[1].index] for e in bm.edges])
+        edges = np.fromiter((v.index for e in bm.edges for v in e.verts), dtype=np.int32, count=2*len(bm.edges))
+        edges = edges.reshape((-1, 2))
     else:
         edges = [[e.verts[0].index, e.verts[1].index] for e in bm.edges]
     if out_np[2]:
-        faces = np.array([[i.index for i in p.verts] for p in bm.faces])
+        sizes = np.fromiter((len(f.verts) for f in bm.faces), dtype=np.int64, count=len(bm.faces))
+        flat = np.fromiter((v.index for f in bm.faces for v in f.verts), dtype=np.int32, count=int(sizes.sum()))
+        offsets = np.zeros(len(sizes), dtype=np.int64)
+        np.cumsum(sizes[:-1], out=offsets[1:])
+        faces = split_polygons(flat, offsets, sizes, output_numpy=True)
     else:
         faces = [[i.index for i in p.verts] for p in bm.faces]
 
     if face_data:
+        face_data_out = face_data_from_bmesh_faces(bm, face_data)
         if out_np[3]:
-            face_data_out = np.array(face_data_from_bmesh_faces(bm, face_data))
-        else:
-            face_data_out = face_data_from_bmesh_faces(bm, face_data)
-            return verts, edges, faces, face_data_out
+            face_data_out = np.array(face_data_out)
+        return verts, edges, faces, face_data_out
     else:
         return verts, edges, faces, []
 
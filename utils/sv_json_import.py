@@ -270,6 +270,8 @@ class TreeGenerator:
                 # some node types are not registered if dependencies are not installed
                 # in this case such nodes are registered as dummies
                 dummy_nodes.register_dummy(bl_type)
+            from sverchok.core import lazy_nodes
+            lazy_nodes.ensure_registered([bl_type])
             node = self._tree.nodes.new(bl_type)
             node.name = node_name
             return node
@@ -0,0 +1,463 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Bounding volume hierarchy of mesh triangles for batched nearest point and
+ray cast queries, implemented with NumPy.
+
+mathutils.bvhtree.BVHTree can be asked about one point per Python call,
+which makes evaluation of fields or nodes on millions of points slow.
+SvTriangleBVH answers queries for whole arrays of points.
+
+The tree is stored in arrays: triangles are sorted by Morton code of their
+centers, and each node is a range of sorted triangles, split into children
+at the highest bit where Morton codes of the range differ ("linear BVH").
+Nodes are numbered level by level; children of inner nodes and triangles of
+leaves (at most LEAF_SIZE of them) are stored in arrays indexed by nodes.
+
+Queries are processed level by level: for pairs (query, node), which can
+still contain the answer, pairs with children of the nodes are generated, and
+pairs which can not contain the answer are dropped. When the number of pairs
+becomes too large, queries are split into smaller groups.
+
+Results follow mathutils.bvhtree.BVHTree.FromPolygons conventions: indices
+are indices of polygons, normals are normals of polygons.
+"""
+
+import numpy as np
+
+from mathutils.geometry import tessellate_polygon
+
+# Maximum number of triangles in a leaf of the tree
+LEAF_SIZE = 8
+# Maximum number of (query, node) or (query, triangle) pairs processed at once
+MAX_CHUNK_PAIRS = 1000000
+# Tolerance of barycentric coordinates in ray - triangle intersection, as in Blender
+RAY_EPSILON = 1.2e-7
+
+def triangulate_polygons(verts, faces):
+    """
+    Split polygons into triangles. Quads are split along 1-3 diagonal,
+    as Blender does; bigger polygons are tessellated (they can be concave).
+    Returns: (m, 3) array of vertex indices and (m,) array of polygon indices of triangles.
+    """
+    triangles = []
+    polygon_indices = []
+    for i, face in enumerate(faces):
+        n = len(face)
+        if n < 3:
+            continue
+        if n == 3:
+            triangles.append((face[0], face[1], face[2]))
+            polygon_indices.append(i)
+        elif n == 4:
+            triangles.append((face[1], face[2], face[3]))
+            triangles.append((face[1], face[3], face[0]))
+            polygon_indices.extend((i, i))
+        else:
+            for tri in tessellate_polygon([[verts[k] for k in face]]):
+                triangles.append((face[tri[0]], face[tri[1]], face[tri[2]]))
+                polygon_indices.append(i)
+    return np.array(triangles, dtype=np.int64).reshape((-1, 3)), np.array(polygon_indices, dtype=np.int64)
+
+def polygon_normals(verts, faces):
+    """
+    Normals of polygons calculated by Newell's method, as Blender does.
+    """
+    normals = np.zeros((len(faces), 3))
+    sizes = np.array([len(face) for face in faces], dtype=np.int64)
+    if not len(faces) or not sizes.sum():
+        return normals
+    corners = np.fromiter((i for face in faces for i in face), dtype=np.int64, count=sizes.sum())
+    offsets = np.cumsum(sizes) - sizes
+    face_of_corner = np.repeat(np.arange(len(faces)), sizes)
+    positions = np.arange(len(corners)) - offsets[face_of_corner]
+    next_corners = corners[offsets[face_of_corner] + (positions + 1) % sizes[face_of_corner]]
+    v1 = verts[corners]
+    v2 = verts[next_corners]
+    products = np.stack(((v1[:,1] - v2[:,1]) * (v1[:,2] + v2[:,2]),
+                         (v1[:,2] - v2[:,2]) * (v1[:,0] + v2[:,0]),
+                         (v1[:,0] - v2[:,0]) * (v1[:,1] + v2[:,1])), axis=1)
+    np.add.at(normals, face_of_corner, products)
+    lengths = np.linalg.norm(normals, axis=1)
+    nonzero = lengths > 0
+    normals[nonzero] /= lengths[nonzero][:, np.newaxis]
+    return normals
+
+def morton_codes(points):
+    """
+    Morton (Z-order) codes of points, with 10 bits per axis.
+    """
+    lo = points.min(axis=0)
+    size = points.max(axis=0) - lo
+    size[size == 0] = 1.0
+    cells = np.clip(((points - lo) / size * 1023).astype(np.int64), 0, 1023)
+    codes = np.zeros(len(points), dtype=np.int64)
+    for bit in range(10):
+        for axis in range(3):
+            codes |= ((cells[:, axis] >> bit) & 1) << (3 * bit + axis)
+    return codes
+
+def closest_points_on_triangles(p, a, b, c):
+    """
+    Closest points of triangles (a, b, c) to points p; all arguments are (n, 3) arrays.
+    See "Real-Time Collision Detection" by Christer Ericson, 5.1.5.
+    """
+    def dot(v1, v2):
+        return np.einsum('ij,ij->i', v1, v2)
+
+    ab = b - a
+    ac = c - a
+    ap = p - a
+    d1 = dot(ab, ap)
+    d2 = dot(ac, ap)
+    bp = p - b
+    d3 = dot(ab, bp)
+    d4 = dot(ac, bp)
+    cp = p - c
+    d5 = dot(ab, cp)
+    d6 = dot(ac, cp)
+    va = d3*d6 - d5*d4
+    vb = d5*d2 - d1*d6
+    vc = d1*d4 - d3*d2
+
+    # closest point is a + ab*s + ac*t
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # inside of the triangle
+        denom = va + vb + vc
+        s = vb / denom
+        t = vc / denom
+
+        # regions of edges and vertices, in order of increasing priority
+        edge_bc = (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0)
+        w = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        s = np.where(edge_bc, 1 - w, s)
+        t = np.where(edge_bc, w, t)
+
+        edge_ac = (vb <= 0) & (d2 >= 0) & (d6 <= 0)
+        w = d2 / (d2 - d6)
+        s[edge_ac] = 0
+        t = np.where(edge_ac, w, t)
+
+        vertex_c = (d6 >= 0) & (d5 <= d6)
+        s[vertex_c] = 0
+        t[vertex_c] = 1
+
+        edge_ab = (vc <= 0) & (d1 >= 0) & (d3 <= 0)
+        v = d1 / (d1 - d3)
+        s = np.where(edge_ab, v, s)
+        t[edge_ab] = 0
+
+        vertex_b = (d3 >= 0) & (d4 <= d3)
+        s[vertex_b] = 1
+        t[vertex_b] = 0
+
+        vertex_a = (d1 <= 0) & (d2 <= 0)
+        s[vertex_a] = 0
+        t[vertex_a] = 0
+    return a + ab * s[:, np.newaxis] + ac * t[:, np.newaxis]
+
+def ray_triangle_distances(origins, directions, a, b, c, epsilon=RAY_EPSILON):
+    """
+    Distances along rays to intersections with triangles (Moller - Trumbore algorithm).
+    Triangles are intersected from both sides. Returns inf where a ray does not hit its triangle.
+    """
+    def dot(v1, v2):
+        return np.einsum('ij,ij->i', v1, v2)
+
+    e1 = b - a
+    e2 = c - a
+    pvec = np.cross(directions, e2)
+    det = dot(e1, pvec)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv_det = 1.0 / det
+        tvec = origins - a
+        u = dot(tvec, pvec) * inv_det
+        qvec = np.cross(tvec, e1)
+        v = dot(directions, qvec) * inv_det
+        t = dot(e2, qvec) * inv_det
+        hit = (det != 0) & (u >= -epsilon) & (v >= -epsilon) & (u + v <= 1 + epsilon) & (t >= 0)
+    return np.where(hit, t, np.inf)
+
+def _first_of_groups(keys, values):
+    """
+    For each unique key, index of the smallest value with this key.
+    Keys must be sorted.
+    Returns: unique keys, indices.
+    """
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    minimums = np.minimum.reduceat(values, starts)
+    counts = np.diff(np.append(starts, len(keys)))
+    candidates = np.flatnonzero(values == np.repeat(minimums, counts))
+    # several equal minimums of one key are possible; take the first of them
+    first = np.concatenate(([True], keys[candidates[1:]] != keys[candidates[:-1]]))
+    return keys[starts], candidates[first]
+
+class SvTriangleBVH(object):
+    """
+    Bounding volume hierarchy of triangles of a mesh for batched queries.
+    """
+    def __init__(self, verts, faces, leaf_size=LEAF_SIZE):
+        self.verts = np.asarray(verts, dtype=np.float64).reshape((-1, 3))
+        triangles, tri_polygons = triangulate_polygons(self.verts, faces)
+        normals = polygon_normals(self.verts, faces)
+
+        # degenerated triangles can not be nearest to anything but their neighbours
+        a, b, c = (self.verts[triangles[:, i]] for i in range(3))
+        good = np.linalg.norm(np.cross(b - a, c - a), axis=1) > 0
+        a, b, c = a[good], b[good], c[good]
+        tri_polygons = tri_polygons[good]
+
+        codes = np.zeros(len(a), dtype=np.int64)
+        if len(a):
+            codes = morton_codes((a + b + c) / 3.0)
+            order = np.argsort(codes, kind='stable')
+            a, b, c, tri_polygons, codes = a[order], b[order], c[order], tri_polygons[order], codes[order]
+        self.a, self.b, self.c = a, b, c
+        self.tri_polygons = tri_polygons
+        self.tri_normals = normals[tri_polygons]
+        self.tri_min = np.minimum(np.minimum(a, b), c)
+        self.tri_max = np.maximum(np.maximum(a, b), c)
+
+        # nodes, level by level; node is a range of triangles [start, end)
+        level_starts, level_ends, level_children = [np.zeros(1, dtype=np.int64)], [np.array([len(a)])], []
+        n_nodes = 1
+        while True:
+            starts, ends = level_starts[-1], level_ends[-1]
+            children = np.full((len(starts), 2), -1, dtype=np.int64)
+            level_children.append(children)
+            inner = ends - starts > leaf_size
+            n_inner = np.count_nonzero(inner)
+            if not n_inner:
+                break
+            starts, ends = starts[inner], ends[inner]
+            splits = self._split(codes, starts, ends)
+            children[inner] = n_nodes + np.arange(2 * n_inner).reshape((n_inner, 2))
+            n_nodes += 2 * n_inner
+            level_starts.append(np.stack((starts, splits), axis=1).ravel())
+            level_ends.append(np.stack((splits, ends), axis=1).ravel())
+
+        starts = np.concatenate(level_starts)
+        ends = np.concatenate(level_ends)
+        self.children = np.concatenate(level_children)
+        self.leaf_nodes = np.flatnonzero(self.children[:, 0] < 0)
+        self.node_leaves = np.full(n_nodes, -1, dtype=np.int64)
+        self.node_leaves[self.leaf_nodes] = np.arange(len(self.leaf_nodes))
+        slots = starts[self.leaf_nodes][:, np.newaxis] + np.arange(leaf_size)
+        self.leaf_triangles = np.where(slots < ends[self.leaf_nodes][:, np.newaxis], slots, -1)
+
+        # a point of the mesh in each node, its distance bounds the distance to the node's triangles
+        self.node_points = a[np.minimum(starts, len(a) - 1)] if len(a) else np.zeros((n_nodes, 3))
+
+        self.box_min = np.full((n_nodes, 3), np.inf)
+        self.box_max = np.full((n_nodes, 3), -np.inf)
+        if len(a):
+            # leaves cover all triangles without gaps, when sorted by their starts
+            leaf_order = np.argsort(starts[self.leaf_nodes])
+            leaves = self.leaf_nodes[leaf_order]
+            self.box_min[leaves] = np.minimum.reduceat(self.tri_min, starts[leaves])
+            self.box_max[leaves] = np.maximum.reduceat(self.tri_max, starts[leaves])
+        level_offsets = np.cumsum([0] + [len(level) for level in level_starts])
+        for first, last in reversed(list(zip(level_offsets[:-1], level_offsets[1:]))):
+            nodes = np.arange(first, last)
+            nodes = nodes[self.children[nodes, 0] >= 0]
+            left, right = self.children[nodes, 0], self.children[nodes, 1]
+            self.box_min[nodes] = np.minimum(self.box_min[left], self.box_min[right])
+            self.box_max[nodes] = np.maximum(self.box_max[left], self.box_max[right])
+
+    @staticmethod
+    def _split(codes, starts, ends):
+        # positions where ranges of sorted Morton codes are split into children
+        first, last = codes[starts], codes[ends - 1]
+        _, exponents = np.frexp(first ^ last)
+        highest_bit = np.maximum(exponents - 1, 0)
+        splits = np.searchsorted(codes, (last >> highest_bit) << highest_bit)
+        # all codes are equal - split in the middle
+        same = first == last
+        splits[same] = (starts[same] + ends[same]) // 2
+        return splits
+
+    def _traverse(self, queries, is_close):
+        """
+        Descend from the root to leaves, keeping only pairs
+        (query, node) for which is_close(queries, nodes) returns True.
+        Yields arrays (queries, leaf indices), sorted by queries, in chunks of limited size.
+        """
+        leaf_size = self.leaf_triangles.shape[1]
+        stack = [(queries, np.zeros(len(queries), dtype=np.int64))]
+        while stack:
+            queries, nodes = stack.pop()
+            found_queries, found_leaves, n_found = [], [], 0
+            while len(queries):
+                keep = is_close(queries, nodes)
+                queries, nodes = queries[keep], nodes[keep]
+                leaves = self.node_leaves[nodes]
+                is_leaf = leaves >= 0
+                found_queries.append(queries[is_leaf])
+                found_leaves.append(leaves[is_leaf])
+                n_found += len(found_queries[-1])
+                queries, nodes = queries[~is_leaf], nodes[~is_leaf]
+                if not len(queries):
+                    break
+                if (2 * len(queries) > MAX_CHUNK_PAIRS or n_found * leaf_size > MAX_CHUNK_PAIRS) \
+                        and queries[0] != queries[-1]:
+                    # process two groups of queries separately
+                    middle = np.searchsorted(queries, queries[len(queries) // 2])
+                    if middle == 0:
+                        middle = np.searchsorted(queries, queries[0], side='right')
+                    stack.append((queries[middle:], nodes[middle:]))
+                    queries, nodes = queries[:middle], nodes[:middle]
+                queries = np.repeat(queries, 2)
+                nodes = self.children[nodes].ravel()
+            if n_found:
+                queries = np.concatenate(found_queries)
+                order = np.argsort(queries, kind='stable')
+                yield queries[order], np.concatenate(found_leaves)[order]
+
+    def _leaf_pairs(self, queries, leaves):
+        # pairs (query, triangle) for all triangles of leaves
+        triangles = self.leaf_triangles[leaves]
+        queries = np.repeat(queries, triangles.shape[1])
+        triangles = triangles.ravel()
+        good = triangles >= 0
+        return queries[good], triangles[good]
+
+    def _box_distances(self, points, nodes, box_min=None, box_max=None):
+        # squared distances from points to boxes of nodes
+        if box_min is None:
+            box_min, box_max = self.box_min, self.box_max
+        offsets = np.maximum(np.maximum(box_min[nodes] - points, points - box_max[nodes]), 0)
+        return np.einsum('ij,ij->i', offsets, offsets)
+
+    def _nearest_in_leaves(self, points, queries, leaves, bounds):
+        """
+        Nearest points of triangles of leaves, not farther than squared distances in bounds.
+        Returns: queries, triangles, locations and squared distances.
+        """
+        queries, tris = self._leaf_pairs(queries, leaves)
+        p = points[queries]
+        # bounding boxes of triangles are much cheaper to check than triangles themselves
+        close = self._box_distances(p, tris, self.tri_min, self.tri_max) <= bounds[queries]
+        queries, tris, p = queries[close], tris[close], p[close]
+        nearest = closest_points_on_triangles(p, self.a[tris], self.b[tris], self.c[tris])
+        distances = ((nearest - p) ** 2).sum(axis=1)
+        if not len(queries):
+            return queries, tris, nearest, distances
+        uniq, first = _first_of_groups(queries, distances)
+        return uniq, tris[first], nearest[first], distances[first]
+
+    def find_nearest(self, points, distance=np.inf):
+        """
+        Find nearest points of the mesh for each of points.
+        Returns: tuple of np.arrays: locations (n, 3), normals (n, 3), polygon indices (n,), distances (n,).
+            For points which have no mesh within specified distance, index is -1,
+            location and normal are NaN, and distance is inf.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        n = len(points)
+        locations = np.full((n, 3), np.nan)
+        normals = np.full((n, 3), np.nan)
+        indices = np.full(n, -1, dtype=np.int64)
+        distances = np.full(n, np.inf)
+        if not len(self.a) or not n:
+            return locations, normals, indices, distances
+
+        triangles = np.full(n, -1, dtype=np.int64)
+        best = np.full(n, np.inf)
+        # upper bounds of squared distances, from the limit and from points of visited nodes
+        bounds = np.full(n, float(distance) ** 2)
+
+        def is_close(queries, nodes):
+            p = points[queries]
+            close = self._box_distances(p, nodes) <= bounds[queries]
+            queries, nodes, p = queries[close], nodes[close], p[close]
+            if len(queries):
+                offsets = self.node_points[nodes] - p
+                uniq, first = _first_of_groups(queries, np.einsum('ij,ij->i', offsets, offsets))
+                bounds[uniq] = np.minimum(bounds[uniq], np.einsum('ij,ij->i', offsets[first], offsets[first]))
+            return close
+
+        for queries, leaves in self._traverse(np.arange(n), is_close):
+            # Leaves of each query are checked starting from the nearest ones,
+            # a few at a time, so that farther leaves are mostly dropped by the improved distance.
+            box_distances = self._box_distances(points[queries], self.leaf_nodes[leaves])
+            order = np.lexsort((box_distances, queries))
+            queries, leaves, box_distances = queries[order], leaves[order], box_distances[order]
+            starts = np.flatnonzero(np.concatenate(([True], queries[1:] != queries[:-1])))
+            ranks = np.arange(len(queries)) - np.repeat(starts, np.diff(np.append(starts, len(queries))))
+            rank, step = 0, 1
+            while len(queries):
+                current = ranks < rank + step
+                uniq, tris, nearest, dist = self._nearest_in_leaves(points, queries[current], leaves[current], bounds)
+                better = dist < best[uniq]
+                uniq = uniq[better]
+                triangles[uniq], locations[uniq], best[uniq] = tris[better], nearest[better], dist[better]
+                bounds[uniq] = np.minimum(bounds[uniq], best[uniq])
+                rest = ~current & (box_distances <= bounds[queries])
+                queries, leaves, box_distances, ranks = queries[rest], leaves[rest], box_distances[rest], ranks[rest]
+                rank, step = rank + step, 2 * step
+
+        found = best <= float(distance) ** 2
+        locations[~found] = np.nan
+        normals[found] = self.tri_normals[triangles[found]]
+        indices[found] = self.tri_polygons[triangles[found]]
+        distances[found] = np.sqrt(best[found])
+        return locations, normals, indices, distances
+
+    def ray_cast(self, origins, directions, distance=np.inf):
+        """
+        Cast rays and find their first intersections with the mesh.
+        Directions are normalized, zero directions do not hit anything.
+        Returns: tuple of np.arrays: locations (n, 3), normals (n, 3), polygon indices (n,), distances (n,).
+            For rays which do not hit the mesh within specified distance,
+            index is -1, location and normal are NaN, and distance is inf.
+        """
+        origins, directions = np.broadcast_arrays(np.asarray(origins, dtype=np.float64).reshape((-1, 3)),
+                                                  np.asarray(directions, dtype=np.float64).reshape((-1, 3)))
+        origins = np.array(origins)
+        directions = np.array(directions)
+        n = len(origins)
+        locations = np.full((n, 3), np.nan)
+        normals = np.full((n, 3), np.nan)
+        indices = np.full(n, -1, dtype=np.int64)
+        distances = np.full(n, np.inf)
+        lengths = np.linalg.norm(directions, axis=1)
+        valid = lengths > 0
+        if not len(self.a) or not valid.any():
+            return locations, normals, indices, distances
+        directions[valid] /= lengths[valid][:, np.newaxis]
+        with np.errstate(divide='ignore'):
+            inv_directions = 1.0 / directions
+
+        def is_close(queries, nodes):
+            o = origins[queries]
+            inv = inv_directions[queries]
+            with np.errstate(invalid='ignore'):
+                t1 = (self.box_min[nodes] - o) * inv
+                t2 = (self.box_max[nodes] - o) * inv
+            # NaN appears when ray lies in plane of a side of a box, it is ignored by fmin / fmax
+            t_enter = np.fmax.reduce(np.fmin(t1, t2), axis=1)
+            t_exit = np.fmin.reduce(np.fmax(t1, t2), axis=1)
+            return (t_exit >= np.maximum(t_enter, 0)) & (t_enter <= distance)
+
+        rays = np.flatnonzero(valid)
+        triangles = np.full(n, -1, dtype=np.int64)
+        for queries, leaves in self._traverse(rays, is_close):
+            queries, tris = self._leaf_pairs(queries, leaves)
+            ts = ray_triangle_distances(origins[queries], directions[queries], self.a[tris], self.b[tris], self.c[tris])
+            uniq, first = _first_of_groups(queries, ts)
+            better = ts[first] < distances[uniq]
+            uniq, first = uniq[better], first[better]
+            distances[uniq] = ts[first]
+            triangles[uniq] = tris[first]
+
+        found = (triangles >= 0) & (distances <= distance)
+        distances[~found] = np.inf
+        locations[found] = origins[found] + directions[found] * distances[found][:, np.newaxis]
+        normals[found] = self.tri_normals[triangles[found]]
+        indices[found] = self.tri_polygons[triangles[found]]
+        return locations, normals, indices, distances
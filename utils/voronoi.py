@@ -119,6 +119,10 @@ from sverchok.utils.logging import debug, info, error
 from sverchok.utils.geom import center, LineEquation2D, CircleEquation2D
 from sverchok.utils.math import weighted_center
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata
+from sverchok.dependencies import scipy
+
+if scipy is not None:
+    from scipy.spatial import Delaunay, cKDTree, QhullError
 
 TOLERANCE = 1e-9
 BIG_FLOAT = 1e38
@@ -1301,6 +1305,9 @@ def unique_points(points, eps=1e-4):
     return mask, unique, repeating
 
 def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None):
+    if scipy is not None:
+        return [tuple(pt) for pt in lloyd2d_np(bound_mode, verts, n_iterations, clip, weight_field).tolist()]
+
     bounds = Bounds.new(bound_mode)
     bounds.init_from_sites(verts)
 
@@ -1357,3 +1364,409 @@ def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None):
         points = restrict(points)
     return points
 
+
+#------------------------------------------------------------------
+# Array-based implementation, on top of scipy.spatial.
+#
+# Cells of the diagram are kept as a "padded" array of shape (n, k, 2):
+# vertices of i'th cell are polygons[i, :counts[i]], in counterclockwise
+# order; the rest of the row is not used.
+
+def delaunay_triangles_np(points):
+    """
+    Delaunay triangulation of 2D points by scipy.spatial.Delaunay.
+    Triangles are returned in the same order and with the same order of
+    vertices as computeDelaunayTriangulation gives them: sorted by the
+    top point of circumcircle (as the sweep line meets them), vertices
+    clockwise, with the vertex whose parabola is removed by the circle
+    event at last place. For less than 3 points, or points on one line,
+    there are no triangles.
+    Returns: array of shape (m, 3) of indices of points.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 3:
+        return np.empty((0, 3), dtype=np.int64)
+    points = points[:, :2]
+    try:
+        triangles = Delaunay(points).simplices.astype(np.int64)
+    except QhullError:
+        return np.empty((0, 3), dtype=np.int64)
+    triangles = triangles[np.all(np.isfinite(_circumcenters(points, triangles)), axis=1)]
+
+    counterclockwise = _orientations(points, triangles)
+    triangles[counterclockwise] = triangles[counterclockwise][:, ::-1]
+
+    circumcenters = _circumcenters(points, triangles)
+    radiuses = np.linalg.norm(points[triangles[:, 0]] - circumcenters, axis=1)
+    # Of three Voronoi edges at the circumcenter, one starts at the circle
+    # event: the one along which the sweep time (y + distance to sites)
+    # grows. The vertex opposite to that edge is the removed one.
+    firsts = points[np.roll(triangles, -1, axis=1)]
+    seconds = points[np.roll(triangles, -2, axis=1)]
+    sides = seconds - firsts
+    # triangle is clockwise, so (-dy, dx) points out of it
+    normals = np.stack((-sides[:, :, 1], sides[:, :, 0]), axis=-1)
+    normals /= np.linalg.norm(normals, axis=2)[:, :, np.newaxis]
+    offsets = ((circumcenters[:, np.newaxis, :] - 0.5 * (firsts + seconds)) * normals).sum(axis=2)
+    growth = normals[:, :, 1] + offsets / radiuses[:, np.newaxis]
+    shift = np.argmax(growth, axis=1) + 1
+    columns = (np.arange(3)[np.newaxis, :] + shift[:, np.newaxis]) % 3
+    triangles = triangles[np.arange(len(triangles))[:, np.newaxis], columns]
+
+    order = np.lexsort((circumcenters[:, 0], circumcenters[:, 1] + radiuses))
+    return triangles[order]
+
+def bounds_halfplanes(bounds, clip=0.0, circle_segments=64):
+    """
+    Area within bounds, extended by clip, as intersection of half-planes.
+    Circle is replaced by a polygon described around it.
+    Returns: tuple (normals, offsets); point p is inside if normal.p <= offset for all half-planes.
+    """
+    if isinstance(bounds, BoxBounds):
+        normals = np.array([(-1.0, 0.0), (1.0, 0.0), (0.0, -1.0), (0.0, 1.0)])
+        offsets = np.array([-bounds.x_min, bounds.x_max, -bounds.y_min, bounds.y_max]) + clip
+    else:
+        angles = np.linspace(0, 2*np.pi, num=circle_segments, endpoint=False)
+        normals = np.stack((np.cos(angles), np.sin(angles)), axis=-1)
+        offsets = normals.dot(np.array(bounds.center)) + bounds.r_max + clip
+    return normals, offsets
+
+def _compact(points, keep):
+    """Move points marked by keep to the beginning of each row"""
+    order = np.argsort(~keep, axis=1, kind='stable')
+    rows = np.arange(len(points))[:, np.newaxis]
+    counts = keep.sum(axis=1)
+    width = max(counts.max(initial=0), 1)
+    return points[rows, order][:, :width], counts
+
+def clip_polygons(polygons, counts, normal, offset):
+    """
+    Sutherland-Hodgman clipping of all convex polygons by one
+    half-plane (normal.p <= offset). Only polygons which are
+    crossed by the line are processed.
+    """
+    n, k, _ = polygons.shape
+    valid = np.arange(k)[np.newaxis, :] < counts[:, np.newaxis]
+    distance = polygons.dot(normal) - offset
+    outside = (distance > 0) & valid
+    crossed = np.flatnonzero(outside.any(axis=1))
+    if len(crossed) == 0:
+        return polygons, counts
+
+    sub, sub_counts, sub_valid, sub_distance = polygons[crossed], counts[crossed], valid[crossed], distance[crossed]
+    rows = np.arange(len(crossed))[:, np.newaxis]
+    next_idx = (np.arange(k)[np.newaxis, :] + 1) % np.maximum(sub_counts, 1)[:, np.newaxis]
+    next_points = sub[rows, next_idx]
+    next_distance = sub_distance[rows, next_idx]
+    inside = sub_distance <= 0
+    next_inside = next_distance <= 0
+
+    # each vertex gives itself, if it is inside, and the intersection
+    # of the edge to the next vertex with the line, if the edge crosses it
+    denominator = sub_distance - next_distance
+    denominator[denominator == 0] = 1.0
+    t = sub_distance / denominator
+    intersections = sub + t[:, :, np.newaxis] * (next_points - sub)
+    candidates = np.stack((sub, intersections), axis=2).reshape((len(crossed), 2*k, 2))
+    keep = np.stack((inside & sub_valid, (inside != next_inside) & sub_valid), axis=2).reshape((len(crossed), 2*k))
+    clipped, clipped_counts = _compact(candidates, keep)
+
+    width = max(k, clipped.shape[1])
+    if width > k:
+        polygons = np.concatenate((polygons, np.zeros((n, width - k, 2))), axis=1)
+    polygons[crossed] = 0.0
+    polygons[crossed, :clipped.shape[1]] = clipped
+    counts = counts.copy()
+    counts[crossed] = clipped_counts
+    return polygons, counts
+
+def _ghost_sites(size):
+    """
+    Four far sites around the area of given size (around the origin),
+    so that cells of all real sites are finite and contain all of their
+    part of the area.
+    """
+    far = 10.0 * (size + 1.0)
+    return far * np.array([(-1.0, -1.0), (1.0, -1.0), (1.0, 1.0), (-1.0, 1.0)])
+
+def _circumcenters(points, simplices):
+    """Centers of circumcircles; infinite or NaN for degenerate triangles"""
+    a = points[simplices[:, 0]]
+    b = points[simplices[:, 1]] - a
+    c = points[simplices[:, 2]] - a
+    d = 2.0 * (b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0])
+    b2 = (b * b).sum(axis=1)
+    c2 = (c * c).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = (c[:, 1] * b2 - b[:, 1] * c2) / d
+        y = (b[:, 0] * c2 - c[:, 0] * b2) / d
+    return a + np.stack((x, y), axis=-1)
+
+def _orientations(points, simplices):
+    a = points[simplices[:, 0]]
+    b = points[simplices[:, 1]] - a
+    c = points[simplices[:, 2]] - a
+    return b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0] > 0
+
+def _delaunay_holds(points, simplices, neighbors, orientations, circumcenters):
+    """
+    Check if triangulation (built for other positions of the same points)
+    is still Delaunay triangulation: no triangle is turned over, and
+    no vertex of neighbour triangle is inside circumcircle of a triangle.
+    """
+    if not np.array_equal(_orientations(points, simplices), orientations):
+        return False
+    triangles, sides = np.nonzero(neighbors >= 0)
+    others = neighbors[triangles, sides]
+    # vertex of neighbour triangle, which is opposite to the common side
+    opposite = simplices[others, np.argmax(neighbors[others] == triangles[:, np.newaxis], axis=1)]
+    radiuses = ((points[simplices[triangles, 0]] - circumcenters[triangles])**2).sum(axis=1)
+    distances = ((points[opposite] - circumcenters[triangles])**2).sum(axis=1)
+    return bool((distances >= radiuses * (1.0 - 1e-9)).all())
+
+def _cells_from_triangulation(points, simplices, circumcenters, n):
+    """
+    Voronoi cells of first n points: circumcenters of triangles around
+    each point, ordered counterclockwise.
+    """
+    flat_points = simplices.ravel()
+    flat_triangles = np.repeat(np.arange(len(simplices)), 3)
+    real = flat_points < n
+    flat_points, flat_triangles = flat_points[real], flat_triangles[real]
+    order = np.argsort(flat_points, kind='stable')
+    flat_points, flat_triangles = flat_points[order], flat_triangles[order]
+    counts = np.bincount(flat_points, minlength=n)
+    columns = np.arange(len(flat_points)) - np.repeat(np.cumsum(counts) - counts, counts)
+    polygons = np.zeros((n, max(counts.max(initial=0), 1), 2))
+    polygons[flat_points, columns] = circumcenters[flat_triangles]
+
+    k = polygons.shape[1]
+    valid = np.arange(k)[np.newaxis, :] < counts[:, np.newaxis]
+    directions = polygons - points[:n, np.newaxis, :]
+    angles = np.arctan2(directions[:, :, 1], directions[:, :, 0])
+    angles[~valid] = np.inf
+    order = np.argsort(angles, axis=1)
+    return polygons[np.arange(n)[:, np.newaxis], order], counts
+
+def _clip_cells(polygons, counts, halfplanes):
+    for normal, offset in zip(*halfplanes):
+        polygons, counts = clip_polygons(polygons, counts, normal, offset)
+    return polygons, counts
+
+def voronoi_cells_np(sites, halfplanes):
+    """
+    Voronoi cells of 2D sites (without coinciding ones), clipped by the
+    convex area given by half-planes (see bounds_halfplanes).
+    Cells are built from Delaunay triangulation: vertices of the cell of
+    a site are circumcenters of triangles around it.
+    Returns: tuple (padded array of cell vertices, counts).
+    """
+    sites = np.asarray(sites, dtype=np.float64)[:, :2]
+    size = max(np.abs(sites).max(initial=0), np.abs(halfplanes[1]).max())
+    points = np.concatenate((sites, _ghost_sites(size)))
+    simplices = Delaunay(points).simplices
+    circumcenters = _circumcenters(points, simplices)
+    polygons, counts = _cells_from_triangulation(points, simplices, circumcenters, len(sites))
+    return _clip_cells(polygons, counts, halfplanes)
+
+def polygon_centers_np(polygons, counts, weight_field=None):
+    """
+    Centers of cells, as mean of vertices, or weighted mean with weights
+    given by scalar field at vertices (as weighted_center does).
+    """
+    n, k, _ = polygons.shape
+    valid = np.arange(k)[np.newaxis, :] < counts[:, np.newaxis]
+    if weight_field is None:
+        weights = valid.astype(np.float64)
+    else:
+        xs, ys = polygons[valid][:, 0], polygons[valid][:, 1]
+        weights = np.zeros((n, k))
+        weights[valid] = weight_field.evaluate_grid(xs, ys, np.zeros_like(xs))
+    totals = weights.sum(axis=1)
+    totals[totals == 0] = 1.0
+    return (polygons * weights[:, :, np.newaxis]).sum(axis=1) / totals[:, np.newaxis]
+
+def restrict_np(bounds, points):
+    """Vectorized version of bounds.restrict()"""
+    points = np.array(points, dtype=np.float64)
+    if isinstance(bounds, BoxBounds):
+        points[:, 0] = np.clip(points[:, 0], bounds.x_min, bounds.x_max)
+        points[:, 1] = np.clip(points[:, 1], bounds.y_min, bounds.y_max)
+    else:
+        center = np.array(bounds.center)
+        directions = points[:, :2] - center
+        radiuses = np.linalg.norm(directions, axis=1)
+        outside = radiuses > bounds.r_max
+        points[outside, :2] = center + directions[outside] * (bounds.r_max / radiuses[outside])[:, np.newaxis]
+        points[outside, 2] = 0.0
+    return points
+
+def bounds_contain_np(bounds, points):
+    """Vectorized version of bounds.contains() (with edge_ok=True)"""
+    xs, ys = points[..., 0], points[..., 1]
+    if isinstance(bounds, BoxBounds):
+        return (bounds.x_min <= xs) & (xs <= bounds.x_max) & (bounds.y_min <= ys) & (ys <= bounds.y_max)
+    else:
+        cx, cy = bounds.center
+        values = (xs - cx)**2 + (ys - cy)**2 - bounds.r_max**2
+        return (values < 0) | (abs(values) < 1e-8)
+
+def _boundary_crossings(bounds, inner, outer):
+    """Points where segments from inner points (inside bounds) to outer points leave the bounds"""
+    directions = outer - inner
+    if isinstance(bounds, BoxBounds):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ts = []
+            for i, (v_min, v_max) in enumerate([(bounds.x_min, bounds.x_max), (bounds.y_min, bounds.y_max)]):
+                d = directions[:, i]
+                t = np.where(d > 0, (v_max - inner[:, i]) / d, (v_min - inner[:, i]) / d)
+                ts.append(np.where(d == 0, np.inf, t))
+        t = np.clip(np.minimum(*ts), 0.0, 1.0)
+    else:
+        f = inner - np.array(bounds.center)
+        a = (directions * directions).sum(axis=1)
+        b = 2.0 * (f * directions).sum(axis=1)
+        c = (f * f).sum(axis=1) - bounds.r_max**2
+        t = (-b + np.sqrt(np.maximum(b*b - 4*a*c, 0.0))) / (2.0 * a)
+        t = np.clip(t, 0.0, 1.0)
+    return inner + t[:, np.newaxis] * directions
+
+def cut_polygons(polygons, counts, bounds):
+    """
+    Cut convex polygons by bounds the same way voronoi_bounded does:
+    vertices outside of bounds are removed, edges which cross the boundary
+    are cut at it, and two cut points of a polygon are connected by a straight
+    line (so corners of box and arcs of circle are not included).
+    """
+    n, k, _ = polygons.shape
+    valid = np.arange(k)[np.newaxis, :] < counts[:, np.newaxis]
+    inside = bounds_contain_np(bounds, polygons)
+    crossed = np.flatnonzero((valid & ~inside).any(axis=1))
+    if len(crossed) == 0:
+        return polygons, counts
+
+    sub, sub_counts, sub_valid, sub_inside = polygons[crossed], counts[crossed], valid[crossed], inside[crossed]
+    rows = np.arange(len(crossed))[:, np.newaxis]
+    next_idx = (np.arange(k)[np.newaxis, :] + 1) % np.maximum(sub_counts, 1)[:, np.newaxis]
+    next_points = sub[rows, next_idx]
+    next_inside = sub_inside[rows, next_idx]
+
+    leaving = sub_inside & ~next_inside
+    inner = np.where(leaving[:, :, np.newaxis], sub, next_points)
+    outer = np.where(leaving[:, :, np.newaxis], next_points, sub)
+    crossings = _boundary_crossings(bounds, inner.reshape((-1, 2)), outer.reshape((-1, 2))).reshape(sub.shape)
+    candidates = np.stack((sub, crossings), axis=2).reshape((len(crossed), 2*k, 2))
+    keep = np.stack((sub_inside & sub_valid, (sub_inside != next_inside) & sub_valid), axis=2).reshape((len(crossed), 2*k))
+    clipped, clipped_counts = _compact(candidates, keep)
+
+    width = max(k, clipped.shape[1])
+    if width > k:
+        polygons = np.concatenate((polygons, np.zeros((n, width - k, 2))), axis=1)
+    polygons[crossed] = 0.0
+    polygons[crossed, :clipped.shape[1]] = clipped
+    counts = counts.copy()
+    counts[crossed] = clipped_counts
+    return polygons, counts
+
+def mirror_sites_np(bounds, points):
+    """
+    Vectorized version of mirroring of sites in lloyd2d: each site strictly
+    inside the bounds is reflected in its projection to the bounds (the
+    nearest corner of the box, or the nearest point of the circle).
+    Returns: tuple (mask of mirrored sites, array of shape (m, 2)).
+    """
+    xy = points[:, :2]
+    if isinstance(bounds, BoxBounds):
+        inside = ((bounds.x_min < xy[:, 0]) & (xy[:, 0] < bounds.x_max)
+                    & (bounds.y_min < xy[:, 1]) & (xy[:, 1] < bounds.y_max))
+        mid_x = 0.5*(bounds.x_min + bounds.x_max)
+        mid_y = 0.5*(bounds.y_min + bounds.y_max)
+        projections = np.stack((np.where(xy[:, 0] > mid_x, bounds.x_max, bounds.x_min),
+                                np.where(xy[:, 1] > mid_y, bounds.y_max, bounds.y_min)), axis=-1)
+    else:
+        center = np.array(bounds.center)
+        directions = xy - center
+        radiuses = np.linalg.norm(directions, axis=1)
+        # sites on the circle (as the farthest one) are not mirrored
+        inside = (radiuses**2 - bounds.r_max**2 < -1e-8) & (radiuses > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            projections = center + directions * (bounds.r_max / radiuses)[:, np.newaxis]
+    inside &= (projections != xy).any(axis=1)
+    return inside, 2*projections[inside] - xy[inside]
+
+def _bounds_of_sites(bound_mode, xy, clip):
+    """Vectorized version of the bounds voronoi_bounded builds around the sites"""
+    bounds = Bounds.new(bound_mode)
+    x0, y0 = xy.mean(axis=0)
+    bounds.center = (x0, y0)
+    bounds.r_max = np.linalg.norm(xy - np.array([x0, y0]), axis=1).max() + clip
+    bounds.x_min, bounds.y_min = xy.min(axis=0) - clip
+    bounds.x_max, bounds.y_max = xy.max(axis=0) + clip
+    return bounds
+
+def lloyd2d_np(bound_mode, verts, n_iterations, clip=0.0, weight_field=None, eps=1e-4):
+    """
+    Lloyd relaxation of 2D points; vectorized version of lloyd2d, which gives
+    the same result. As there, sites are mirrored in the bounds of original
+    points, and the diagram of original and mirrored sites is bounded by their
+    bounds extended by clip. Points which coincide with other points (within eps)
+    stay where they are.
+
+    Points move less and less with iterations, so Delaunay triangulation
+    is rebuilt only when the one of previous iteration is not valid
+    for new positions of points anymore.
+    Returns: array of shape (n, 3).
+    """
+    bounds = Bounds.new(bound_mode)
+    bounds.init_from_sites(verts)
+
+    points = restrict_np(bounds, verts)
+    if len(points) == 0:
+        return points
+    # mirrored sites are not further from the original bounds than their size,
+    # so far sites can stay the same for all iterations
+    extent = max(bounds.x_max - bounds.x_min, bounds.y_max - bounds.y_min, bounds.r_max)
+    ghosts = _ghost_sites(np.abs(points[:, :2]).max() + 2*extent + abs(clip))
+
+    triangulation = None
+    previous_key = None
+    for i in range(n_iterations):
+        xy = points[:, :2]
+        if len(points) > 1:
+            distances, _ = cKDTree(xy).query(xy, k=2)
+            unique = distances[:, 1] > eps
+        else:
+            unique = np.ones(1, dtype=bool)
+        n = int(unique.sum())
+        if n == 0:
+            break
+        mirrored, mirror_sites = mirror_sites_np(bounds, points[unique])
+        sites = np.concatenate((xy[unique], mirror_sites))
+        cell_bounds = _bounds_of_sites(bound_mode, sites, clip)
+        all_points = np.concatenate((sites, ghosts))
+
+        key = np.concatenate((unique, mirrored))
+        if triangulation is not None and np.array_equal(key, previous_key):
+            simplices, neighbors, orientations = triangulation
+            circumcenters = _circumcenters(all_points, simplices)
+            if not _delaunay_holds(all_points, simplices, neighbors, orientations, circumcenters):
+                triangulation = None
+        else:
+            triangulation = None
+        if triangulation is None:
+            delaunay = Delaunay(all_points)
+            simplices, neighbors = delaunay.simplices, delaunay.neighbors
+            triangulation = simplices, neighbors, _orientations(all_points, simplices)
+            circumcenters = _circumcenters(all_points, simplices)
+        previous_key = key
+
+        polygons, counts = _cells_from_triangulation(all_points, simplices, circumcenters, n)
+        polygons, counts = cut_polygons(polygons, counts, cell_bounds)
+        centers = polygon_centers_np(polygons, counts, weight_field)
+        # points which got no cell (Qhull could skip nearly coinciding points) stay
+        ok = (counts >= 3) & np.isfinite(centers).all(axis=1)
+        moved = np.flatnonzero(unique)[ok]
+        points[moved, :2] = centers[ok]
+        points[moved, 2] = 0.0
+        points = restrict_np(bounds, points)
+    return points
@@ -3,11 +3,29 @@ Initial code was taken from Houdini software implementation
 https://github.com/sideeffects/SideFXLabs
 """
 
-from itertools import chain
+from heapq import heapify, heappush, heappop
 
 import numpy as np
 
 
+def bitset_indices(bits):
+    # Indices of set bits of an integer, in ascending order
+    indices = []
+    while bits:
+        lowest = bits & -bits
+        indices.append(lowest.bit_length() - 1)
+        bits ^= lowest
+    return np.array(indices, dtype=np.int64)
+
+
+def indices_bitset(indices):
+    # Integer with bits of given indices set
+    bits = 0
+    for index in indices.tolist():
+        bits |= 1 << index
+    return bits
+
+
 class WaveFunctionCollapse:
     # wave = WaveFunctionCollapse(*params)  this step will read input image and create patterns
     # new_image = wave.solve(*params)  this step will generate output image
@@ -19,8 +37,8 @@ class WaveFunctionCollapse:
             periodic_input=True,
             rotate_patterns=True):
 
+        self.input_image = np.asarray(image).reshape(image.shape[0], image.shape[1], -1)
         self.input_grid_size = image.shape
-        self.input_sample_image = image.reshape(-1, 4).tolist()
         self.periodic_input = periodic_input
         self.add_rotations = rotate_patterns
         self.pattern_size = patter_size
@@ -28,15 +46,23 @@ class WaveFunctionCollapse:
         self.output_grid_size = None
         self.seed = None
         self.tile_around_bounds = None
+        self.random = None
 
-        self.patterns = []
+        self.patterns = None  # array of patterns, shape (number of patterns, pattern size, pattern size, 4)
         self.patterns_transforms = []
-        self.pattern_frequencies = []
+        self.pattern_frequencies = None
         self.number_of_unique_patterns = None
-        self.output_grid = {}
-        self.entropy_grid = {}
+        # Wave keeps patterns still allowed in each cell as bitset (Python integer),
+        # bit with number N is set if pattern with index N is allowed
+        self.wave = None
+        self.entropy_grid = None  # number of allowed patterns of each cell
+        self.collapsed = None
+        self.entropy_heap = []
+        self.cell_neighbors = None
         self.solve_starting_point_index = None
-        self.allowed_pattern_adjacencies = {}
+        self.allowed_pattern_adjacencies = None  # boolean array, shape (directions, patterns, patterns)
+        self.adjacency_masks = None  # bitsets of patterns allowed in each direction by each pattern
+        self._allowed_masks_cache = None
         self.nbr_directions = ((-1, 0), (1, 0), (0, -1), (0, 1))
         self.respect_user_constraints = False
         self.use_input_pattern_frequency = 1
@@ -52,15 +78,18 @@ class WaveFunctionCollapse:
         self.output_grid_size = output_size
         self.tile_around_bounds = tiling_output
 
+        if self.allowed_pattern_adjacencies is None:
+            self.calculate_adjacencies()
+        self.calculate_cell_neighbors()
+
         for solve_attempt in range(max_number_contradiction_tries):
 
             # Set the seed for our random picking of values
-            np.random.seed(seed + solve_attempt * 100)
+            self.random = np.random.RandomState(seed + solve_attempt * 100)
 
             # Initialize WFC process
             self.initialize_grid()
             self.initialize_entropy_grid()
-            self.calculate_adjacencies()
 
             if self.respect_user_constraints:
                 success = ForceUserConstraints()  # is this need?
@@ -81,231 +110,222 @@ class WaveFunctionCollapse:
                            "Try to change seed or number of contradiction tries")
 
     def create_patterns_from_input(self):
-        # Here we will take the input grid, extract its values (name attribute), and cut it up into NxN size patterns
-        # Kernel to store data in
-        search_kernel = tuple(
-            tuple(i + n * self.input_grid_size[0] for i in range(self.pattern_size)) for n in range(self.pattern_size))
-
-        all_temp_patterns = []
-        all_temp_patterns_transforms = []
+        # Here we will take the input grid, and cut it up into NxN size patterns
+        height, width = self.input_grid_size[:2]
+        size = self.pattern_size
 
         if self.periodic_input:
             offset = 0
         else:
-            offset = (self.pattern_size - 1)
-
-        # Loop over grid
-        for y in range(self.input_grid_size[1] - offset):
-            for x in range(self.input_grid_size[0] - offset):
-
-                matrix_as_list = []
-                for item in search_kernel:
-                    tmp = []
-                    for sub_items in item:
-                        list_index = int(((x + sub_items) % self.input_grid_size[0]) + (
-                                        ((item[0] + self.input_grid_size[0] * y) / self.input_grid_size[0])
-                                        % self.input_grid_size[1]) * self.input_grid_size[0])
-                        tmp.append(self.input_sample_image[list_index])
-
-                    # This is where variations would take place
-
-                    matrix_as_list.append(tuple(tmp))
-
-                temp_pattern = tuple(matrix_as_list)
-
-                if not self.add_rotations:
-                    all_temp_patterns.append(temp_pattern)
-                    all_temp_patterns_transforms.append([0, 1, 1])
-                else:
-                    for x in range(4):
-                        temp_pattern = list(zip(*temp_pattern[::-1]))
-                        all_temp_patterns.append(temp_pattern)
-                        all_temp_patterns_transforms.append([(x + 1) * 90, 1, 1])
-                        # Maybe add horizontal flip too??
-                        # all_temp_patterns.append([a[::-1] for a in temp_pattern]) # Flip X
-                        # all_temp_patterns_transforms.append([(x+1)*90, -1, 1])
-
-        all_temp_patterns = [tuple(chain.from_iterable(p)) for p in all_temp_patterns]
-
-        self.patterns = []
-        self.patterns_transforms = []
-        self.pattern_frequencies = []
+            offset = (size - 1)
 
-        for i, pattern in enumerate(all_temp_patterns):
-            if pattern not in self.patterns:
-                self.patterns.append(pattern)
-                self.pattern_frequencies.append(1)
-                self.patterns_transforms.append(all_temp_patterns_transforms[i])
-            else:
-                index = self.patterns.index(pattern)
-                self.pattern_frequencies[index] += 1
+        # Index of pixel of every pattern (patterns are ordered row by row of the input grid),
+        # shape (rows, columns, pattern size, pattern size)
+        rows = (np.arange(max(height - offset, 0))[:, np.newaxis] + np.arange(size)) % height
+        columns = (np.arange(max(width - offset, 0))[:, np.newaxis] + np.arange(size)) % width
+        all_temp_patterns = self.input_image[rows[:, np.newaxis, :, np.newaxis], columns[np.newaxis, :, np.newaxis, :]]
+        all_temp_patterns = all_temp_patterns.reshape((-1, size, size, self.input_image.shape[2]))
 
+        if not self.add_rotations:
+            all_temp_patterns_transforms = [[0, 1, 1]] * len(all_temp_patterns)
+        else:
+            # Each pattern is followed by its rotations by 90, 180, 270 and 360 degrees (clockwise)
+            all_temp_patterns = np.stack([np.rot90(all_temp_patterns, -(x + 1), axes=(1, 2)) for x in range(4)], 1)
+            all_temp_patterns = all_temp_patterns.reshape((-1, size, size, self.input_image.shape[2]))
+            all_temp_patterns_transforms = [[(x + 1) * 90, 1, 1] for x in range(4)] * (len(all_temp_patterns) // 4)
+            # Maybe add horizontal flip too??
+
+        # Unique patterns in order of their first appearance
+        flat_patterns = np.ascontiguousarray(all_temp_patterns.reshape((len(all_temp_patterns), -1)))
+        _, first_indices, counts = np.unique(flat_patterns, axis=0, return_index=True, return_counts=True)
+        order = np.argsort(first_indices)
+
+        self.patterns = all_temp_patterns[first_indices[order]]
+        self.pattern_frequencies = counts[order]
+        self.patterns_transforms = [all_temp_patterns_transforms[i] for i in first_indices[order]]
         self.number_of_unique_patterns = len(self.pattern_frequencies)
 
-    def initialize_grid(self):
-        # Here we create a list that will be used as our output grid. (Used for solving in)
+    @staticmethod
+    def boundary_signatures(parts_1, parts_2):
+        # Integer signatures of pattern parts; equal parts get equal signature
+        flat = np.concatenate((parts_1, parts_2)).reshape((len(parts_1) + len(parts_2), -1))
+        _, signatures = np.unique(np.ascontiguousarray(flat), axis=0, return_inverse=True)
+        signatures = signatures.ravel()
+        return signatures[:len(parts_1)], signatures[len(parts_1):]
+
+    def calculate_adjacencies(self):
+        # If PatternIndex = 10 has been observed to be to the left of of PatternIndex = 15 in the InputGrid:
+        # AllowedPatternAdjacencies[direction=0][PatternIndex=15][PatternIndex=10] == True
+        # Directions: 0 = left, 1 = right, 2 = up, 3 = down
+        # Instead of comparing parts of each pair of patterns, parts are replaced by signatures
+        # and only the signatures are compared
+
+        # Columns compatibility: pattern without its last column should be equal to other pattern without first one
+        without_last, without_first = self.boundary_signatures(self.patterns[:, :, :-1], self.patterns[:, :, 1:])
+        left = without_last[:, np.newaxis] == without_first[np.newaxis, :]
+
+        # Rows compatibility
+        without_last, without_first = self.boundary_signatures(self.patterns[:, :-1], self.patterns[:, 1:])
+        up = without_last[:, np.newaxis] == without_first[np.newaxis, :]
+
+        self.allowed_pattern_adjacencies = np.stack((left, left.T, up, up.T))
+        self.adjacency_masks = [[indices_bitset(np.flatnonzero(row)) for row in direction]
+                                for direction in self.allowed_pattern_adjacencies]
+        self._allowed_masks_cache = [dict() for _ in self.nbr_directions]
+
+    def calculate_cell_neighbors(self):
+        # Index of neighbor cell in each direction, -1 if the neighbor is out of the output grid
+        width, height = self.output_grid_size
+        xs, ys = np.meshgrid(np.arange(width), np.arange(height))
+        xs, ys = xs.ravel(), ys.ravel()
+        neighbors = []
+        for transform in self.nbr_directions:
+            x = xs + transform[0]
+            y = ys + transform[1]
+            # If the user does not want the WFC solve to create a tiling output,
+            # we just state that the found neighbor cell is invalid and don't propagate it
+            is_valid = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+            neighbor = (x % width) + (y % height) * width
+            if not self.tile_around_bounds:
+                neighbor[~is_valid] = -1
+            neighbors.append(neighbor)
+        self.cell_neighbors = np.stack(neighbors, axis=1).tolist()
 
-        for x in range(self.output_grid_size[0] * self.output_grid_size[1]):
-            self.output_grid[x] = set(range(self.number_of_unique_patterns))
+    def initialize_grid(self):
+        # Here we create an array that will be used as our output grid. (Used for solving in)
+        number_of_cells = self.output_grid_size[0] * self.output_grid_size[1]
+        self.wave = [(1 << self.number_of_unique_patterns) - 1] * number_of_cells
+        self.collapsed = [False] * number_of_cells
 
     def initialize_entropy_grid(self):
         # Here we create grid that matches the output grid, but we store entropy values instead.
         # (Entropy = Number of remaining legal patterns)
-
-        for x in range(self.output_grid_size[0] * self.output_grid_size[1]):
-            self.entropy_grid[x] = self.number_of_unique_patterns
+        number_of_cells = len(self.wave)
+        self.entropy_grid = [self.number_of_unique_patterns] * number_of_cells
 
         # Pick starting point for solve. (Random if not specified)
         if self.solve_starting_point_index is None:
-            # solve_starting_point_index = np.random.randint(NumberOfUniquePatterns)
-            self.solve_starting_point_index = np.random.randint(len(self.entropy_grid.keys()))
+            self.solve_starting_point_index = self.random.randint(number_of_cells)
 
         self.entropy_grid[self.solve_starting_point_index] = self.number_of_unique_patterns - 1
 
-    def calculate_adjacencies(self):
-        # If PatternIndex = 10 has been observed to be to the left of of PatternIndex = 15 in the InputGrid:
-        # AllowedPatternAdjacencies[PatternIndex=15][0].add(PatternIndex=10)
-        # Directions: 0 = left, 1 = right, 2 = up, 3 = down
-        # OUTPUT EXAMPLE PatternIndex = 15 --> (LEFT: set([65, 36, 69, 44, 87, 56, 29]),
-        # RIGHT: set([8]), UP: set([32, 64, 10, 12, 14, 83, 21]), DOWN: set([15]))
-
-        # Initialize empty AllowedPatternAdjacencies
-        for x in range(self.number_of_unique_patterns):
-            self.allowed_pattern_adjacencies[x] = tuple(set() for _ in range(len(self.nbr_directions)))
-
-        # Comparing patterns to each other
-        for PatternIndex1 in range(self.number_of_unique_patterns):
-            for PatternIndex2 in range(self.number_of_unique_patterns):
-
-                pattern1_boundary_columns = [n for i, n in enumerate(self.patterns[PatternIndex1]) if
-                                             i % self.pattern_size != (self.pattern_size - 1)]
-                pattern2_boundary_columns = [n for i, n in enumerate(self.patterns[PatternIndex2]) if
-                                             i % self.pattern_size != 0]
-
-                # Compare Columns compatability
-                if pattern1_boundary_columns == pattern2_boundary_columns:
-                    self.allowed_pattern_adjacencies[PatternIndex1][0].add(PatternIndex2)
-                    self.allowed_pattern_adjacencies[PatternIndex2][1].add(PatternIndex1)
-
-                pattern1_boundary_rows = self.patterns[PatternIndex1][
-                                       :(self.pattern_size * self.pattern_size) - self.pattern_size]
-                pattern2_boundary_rows = self.patterns[PatternIndex2][self.pattern_size:]
-
-                if pattern1_boundary_rows == pattern2_boundary_rows:
-                    self.allowed_pattern_adjacencies[PatternIndex1][2].add(PatternIndex2)
-                    self.allowed_pattern_adjacencies[PatternIndex2][3].add(PatternIndex1)
+        # Heap of (entropy, cell) records. Records are not removed when entropy of the cell changes,
+        # a new record is pushed instead, outdated records are skipped when they are popped
+        self.entropy_heap = [(entropy, cell) for cell, entropy in enumerate(self.entropy_grid)]
+        heapify(self.entropy_heap)
 
     def run_wfc_solve(self):
         # This runs the actual WFC solve
-        running = True
-        while running:
+        while True:
 
             # Find the cell with the lowest entropy value, and assign a random valid PatternIndex
             lowest_entropy_cell = self.get_lowest_entropy_cell()
+
+            # Check if all cells in the OutputGrid have collapsed yet (done solving)
+            if lowest_entropy_cell is None:
+                return True
+
             pattern_index_for_cell = self.get_random_allowed_pattern_index_from_cell(lowest_entropy_cell)
             self.assign_pattern_to_cell(lowest_entropy_cell, pattern_index_for_cell)
 
             # Propagate the OutputGrid after collapsing the LowestEntropyCell
-            running, error = self.propagate_grid_cells(lowest_entropy_cell)
-
-            # Check if all cells in the OutputGrid have collapsed yet (done solving)
-            if len(self.entropy_grid.keys()) == 0:
-                running = False
-
-        # Check if we have ran into an error. (contradiction while propagating)
-        if error == 1:
-            return False
-        else:
-            return True
+            # Check if we have ran into an error. (contradiction while propagating)
+            if not self.propagate_grid_cells(lowest_entropy_cell):
+                return False
 
     def get_lowest_entropy_cell(self):
-        # Find the list entry in the entropy grid with the lowest value
-        return min(self.entropy_grid, key=self.entropy_grid.get)
+        # Pop records from the heap until the one, which is still actual, is found
+        heap = self.entropy_heap
+        while heap:
+            entropy, cell = heappop(heap)
+            if not self.collapsed[cell] and self.entropy_grid[cell] == entropy:
+                return cell
+        return None
 
     def get_random_allowed_pattern_index_from_cell(self, cell):
         # Assign a random allowed pattern_index to given cell.
         # This can either use frequency of found patterns as a weighted random or not depending on user parm
+        pattern_indices = bitset_indices(self.wave[cell])
         if self.use_input_pattern_frequency == 1:
-            return np.random.choice(
-                [pattern_index for pattern_index in self.output_grid[cell]
-                 for i in range(self.pattern_frequencies[pattern_index])])
+            weights = np.cumsum(self.pattern_frequencies[pattern_indices])
+            return pattern_indices[np.searchsorted(weights, self.random.random_sample() * weights[-1], side='right')]
         else:
-            return np.random.choice([pattern_index for pattern_index in self.output_grid[cell]])
+            return pattern_indices[self.random.randint(len(pattern_indices))]
 
     def assign_pattern_to_cell(self, cell, pattern_index):
-        # Assign given cell a chosen PatternIndex, and delete cell from EntropyGrid (Cell has collapsed)
-        self.output_grid[cell] = {pattern_index}
-        del self.entropy_grid[cell]
+        # Assign given cell a chosen PatternIndex, and mark the cell as collapsed
+        self.wave[cell] = 1 << int(pattern_index)
+        self.entropy_grid[cell] = 1
+        self.collapsed[cell] = True
+
+    def allowed_masks(self, direction, cell_patterns):
+        # Bitset of patterns allowed in the neighbor cell in given direction by all patterns of the cell.
+        # The number of different sets of patterns in cells is usually small, so results are cached
+        cache = self._allowed_masks_cache[direction]
+        allowed = cache.get(cell_patterns)
+        if allowed is None:
+            masks = self.adjacency_masks[direction]
+            allowed = 0
+            for pattern_index in bitset_indices(cell_patterns).tolist():
+                allowed |= masks[pattern_index]
+            cache[cell_patterns] = allowed
+        return allowed
 
     def propagate_grid_cells(self, cell):
         # This propagates all the cells that should have been affected from the just-collapsed cell
+        wave = self.wave
+        entropy_grid = self.entropy_grid
+        collapsed = self.collapsed
+        allowed_masks_cache = self._allowed_masks_cache
 
         # We are using a stack to add newly found to-be-updated cells to
-        to_update_stack = {cell}
-        while len(to_update_stack) != 0:
+        to_update_stack = [cell]
+        in_stack = {cell}
+        while to_update_stack:
             cell_index = to_update_stack.pop()
+            in_stack.discard(cell_index)
+            cell_patterns = wave[cell_index]
 
             # loop through neighbor cells of currently propagated cell
-            for direction, transform in enumerate(self.nbr_directions):
-
-                neighbor_index_is_valid = True
-
-                x = int((cell_index % self.output_grid_size[0] + transform[0]) % self.output_grid_size[0])
-                y = int((cell_index / self.output_grid_size[0] + transform[1]) % self.output_grid_size[1])
-                neighbor_cell_index = x + y * self.output_grid_size[0]  # index of neighboring cell
-
-                # If the user does not want the WFC solve to create a tiling output,
-                # we just state that the found neighbor cell is invalid and don't propagate it
-                if not self.tile_around_bounds:
-                    x_is_wrapping = abs(neighbor_cell_index % self.output_grid_size[0]
-                                        - cell_index % self.output_grid_size[0]) > 1
-                    y_is_wrapping = abs(neighbor_cell_index / self.output_grid_size[1]
-                                        - cell_index / self.output_grid_size[1]) > 1
-
-                    if x_is_wrapping or y_is_wrapping:
-                        neighbor_index_is_valid = False
-
-                # Cell has not yet been collapsed yet
-                if neighbor_cell_index in self.entropy_grid and neighbor_index_is_valid:
+            for direction, neighbor_cell_index in enumerate(self.cell_neighbors[cell_index]):
 
-                    # These are all the allowed patterns for the direction of the checked neighbor cell
-                    pattern_indices_in_cell = {n for pattern_index in self.output_grid[cell_index] for n in
-                                               self.allowed_pattern_adjacencies[pattern_index][direction]}
+                # Cell is out of output grid or has been collapsed already
+                if neighbor_cell_index < 0 or collapsed[neighbor_cell_index]:
+                    continue
 
-                    # These are all the patterns the neighbor allows itself
-                    pattern_indices_in_neighbor_cell = self.output_grid[neighbor_cell_index]
+                # These are all the allowed patterns for the direction of the checked neighbor cell
+                pattern_indices_in_cell = allowed_masks_cache[direction].get(cell_patterns)
+                if pattern_indices_in_cell is None:
+                    pattern_indices_in_cell = self.allowed_masks(direction, cell_patterns)
 
-                    # Make sure we need to update the cell
-                    # by checking if the currently pattern_indices_in_cell patterns for the neighbor cells
-                    # are already fully contained in the now reduced set of patterns
-                    if not pattern_indices_in_neighbor_cell.issubset(pattern_indices_in_cell):
+                # These are all the patterns the neighbor allows itself
+                pattern_indices_in_neighbor_cell = wave[neighbor_cell_index]
+                shared_cell_and_neighbor_pattern_indices = pattern_indices_in_neighbor_cell & pattern_indices_in_cell
 
-                        shared_cell_and_neighbor_pattern_indices = set(
-                            [x for x in pattern_indices_in_cell if x in pattern_indices_in_neighbor_cell])
+                # Make sure we need to update the cell
+                # by checking if the patterns of the neighbor cell are already fully contained in the allowed ones
+                if shared_cell_and_neighbor_pattern_indices == pattern_indices_in_neighbor_cell:
+                    continue
 
-                        if len(shared_cell_and_neighbor_pattern_indices) == 0:
-                            return False, 1
+                if not shared_cell_and_neighbor_pattern_indices:
+                    return False
 
-                        self.output_grid[neighbor_cell_index] = shared_cell_and_neighbor_pattern_indices
-                        self.entropy_grid[neighbor_cell_index] = len(self.output_grid[neighbor_cell_index])
-                        to_update_stack.add(neighbor_cell_index)
+                shared_number = bin(shared_cell_and_neighbor_pattern_indices).count('1')
+                wave[neighbor_cell_index] = shared_cell_and_neighbor_pattern_indices
+                entropy_grid[neighbor_cell_index] = shared_number
+                heappush(self.entropy_heap, (shared_number, neighbor_cell_index))
+                if neighbor_cell_index not in in_stack:
+                    to_update_stack.append(neighbor_cell_index)
+                    in_stack.add(neighbor_cell_index)
 
-        return True, 0
+        return True
 
     def assign_wave_to_output(self):
         # This finds and assigns the picked PatternIndex to the output grid as attributes
-        flat_out_image = []
-        for x in self.output_grid.keys():
-            val = next(iter(self.output_grid[x]))
-            flat_out_image.append(self.patterns[val][0])
-
-        out_image = []
-        for i_row in range(self.output_grid_size[1]):
-            current_row_position = i_row * self.output_grid_size[0]
-            pixel_row = flat_out_image[current_row_position: current_row_position + self.output_grid_size[0]]
-            out_image.append(pixel_row)
-
-        return out_image
+        picked_patterns = [cell_patterns.bit_length() - 1 for cell_patterns in self.wave]
+        flat_out_image = self.patterns[picked_patterns, 0, 0]
+        width, height = self.output_grid_size
+        return flat_out_image.reshape((height, width, -1)).tolist()
 
 
 # def ForceUserConstraints():